@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+zCLI Startup Benchmark - eager vs lazy subsystem initialization
+
+Each run is a fresh interpreter (imports are cached per process), timing:
+
+    import      `from zCLI import zCLI` (heavy third-party modules such as
+                requests, websockets, pandas are deferred to first use)
+    init        zCLI({...}) - every subsystem (eager) or only zConfig, zComm
+                and zDisplay (lazy, zSpark "lazy": True)
+    first use   z.data in lazy mode (the deferred build of zData)
+
+The per-subsystem startup_report() of the last run of each mode is printed
+after the table (use --no-report to hide it).
+
+Usage:
+    python Demos/Benchmarks/zcli_startup_benchmark.py
+    python Demos/Benchmarks/zcli_startup_benchmark.py --runs 10 --no-report
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+CHILD = r"""
+import io, json, sys, time, contextlib
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+from zCLI import zCLI
+imported = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    z = zCLI({{"zMode": "Terminal", "logger": "PROD", "lazy": {lazy}}})
+initialized = time.perf_counter()
+z.data
+used = time.perf_counter()
+print(json.dumps({{
+    "import": imported - started,
+    "init": initialized - imported,
+    "first_use": used - initialized,
+    "modules": len(sys.modules),
+    "report": z.startup_report(),
+}}))
+"""
+
+
+def run_once(lazy):
+    """One fresh-process startup; returns the child's timing dict."""
+    code = CHILD.format(root=str(workspace_root), lazy=lazy)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=workspace_root
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zCLI startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per mode (median reported)")
+    parser.add_argument("--no-report", action="store_true", help="Skip the per-subsystem startup report")
+    args = parser.parse_args()
+
+    results = {}
+    for lazy in (False, True):
+        runs = [run_once(lazy) for _ in range(args.runs)]
+        results["lazy" if lazy else "eager"] = runs
+
+    print()
+    print("=" * 72)
+    print(f"zCLI startup: median of {args.runs} fresh processes")
+    print("=" * 72)
+    print(f"{'mode':>6} | {'import':>9} | {'init':>9} | {'ready':>9} | {'+ z.data':>9} | {'modules':>7}")
+    print("-" * 72)
+    baseline = None
+    for mode, runs in results.items():
+        median = {key: statistics.median(run[key] for run in runs) * 1000
+                  for key in ("import", "init", "first_use")}
+        ready = median["import"] + median["init"]
+        baseline = baseline or ready
+        modules = int(statistics.median(run["modules"] for run in runs))
+        print(f"{mode:>6} | {median['import']:>6.1f} ms | {median['init']:>6.1f} ms | {ready:>6.1f} ms | "
+              f"{median['first_use']:>6.1f} ms | {modules:>7}   ({baseline / ready:.1f}x)")
+    print("=" * 72)
+
+    if not args.no_report:
+        for mode, runs in results.items():
+            print()
+            print(runs[-1]["report"])
+
+
+if __name__ == "__main__":
+    main()
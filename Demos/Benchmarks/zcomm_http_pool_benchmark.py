@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+zComm HTTP Client Benchmark - per-call connections vs the pooled session
+
+Sends --requests GET requests to a local keep-alive HTTP/1.1 server from
+--threads threads in three ways:
+
+    per-call        requests.get() - a new TCP connection per request
+                    (the previous HTTPClient behaviour)
+    pooled          HTTPClient.get() - keep-alive connections from the
+                    client's requests.Session pool
+    async pooled    AsyncHTTPClient.get() - the same pools, awaited with
+                    asyncio.gather from one event loop
+
+Connections are counted on the server side.
+
+Usage:
+    python Demos/Benchmarks/zcomm_http_pool_benchmark.py
+    python Demos/Benchmarks/zcomm_http_pool_benchmark.py --requests 2000 --threads 8
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+import requests  # noqa: E402
+
+from zCLI.subsystems.zComm.zComm_modules.comm_http import HTTPClient, AsyncHTTPClient  # noqa: E402
+
+BODY = b'{"ok": true}'
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Tiny JSON endpoint that keeps connections open (HTTP/1.1)."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body are separate writes
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with KeepAliveHandler.lock:
+            KeepAliveHandler.connections += 1
+
+    def do_GET(self):  # noqa: N802 (http.server naming)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_threads(fetch, url, total, threads):
+    """Send total requests from threads threads; returns elapsed seconds."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for response in pool.map(lambda _: fetch(url), range(total)):
+            assert response is not None and response.status_code == 200
+    return time.perf_counter() - start
+
+
+def run_async(client, url, total):
+    """Send total requests concurrently from one event loop; returns elapsed seconds."""
+    async def _main():
+        responses = await asyncio.gather(*(client.get(url) for _ in range(total)))
+        assert all(response.status_code == 200 for response in responses)
+
+    start = time.perf_counter()
+    asyncio.run(_main())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zComm HTTP client pooling benchmark")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per run")
+    parser.add_argument("--threads", type=int, default=4, help="Client threads (sync runs)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+
+    logger = logging.getLogger("zcomm_http_pool_benchmark")
+    logger.addHandler(logging.NullHandler())
+    client = HTTPClient(logger)
+    async_client = AsyncHTTPClient(client)
+
+    results = []
+    for label, runner in (
+        ("per-call", lambda: run_threads(lambda u: requests.get(u, timeout=10), url, args.requests, args.threads)),
+        ("pooled", lambda: run_threads(client.get, url, args.requests, args.threads)),
+        ("async pooled", lambda: run_async(async_client, url, args.requests)),
+    ):
+        opened = KeepAliveHandler.connections
+        elapsed = runner()
+        results.append((label, args.requests / elapsed, KeepAliveHandler.connections - opened))
+
+    async_client.close()
+    client.close()
+    server.shutdown()
+
+    print()
+    print("=" * 64)
+    print(f"zComm HTTP client: {args.requests} GETs, {args.threads} threads, local keep-alive server")
+    print("=" * 64)
+    print(f"{'path':>13} | {'req/s':>10} | {'connections':>11} | {'speedup':>8}")
+    print("-" * 64)
+    baseline = results[0][1]
+    for label, rate, connections in results:
+        print(f"{label:>13} | {rate:>10,.0f} | {connections:>11,} | {rate / baseline:>7.1f}x")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
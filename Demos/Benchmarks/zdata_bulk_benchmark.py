@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+zData Bulk Load Benchmark - per-row insert() vs insert_many()
+
+Loads N rows into a fresh table for each backend and reports rows per second:
+
+    insert        adapter.insert() per row (one commit per row for SQL,
+                  one DataFrame concat per row for CSV)
+    insert_many   adapter.insert_many() - chunked executemany / single concat,
+                  one commit for the whole load
+
+Usage:
+    python Demos/Benchmarks/zdata_bulk_benchmark.py
+    python Demos/Benchmarks/zdata_bulk_benchmark.py --rows 50000 --chunk-size 2000 --backends sqlite
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+
+FIELDS = ["id", "name", "score"]
+SCHEMA = {
+    "id": {"type": "int", "pk": True},
+    "name": {"type": "str"},
+    "score": {"type": "float"},
+}
+
+
+def make_rows(count):
+    """Deterministic rows: (id, name, score)."""
+    return ((i, f"user{i}", i * 0.5) for i in range(1, count + 1))
+
+
+def _fresh_adapter(backend, path, label):
+    """Connected adapter with an empty 'bench' table."""
+    adapter = AdapterFactory.create_adapter(backend, {"path": path, "label": label, "meta": {}})
+    adapter.connect()
+    adapter.create_table("bench", SCHEMA)
+    return adapter
+
+
+def run_per_row(backend, path, count):
+    """Rows/sec for one insert() call per row."""
+    adapter = _fresh_adapter(backend, path, f"{backend}_rows")
+    try:
+        start = time.perf_counter()
+        for row in make_rows(count):
+            adapter.insert("bench", FIELDS, list(row))
+        adapter.commit()
+        elapsed = time.perf_counter() - start
+    finally:
+        adapter.disconnect()
+    return count / elapsed if elapsed else float("inf")
+
+
+def run_bulk(backend, path, count, chunk_size):
+    """Rows/sec reported by insert_many()."""
+    adapter = _fresh_adapter(backend, path, f"{backend}_bulk")
+    try:
+        stats = adapter.insert_many("bench", FIELDS, make_rows(count), chunk_size=chunk_size)
+    finally:
+        adapter.disconnect()
+    return stats["rows_per_sec"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zData bulk load benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows loaded by insert_many")
+    parser.add_argument("--per-row", type=int, default=2000, help="Rows loaded by per-row insert (slow)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="insert_many chunk size")
+    parser.add_argument("--backends", default="sqlite,csv", help="Comma-separated backends")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="zdata_bulk_")
+    results = []
+    try:
+        for backend in args.backends.split(","):
+            per_row = run_per_row(backend, temp_dir, args.per_row)
+            bulk = run_bulk(backend, temp_dir, args.rows, args.chunk_size)
+            results.append((backend, per_row, bulk))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print()
+    print("=" * 66)
+    print(f"zData bulk load ({args.per_row} rows per-row, {args.rows} rows bulk, chunk {args.chunk_size})")
+    print("=" * 66)
+    print(f"{'backend':>8} | {'insert rows/s':>15} | {'insert_many rows/s':>19} | {'speedup':>9}")
+    print("-" * 66)
+    for backend, per_row, bulk in results:
+        print(f"{backend:>8} | {per_row:>15,.0f} | {bulk:>19,.0f} | {bulk / per_row:>8.1f}x")
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+zData CSV Engine Benchmark - classic vs resident write path
+
+Runs the same single-row workload against a CSV table preloaded with --base
+rows, once per engine, and reports operations per second:
+
+    insert   adapter.insert() without an id (auto-increment)
+    update   adapter.update() by primary key
+    upsert   adapter.upsert() on a unique column (half hits, half new rows)
+
+classic   rewrites the CSV and recomputes max(id) on every write
+resident  appends each write to the WAL and writes the CSV once at commit()
+          (Meta Data_Engine: resident); commit time is included
+
+Usage:
+    python Demos/Benchmarks/zdata_csv_engine_benchmark.py
+    python Demos/Benchmarks/zdata_csv_engine_benchmark.py --base 50000 --ops 500
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+
+SCHEMA = {
+    "id": {"type": "int", "pk": True, "auto_increment": True},
+    "email": {"type": "str", "unique": True},
+    "score": {"type": "int"},
+}
+
+
+def _fresh_adapter(engine, path, base):
+    """Connected CSV adapter with a 'bench' table holding base rows."""
+    adapter = AdapterFactory.create_adapter("csv", {"path": path, "label": engine, "meta": {"Data_Engine": engine}})
+    adapter.connect()
+    adapter.create_table("bench", SCHEMA)
+    adapter.insert_many("bench", ["email", "score"], ((f"user{i}@x.io", i) for i in range(base)))
+    return adapter
+
+
+def run_workload(engine, path, base, ops):
+    """Ops/sec for insert, update and upsert on one engine."""
+    adapter = _fresh_adapter(engine, path, base)
+    workloads = {
+        "insert": lambda i: adapter.insert("bench", ["email", "score"], [f"new{i}@x.io", i]),
+        "update": lambda i: adapter.update("bench", ["score"], [-i], {"id": (i * 7919) % base + 1}),
+        "upsert": lambda i: adapter.upsert("bench", ["email", "score"], [f"user{i * 2}@x.io", i], ["email"]),
+    }
+    results = {}
+    try:
+        for name, work in workloads.items():
+            start = time.perf_counter()
+            for i in range(ops):
+                work(i)
+            adapter.commit()
+            elapsed = time.perf_counter() - start
+            results[name] = ops / elapsed if elapsed else float("inf")
+    finally:
+        adapter.disconnect()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zData CSV engine benchmark")
+    parser.add_argument("--base", type=int, default=20000, help="Rows in the table before the workload")
+    parser.add_argument("--ops", type=int, default=200, help="Operations per workload")
+    args = parser.parse_args()
+
+    results = {}
+    for engine in ("classic", "resident"):
+        temp_dir = tempfile.mkdtemp(prefix="zdata_csv_engine_")
+        try:
+            results[engine] = run_workload(engine, temp_dir, args.base, args.ops)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print()
+    print("=" * 60)
+    print(f"zData CSV engines ({args.base} base rows, {args.ops} ops per workload)")
+    print("=" * 60)
+    print(f"{'workload':>8} | {'classic ops/s':>14} | {'resident ops/s':>15} | {'speedup':>9}")
+    print("-" * 60)
+    for name in ("insert", "update", "upsert"):
+        classic, resident = results["classic"][name], results["resident"][name]
+        print(f"{name:>8} | {classic:>14,.0f} | {resident:>15,.0f} | {resident / classic:>8.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+zData PostgreSQL Connect Benchmark - per-connect bootstrap vs fast path vs pool
+
+Measures connect() + SELECT 1 + disconnect() latency against a local PostgreSQL
+server, the way one-shot zData requests use it:
+
+    bootstrap     what every connect() used to do: connect to 'postgres' and
+                  check pg_database, connect to the target database, then
+                  SELECT version(), SHOW data_directory and rewrite .pginfo.yaml
+    fast path     connect() on an already provisioned database - one handshake
+    pool          checkout/return through the shared zData connection pool
+
+Requires psycopg2 and a reachable server (the database is created if missing).
+
+Usage:
+    python Demos/Benchmarks/zdata_postgres_connect_benchmark.py
+    python Demos/Benchmarks/zdata_postgres_connect_benchmark.py --host 127.0.0.1 --user postgres --iterations 500
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zData.zData_modules.shared.backends import (
+    AdapterFactory, get_connection_pool, reset_provisioned_databases,
+)
+from zCLI.subsystems.zData.zData_modules.shared.backends.connection_pool import make_pool_key
+from zCLI.subsystems.zData.zData_modules.shared.backends.postgresql_adapter import PSYCOPG2_AVAILABLE
+
+
+def _ping(adapter):
+    """One trivial round trip so every mode ends with a usable connection."""
+    cursor = adapter.get_cursor()
+    cursor.execute("SELECT 1")
+    cursor.fetchone()
+
+
+def run_bootstrap(config):
+    """Replays the old connect(): database check, connect, project info rewrite."""
+    adapter = AdapterFactory.create_adapter("postgresql", config)
+    adapter._bootstrap_database()
+    adapter.connection = adapter._open_connection(adapter.database_name)
+    adapter._write_project_info()
+    _ping(adapter)
+    adapter.disconnect()
+
+
+def run_fast_path(config):
+    """connect() on a provisioned database."""
+    adapter = AdapterFactory.create_adapter("postgresql", config)
+    adapter.connect()
+    _ping(adapter)
+    adapter.disconnect()
+
+
+def run_pool(config):
+    """Borrow from and return to the shared connection pool."""
+    pool = get_connection_pool()
+    adapter = pool.acquire(
+        make_pool_key("postgresql", config),
+        lambda: AdapterFactory.create_adapter("postgresql", config),
+    )
+    _ping(adapter)
+    pool.release(adapter)
+
+
+def measure(func, config, iterations):
+    """Per-call latencies in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(config)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zData PostgreSQL connect latency benchmark")
+    parser.add_argument("--host", default="localhost", help="PostgreSQL host")
+    parser.add_argument("--port", type=int, default=5432, help="PostgreSQL port")
+    parser.add_argument("--user", default=None, help="PostgreSQL user (default: system user)")
+    parser.add_argument("--password", default=None, help="PostgreSQL password")
+    parser.add_argument("--database", default="zdata_connect_bench", help="Database (created if missing)")
+    parser.add_argument("--iterations", type=int, default=200, help="Connects per mode")
+    args = parser.parse_args()
+
+    if not PSYCOPG2_AVAILABLE:
+        print("psycopg2 is not installed - pip install zolo-zcli[postgresql]")
+        return 1
+
+    temp_dir = tempfile.mkdtemp(prefix="zdata_pg_connect_")
+    meta = {"Data_Host": args.host, "Data_Port": args.port}
+    if args.user:
+        meta["Data_User"] = args.user
+    if args.password:
+        meta["Data_Password"] = args.password
+    config = {"path": temp_dir, "label": args.database, "meta": meta}
+
+    modes = [("bootstrap", run_bootstrap), ("fast path", run_fast_path), ("pool", run_pool)]
+    results = []
+    try:
+        reset_provisioned_databases()
+        run_fast_path(config)  # provision once (creates the database if needed)
+        for name, func in modes:
+            func(config)  # warm-up
+            results.append((name, measure(func, config, args.iterations)))
+    finally:
+        get_connection_pool().close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    baseline = statistics.mean(results[0][1])
+    print()
+    print("=" * 66)
+    print(f"zData PostgreSQL connect ({args.iterations} per mode, {args.host}:{args.port}/{args.database})")
+    print("=" * 66)
+    print(f"{'mode':>10} | {'mean ms':>9} | {'p50 ms':>9} | {'p95 ms':>9} | {'speedup':>9}")
+    print("-" * 66)
+    for name, timings in results:
+        ordered = sorted(timings)
+        mean = statistics.mean(timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{name:>10} | {mean:>9.2f} | {statistics.median(timings):>9.2f} | {p95:>9.2f} | "
+              f"{baseline / mean:>8.1f}x")
+    print("=" * 66)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+zDisplay Output Benchmark - lines/sec, write-through vs batched
+
+Renders "events" of --lines lines each (e.g. a 500-row zTable) through
+zPrimitives.line() and counts what reaches the terminal and the GUI:
+
+    write-through   one print(..., flush=True) per line and, in Bifrost
+                    mode, one json.dumps + broadcast per line - the previous
+                    zDisplay behaviour
+    batched         each event inside zPrimitives.batch(), as
+                    zDisplay.handle() now does - one terminal write and one
+                    GUI frame per event
+
+Terminal output goes to a counting stream (or /dev/null with --devnull);
+Bifrost frames go to an in-process orchestrator on a running event loop.
+
+Usage:
+    python Demos/Benchmarks/zdisplay_output_benchmark.py
+    python Demos/Benchmarks/zdisplay_output_benchmark.py --lines 500 --events 40 --devnull
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zDisplay.zDisplay_modules.display_primitives import zPrimitives
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() and flush() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+
+
+class CountingOrchestrator:
+    """Stands in for zBifrost: counts broadcast frames and bytes."""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def broadcast(self, payload):
+        self.frames += 1
+        self.bytes += len(payload)
+
+
+class FakeDisplay:
+    """Just enough of zDisplay for zPrimitives (mode, zcli, buffer_event)."""
+
+    def __init__(self, mode, orchestrator=None):
+        self.mode = mode
+        self.zcli = None
+        if orchestrator is not None:
+            comm = type("Comm", (), {"broadcast_websocket": lambda *args: None})()
+            bifrost = type("Bifrost", (), {"orchestrator": orchestrator})()
+            self.zcli = type("zCLI", (), {"comm": comm, "bifrost": bifrost})()
+
+    def buffer_event(self, event_data):
+        pass
+
+
+def render(primitives, events, lines, batched):
+    """Render events x lines lines; returns elapsed seconds."""
+    rows = [f"| {i:>6} | user_{i:<12} | user_{i}@example.com{' ' * 8}|" for i in range(lines)]
+    start = time.perf_counter()
+    for _ in range(events):
+        scope = primitives.batch() if batched else contextlib.nullcontext()
+        with scope:
+            for row in rows:
+                primitives.line(row)
+    return time.perf_counter() - start
+
+
+def run_terminal(events, lines, batched, devnull):
+    """(lines/sec, terminal writes) in Terminal mode."""
+    primitives = zPrimitives(FakeDisplay("Terminal"))
+    if devnull:
+        with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+            elapsed = render(primitives, events, lines, batched)
+        writes = None
+    else:
+        sink = CountingStream()
+        with contextlib.redirect_stdout(sink):
+            elapsed = render(primitives, events, lines, batched)
+        writes = sink.writes
+    return events * lines / elapsed, writes
+
+
+def run_bifrost(events, lines, batched):
+    """(lines/sec, terminal writes, GUI frames) in zBifrost mode."""
+    orchestrator = CountingOrchestrator()
+    primitives = zPrimitives(FakeDisplay("zBifrost", orchestrator))
+    sink = CountingStream()
+
+    async def _main():
+        with contextlib.redirect_stdout(sink):
+            elapsed = render(primitives, events, lines, batched)
+        await asyncio.sleep(0)  # Broadcasts are scheduled thread-safely; let them start
+        while asyncio.all_tasks() - {asyncio.current_task()}:
+            await asyncio.sleep(0)
+        return elapsed
+
+    elapsed = asyncio.run(_main())
+    return events * lines / elapsed, sink.writes, orchestrator.frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zDisplay output benchmark")
+    parser.add_argument("--lines", type=int, default=500, help="Lines per event (e.g. zTable rows)")
+    parser.add_argument("--events", type=int, default=20, help="Events rendered per run")
+    parser.add_argument("--devnull", action="store_true", help="Terminal runs write to /dev/null (real syscalls)")
+    args = parser.parse_args()
+
+    results = []
+    for batched in (False, True):
+        label = "batched" if batched else "write-through"
+        rate, writes = run_terminal(args.events, args.lines, batched, args.devnull)
+        results.append(("Terminal", label, rate, writes, "-"))
+    for batched in (False, True):
+        label = "batched" if batched else "write-through"
+        rate, writes, frames = run_bifrost(args.events, args.lines, batched)
+        results.append(("zBifrost", label, rate, writes, frames))
+
+    print()
+    print("=" * 72)
+    print(f"zDisplay output: {args.events} events x {args.lines} lines")
+    print("=" * 72)
+    print(f"{'mode':>9} | {'path':>13} | {'lines/s':>12} | {'writes':>8} | {'frames':>7} | {'speedup':>8}")
+    print("-" * 72)
+    for index, (mode, label, rate, writes, frames) in enumerate(results):
+        baseline = results[index - index % 2][2]
+        writes_text = "n/a" if writes is None else f"{writes:,}"
+        frames_text = frames if isinstance(frames, str) else f"{frames:,}"
+        print(f"{mode:>9} | {label:>13} | {rate:>12,.0f} | {writes_text:>8} | {frames_text:>7} | "
+              f"{rate / baseline:>7.1f}x")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
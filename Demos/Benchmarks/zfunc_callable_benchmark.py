@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+zFunc Callable Benchmark - resolve + execute per call, uncached vs cached
+
+Times the resolve/inject/call path zFunc.handle() runs for every
+``&plugin.fn(...)`` step, against a generated plugin file:
+
+    uncached   resolve_callable() (executes the file) + inspect.signature()
+               per call - the previous zFunc behaviour
+    cached     CallableCache.resolve() (os.stat + dict lookup) +
+               memoized injection_plan() per call
+
+Usage:
+    python Demos/Benchmarks/zfunc_callable_benchmark.py
+    python Demos/Benchmarks/zfunc_callable_benchmark.py --calls 20000 --functions 200
+"""
+
+import argparse
+import inspect
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zFunc.zFunc_modules.func_cache import CallableCache, injection_plan
+from zCLI.subsystems.zFunc.zFunc_modules.func_resolver import resolve_callable
+
+LOGGER = logging.getLogger("zfunc_bench")
+
+
+def write_plugin(directory, functions):
+    """Plugin with a few imports and `functions` small functions; returns its path."""
+    lines = ["import json", "import re", "from datetime import datetime", ""]
+    for i in range(functions):
+        lines.append(f"def fn_{i}(value, zcli=None, context=None):")
+        lines.append(f"    return json.dumps({{'fn': {i}, 'value': value}})")
+        lines.append("")
+    path = Path(directory) / "bench_plugin.py"
+    path.write_text("\n".join(lines))
+    return str(path)
+
+
+def run_uncached(path, calls, functions):
+    """Calls/sec with a fresh module execution + signature per call."""
+    start = time.perf_counter()
+    for i in range(calls):
+        func = resolve_callable(path, f"fn_{i % functions}", LOGGER)
+        params = inspect.signature(func).parameters
+        func(i, zcli=None) if "zcli" in params else func(i)
+    elapsed = time.perf_counter() - start
+    return calls / elapsed if elapsed else float("inf")
+
+
+def run_cached(path, calls, functions):
+    """Calls/sec through CallableCache + memoized injection plans."""
+    cache = CallableCache(LOGGER)
+    start = time.perf_counter()
+    for i in range(calls):
+        func, _plan = cache.resolve(path, f"fn_{i % functions}")
+        func(i, zcli=None) if "zcli" in injection_plan(func) else func(i)
+    elapsed = time.perf_counter() - start
+    return calls / elapsed if elapsed else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zFunc callable benchmark")
+    parser.add_argument("--calls", type=int, default=20000, help="Calls through the cached path")
+    parser.add_argument("--uncached-calls", type=int, default=500, help="Calls through the uncached path (slow)")
+    parser.add_argument("--functions", type=int, default=50, help="Functions in the generated plugin")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="zfunc_bench_") as temp_dir:
+        path = write_plugin(temp_dir, args.functions)
+        uncached = run_uncached(path, args.uncached_calls, args.functions)
+        cached = run_cached(path, args.calls, args.functions)
+
+    print()
+    print("=" * 60)
+    print(f"zFunc resolve + call ({args.functions}-function plugin)")
+    print("=" * 60)
+    print(f"{'path':>10} | {'calls':>8} | {'calls/s':>14} | {'speedup':>9}")
+    print("-" * 60)
+    print(f"{'uncached':>10} | {args.uncached_calls:>8} | {uncached:>14,.0f} | {1.0:>8.1f}x")
+    print(f"{'cached':>10} | {args.calls:>8} | {cached:>14,.0f} | {cached / uncached:>8.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
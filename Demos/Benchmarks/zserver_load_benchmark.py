@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+zServer Load Benchmark - single vs threaded Development serving
+
+Starts zServer twice (concurrency="single" and concurrency="threaded") against
+the same routes file and measures requests/sec as client concurrency grows.
+
+Usage:
+    python Demos/Benchmarks/zserver_load_benchmark.py
+    python Demos/Benchmarks/zserver_load_benchmark.py --render-ms 20 --requests 400
+
+--render-ms simulates a slow route (template / PageRenderer / form work) by
+sleeping inside the content route handler.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI import zCLI
+from zCLI.subsystems.zServer import zServer
+from zCLI.subsystems.zServer.zServer_modules.handler import LoggingHTTPRequestHandler
+
+ROUTES_YAML = """type: server
+meta:
+  base_path: "."
+routes:
+  /:
+    type: content
+    content: "<h1>zServer benchmark</h1>"
+"""
+
+
+def _simulate_render_latency(render_ms):
+    """Wrap the content route so each request spends render_ms in the handler."""
+    if render_ms <= 0:
+        return
+    original = LoggingHTTPRequestHandler._handle_content_route
+
+    def slow_content_route(self, route):
+        time.sleep(render_ms / 1000.0)
+        return original(self, route)
+
+    LoggingHTTPRequestHandler._handle_content_route = slow_content_route
+
+
+def _run_load(url, clients, total_requests):
+    """Fire total_requests GETs from `clients` threads; return (req/s, errors)."""
+    per_client = max(1, total_requests // clients)
+    errors = []
+
+    def worker():
+        for _ in range(per_client):
+            try:
+                with urllib.request.urlopen(url, timeout=30) as resp:
+                    resp.read()
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return (per_client * clients) / elapsed, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zServer load benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--render-ms", type=float, default=10.0, help="Simulated handler latency (ms)")
+    parser.add_argument("--workers", type=int, default=16, help="max_workers for threaded mode")
+    parser.add_argument("--levels", default="1,2,4,8,16,32", help="Client concurrency levels")
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    levels = [int(x) for x in args.levels.split(",")]
+    _simulate_render_latency(args.render_ms)
+
+    serve_dir = tempfile.mkdtemp(prefix="zserver_bench_")
+    with open(os.path.join(serve_dir, "zServer.routes.yaml"), "w") as f:
+        f.write(ROUTES_YAML)
+
+    z = zCLI({"zWorkspace": serve_dir, "zMode": "Terminal", "logger": "ERROR"})
+
+    results = {}
+    for mode in ("single", "threaded"):
+        server = zServer(
+            z.logger, zcli=z, port=args.port, serve_path=serve_dir,
+            routes_file="zServer.routes.yaml", concurrency=mode,
+            max_workers=args.workers, backlog=128
+        )
+        server.start()
+        time.sleep(0.2)
+        url = f"{server.get_url()}/"
+        results[mode] = [_run_load(url, clients, args.requests) for clients in levels]
+        server.stop()
+        time.sleep(0.2)
+
+    print()
+    print("=" * 64)
+    print(f"zServer load benchmark ({args.requests} req/level, render {args.render_ms}ms)")
+    print("=" * 64)
+    print(f"{'clients':>8} | {'single req/s':>14} | {'threaded req/s':>14} | {'speedup':>8}")
+    print("-" * 64)
+    for i, clients in enumerate(levels):
+        single_rps, single_err = results["single"][i]
+        threaded_rps, threaded_err = results["threaded"][i]
+        speedup = threaded_rps / single_rps if single_rps else 0.0
+        errs = f"  (errors: {single_err}/{threaded_err})" if single_err or threaded_err else ""
+        print(f"{clients:>8} | {single_rps:>14.1f} | {threaded_rps:>14.1f} | {speedup:>7.2f}x{errs}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+zServer Precompress Report - bytes saved per asset by .gz/.br sidecars
+
+Runs the zServer precompress step over a folder (default: the bundled zTheme
+CSS/JS/fonts) and prints original vs gzip vs brotli sizes per asset.
+
+Usage:
+    python Demos/Benchmarks/zserver_precompress_report.py
+    python Demos/Benchmarks/zserver_precompress_report.py --path my_app/static --write
+
+Without --write the folder is copied to a temp dir first, so the source tree
+is left untouched. Brotli sizes appear when the optional `brotli` package is
+installed (pip install zolo-zcli[compression]).
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zServer.zServer_modules.compression import (
+    BROTLI_AVAILABLE, precompress_assets, format_compression_report
+)
+
+DEFAULT_PATH = workspace_root / "zCLI" / "utils" / "zTheme"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zServer precompress report")
+    parser.add_argument("--path", default=str(DEFAULT_PATH), help="Folder to precompress")
+    parser.add_argument("--min-size", type=int, default=1024, help="Skip files smaller than this (bytes)")
+    parser.add_argument("--write", action="store_true", help="Write sidecars into --path (default: temp copy)")
+    args = parser.parse_args()
+
+    target = Path(args.path)
+    temp_dir = None
+    if not args.write:
+        temp_dir = tempfile.mkdtemp(prefix="zserver_precompress_")
+        target = Path(shutil.copytree(target, Path(temp_dir) / target.name))
+
+    try:
+        report = precompress_assets(str(target), min_size=args.min_size)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print()
+    print(f"Precompress report: {args.path} (brotli {'on' if BROTLI_AVAILABLE else 'not installed'})")
+    print(format_compression_report(report))
+
+
+if __name__ == "__main__":
+    main()
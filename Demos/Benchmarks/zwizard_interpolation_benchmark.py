@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+zWizard zHat Interpolation Benchmark - per-step re.sub walk vs compiled templates
+
+Builds a wizard whose first step returns a result set of N rows, followed by
+steps that are mostly static (a large zDisplay layout) with a few that reference
+earlier results, and times the interpolation work of one wizard run:
+
+    legacy    Previous interpolate_zhat(): every step rebuilt recursively,
+              re.sub() on every string, repr() of every referenced value
+    compiled  get_zhat_template() + render() only for steps with deps, as
+              zWizard.handle() now does (templates cached across runs)
+
+Usage:
+    python Demos/Benchmarks/zwizard_interpolation_benchmark.py
+    python Demos/Benchmarks/zwizard_interpolation_benchmark.py --rows 10,1000,10000 --runs 20
+"""
+
+import argparse
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zWizard.zWizard_modules.wizard_hat import WizardHat
+from zCLI.subsystems.zWizard.zWizard_modules.wizard_interpolation import (
+    ZHAT_PATTERN, ZHAT_FALLBACK, STR_QUOTE_CHARS, get_zhat_template,
+)
+
+STATIC_STEPS = 20
+
+
+def legacy_interpolate(step_value, zHat, logger):
+    """Previous interpolate_zhat() (recursive rebuild + re.sub per string)."""
+    if isinstance(step_value, str):
+        def repl(match):
+            key = match.group(1)
+            if key.isdigit():
+                idx = int(key)
+                return repr(zHat[idx]) if idx < len(zHat) else ZHAT_FALLBACK
+            key_clean = key.strip(STR_QUOTE_CHARS)
+            if key_clean in zHat:
+                return repr(zHat[key_clean])
+            return ZHAT_FALLBACK
+        return re.sub(ZHAT_PATTERN, repl, step_value)
+    if isinstance(step_value, dict):
+        return {k: legacy_interpolate(v, zHat, logger) for k, v in step_value.items()}
+    if isinstance(step_value, list):
+        return [legacy_interpolate(item, zHat, logger) for item in step_value]
+    return step_value
+
+
+def build_workflow():
+    """fetch, STATIC_STEPS static layout steps, then two steps using the results."""
+    workflow = {"fetch": {"zData": {"action": "read", "model": "users"}}}
+    for i in range(STATIC_STEPS):
+        workflow[f"layout_{i}"] = {"zDisplay": {
+            "event": "table",
+            "columns": [{"name": f"col_{c}", "label": f"Column {c}", "width": 12} for c in range(10)],
+            "rows": [[f"cell {r}.{c}" for c in range(10)] for r in range(10)],
+        }}
+    workflow["render"] = {"zDisplay": {"event": "table", "rows": "zHat[fetch]"}}
+    workflow["summary"] = {"zDisplay": {"event": "text", "content": "Loaded zHat[count] users"}}
+    return workflow
+
+
+def build_hat(rows):
+    """WizardHat as it looks before 'render' runs."""
+    zHat = WizardHat()
+    zHat.add("fetch", [{"id": i, "name": f"user_{i}", "email": f"user_{i}@example.com"} for i in range(rows)])
+    zHat.add("count", rows)
+    return zHat
+
+
+def run_legacy(workflow, zHat, logger):
+    for key, value in workflow.items():
+        legacy_interpolate(value, zHat, logger)
+
+
+def run_compiled(workflow, zHat, logger):
+    for key, value in workflow.items():
+        template = get_zhat_template(value)
+        if template.deps:
+            template.render(zHat, logger)
+
+
+def best_of(func, runs, *args):
+    """Best wall time of runs calls, in seconds."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zWizard zHat interpolation benchmark")
+    parser.add_argument("--rows", default="10,1000,10000", help="Comma-separated result set sizes")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per size (best is reported)")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("zwizard_interpolation_benchmark")
+    workflow = build_workflow()
+    results = []
+    for rows in (int(r) for r in args.rows.split(",")):
+        zHat = build_hat(rows)
+        run_compiled(workflow, zHat, logger)  # first run compiles
+        legacy = best_of(run_legacy, args.runs, workflow, zHat, logger)
+        compiled = best_of(run_compiled, args.runs, workflow, zHat, logger)
+        results.append((rows, legacy, compiled))
+
+    print()
+    print("=" * 62)
+    print(f"zWizard interpolation, {len(workflow)} steps per run (best of {args.runs})")
+    print("=" * 62)
+    print(f"{'rows':>8} | {'legacy ms':>11} | {'compiled ms':>12} | {'speedup':>9}")
+    print("-" * 62)
+    for rows, legacy, compiled in results:
+        print(f"{rows:>8} | {legacy * 1000:>11.3f} | {compiled * 1000:>12.3f} | {legacy / compiled:>8.1f}x")
+    print("=" * 62)
+
+
+if __name__ == "__main__":
+    main()
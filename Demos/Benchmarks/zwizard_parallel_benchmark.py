@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+zWizard Parallel Steps Benchmark - sequential vs _parallel wizard latency
+
+Runs a wizard of N independent I/O-bound steps (each sleeps --latency ms, like
+a zData read or an HTTP zFunc call) plus one step that combines their results,
+through zWizard.handle() with a stub dispatcher, and reports end-to-end latency
+from wizard.last_run_stats:
+
+    sequential    default mode, steps one after another
+    parallel      _parallel: true (bounded pool, default 8 workers)
+
+Usage:
+    python Demos/Benchmarks/zwizard_parallel_benchmark.py
+    python Demos/Benchmarks/zwizard_parallel_benchmark.py --steps 2,4,8,16 --latency 50
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zWizard import zWizard
+
+
+def build_workflow(steps, parallel):
+    """steps independent fetches and a combine step referencing all of them."""
+    workflow = {"_parallel": True} if parallel else {}
+    for i in range(steps):
+        workflow[f"fetch_{i}"] = {"zFunc": f"&io.fetch({i})"}
+    refs = ", ".join(f"zHat[fetch_{i}]" for i in range(steps))
+    workflow["combine"] = {"zFunc": f"&io.combine({refs})"}
+    return workflow
+
+
+def make_wizard(latency):
+    """Walker-mode zWizard whose dispatcher sleeps latency seconds per fetch."""
+    def dispatch(key, value, context=None):
+        if key.startswith("fetch_"):
+            time.sleep(latency)
+        return key
+
+    logger = logging.getLogger("zwizard_parallel_benchmark")
+    walker = SimpleNamespace(
+        zSession={"bench": True}, logger=logger, display=None, zcli=None,
+        dispatch=SimpleNamespace(handle=dispatch),
+    )
+    return zWizard(walker=walker)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zWizard parallel steps benchmark")
+    parser.add_argument("--steps", default="2,4,8,16", help="Comma-separated independent step counts")
+    parser.add_argument("--latency", type=float, default=20, help="Per-step I/O latency in ms")
+    args = parser.parse_args()
+
+    wizard = make_wizard(args.latency / 1000)
+    results = []
+    for steps in (int(s) for s in args.steps.split(",")):
+        wizard.handle(build_workflow(steps, parallel=False))
+        sequential = wizard.last_run_stats["elapsed_ms"]
+        wizard.handle(build_workflow(steps, parallel=True))
+        stats = wizard.last_run_stats
+        results.append((steps, sequential, stats["elapsed_ms"], stats["max_in_flight"]))
+
+    print()
+    print("=" * 66)
+    print(f"zWizard end-to-end latency, {args.latency:.0f} ms per independent step")
+    print("=" * 66)
+    print(f"{'steps':>6} | {'sequential ms':>14} | {'parallel ms':>12} | {'speedup':>8} | {'in flight':>9}")
+    print("-" * 66)
+    for steps, sequential, parallel, in_flight in results:
+        print(f"{steps:>6} | {sequential:>14.1f} | {parallel:>12.1f} | {sequential / parallel:>7.1f}x | {in_flight:>9}")
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+zWizard Block Plan Micro-Benchmark - per-call key scans vs compiled BlockPlan
+
+Builds synthetic menu blocks (one `~Root*` menu followed by N items, every
+tenth item carrying an empty `_rbac` dict) and times one full menu pass: the menu
+selects each item in turn, the item runs, the loop returns to the menu, and so on
+until the menu returns zBack.
+
+    legacy    Previous execute_loop: key list rebuilt per call, keys_list.index()
+              per jump, backwards scan for the menu anchor after every item,
+              check_rbac_access() on every key
+    plan      zWizard.execute_loop with the BlockPlan cached in SystemCache
+
+Usage:
+    python Demos/Benchmarks/zwizard_plan_benchmark.py
+    python Demos/Benchmarks/zwizard_plan_benchmark.py --sizes 10,100,1000 --passes 20
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+workspace_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from zCLI.subsystems.zLoader.loader_modules.loader_cache_system import SystemCache
+from zCLI.subsystems.zWizard.zWizard import zWizard, NAVIGATION_SIGNALS
+from zCLI.subsystems.zWizard.zWizard_modules.wizard_rbac import check_rbac_access, RBAC_ACCESS_DENIED
+
+MENU_KEY = "~Root*"
+UI_CACHE_KEY = "zUI_/bench/zUI.synthetic.yaml"
+
+
+def build_block(size):
+    """Menu key followed by size items (every tenth with an empty _rbac)."""
+    block = {MENU_KEY: [f"item_{i}" for i in range(size)]}
+    for i in range(size):
+        item = {"zDisplay": {"event": "text", "content": f"Item {i}"}}
+        if i % 10 == 0:
+            item["_rbac"] = {}
+        block[f"item_{i}"] = item
+    return block
+
+
+def make_dispatch(size):
+    """Menu picks item_0..item_{size-1}, then zBack; items return None."""
+    state = {"next": 0}
+
+    def dispatch(key, value):
+        if key != MENU_KEY:
+            return None
+        if state["next"] >= size:
+            state["next"] = 0
+            return "zBack"
+        selection = f"item_{state['next']}"
+        state["next"] += 1
+        return selection
+    return dispatch
+
+
+def legacy_execute_loop(wizard, items_dict, dispatch_fn):
+    """Previous execute_loop control flow (display/callback paths omitted)."""
+    keys_list = [k for k in items_dict.keys() if not k.startswith('_')]
+    idx = 0
+    while idx < len(keys_list):
+        key = keys_list[idx]
+        value = items_dict[key]
+        if check_rbac_access(key, value, wizard.zcli, wizard.walker, wizard.logger, wizard.display) == RBAC_ACCESS_DENIED:
+            idx += 1
+            continue
+        result = dispatch_fn(key, value)
+        if isinstance(result, str) and result in keys_list and result not in NAVIGATION_SIGNALS:
+            idx = keys_list.index(result)
+            continue
+        if result in NAVIGATION_SIGNALS:
+            return result
+        menu_idx = None
+        for i in range(idx - 1, -1, -1):
+            check_key = keys_list[i]
+            if '~' in check_key and '*' in check_key:
+                menu_idx = i
+                break
+        if menu_idx is not None:
+            idx = menu_idx
+            continue
+        idx += 1
+    return None
+
+
+def make_wizard(block):
+    """Walker-mode zWizard without display, with a SystemCache holding the block's UI."""
+    logger = logging.getLogger("zwizard_plan_benchmark")
+    logger.setLevel(logging.WARNING)
+    cache = SystemCache({}, logger)
+    cache.set(UI_CACHE_KEY, {"Root": block})
+    walker = SimpleNamespace(
+        zSession={"bench": True}, logger=logger, display=None, zcli=None,
+        loader=SimpleNamespace(cache=SimpleNamespace(schema_cache=None, system_cache=cache)),
+    )
+    return zWizard(walker=walker), cache
+
+
+def time_passes(run, passes):
+    """Seconds per pass (best of passes)."""
+    best = float("inf")
+    for _ in range(passes):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zWizard BlockPlan micro-benchmark")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated block sizes")
+    parser.add_argument("--passes", type=int, default=10, help="Timed passes per size (best is reported)")
+    args = parser.parse_args()
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        block = build_block(size)
+        wizard, cache = make_wizard(block)
+        legacy_dispatch = make_dispatch(size)
+        plan_dispatch = make_dispatch(size)
+
+        assert legacy_execute_loop(wizard, block, legacy_dispatch) == "zBack"
+        assert wizard.execute_loop(block, dispatch_fn=plan_dispatch) == "zBack"
+
+        legacy = time_passes(lambda: legacy_execute_loop(wizard, block, legacy_dispatch), args.passes)
+        planned = time_passes(lambda: wizard.execute_loop(block, dispatch_fn=plan_dispatch), args.passes)
+        stats = cache.get_stats()
+        results.append((size, legacy, planned, stats["plan_compiles"]))
+
+    print()
+    print("=" * 70)
+    print(f"zWizard execute_loop, one full menu pass (best of {args.passes})")
+    print("=" * 70)
+    print(f"{'keys':>6} | {'legacy ms':>11} | {'plan ms':>11} | {'speedup':>9} | {'compiles':>9}")
+    print("-" * 70)
+    for size, legacy, planned, compiles in results:
+        print(f"{size:>6} | {legacy * 1000:>11.3f} | {planned * 1000:>11.3f} | "
+              f"{legacy / planned:>8.1f}x | {compiles:>9}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -589,6 +589,28 @@
       });
     }
 
+    /**
+     * Fetch the next page of a streamed table (zTable_start → stream id).
+     * Rows arrive as zTable_chunk display events, followed by zTable_end.
+     * @param {string} stream - Stream id from the zTable_start event
+     * @param {number} rows - Page size (optional, server default otherwise)
+     * @returns {Promise<Object>} {stream, sent, has_more}
+     */
+    async fetchTable(stream, rows = null) {
+      const payload = { event: 'table_fetch', stream: stream };
+      if (rows) payload.rows = rows;
+      return this.send(payload);
+    }
+
+    /**
+     * Discard a streamed table's server-side cursor before it is exhausted
+     * @param {string} stream - Stream id from the zTable_start event
+     * @returns {Promise<Object>} {stream, closed}
+     */
+    async closeTable(stream) {
+      return this.send({ event: 'table_close', stream: stream });
+    }
+
     // ═══════════════════════════════════════════════════════════
     // zCLI Operations
     // ═══════════════════════════════════════════════════════════
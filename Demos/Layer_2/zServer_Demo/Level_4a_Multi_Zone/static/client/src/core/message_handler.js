@@ -88,6 +88,12 @@ export class MessageHandler {
         return;
       }
 
+      // Coalesced display events (requests sent with _batch: true)
+      if (message.event === 'display_batch') {
+        (message.events || []).forEach(event => this.hooks.call('onDisplay', event));
+        return;
+      }
+
       if (message.event === 'input_request' || message.type === 'input_request') {
         this.hooks.call('onInput', message);
         return;
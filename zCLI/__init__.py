@@ -106,6 +106,17 @@ Exported Categories:
     • **Typing Helpers**: Any, Callable, Dict, List, Optional, Tuple, Union
     • **Utilities**: Colors (zCLI color constants), load_dotenv (optional .env support)
 
+DEFERRED IMPORTS
+─────────────────────────────────────────────────────────────────────────────────
+
+requests, websockets, webbrowser and sqlite3 are exported as lazy modules:
+`from zCLI import requests` is free, the module body runs on first attribute
+access (requests alone is ~40% of the package import). ws_serve,
+WebSocketServerProtocol and ws_exceptions are resolved on first import by
+name. A missing dependency still fails at package import, as before.
+Subsystems use lazy_import() the same way for their own heavy optional
+dependencies (e.g. pandas for the CSV backend).
+
 FALLBACK DOTENV IMPLEMENTATION
 ─────────────────────────────────────────────────────────────────────────────────
 
@@ -216,28 +227,64 @@ import re
 import secrets
 import shutil
 import socket
-import sqlite3
 import subprocess
 import sys
 import time
 import traceback
 import typing
 import uuid
-import webbrowser
 from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+
+def lazy_import(name: str) -> Any:
+    """Import name on first attribute access (importlib LazyLoader).
+
+    Returns the module itself if it is already imported. Raises
+    ModuleNotFoundError now, like a plain import, if it is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Heavy modules, loaded on first use (see DEFERRED IMPORTS above)
+sqlite3 = lazy_import("sqlite3")
+webbrowser = lazy_import("webbrowser")
+
 # Third-party imports
-import platformdirs  # pylint: disable=import-error
-import requests  # pylint: disable=import-error
-import yaml  # pylint: disable=import-error
-import websockets  # pylint: disable=import-error
-from websockets import serve as ws_serve  # pylint: disable=import-error
-from websockets.legacy.server import WebSocketServerProtocol  # pylint: disable=import-error
-from websockets import exceptions as ws_exceptions  # pylint: disable=import-error
+import platformdirs  # pylint: disable=import-error,wrong-import-position
+import yaml  # pylint: disable=import-error,wrong-import-position
+requests = lazy_import("requests")
+websockets = lazy_import("websockets")
+
+# websockets names resolved by module __getattr__ on first `from zCLI import ...`
+_DEFERRED_NAMES: Dict[str, Tuple[str, str]] = {
+    "ws_serve": ("websockets", "serve"),
+    "WebSocketServerProtocol": ("websockets.legacy.server", "WebSocketServerProtocol"),
+    "ws_exceptions": ("websockets", "exceptions"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a deferred export (PEP 562) and cache it on the package."""
+    if name not in _DEFERRED_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _DEFERRED_NAMES[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
 # Optional third-party helper (fallback implementation if python-dotenv missing)
 if importlib.util.find_spec("dotenv") is not None:
@@ -321,7 +368,7 @@ __all__: List[str] = [
     "Any", "Callable", "Dict", "List", "Optional", "Tuple", "Union",
 
     # Third-party helpers
-    "load_dotenv",
+    "load_dotenv", "lazy_import",
 
     # Utils
     "Colors",
@@ -228,7 +228,7 @@ For multi-threaded applications:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-from typing import Any, Optional, Dict, Union, List
+from typing import Any, Optional, Dict, Union, List, Tuple
 
 # zConfig imports (session constants)
 from ..zConfig.zConfig_modules.config_session import SESSION_KEY_ZAUTH
@@ -902,6 +902,21 @@ class zAuth:
     # RBAC - CONTEXT-AWARE (Facade → rbac module)
     # ════════════════════════════════════════════════════════════════════════════
     
+    def get_current_role(self) -> Optional[Union[str, Tuple[str, str]]]:
+        """
+        Get the current user's role(s) from the active context.
+        
+        Delegates to: rbac.get_current_role()
+        
+        Returns:
+            Optional[Union[str, Tuple[str, str]]]: Role string, (zsession_role, app_role)
+                tuple in "dual" context, or None if no role is assigned
+        
+        Example:
+            role = zcli.auth.get_current_role()  # e.g. "admin"
+        """
+        return self.rbac.get_current_role()
+    
     def has_role(self, required_role: Union[str, List[str], None]) -> bool:
         """
         Check if the current user has the required role (context-aware).
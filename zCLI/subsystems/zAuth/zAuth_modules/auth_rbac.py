@@ -75,6 +75,20 @@ Permissions are stored per user_id and checked against the current user's ID
 from the active context. In dual-mode, permissions are checked for BOTH user IDs
 (zSession and application) with OR logic.
 
+Permission Snapshot
+-------------------
+has_permission() does not query per permission. Each user's full permission set
+is loaded with one SELECT and kept in memory, so a check (single permission or
+list, one or both user IDs) is a set lookup. A snapshot is dropped when:
+    - grant_permission()/revoke_permission() run in this process (they bump a
+      process-wide version counter; the writing instance updates its own
+      snapshot in place - write-through)
+    - it is older than the TTL (zSpark "permission_cache_ttl" or
+      ZOLO_PERMISSION_CACHE_TTL, default 30s) - bounds staleness when another
+      process edits user_permissions
+A TTL of 0 disables the snapshot. get_permission_cache_stats() reports hits vs
+DB queries.
+
 Security Model
 --------------
     - Permissions are explicitly granted by admins (whitelist approach)
@@ -146,9 +160,12 @@ See MODULE CONSTANTS section below for all 38 defined constants:
     - Defaults: DEFAULT_GRANTED_BY
 """
 
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, Dict, Union, Tuple, List
+from typing import Optional, Any, Dict, Union, Tuple, List, FrozenSet
 
 # Import zConfig constants for session structure and three-tier authentication
 from zCLI.subsystems.zConfig.zConfig_modules.config_session import (
@@ -202,6 +219,14 @@ QUERY_LEN_ZERO = 0
 # Defaults
 DEFAULT_GRANTED_BY = "system"
 
+# Permission Snapshot (per-user permission sets held in memory)
+DEFAULT_PERMISSION_CACHE_TTL = 30.0  # seconds; bounds staleness across processes
+ZSPARK_PERMISSION_CACHE_TTL = "permission_cache_ttl"
+ENV_PERMISSION_CACHE_TTL = "ZOLO_PERMISSION_CACHE_TTL"
+STAT_HITS = "hits"
+STAT_DB_QUERIES = "db_queries"
+STAT_INVALIDATIONS = "invalidations"
+
 # Logging Messages
 LOG_PREFIX = "[RBAC]"
 LOG_NOT_AUTHENTICATED = "User not authenticated, role check failed"
@@ -231,6 +256,21 @@ LOG_CONTEXT_DUAL = "Checking role in dual context (OR logic)"
 LOG_DUAL_ROLE_MATCH = "Role matched in dual context"
 LOG_NO_ACTIVE_APP = "No active application in session"
 LOG_UNKNOWN_CONTEXT = "Unknown active context"
+LOG_PERMISSIONS_LOADED = "Loaded permission snapshot"
+LOG_INVALID_CACHE_TTL = "Invalid permission cache TTL, using default"
+
+
+# Bumped by every grant/revoke in this process; snapshots from an older version are reloaded
+_permission_version = 0
+_permission_version_lock = threading.Lock()
+
+
+def _bump_permission_version() -> int:
+    """Invalidate every RBAC instance's permission snapshot in this process."""
+    global _permission_version  # pylint: disable=global-statement
+    with _permission_version_lock:
+        _permission_version += 1
+        return _permission_version
 
 
 # =============================================================================
@@ -247,8 +287,8 @@ class RBAC:
     Features:
         - Context-aware role checks (zSession/Application/Dual)
         - Multi-app RBAC (different roles per application)
-        - Context-aware permission checks (database-backed)
-        - Permission grant/revoke (admin operations)
+        - Context-aware permission checks (database-backed, in-memory snapshot)
+        - Permission grant/revoke (admin operations, write-through)
         - Dual-mode OR logic (either context can grant access)
         - SQLite-backed permissions database
         - Integration with three-tier authentication (Week 6.3)
@@ -288,6 +328,8 @@ class RBAC:
     session: Dict[str, Any]
     logger: Any
     _permissions_db_initialized: bool
+    permission_cache_ttl: float
+    _permission_cache: Dict[str, Tuple[FrozenSet[str], int, float]]
     
     def __init__(self, zcli: Any) -> None:
         """
@@ -299,6 +341,7 @@ class RBAC:
         Notes:
             - Stores references to zcli.session and zcli.logger for convenience
             - Permissions database is lazily initialized on first use
+            - Permission snapshot TTL from zSpark/env (see module docstring)
             - No authentication checks in __init__ (happens per-method)
         
         Example:
@@ -310,6 +353,9 @@ class RBAC:
         self.session = zcli.session
         self.logger = zcli.logger
         self._permissions_db_initialized = False
+        self.permission_cache_ttl = self._resolve_cache_ttl()
+        self._permission_cache = {}  # user_id → (permissions, version, loaded_at)
+        self._permission_stats = {STAT_HITS: 0, STAT_DB_QUERIES: 0, STAT_INVALIDATIONS: 0}
     
     # =========================================================================
     # CONTEXT-AWARE HELPER METHODS (Private)
@@ -623,6 +669,20 @@ class RBAC:
     # PUBLIC API - CONTEXT-AWARE ROLE & PERMISSION CHECKS
     # =========================================================================
     
+    def get_current_role(self) -> Optional[Union[str, Tuple[str, str]]]:
+        """
+        Get the current user's role(s) from the active authentication context.
+        
+        Returns:
+            Optional[Union[str, Tuple[str, str]]]: Role, (zsession_role, app_role)
+                in dual context, or None if no role is assigned
+        
+        Example:
+            >>> rbac.get_current_role()
+            'admin'
+        """
+        return self._get_current_role()
+    
     def has_role(self, required_role: Optional[Union[str, List[str]]]) -> bool:
         """
         Check if the current user has the required role (context-aware).
@@ -727,8 +787,9 @@ class RBAC:
                 - Returns True if EITHER user ID has the required permission
         
         Implementation:
-            Queries the user_permissions table from zSchema.auth.yaml
-            to check if the user has been granted the specified permission.
+            Looks the permission(s) up in each user ID's permission snapshot,
+            loaded from the user_permissions table with one SELECT per user
+            (see _get_user_permissions()).
         
         Examples:
             >>> rbac = RBAC(zcli)
@@ -757,92 +818,131 @@ class RBAC:
             self._log("debug", LOG_NO_USER_ID)
             return False
         
+        if isinstance(required_permission, str):
+            required = (required_permission,)
+        elif isinstance(required_permission, list):
+            required = tuple(required_permission)
+        else:
+            self._log("warning", f"{LOG_INVALID_PERMISSION_TYPE}: {type(required_permission)}")
+            return False
+        
         try:
             # Ensure permissions database is loaded
             self.ensure_permissions_db()
             
             # Dual context: Check permissions for BOTH user IDs (OR logic)
-            if isinstance(user_id, tuple):
-                zsession_id, app_id = user_id
-                
-                # Single permission check (str)
-                if isinstance(required_permission, str):
-                    # Check zSession user
-                    if zsession_id:
-                        results = self.zcli.data.select(
-                            table=TABLE_PERMISSIONS,
-                            where=f"{FIELD_USER_ID} = '{zsession_id}' AND {FIELD_PERMISSION} = '{required_permission}'",
-                            limit=QUERY_LIMIT_ONE
-                        )
-                        if results and len(results) > QUERY_LEN_ZERO:
-                            return True
-                    
-                    # Check app user
-                    if app_id:
-                        results = self.zcli.data.select(
-                            table=TABLE_PERMISSIONS,
-                            where=f"{FIELD_USER_ID} = '{app_id}' AND {FIELD_PERMISSION} = '{required_permission}'",
-                            limit=QUERY_LIMIT_ONE
-                        )
-                        if results and len(results) > QUERY_LEN_ZERO:
-                            return True
-                    
-                    return False
-                
-                # Multiple permissions check (list) - OR logic
-                if isinstance(required_permission, list):
-                    for perm in required_permission:
-                        # Check zSession user
-                        if zsession_id:
-                            results = self.zcli.data.select(
-                                table=TABLE_PERMISSIONS,
-                                where=f"{FIELD_USER_ID} = '{zsession_id}' AND {FIELD_PERMISSION} = '{perm}'",
-                                limit=QUERY_LIMIT_ONE
-                            )
-                            if results and len(results) > QUERY_LEN_ZERO:
-                                return True
-                        
-                        # Check app user
-                        if app_id:
-                            results = self.zcli.data.select(
-                                table=TABLE_PERMISSIONS,
-                                where=f"{FIELD_USER_ID} = '{app_id}' AND {FIELD_PERMISSION} = '{perm}'",
-                                limit=QUERY_LIMIT_ONE
-                            )
-                            if results and len(results) > QUERY_LEN_ZERO:
-                                return True
-                    
-                    return False
-            
-            # Single context: Standard permission check
-            # Single permission check (str)
-            if isinstance(required_permission, str):
-                results = self.zcli.data.select(
-                    table=TABLE_PERMISSIONS,
-                    where=f"{FIELD_USER_ID} = '{user_id}' AND {FIELD_PERMISSION} = '{required_permission}'",
-                    limit=QUERY_LIMIT_ONE
-                )
-                return len(results) > QUERY_LEN_ZERO if results else False
-            
-            # Multiple permissions check (list) - OR logic
-            if isinstance(required_permission, list):
-                for perm in required_permission:
-                    results = self.zcli.data.select(
-                        table=TABLE_PERMISSIONS,
-                        where=f"{FIELD_USER_ID} = '{user_id}' AND {FIELD_PERMISSION} = '{perm}'",
-                        limit=QUERY_LIMIT_ONE
-                    )
-                    if results and len(results) > QUERY_LEN_ZERO:
-                        return True
-                return False
-            
-            self._log("warning", f"{LOG_INVALID_PERMISSION_TYPE}: {type(required_permission)}")
+            user_ids = user_id if isinstance(user_id, tuple) else (user_id,)
+            for uid in user_ids:
+                if uid and not self._get_user_permissions(uid).isdisjoint(required):
+                    return True
             return False
             
         except Exception as e:
             self._log("error", f"{LOG_PERMISSION_ERROR}: {e}")
             return False
     
+    # =========================================================================
+    # PERMISSION SNAPSHOT
+    # =========================================================================
+    
+    def _resolve_cache_ttl(self) -> float:
+        """
+        Permission snapshot TTL in seconds (zSpark, then env var, then default).
+        
+        Returns:
+            float: TTL (0 disables the snapshot)
+        """
+        zspark = getattr(self.zcli, "zspark_obj", None) or {}
+        value = zspark.get(ZSPARK_PERMISSION_CACHE_TTL, os.environ.get(ENV_PERMISSION_CACHE_TTL))
+        if value is None:
+            return DEFAULT_PERMISSION_CACHE_TTL
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            self._log("warning", f"{LOG_INVALID_CACHE_TTL}: {value!r}")
+            return DEFAULT_PERMISSION_CACHE_TTL
+    
+    def _get_user_permissions(self, user_id: str) -> FrozenSet[str]:
+        """
+        Get all permissions of user_id, from the snapshot or one SELECT.
+        
+        Args:
+            user_id: User ID (zSession or application)
+        
+        Returns:
+            FrozenSet[str]: Granted permission names
+        """
+        user_id = str(user_id)
+        cached = self._permission_cache.get(user_id)
+        if cached is not None:
+            permissions, version, loaded_at = cached
+            if version == _permission_version and time.monotonic() - loaded_at < self.permission_cache_ttl:
+                self._permission_stats[STAT_HITS] += 1
+                return permissions
+        
+        version = _permission_version  # Read before the query so a concurrent grant is not masked
+        rows = self.zcli.data.select(
+            table=TABLE_PERMISSIONS,
+            fields=[FIELD_PERMISSION],
+            where={FIELD_USER_ID: user_id}
+        )
+        self._permission_stats[STAT_DB_QUERIES] += 1
+        permissions = frozenset(row[FIELD_PERMISSION] for row in rows or [] if row.get(FIELD_PERMISSION))
+        if self.permission_cache_ttl > 0:
+            self._permission_cache[user_id] = (permissions, version, time.monotonic())
+        self._log("debug", f"{LOG_PERMISSIONS_LOADED} '{user_id}': {len(permissions)} permission(s)")
+        return permissions
+    
+    def _write_through(self, user_id: str, permission: str, granted: bool) -> None:
+        """
+        Invalidate other snapshots and apply a grant/revoke to this instance's copy.
+        
+        Args:
+            user_id: User whose permissions changed
+            permission: Permission granted or revoked
+            granted: True for grant, False for revoke
+        """
+        user_id = str(user_id)
+        version = _bump_permission_version()
+        self._permission_stats[STAT_INVALIDATIONS] += 1
+        cached = self._permission_cache.get(user_id)
+        if cached is None:
+            return
+        permissions = set(cached[0])
+        if granted:
+            permissions.add(permission)
+        else:
+            permissions.discard(permission)
+        self._permission_cache[user_id] = (frozenset(permissions), version, cached[2])
+    
+    def clear_permission_cache(self) -> None:
+        """Drop every permission snapshot (next check reloads from the database)."""
+        self._permission_cache.clear()
+        self._permission_stats[STAT_INVALIDATIONS] += 1
+    
+    def get_permission_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get permission snapshot statistics.
+        
+        Returns:
+            Dict with hits, db_queries, invalidations, hit_rate, cached users,
+            ttl and the process-wide version
+        
+        Example:
+            >>> rbac.get_permission_cache_stats()
+            {'hits': 41, 'db_queries': 2, 'invalidations': 1, 'hit_rate': '95.3%', ...}
+        """
+        hits = self._permission_stats[STAT_HITS]
+        queries = self._permission_stats[STAT_DB_QUERIES]
+        total = hits + queries
+        return {
+            **self._permission_stats,
+            "hit_rate": f"{(hits / total * 100):.1f}%" if total else "0.0%",
+            "users": len(self._permission_cache),
+            "ttl": self.permission_cache_ttl,
+            "version": _permission_version,
+        }
+    
     # =========================================================================
     # ADMIN OPERATIONS - PERMISSION MANAGEMENT
     # =========================================================================
@@ -927,6 +1027,8 @@ class RBAC:
                 values=[user_id, permission, granted_by, datetime.now().isoformat()]
             )
             
+            self._write_through(user_id, permission, granted=True)
+            
             self._log("info", f"{LOG_PERMISSION_GRANTED} '{permission}' to user '{user_id}' by '{granted_by}'")
             return True
             
@@ -967,6 +1069,8 @@ class RBAC:
                 where=f"{FIELD_USER_ID} = '{user_id}' AND {FIELD_PERMISSION} = '{permission}'"
             )
             
+            self._write_through(user_id, permission, granted=False)
+            
             self._log("info", f"{LOG_PERMISSION_REVOKED} '{permission}' from user '{user_id}'")
             return True
             
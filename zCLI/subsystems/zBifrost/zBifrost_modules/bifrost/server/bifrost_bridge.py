@@ -11,6 +11,8 @@ Architecture:
     - Event-Driven: Messages route through centralized event map to domain-specific handlers
     - Modular Components: CacheManager, AuthenticationManager, MessageHandler, ConnectionInfoManager
     - Async/Await: Full async support for non-blocking I/O and concurrent connections
+    - Pipelining: Requests carrying a _requestId run concurrently per connection
+      (bounded by max_in_flight); blocking work goes to a fair, bounded executor
     - Health Monitoring: Built-in health check API for service monitoring
     - Graceful Shutdown: Timeout-based shutdown with client notification
 
@@ -18,13 +20,13 @@ Key Responsibilities:
     - WebSocket server lifecycle (start, stop, health checks)
     - Client connection management (authentication, registration, cleanup)
     - Message routing and event dispatch
-    - Broadcasting to multiple clients
+    - Broadcasting to topic subscribers (concurrent, bounded per-client queues)
     - Integration with zCLI configuration and logging systems
 """
 
 from zCLI import (
     asyncio, json,
-    Optional, Dict, Any,
+    Optional, Dict, Any, List, Union,
     ws_serve, WebSocketServerProtocol, ws_exceptions
 )
 from zCLI.subsystems.zComm.zComm_modules.comm_websocket_auth import WebSocketAuth
@@ -32,13 +34,17 @@ from .modules import (
     CacheManager,
     AuthenticationManager,
     MessageHandler,
-    ConnectionInfoManager
+    ConnectionInfoManager,
+    FairExecutor,
+    RequestPipeline,
+    FanoutHub
 )
 from .modules.events import (
     ClientEvents,
     CacheEvents,
     DiscoveryEvents,
-    DispatchEvents
+    DispatchEvents,
+    TableEvents
 )
 
 # ═══════════════════════════════════════════════════════════
@@ -52,6 +58,10 @@ DEFAULT_REQUIRE_AUTH = True
 DEFAULT_ALLOWED_ORIGINS = []
 DEFAULT_QUERY_TTL = 60
 DEFAULT_SHUTDOWN_TIMEOUT = 5.0
+DEFAULT_CACHE_SWEEP_INTERVAL = 30.0  # seconds between expired query-cache sweeps
+DEFAULT_MAX_IN_FLIGHT = 8  # Pipelined requests per connection
+DEFAULT_WORKER_THREADS = None  # None = min(32, cpu_count + 4)
+DEFAULT_SEND_QUEUE_SIZE = 256  # Queued broadcasts per client before it counts as slow
 
 # Port Validation
 PORT_MIN = 1
@@ -76,8 +86,6 @@ LOG_MISSING_EVENT = f"{LOG_PREFIX} Message missing 'event' field and cannot be i
 LOG_UNKNOWN_EVENT = f"{LOG_PREFIX} Unknown event: {{event}}"
 LOG_ERROR_HANDLING_EVENT = f"{LOG_PREFIX} Error handling event '{{event}}': {{error}}"
 LOG_BROADCASTING = f"{LOG_PREFIX} [BROADCAST] Broadcasting to {{count}} other clients"
-LOG_SENT = f"{LOG_PREFIX} [SENT] Sent to {{remote_addr}}"
-LOG_BROADCAST_SKIPPED = f"{LOG_PREFIX} [BROADCAST] Skipped client (closed or error): {{error}}"
 LOG_LIVE_SOCKET = "[OK] LIVE zSocket loaded"
 LOG_SECURITY = "[SECURITY] Security: Auth={{auth}}, Origins={{origins}}"
 LOG_HANDLER = "[HANDLER] Handler = {{name}}, args = {{args}}"
@@ -99,6 +107,9 @@ LOG_SYNC_FORCE_CLOSING = f"{LOG_PREFIX} Forcefully closing {{count}} connections
 LOG_SYNC_CLOSED = f"{LOG_PREFIX} Server closed (sync)"
 LOG_SYNC_ERROR = f"{LOG_PREFIX} Sync close error: {{error}}"
 LOG_SYNC_COMPLETE = f"{LOG_PREFIX} Sync shutdown complete"
+LOG_CACHE_SWEPT = f"{LOG_PREFIX} [CACHE] Swept {{count}} expired query entries"
+LOG_PIPELINED = f"{LOG_PREFIX} [PIPELINE] Request {{request_id}} ({{event}}) started, in flight: {{count}}"
+LOG_BACKGROUND_TASK = f"{LOG_PREFIX} Created background task for event: {{event}}"
 
 # JSON Message Keys
 KEY_EVENT = "event"
@@ -111,6 +122,7 @@ KEY_ACTION = "action"
 KEY_ZKEY = "zKey"
 KEY_CMD = "cmd"
 KEY_USER = "user"
+KEY_REQUEST_ID = "_requestId"
 
 # Event Names
 EVENT_CONNECTION_INFO = "connection_info"
@@ -123,6 +135,27 @@ EVENT_SET_CACHE_TTL = "set_cache_ttl"
 EVENT_DISCOVER = "discover"
 EVENT_INTROSPECT = "introspect"
 EVENT_DISPATCH = "dispatch"
+EVENT_EXECUTE_WALKER = "execute_walker"
+EVENT_LOAD_PAGE = "load_page"
+EVENT_FORM_SUBMIT = "form_submit"
+EVENT_SUBSCRIBE = "subscribe"
+EVENT_UNSUBSCRIBE = "unsubscribe"
+EVENT_TABLE_FETCH = "table_fetch"
+EVENT_TABLE_CLOSE = "table_close"
+
+# Built-in events are awaited by the connection's read loop (custom handlers run
+# as background tasks so they can wait on input_response).
+BUILTIN_EVENTS = frozenset({
+    EVENT_INPUT_RESPONSE, EVENT_CONNECTION_INFO, EVENT_GET_SCHEMA,
+    EVENT_CLEAR_CACHE, EVENT_CACHE_STATS, EVENT_SET_CACHE_TTL,
+    EVENT_DISCOVER, EVENT_INTROSPECT, EVENT_DISPATCH,
+    EVENT_EXECUTE_WALKER, EVENT_LOAD_PAGE, EVENT_FORM_SUBMIT,
+    EVENT_SUBSCRIBE, EVENT_UNSUBSCRIBE, EVENT_TABLE_FETCH, EVENT_TABLE_CLOSE
+})
+
+# Built-in events that run concurrently when they carry a _requestId. Walker
+# events stay sequential: they share the session's zCrumbs and display buffer.
+PIPELINED_EVENTS = frozenset({EVENT_DISPATCH, EVENT_GET_SCHEMA, EVENT_FORM_SUBMIT, EVENT_TABLE_FETCH})
 
 # Health Check Keys
 HEALTH_RUNNING = "running"
@@ -132,6 +165,10 @@ HEALTH_URL = "url"
 HEALTH_CLIENTS = "clients"
 HEALTH_AUTHENTICATED_CLIENTS = "authenticated_clients"
 HEALTH_REQUIRE_AUTH = "require_auth"
+HEALTH_IN_FLIGHT = "in_flight"
+HEALTH_EXECUTOR = "executor"
+HEALTH_FANOUT = "fanout"
+HEALTH_TABLE_STREAMS = "table_streams"
 
 # Error/Reason Messages
 ERROR_INVALID_ORIGIN = "Invalid origin"
@@ -170,6 +207,9 @@ class zBifrost:
         AuthenticationManager: Client authentication and origin validation
         MessageHandler: Message routing and command dispatch
         ConnectionInfoManager: Server metadata for client discovery
+        FairExecutor: Bounded worker threads shared fairly across clients
+        RequestPipeline: Per-connection concurrent requests (one per client)
+        FanoutHub: Topic subscriptions and per-client outbound queues
     
     Lifecycle:
         1. Initialize with logger (required) and optional walker/zcli
@@ -231,16 +271,27 @@ class zBifrost:
             self.host = host or self.ws_config.host
             require_auth = self.ws_config.require_auth
             allowed_origins = self.ws_config.allowed_origins
+            max_in_flight = getattr(self.ws_config, 'max_in_flight', DEFAULT_MAX_IN_FLIGHT)
+            worker_threads = getattr(self.ws_config, 'worker_threads', DEFAULT_WORKER_THREADS)
+            send_queue_size = getattr(self.ws_config, 'send_queue_size', DEFAULT_SEND_QUEUE_SIZE)
         else:
             # Fallback to defaults if zCLI config not available
             self.port = port or DEFAULT_PORT
             self.host = host or DEFAULT_HOST
             require_auth = DEFAULT_REQUIRE_AUTH
             allowed_origins = DEFAULT_ALLOWED_ORIGINS
+            max_in_flight = DEFAULT_MAX_IN_FLIGHT
+            worker_threads = DEFAULT_WORKER_THREADS
+            send_queue_size = DEFAULT_SEND_QUEUE_SIZE
 
         self.clients = set()
         self._running = False  # Track server running state
         self.server = None  # WebSocket server instance
+        self._cache_sweeper = None  # Background task expiring query-cache entries
+        self.max_in_flight = max_in_flight
+        self.pipelines: Dict[WebSocketServerProtocol, RequestPipeline] = {}
+        self.executor = FairExecutor(worker_threads)
+        self.fanout = FanoutHub(logger, send_queue_size)
 
         # Initialize modular components
         self.cache = CacheManager(logger, default_query_ttl=DEFAULT_QUERY_TTL)
@@ -255,7 +306,8 @@ class zBifrost:
         self.message_handler = MessageHandler(
             logger, self.cache, self.zcli, self.walker,
             connection_info_manager=self.connection_info,
-            auth_manager=self.auth
+            auth_manager=self.auth,
+            executor=self.executor
         )
 
         # Initialize event handlers (event-driven architecture)
@@ -263,7 +315,8 @@ class zBifrost:
             'client': ClientEvents(self, auth_manager=self.auth),
             'cache': CacheEvents(self, auth_manager=self.auth),
             'discovery': DiscoveryEvents(self, auth_manager=self.auth),
-            'dispatch': DispatchEvents(self, auth_manager=self.auth)
+            'dispatch': DispatchEvents(self, auth_manager=self.auth),
+            'table': TableEvents(self, auth_manager=self.auth)
         }
 
         # Event map - single registry for all events (like zDisplay)
@@ -271,6 +324,8 @@ class zBifrost:
             # Client events
             EVENT_INPUT_RESPONSE: self.events['client'].handle_input_response,
             EVENT_CONNECTION_INFO: self.events['client'].handle_connection_info,
+            EVENT_SUBSCRIBE: self.events['client'].handle_subscribe,
+            EVENT_UNSUBSCRIBE: self.events['client'].handle_unsubscribe,
 
             # Cache events
             EVENT_GET_SCHEMA: self.events['cache'].handle_get_schema,
@@ -284,13 +339,17 @@ class zBifrost:
 
             # Dispatch events (zDispatch commands)
             EVENT_DISPATCH: self.events['dispatch'].handle_dispatch,
+
+            # Streamed zTable paging (server-side cursors)
+            EVENT_TABLE_FETCH: self.events['table'].handle_fetch,
+            EVENT_TABLE_CLOSE: self.events['table'].handle_close,
             
             # Walker execution events (declarative UI rendering)
-            'execute_walker': self.message_handler._handle_walker_execution,
-            'load_page': self.message_handler._handle_walker_execution,
+            EVENT_EXECUTE_WALKER: self.message_handler._handle_walker_execution,
+            EVENT_LOAD_PAGE: self.message_handler._handle_walker_execution,
             
             # Form submission events (async form handling)
-            'form_submit': self.message_handler._handle_form_submit,
+            EVENT_FORM_SUBMIT: self.message_handler._handle_form_submit,
         }
 
         self.logger.info(LOG_INITIALIZED)
@@ -329,6 +388,8 @@ class zBifrost:
         # Register client
         self.auth.register_client(ws, auth_info)
         self.clients.add(ws)
+        self.pipelines[ws] = RequestPipeline(self.logger, self.max_in_flight)
+        self.events['client'].join_user_topic(ws)
 
         user = auth_info.get(KEY_USER)
         self.logger.info(LOG_CLIENT_AUTHENTICATED.format(user=user, remote_addr=remote_addr))
@@ -380,6 +441,15 @@ class zBifrost:
         """
         if ws in self.clients:
             self.clients.remove(ws)
+        self.fanout.remove(ws)
+
+        pipeline = self.pipelines.pop(ws, None)
+        if pipeline is not None:
+            await pipeline.close()
+
+        table_streams = self.events['table'].streams
+        if table_streams is not None:
+            table_streams.release(ws)
 
         auth_info = self.auth.unregister_client(ws)
         if auth_info:
@@ -430,33 +500,53 @@ class zBifrost:
             await self.broadcast(json.dumps(data), sender=ws)
             return
 
-        # Execute handler
-        # For custom event handlers that may block on user input (like show_inputs),
-        # we need to run them as background tasks to avoid blocking the message loop.
-        # This prevents deadlock when handler awaits input_response that arrives later.
+        # Built-in events are awaited here, one at a time per connection, unless
+        # they carry a _requestId and are pipelineable - then they run as
+        # concurrent tasks (bounded per connection) and reply out of order.
+        # Custom event handlers that may block on user input (like show_inputs)
+        # run as background tasks so they never block the message loop - this
+        # prevents deadlock when a handler awaits an input_response.
+        if event not in BUILTIN_EVENTS:
+            asyncio.create_task(self._run_handler(ws, event, handler, data))
+            self.logger.debug(LOG_BACKGROUND_TASK.format(event=event))
+            return
+
+        request_id = data.get(KEY_REQUEST_ID)
+        pipeline = self.pipelines.get(ws)
+        if event in PIPELINED_EVENTS and request_id is not None and pipeline is not None:
+            await pipeline.submit(request_id, self._run_handler(ws, event, handler, data))
+            self.logger.debug(LOG_PIPELINED.format(
+                request_id=request_id, event=event, count=len(pipeline.in_flight)
+            ))
+            return
+
+        await self._run_handler(ws, event, handler, data)
+
+    async def _run_handler(self, ws: WebSocketServerProtocol, event: str, handler: Any,
+                           data: Dict[str, Any]) -> None:
+        """
+        Run one event handler, reporting failures to the client.
+        
+        Args:
+            ws: WebSocket connection
+            event: Event name (for logging)
+            handler: Event handler coroutine function
+            data: Parsed message (its _requestId is echoed in error responses)
+        """
         try:
-            # Check if this is a built-in event that should be awaited inline
-            builtin_events = {
-                EVENT_INPUT_RESPONSE, EVENT_CONNECTION_INFO, EVENT_GET_SCHEMA, 
-                EVENT_CLEAR_CACHE, EVENT_CACHE_STATS, EVENT_SET_CACHE_TTL,
-                EVENT_DISCOVER, EVENT_INTROSPECT, EVENT_DISPATCH,
-                'execute_walker', 'load_page', 'form_submit'  # Walker and form events need responses
-            }
-            
-            if event in builtin_events:
-                # Built-in events: await normally (they don't block on user input)
-                await handler(ws, data)
-            else:
-                # Custom handlers: run as background task to avoid blocking message loop
-                asyncio.create_task(handler(ws, data))
-                self.logger.debug(f"[zBifrost] Created background task for event: {event}")
+            await handler(ws, data)
         except Exception as e:
             self.logger.error(LOG_ERROR_HANDLING_EVENT.format(event=event, error=e), exc_info=True)
             error_response = {
                 KEY_ERROR: ERROR_FAILED_HANDLE_EVENT.format(event=event),
                 KEY_DETAILS: str(e)
             }
-            await ws.send(json.dumps(error_response))
+            if KEY_REQUEST_ID in data:
+                error_response[KEY_REQUEST_ID] = data[KEY_REQUEST_ID]
+            try:
+                await ws.send(json.dumps(error_response))
+            except ws_exceptions.ConnectionClosed:
+                pass
 
     # ═══════════════════════════════════════════════════════════
     # Health Check
@@ -475,7 +565,12 @@ class zBifrost:
                 - clients (int): Number of connected clients
                 - authenticated_clients (int): Number of authenticated clients
                 - require_auth (bool): Whether authentication is required
+                - in_flight (int): Pipelined requests running across all clients
+                - executor (dict): Worker pool stats (workers, queued, completed, ...)
+                - fanout (dict): Broadcast stats (topics, queued, slow_disconnects, ...)
+                - table_streams (dict|None): Streamed zTable cursors (open, opened, pages, expired)
         """
+        table_streams = self.events['table'].streams
         return {
             HEALTH_RUNNING: self._running,
             HEALTH_HOST: self.host,
@@ -483,35 +578,44 @@ class zBifrost:
             HEALTH_URL: f"ws://{self.host}:{self.port}" if self._running else None,
             HEALTH_CLIENTS: len(self.clients),
             HEALTH_AUTHENTICATED_CLIENTS: len(self.auth.authenticated_clients),
-            HEALTH_REQUIRE_AUTH: self.auth.require_auth
+            HEALTH_REQUIRE_AUTH: self.auth.require_auth,
+            HEALTH_IN_FLIGHT: sum(len(p.in_flight) for p in self.pipelines.values()),
+            HEALTH_EXECUTOR: self.executor.get_stats(),
+            HEALTH_FANOUT: self.fanout.get_stats(),
+            HEALTH_TABLE_STREAMS: table_streams.get_stats() if table_streams is not None else None
         }
 
     # ═══════════════════════════════════════════════════════════
     # Broadcasting
     # ═══════════════════════════════════════════════════════════
 
-    async def broadcast(self, message: str, sender: Optional[WebSocketServerProtocol] = None) -> None:
+    async def broadcast(
+        self,
+        message: Any,
+        sender: Optional[WebSocketServerProtocol] = None,
+        topics: Optional[Union[str, List[str]]] = None
+    ) -> None:
         """
-        Broadcast message to all connected clients except sender.
+        Broadcast message to connected clients except sender.
+        
+        The message is serialized once and queued on each recipient's bounded
+        outbox; sends run concurrently and this call never waits on a socket.
+        Clients whose outbox is full are disconnected as slow consumers.
         
         Args:
-            message: Message string to broadcast
+            message: Message string (dicts are JSON-encoded once)
             sender: Optional sender to exclude from broadcast
+            topics: Topic or topics to deliver to (None = every client)
         """
-        count = len(self.clients) - (1 if sender else 0)
-        self.logger.debug(LOG_BROADCASTING.format(count=count))
+        payload = message if isinstance(message, str) else json.dumps(message)
+        if topics is None:
+            recipients = set(self.clients)
+        else:
+            recipients = self.fanout.subscribers(*([topics] if isinstance(topics, str) else topics))
+        recipients.discard(sender)
 
-        for client in self.clients:
-            if client != sender:
-                try:
-                    # Check if connection is open (compatible with all websockets versions)
-                    is_open = getattr(client, 'open', None) or (not getattr(client, 'closed', False))
-                    if is_open:
-                        await client.send(message)
-                        remote_addr = getattr(client, 'remote_address', 'N/A')
-                        self.logger.debug(LOG_SENT.format(remote_addr=remote_addr))
-                except Exception as e:
-                    self.logger.debug(LOG_BROADCAST_SKIPPED.format(error=e))
+        self.logger.debug(LOG_BROADCASTING.format(count=len(recipients)))
+        self.fanout.publish(payload, recipients)
 
     # ═══════════════════════════════════════════════════════════
     # Server Lifecycle
@@ -545,9 +649,27 @@ class zBifrost:
         security_note = SECURITY_LOCALHOST_ONLY if self.host == DEFAULT_HOST else ""
         self.logger.info(LOG_STARTED.format(bind_info=bind_info, security_note=security_note))
         self._running = True
+        self._cache_sweeper = asyncio.create_task(self._sweep_query_cache())
         socket_ready.set()
-        await self.server.wait_closed()
-        self._running = False
+        try:
+            await self.server.wait_closed()
+        finally:
+            self._stop_cache_sweeper()
+            self._running = False
+
+    async def _sweep_query_cache(self, interval: float = DEFAULT_CACHE_SWEEP_INTERVAL) -> None:
+        """Periodically drop expired query-cache entries (runs while the server is up)."""
+        while True:
+            await asyncio.sleep(interval)
+            removed = self.cache.sweep_expired()
+            if removed:
+                self.logger.debug(LOG_CACHE_SWEPT.format(count=removed))
+
+    def _stop_cache_sweeper(self) -> None:
+        """Cancel the query-cache sweeper task if it is running."""
+        if self._cache_sweeper is not None:
+            self._cache_sweeper.cancel()
+            self._cache_sweeper = None
 
     def _log_with_traceback(self, e: Exception, message: str, context: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -587,6 +709,7 @@ class zBifrost:
             return
 
         self.logger.info(LOG_SHUTDOWN_INITIATING)
+        self._stop_cache_sweeper()
 
         try:
             # Close all client connections gracefully
@@ -634,6 +757,8 @@ class zBifrost:
 
         finally:
             # Always mark as not running after shutdown attempt
+            self.executor.shutdown()
+            self.fanout.close_all()
             self._running = False
             self.logger.info(LOG_SHUTDOWN_COMPLETE)
 
@@ -651,6 +776,7 @@ class zBifrost:
             return
 
         self.logger.info(LOG_SYNC_SHUTDOWN)
+        self._stop_cache_sweeper()
 
         try:
             # Clear client lists (no async send needed)
@@ -670,5 +796,7 @@ class zBifrost:
                     self.server = None
 
         finally:
+            self.executor.shutdown()
+            self.fanout.close_all()
             self._running = False
             self.logger.info(LOG_SYNC_COMPLETE)
@@ -11,6 +11,9 @@ Exports:
     AuthenticationManager: Handles client authentication and authorization
     MessageHandler: Routes and dispatches messages between client and backend
     ConnectionInfoManager: Tracks connection state and client metadata
+    FairExecutor: Bounded worker threads, served round-robin across clients
+    RequestPipeline: Per-connection concurrent request execution with backpressure
+    FanoutHub: Topic subscriptions and concurrent, bounded per-client broadcast
 
 Architecture:
     These modules work together to provide a clean separation of concerns within
@@ -22,11 +25,16 @@ from .bridge_cache import CacheManager
 from .bridge_auth import AuthenticationManager
 from .bridge_messages import MessageHandler
 from .bridge_connection import ConnectionInfoManager
+from .bridge_pipeline import FairExecutor, RequestPipeline
+from .bridge_fanout import FanoutHub
 
 __all__ = [
     'CacheManager',
     'AuthenticationManager',
     'MessageHandler',
-    'ConnectionInfoManager'
+    'ConnectionInfoManager',
+    'FairExecutor',
+    'RequestPipeline',
+    'FanoutHub'
 ]
 
@@ -3,7 +3,9 @@ Cache Manager Module - Secure multi-context caching with user/app isolation
 
 This module provides thread-safe caching for Bifrost bridge operations with:
 - Schema caching (permanent, no expiration)
-- Query result caching (TTL-based expiration)
+- Query result caching (LRU + TTL, bounded by entry count and memory budget)
+- Model tagging: writes evict the cached reads of the models they touch
+- Periodic sweeping of expired entries (driven by the Bifrost server)
 - User/application isolation (prevents data leaks between contexts)
 - Statistics tracking for cache performance monitoring
 
@@ -28,11 +30,35 @@ Example:
     # Check cache
     result = cache.get_query(cache_key)
     if result is None:
+        epoch = cache.write_epoch
         result = fetch_from_database(data)
-        cache.cache_query(cache_key, result)
+        cache.cache_query(cache_key, result, tags=cache.query_tags(data),
+                          user_context=user_context, epoch=epoch)
+
+    # After a write to "users": drop every cached read tagged "users"
+    cache.invalidate_queries({"users"})
+
+Bounds & Expiry:
+    Query entries are kept in LRU order. Inserting past max_entries or
+    max_bytes (payload size, measured as serialized JSON) evicts the least
+    recently used entries. Expired entries are dropped when read and by
+    sweep_expired(), which zBifrost calls periodically.
+
+Write Invalidation:
+    Each entry is tagged with the request's model/table. invalidate_queries()
+    drops the tagged entries plus every untagged entry (a read with no known
+    model may depend on any write), or all entries when the write's tags are
+    unknown, and bumps write_epoch; a read that started before the write
+    passes the epoch it saw to cache_query(), which then refuses to store its
+    possibly stale result.
 """
 import hashlib
+import json
+import sys
+import threading
 import time
+from collections import OrderedDict
+from typing import Iterable, Set
 from zCLI import Optional, Dict, Any, Callable
 
 # ═══════════════════════════════════════════════════════════
@@ -45,6 +71,8 @@ ANONYMOUS_USER_ID: str = "anonymous"
 DEFAULT_APP_NAME: str = "default"
 DEFAULT_ROLE: str = "guest"
 DEFAULT_AUTH_CONTEXT: str = "none"
+DEFAULT_MAX_ENTRIES: int = 1024
+DEFAULT_MAX_BYTES: int = 32 * 1024 * 1024  # 32 MB of cached payloads
 
 # Cache key components
 CACHE_KEY_SEPARATOR: str = "|"
@@ -58,22 +86,36 @@ LOG_PREFIX_QUERY_HIT: str = "[QUERY HIT]"
 LOG_PREFIX_QUERY_MISS: str = "[QUERY MISS]"
 LOG_PREFIX_QUERY_EXPIRED: str = "[QUERY EXPIRED]"
 LOG_PREFIX_QUERY_CACHED: str = "[CACHED]"
+LOG_PREFIX_QUERY_EVICTED: str = "[QUERY EVICTED]"
+LOG_PREFIX_QUERY_INVALIDATED: str = "[QUERY INVALIDATED]"
+LOG_PREFIX_QUERY_SKIPPED: str = "[QUERY NOT CACHED]"
 LOG_PREFIX_SECURITY_WARNING: str = "[SECURITY WARNING]"
 
 # Statistics keys
 STAT_KEY_HITS: str = "hits"
 STAT_KEY_MISSES: str = "misses"
 STAT_KEY_EXPIRED: str = "expired"
+STAT_KEY_EVICTIONS: str = "evictions"
+STAT_KEY_INVALIDATIONS: str = "invalidations"
+STAT_KEY_ENTRIES: str = "entries"
+STAT_KEY_BYTES: str = "bytes"
+STAT_KEY_MAX_ENTRIES: str = "max_entries"
+STAT_KEY_MAX_BYTES: str = "max_bytes"
 
 # Cache entry keys
 CACHE_ENTRY_DATA: str = "data"
 CACHE_ENTRY_TIMESTAMP: str = "timestamp"
 CACHE_ENTRY_TTL: str = "ttl"
+CACHE_ENTRY_SIZE: str = "size"
+CACHE_ENTRY_TAGS: str = "tags"
+CACHE_ENTRY_USER_ID: str = "user_id"
+CACHE_ENTRY_APP_NAME: str = "app_name"
 
 # Request data keys
 REQUEST_KEY_ZKEY: str = "zKey"
 REQUEST_KEY_ACTION: str = "action"
 REQUEST_KEY_MODEL: str = "model"
+REQUEST_KEY_TABLE: str = "table"
 REQUEST_KEY_WHERE: str = "where"
 REQUEST_KEY_FILTERS: str = "filters"
 REQUEST_KEY_FIELDS: str = "fields"
@@ -94,7 +136,8 @@ class CacheManager:
     
     Features:
         - Schema caching (permanent, model-based)
-        - Query result caching (TTL-based, request-based)
+        - Query result caching (LRU + TTL, bounded, model-tagged)
+        - Write invalidation by model/table tag
         - User/application isolation (security-critical)
         - Performance statistics tracking
         - Selective cache clearing
@@ -108,8 +151,10 @@ class CacheManager:
         logger: Logger instance for diagnostics
         schema_cache: Permanent cache for schema definitions
         ui_cache: Reserved for future UI component caching
-        query_cache: TTL-based cache for query results
+        query_cache: LRU-ordered cache for query results (key → entry dict)
         query_cache_ttl: Default TTL for query cache entries
+        max_entries: Maximum number of query entries kept
+        max_bytes: Memory budget for cached query payloads
         schema_stats: Schema cache performance counters
         query_stats: Query cache performance counters
     """
@@ -117,7 +162,9 @@ class CacheManager:
     def __init__(
         self,
         logger: Any,
-        default_query_ttl: int = DEFAULT_QUERY_TTL
+        default_query_ttl: int = DEFAULT_QUERY_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
     ) -> None:
         """
         Initialize cache manager with isolated caches.
@@ -125,6 +172,8 @@ class CacheManager:
         Args:
             logger: Logger instance for diagnostics and warnings
             default_query_ttl: Default TTL for query cache in seconds (default: 60)
+            max_entries: Query entries kept before LRU eviction (default: 1024)
+            max_bytes: Serialized size budget for query results (default: 32 MB)
         """
         self.logger = logger
         
@@ -135,9 +184,18 @@ class CacheManager:
         # Note: Currently unused, reserved for caching UI schemas and templates
         self.ui_cache: Dict[str, Any] = {}
         
-        # Query result cache (with TTL, user/app isolated)
-        self.query_cache: Dict[str, Dict[str, Any]] = {}
+        # Query result cache (LRU order, with TTL, user/app isolated)
+        self.query_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.query_cache_ttl: int = default_query_ttl
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self._query_bytes: int = 0
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._untagged_keys: Set[str] = set()  # Reads with no model - dropped by every write
+        self._write_epoch: int = 0
+        
+        # Dispatch handlers and the sweeper may touch the cache from different threads
+        self._lock = threading.RLock()
         
         # Performance statistics
         self.schema_stats: Dict[str, int] = self._init_stats(include_expired=False)
@@ -148,7 +206,8 @@ class CacheManager:
         Initialize statistics dictionary.
         
         Args:
-            include_expired: Whether to include 'expired' counter
+            include_expired: Whether to include the query-cache counters
+                (expired, evictions, invalidations)
             
         Returns:
             Statistics dictionary with zeroed counters
@@ -159,6 +218,8 @@ class CacheManager:
         }
         if include_expired:
             stats[STAT_KEY_EXPIRED] = 0
+            stats[STAT_KEY_EVICTIONS] = 0
+            stats[STAT_KEY_INVALIDATIONS] = 0
         return stats
     
     # ═══════════════════════════════════════════════════════════
@@ -279,32 +340,37 @@ class CacheManager:
         """
         Get cached query result if valid (not expired).
         
+        A hit marks the entry as most recently used.
+        
         Args:
             cache_key: Cache key generated by generate_cache_key()
             
         Returns:
             Cached data or None if not found or expired
         """
-        if cache_key not in self.query_cache:
-            self.query_stats[STAT_KEY_MISSES] += 1
-            return None
-        
-        cached = self.query_cache[cache_key]
-        age = time.time() - cached[CACHE_ENTRY_TIMESTAMP]
-        ttl = cached[CACHE_ENTRY_TTL]
-        
-        # Check if expired
-        if age > ttl:
-            self.query_stats[STAT_KEY_EXPIRED] += 1
-            del self.query_cache[cache_key]
-            self.logger.debug(
-                f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_EXPIRED} "
-                f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... "
-                f"(age: {age:.1f}s, ttl: {ttl}s)"
-            )
-            return None
+        with self._lock:
+            cached = self.query_cache.get(cache_key)
+            if cached is None:
+                self.query_stats[STAT_KEY_MISSES] += 1
+                return None
+            
+            age = time.time() - cached[CACHE_ENTRY_TIMESTAMP]
+            ttl = cached[CACHE_ENTRY_TTL]
+            
+            # Check if expired
+            if age > ttl:
+                self.query_stats[STAT_KEY_EXPIRED] += 1
+                self._drop_query(cache_key)
+                self.logger.debug(
+                    f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_EXPIRED} "
+                    f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... "
+                    f"(age: {age:.1f}s, ttl: {ttl}s)"
+                )
+                return None
+            
+            self.query_cache.move_to_end(cache_key)
+            self.query_stats[STAT_KEY_HITS] += 1
         
-        self.query_stats[STAT_KEY_HITS] += 1
         self.logger.debug(
             f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_HIT} "
             f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... "
@@ -316,28 +382,188 @@ class CacheManager:
         self,
         cache_key: str,
         result: Any,
-        ttl: Optional[int] = None
-    ) -> None:
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        epoch: Optional[int] = None
+    ) -> bool:
         """
-        Cache a query result with TTL.
+        Cache a query result with TTL, evicting LRU entries to stay in bounds.
         
         Args:
             cache_key: Cache key generated by generate_cache_key()
             result: Result data to cache
             ttl: Custom TTL in seconds (uses default if None)
+            tags: Model/table tags used by invalidate_queries() (see query_tags())
+            user_context: Owner context, enables clear_user_cache()/clear_app_cache()
+            epoch: write_epoch read before the query ran; if a write has been
+                invalidated since, the (possibly stale) result is not cached
+        
+        Returns:
+            True if the result was cached
         """
         if ttl is None:
             ttl = self.query_cache_ttl
+        size = self._payload_size(result)
+        user_context = user_context or {}
+        
+        with self._lock:
+            if epoch is not None and epoch != self._write_epoch:
+                self.logger.debug(
+                    f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_SKIPPED} "
+                    f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... (write during read)"
+                )
+                return False
+            if size > self.max_bytes:
+                self.logger.debug(
+                    f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_SKIPPED} "
+                    f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... ({size} bytes exceeds budget)"
+                )
+                return False
+            
+            if cache_key in self.query_cache:
+                self._drop_query(cache_key)
+            entry_tags = frozenset(tags or ())
+            self.query_cache[cache_key] = {
+                CACHE_ENTRY_DATA: result,
+                CACHE_ENTRY_TIMESTAMP: time.time(),
+                CACHE_ENTRY_TTL: ttl,
+                CACHE_ENTRY_SIZE: size,
+                CACHE_ENTRY_TAGS: entry_tags,
+                CACHE_ENTRY_USER_ID: user_context.get(CONTEXT_KEY_USER_ID, ANONYMOUS_USER_ID),
+                CACHE_ENTRY_APP_NAME: user_context.get(CONTEXT_KEY_APP_NAME, DEFAULT_APP_NAME)
+            }
+            self._query_bytes += size
+            for tag in entry_tags:
+                self._tag_index.setdefault(tag, set()).add(cache_key)
+            if not entry_tags:
+                self._untagged_keys.add(cache_key)
+            
+            # Evict least recently used entries (never the one just added)
+            while len(self.query_cache) > 1 and (
+                len(self.query_cache) > self.max_entries or self._query_bytes > self.max_bytes
+            ):
+                evicted_key = next(iter(self.query_cache))
+                self._drop_query(evicted_key)
+                self.query_stats[STAT_KEY_EVICTIONS] += 1
+                self.logger.debug(
+                    f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_EVICTED} "
+                    f"{evicted_key[:CACHE_KEY_HASH_LENGTH]}..."
+                )
         
-        self.query_cache[cache_key] = {
-            CACHE_ENTRY_DATA: result,
-            CACHE_ENTRY_TIMESTAMP: time.time(),
-            CACHE_ENTRY_TTL: ttl
-        }
         self.logger.debug(
             f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_CACHED} "
             f"{cache_key[:CACHE_KEY_HASH_LENGTH]}... (ttl: {ttl}s)"
         )
+        return True
+    
+    # ═══════════════════════════════════════════════════════════
+    # Write Invalidation & Expiry (Model Tags, Sweeper)
+    # ═══════════════════════════════════════════════════════════
+    
+    @staticmethod
+    def query_tags(data: Dict[str, Any]) -> Set[str]:
+        """
+        Model/table tags for a request (empty when the request names neither).
+        
+        Args:
+            data: Request data dictionary
+            
+        Returns:
+            Set of tag strings, e.g. {"users"}
+        """
+        return {
+            str(data[key]) for key in (REQUEST_KEY_MODEL, REQUEST_KEY_TABLE)
+            if data.get(key)
+        }
+    
+    @property
+    def write_epoch(self) -> int:
+        """Counter bumped by every invalidate_queries() call."""
+        return self._write_epoch
+    
+    def invalidate_queries(self, tags: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop cached reads that depend on written models.
+        
+        Args:
+            tags: Models/tables written; None or empty drops every query entry
+                (a write whose target is unknown may affect any read). Untagged
+                entries are dropped by every write, since their model is unknown.
+            
+        Returns:
+            Number of cache entries removed
+        """
+        tags = set(tags or ())
+        with self._lock:
+            self._write_epoch += 1
+            if tags:
+                keys = set(self._untagged_keys)
+                for tag in tags:
+                    keys.update(self._tag_index.get(tag, ()))
+            else:
+                keys = set(self.query_cache)
+            for key in keys:
+                self._drop_query(key)
+            self.query_stats[STAT_KEY_INVALIDATIONS] += len(keys)
+        
+        if keys:
+            self.logger.debug(
+                f"{LOG_PREFIX_CACHE} {LOG_PREFIX_QUERY_INVALIDATED} "
+                f"{len(keys)} entries (tags: {sorted(tags) or 'all'})"
+            )
+        return len(keys)
+    
+    def sweep_expired(self) -> int:
+        """
+        Remove every expired query entry (called periodically by zBifrost).
+        
+        Returns:
+            Number of cache entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key for key, entry in self.query_cache.items()
+                if now - entry[CACHE_ENTRY_TIMESTAMP] > entry[CACHE_ENTRY_TTL]
+            ]
+            for key in expired:
+                self._drop_query(key)
+            self.query_stats[STAT_KEY_EXPIRED] += len(expired)
+        
+        if expired:
+            self.logger.debug(f"{LOG_PREFIX_CACHE} Swept {len(expired)} expired query entries")
+        return len(expired)
+    
+    def _drop_query(self, cache_key: str) -> None:
+        """Remove one entry and its tag/size bookkeeping (lock held)."""
+        entry = self.query_cache.pop(cache_key, None)
+        if entry is None:
+            return
+        self._query_bytes -= entry.get(CACHE_ENTRY_SIZE, 0)
+        self._untagged_keys.discard(cache_key)
+        for tag in entry.get(CACHE_ENTRY_TAGS, ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_index[tag]
+    
+    def _clear_matching(self, field: str, value: str) -> int:
+        """Drop entries whose owner field equals value."""
+        with self._lock:
+            keys = [key for key, entry in self.query_cache.items() if entry.get(field) == value]
+            for key in keys:
+                self._drop_query(key)
+        return len(keys)
+    
+    @staticmethod
+    def _payload_size(result: Any) -> int:
+        """Approximate memory cost of a result: its serialized JSON length."""
+        try:
+            return len(json.dumps(result, default=str))
+        except (TypeError, ValueError):
+            return sys.getsizeof(result)
     
     # ═══════════════════════════════════════════════════════════
     # Cache Management (Clearing & Statistics)
@@ -352,7 +578,11 @@ class CacheManager:
         """
         self.schema_cache.clear()
         self.ui_cache.clear()
-        self.query_cache.clear()
+        with self._lock:
+            self.query_cache.clear()
+            self._tag_index.clear()
+            self._untagged_keys.clear()
+            self._query_bytes = 0
         
         self.logger.info(
             f"{LOG_PREFIX_CACHE} All caches cleared. "
@@ -378,21 +608,11 @@ class CacheManager:
             Number of cache entries removed
             
         Note:
-            Current implementation is a placeholder. Full implementation requires
-            storing metadata (user_id, app_name) in cache entries to efficiently
-            match and clear by user without iterating through all keys.
-            For now, use clear_all() to clear all caches.
+            Matches the owner recorded by cache_query(user_context=...);
+            entries cached without a user context belong to "anonymous".
         """
-        # pylint: disable=unused-variable,fixme
-        # TODO: Implement after adding metadata to cache entries
-        # Current limitation: MD5 hashes can't be parsed to extract user_id
-        # Solution: Store metadata dict alongside cache entries
-        cleared = 0
-        
-        self.logger.warning(
-            f"{LOG_PREFIX_CACHE} clear_user_cache() not yet implemented. "
-            f"Use clear_all() to clear all caches. User: '{user_id}'"
-        )
+        cleared = self._clear_matching(CACHE_ENTRY_USER_ID, user_id)
+        self.logger.info(f"{LOG_PREFIX_CACHE} Cleared {cleared} query entries for user '{user_id}'")
         return cleared
     
     def clear_app_cache(self, app_name: str) -> int:
@@ -411,20 +631,10 @@ class CacheManager:
             Number of cache entries removed
             
         Note:
-            Current implementation is a placeholder. Full implementation requires
-            storing metadata (user_id, app_name) in cache entries to efficiently
-            match and clear by application without iterating through all keys.
-            For now, use clear_all() to clear all caches.
+            Matches the owner recorded by cache_query(user_context=...).
         """
-        # pylint: disable=unused-variable,fixme
-        # TODO: Implement after adding metadata to cache entries
-        # Same limitation as clear_user_cache() - needs metadata enhancement
-        cleared = 0
-        
-        self.logger.warning(
-            f"{LOG_PREFIX_CACHE} clear_app_cache() not yet implemented. "
-            f"Use clear_all() to clear all caches. App: '{app_name}'"
-        )
+        cleared = self._clear_matching(CACHE_ENTRY_APP_NAME, app_name)
+        self.logger.info(f"{LOG_PREFIX_CACHE} Cleared {cleared} query entries for app '{app_name}'")
         return cleared
     
     def set_query_ttl(self, ttl: int) -> None:
@@ -448,10 +658,23 @@ class CacheManager:
             Dictionary with schema_cache and query_cache statistics:
                 {
                     "schema_cache": {"hits": 42, "misses": 8},
-                    "query_cache": {"hits": 150, "misses": 30, "expired": 12}
+                    "query_cache": {"hits": 150, "misses": 30, "expired": 12,
+                                    "evictions": 4, "invalidations": 9,
+                                    "entries": 120, "bytes": 48213,
+                                    "max_entries": 1024, "max_bytes": 33554432}
                 }
         """
+        with self._lock:
+            query_stats = dict(
+                self.query_stats,
+                **{
+                    STAT_KEY_ENTRIES: len(self.query_cache),
+                    STAT_KEY_BYTES: self._query_bytes,
+                    STAT_KEY_MAX_ENTRIES: self.max_entries,
+                    STAT_KEY_MAX_BYTES: self.max_bytes
+                }
+            )
         return {
             'schema_cache': self.schema_stats.copy(),
-            'query_cache': self.query_stats.copy()
+            'query_cache': query_stats
         }
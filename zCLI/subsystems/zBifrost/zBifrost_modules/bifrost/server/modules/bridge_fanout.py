@@ -0,0 +1,277 @@
+"""
+Fan-out Module - Topic subscriptions and concurrent, bounded broadcast
+
+zBifrost.broadcast() used to await client.send() for every connected client in
+turn, so one slow socket delayed the message for everyone after it, and every
+broadcast went to every client. FanoutHub replaces that loop:
+
+- Topics: clients subscribe to names such as ``model:users``,
+  ``zBlock:Dashboard`` or ``user:alice``; a broadcast to a topic (or several)
+  reaches only their subscribers, each at most once.
+- Outboxes: every client gets a bounded queue drained by its own writer task.
+  publish() only enqueues, so sends to different clients run concurrently and
+  the broadcaster never waits on a socket.
+- Slow consumers: a client whose queue is full is disconnected (close code
+  1013) instead of buffering without limit.
+- One serialization: callers pass the JSON string once; every recipient's
+  queue holds a reference to the same payload.
+
+Example:
+    hub = FanoutHub(logger, max_queue=256)
+    hub.subscribe(ws, [model_topic("users")])
+    hub.publish(json.dumps(event), hub.subscribers(model_topic("users")))
+"""
+import asyncio
+from zCLI import Optional, Dict, Any, List
+
+# ═══════════════════════════════════════════════════════════
+# Module Constants
+# ═══════════════════════════════════════════════════════════
+
+DEFAULT_MAX_QUEUE: int = 256  # Pending outbound messages per client
+
+# Topic prefixes
+TOPIC_MODEL: str = "model:"
+TOPIC_BLOCK: str = "zBlock:"
+TOPIC_USER: str = "user:"
+
+# WebSocket close code for slow consumers (1013 = Try Again Later)
+WS_CLOSE_SLOW_CONSUMER: int = 1013
+REASON_SLOW_CONSUMER: str = "Slow consumer - outbound queue full"
+
+# Statistics keys
+STAT_KEY_CLIENTS: str = "clients"
+STAT_KEY_TOPICS: str = "topics"
+STAT_KEY_QUEUED: str = "queued"
+STAT_KEY_PUBLISHED: str = "published"
+STAT_KEY_DISCONNECTED: str = "slow_disconnects"
+
+# Log messages
+LOG_PREFIX: str = "[Fanout]"
+LOG_SLOW_CONSUMER: str = f"{LOG_PREFIX} Disconnecting slow consumer {{remote_addr}} ({{size}} messages queued)"
+LOG_SEND_FAILED: str = f"{LOG_PREFIX} Send failed, dropping outbox for {{remote_addr}}: {{error}}"
+
+
+def model_topic(model: str) -> str:
+    """Topic for changes to one model/table."""
+    return f"{TOPIC_MODEL}{model}"
+
+
+def block_topic(block: str) -> str:
+    """Topic for one zBlock."""
+    return f"{TOPIC_BLOCK}{block}"
+
+
+def user_topic(user_id: str) -> str:
+    """Topic joined by every connection of one user."""
+    return f"{TOPIC_USER}{user_id}"
+
+
+def _is_open(ws: Any) -> bool:
+    """Check if connection is open (compatible with all websockets versions)."""
+    return bool(getattr(ws, 'open', None) or (not getattr(ws, 'closed', False)))
+
+
+# ═══════════════════════════════════════════════════════════
+# Client Outbox
+# ═══════════════════════════════════════════════════════════
+
+class ClientOutbox:
+    """
+    Bounded outbound queue for one client, drained by its own writer task.
+
+    Attributes:
+        ws: WebSocket connection
+        queue: Pending payloads (bounded by max_queue)
+    """
+
+    def __init__(self, ws: Any, logger: Any, max_queue: int = DEFAULT_MAX_QUEUE) -> None:
+        """
+        Create the queue and start the writer task (needs a running loop).
+
+        Args:
+            ws: WebSocket connection to write to
+            logger: Logger instance for diagnostics
+            max_queue: Pending messages allowed before the client counts as slow
+        """
+        self.ws = ws
+        self.logger = logger
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._writer = asyncio.create_task(self._drain())
+
+    @property
+    def alive(self) -> bool:
+        """True while the writer task is running."""
+        return not self._writer.done()
+
+    def offer(self, payload: str) -> bool:
+        """Enqueue payload without waiting; False if the queue is full."""
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        """Stop the writer; queued messages are dropped."""
+        self._writer.cancel()
+
+    async def _drain(self) -> None:
+        """Writer task: send queued payloads in order until the socket fails."""
+        while True:
+            payload = await self.queue.get()
+            try:
+                await self.ws.send(payload)
+            except Exception as e:  # pylint: disable=broad-except
+                remote_addr = getattr(self.ws, 'remote_address', 'N/A')
+                self.logger.debug(LOG_SEND_FAILED.format(remote_addr=remote_addr, error=e))
+                return
+
+
+# ═══════════════════════════════════════════════════════════
+# Fan-out Hub
+# ═══════════════════════════════════════════════════════════
+
+class FanoutHub:
+    """
+    Topic registry plus per-client outboxes for zBifrost broadcasts.
+
+    Attributes:
+        logger: Logger instance for diagnostics
+        max_queue: Outbound queue bound per client
+        outboxes: ClientOutbox per connection (created on first publish)
+    """
+
+    def __init__(self, logger: Any, max_queue: int = DEFAULT_MAX_QUEUE) -> None:
+        """
+        Initialize an empty hub.
+
+        Args:
+            logger: Logger instance for diagnostics
+            max_queue: Outbound queue bound per client (default: 256)
+        """
+        self.logger = logger
+        self.max_queue: int = max(1, max_queue)
+        self.outboxes: Dict[Any, ClientOutbox] = {}
+        self._topics: Dict[str, set] = {}
+        self._client_topics: Dict[Any, set] = {}
+        self._published: int = 0
+        self._disconnected: int = 0
+
+    # ───────────────────────────────────────────────────────
+    # Subscriptions
+    # ───────────────────────────────────────────────────────
+
+    def subscribe(self, ws: Any, topics: List[str]) -> List[str]:
+        """
+        Add topics to ws's subscriptions.
+
+        Returns:
+            All topics ws is subscribed to (sorted)
+        """
+        joined = self._client_topics.setdefault(ws, set())
+        for topic in topics:
+            self._topics.setdefault(topic, set()).add(ws)
+            joined.add(topic)
+        return sorted(joined)
+
+    def unsubscribe(self, ws: Any, topics: Optional[List[str]] = None) -> List[str]:
+        """
+        Remove topics from ws's subscriptions (all of them when None).
+
+        Returns:
+            Topics ws is still subscribed to (sorted)
+        """
+        joined = self._client_topics.get(ws, set())
+        for topic in list(joined if topics is None else topics):
+            members = self._topics.get(topic)
+            if members is not None:
+                members.discard(ws)
+                if not members:
+                    del self._topics[topic]
+            joined.discard(topic)
+        if not joined:
+            self._client_topics.pop(ws, None)
+        return sorted(joined)
+
+    def topics(self, ws: Any) -> List[str]:
+        """Topics ws is subscribed to (sorted)."""
+        return sorted(self._client_topics.get(ws, ()))
+
+    def subscribers(self, *topics: str) -> set:
+        """Union of the subscribers of topics (each client once)."""
+        members: set = set()
+        for topic in topics:
+            members.update(self._topics.get(topic, ()))
+        return members
+
+    # ───────────────────────────────────────────────────────
+    # Publishing
+    # ───────────────────────────────────────────────────────
+
+    def publish(self, payload: str, recipients: Any) -> int:
+        """
+        Queue payload for every open recipient; returns how many accepted it.
+
+        Never waits on a socket. A recipient whose outbox is full is
+        disconnected as a slow consumer. Must be called on the event loop.
+        """
+        delivered = 0
+        for ws in list(recipients):
+            if not _is_open(ws):
+                continue
+            outbox = self.outboxes.get(ws)
+            if outbox is None or not outbox.alive:
+                outbox = self.outboxes[ws] = ClientOutbox(ws, self.logger, self.max_queue)
+            if outbox.offer(payload):
+                delivered += 1
+            else:
+                self._disconnect_slow(ws, outbox)
+        self._published += 1
+        return delivered
+
+    def remove(self, ws: Any) -> None:
+        """Forget ws: drop its subscriptions and stop its writer."""
+        self.unsubscribe(ws)
+        outbox = self.outboxes.pop(ws, None)
+        if outbox is not None:
+            outbox.close()
+
+    def close_all(self) -> None:
+        """Stop every writer and clear all subscriptions (server shutdown)."""
+        for outbox in self.outboxes.values():
+            outbox.close()
+        self.outboxes.clear()
+        self._topics.clear()
+        self._client_topics.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get fan-out statistics.
+
+        Returns:
+            Dictionary with clients, topics, queued, published, slow_disconnects
+        """
+        return {
+            STAT_KEY_CLIENTS: len(self.outboxes),
+            STAT_KEY_TOPICS: len(self._topics),
+            STAT_KEY_QUEUED: sum(outbox.queue.qsize() for outbox in self.outboxes.values()),
+            STAT_KEY_PUBLISHED: self._published,
+            STAT_KEY_DISCONNECTED: self._disconnected
+        }
+
+    def _disconnect_slow(self, ws: Any, outbox: ClientOutbox) -> None:
+        """Drop a client that cannot keep up and close its connection."""
+        remote_addr = getattr(ws, 'remote_address', 'N/A')
+        self.logger.warning(LOG_SLOW_CONSUMER.format(remote_addr=remote_addr, size=outbox.queue.qsize()))
+        self._disconnected += 1
+        self.remove(ws)
+        asyncio.ensure_future(_close_slow(ws))
+
+
+async def _close_slow(ws: Any) -> None:
+    """Close a slow consumer's connection, ignoring one that is already gone."""
+    try:
+        await ws.close(code=WS_CLOSE_SLOW_CONSUMER, reason=REASON_SLOW_CONSUMER)
+    except Exception:  # pylint: disable=broad-except
+        pass
@@ -56,6 +56,7 @@ from zCLI import asyncio, json, Dict, Any, Optional, Callable, Awaitable
 
 # Event Names
 EVENT_INPUT_RESPONSE: str = "input_response"
+EVENT_DISPLAY_BATCH: str = "display_batch"
 
 # Action Names
 ACTION_GET_SCHEMA: str = "get_schema"
@@ -83,6 +84,8 @@ MSG_KEY_ERROR: str = "error"
 MSG_KEY_CACHED: str = "_cached"
 MSG_KEY_STATS: str = "stats"
 MSG_KEY_MODELS: str = "models"
+MSG_KEY_EVENTS: str = "events"
+MSG_KEY_BATCH: str = "_batch"  # Client opt-in: all display events in one frame
 
 # Command Prefixes (for cacheable operation detection)
 CMD_PREFIX_LIST: str = "^List"
@@ -134,6 +137,7 @@ class MessageHandler:
         walker: Walker instance for data operations
         connection_info: ConnectionInfoManager for API discovery
         auth: AuthenticationManager for user context extraction
+        executor: Optional FairExecutor for blocking work (asyncio.to_thread if None)
     """
     
     def __init__(
@@ -143,7 +147,8 @@ class MessageHandler:
         zcli: Any,
         walker: Any,
         connection_info_manager: Optional[Any] = None,
-        auth_manager: Optional[Any] = None
+        auth_manager: Optional[Any] = None,
+        executor: Optional[Any] = None
     ) -> None:
         """
         Initialize message handler with required dependencies.
@@ -155,6 +160,7 @@ class MessageHandler:
             walker: Walker instance for data operations and schema loading
             connection_info_manager: Optional ConnectionInfoManager for introspection
             auth_manager: Optional AuthenticationManager for user context extraction
+            executor: Optional FairExecutor shared by the server's connections
         """
         self.logger = logger
         self.cache = cache_manager
@@ -162,6 +168,23 @@ class MessageHandler:
         self.walker = walker
         self.connection_info = connection_info_manager
         self.auth = auth_manager
+        self.executor = executor
+    
+    async def _run_blocking(self, ws: Any, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run blocking func off the event loop, queued fairly per connection.
+        
+        Args:
+            ws: WebSocket connection (fairness key for the executor)
+            func: Blocking callable
+            *args, **kwargs: Passed to func
+        
+        Returns:
+            Whatever func returns
+        """
+        if self.executor is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return await self.executor.run(ws, func, *args, **kwargs)
     
     async def handle_message(
         self,
@@ -417,6 +440,7 @@ class MessageHandler:
                 - zVaFolder (str, optional): YAML folder path (e.g., "@.UI")
                 - zBlock (str, optional): Block name (default: "zVaF")
                 - _requestId (int, optional): Request ID for response correlation
+                - _batch (bool, optional): Send display events as one display_batch frame
         
         Returns:
             bool: True (always handled)
@@ -478,7 +502,7 @@ class MessageHandler:
             self.zcli.zspark_obj["zBlock"] = zBlock
             
             # Load YAML file via loader (pass None to trigger session-based path resolution)
-            raw_zFile = await asyncio.to_thread(self.zcli.loader.handle, None)
+            raw_zFile = await self._run_blocking(ws, self.zcli.loader.handle, None)
             
             if not raw_zFile:
                 error_msg = f"Failed to load zVaFile: {zVaFolder}/{zVaFile}"
@@ -514,16 +538,23 @@ class MessageHandler:
             
             # Execute the block
             block_dict = raw_zFile[zBlock]
-            result = await asyncio.to_thread(walker.zBlock_loop, block_dict)
+            result = await self._run_blocking(ws, walker.zBlock_loop, block_dict)
             
             # Collect buffered display events and broadcast them
             buffered_events = self.zcli.display.collect_buffered_events()
             self.logger.info(f"[MessageHandler] Collected {len(buffered_events)} buffered display events")
-            
-            for i, event in enumerate(buffered_events):
-                event_type = event.get('display_event', event.get('event', 'unknown'))
-                self.logger.info(f"[MessageHandler] Broadcasting event {i+1}/{len(buffered_events)}: {event_type}")
-                await ws.send(json.dumps(event))
+            # Streamed zTables on this page can only be paged by this connection
+            self.zcli.display.table_streams.claim(buffered_events, ws)
+            
+            if data.get(MSG_KEY_BATCH):
+                # One frame for the whole block
+                if buffered_events:
+                    await ws.send(json.dumps({MSG_KEY_EVENT: EVENT_DISPLAY_BATCH, MSG_KEY_EVENTS: buffered_events}))
+            else:
+                for i, event in enumerate(buffered_events):
+                    event_type = event.get('display_event', event.get('event', 'unknown'))
+                    self.logger.info(f"[MessageHandler] Broadcasting event {i+1}/{len(buffered_events)}: {event_type}")
+                    await ws.send(json.dumps(event))
             
             # Send completion response
             await ws.send(self._build_response(data, result="completed"))
@@ -667,8 +698,8 @@ class MessageHandler:
             
             # Execute onSubmit via zDispatch
             # Run in thread to avoid blocking the event loop
-            result = await asyncio.to_thread(
-                self.zcli.dispatch.handle,
+            result = await self._run_blocking(
+                ws, self.zcli.dispatch.handle,
                 'zData',  # Assuming most forms submit via zData
                 injected_action.get('zData', injected_action)  # Extract zData if nested
             )
@@ -788,14 +819,17 @@ class MessageHandler:
         try:
             context = {"websocket_data": data, "mode": "zBifrost"}
             
-            result = await asyncio.to_thread(
-                handle_zDispatch, zKey, zHorizontal,
+            result = await self._run_blocking(
+                ws, handle_zDispatch, zKey, zHorizontal,
                 zcli=self.zcli, walker=self.walker, context=context
             )
             
             # Cache result if cacheable
             if is_cacheable and not disable_cache:
-                self.cache.cache_query(cache_key, result, ttl=cache_ttl)
+                self.cache.cache_query(
+                    cache_key, result, ttl=cache_ttl,
+                    tags=self.cache.query_tags(data), user_context=user_context
+                )
             
             payload = self._build_response(data, result=result)
         
@@ -0,0 +1,288 @@
+"""
+Request Pipeline Module - Per-connection pipelining and fair worker scheduling
+
+zBifrost used to await every built-in event inline, so a client that sent ten
+dispatches had them processed one at a time, and all blocking work went through
+asyncio.to_thread() on the loop's shared, unbounded default pool. This module
+provides the two pieces that replace that:
+
+- RequestPipeline (one per connection): requests that carry a ``_requestId``
+  run as concurrent tasks, up to ``max_in_flight`` per connection. When the
+  limit is reached the connection's read loop waits for a slot, so the client
+  is slowed down (backpressure) instead of queueing unbounded work. Responses
+  go out as each request finishes and are correlated by ``_requestId``.
+- FairExecutor (one per server): a bounded thread pool for the blocking parts
+  of handlers (zDispatch, zLoader, zWalker). Jobs are queued per client and
+  served round-robin, so one busy client cannot starve the others.
+
+Example:
+    executor = FairExecutor(max_workers=8)
+    pipeline = RequestPipeline(logger, max_in_flight=4)
+
+    # In the connection's message loop
+    await pipeline.submit(data["_requestId"], handler(ws, data))
+
+    # Inside a handler
+    result = await executor.run(ws, handle_zDispatch, zKey, zHorizontal)
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections import OrderedDict, deque
+from zCLI import Optional, Dict, Any, Callable
+
+# ═══════════════════════════════════════════════════════════
+# Module Constants
+# ═══════════════════════════════════════════════════════════
+
+DEFAULT_MAX_IN_FLIGHT: int = 8
+WORKER_THREAD_NAME: str = "zBifrost-worker"
+
+# Statistics keys
+STAT_KEY_WORKERS: str = "workers"
+STAT_KEY_MAX_WORKERS: str = "max_workers"
+STAT_KEY_QUEUED: str = "queued"
+STAT_KEY_CLIENTS: str = "clients"
+STAT_KEY_COMPLETED: str = "completed"
+
+# Log messages
+LOG_PREFIX: str = "[RequestPipeline]"
+LOG_BACKPRESSURE: str = f"{LOG_PREFIX} In-flight limit ({{limit}}) reached - waiting for a slot"
+LOG_TASK_FAILED: str = f"{LOG_PREFIX} Request {{request_id}} failed: {{error}}"
+LOG_CANCELLED: str = f"{LOG_PREFIX} Cancelled {{count}} in-flight requests (connection closed)"
+
+
+def default_max_workers() -> int:
+    """Same sizing rule as concurrent.futures.ThreadPoolExecutor."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+# ═══════════════════════════════════════════════════════════
+# Fair Executor (bounded, round-robin across clients)
+# ═══════════════════════════════════════════════════════════
+
+class FairExecutor:
+    """
+    Bounded worker threads that serve per-client FIFO queues round-robin.
+
+    Threads are started on demand up to max_workers. Each job runs in a copy
+    of the submitting task's contextvars, as asyncio.to_thread() does.
+
+    Attributes:
+        max_workers: Upper bound on worker threads
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Initialize the executor (no threads are started yet).
+
+        Args:
+            max_workers: Worker thread limit (default: min(32, cpu_count + 4))
+        """
+        self.max_workers: int = max_workers or default_max_workers()
+        self._queues: "OrderedDict[Any, deque]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._threads: list = []
+        self._idle: int = 0
+        self._queued: int = 0
+        self._completed: int = 0
+        self._retire: int = 0  # Workers asked to exit once they run out of work
+
+    async def run(self, client: Any, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func(*args, **kwargs) on a worker thread and await its result.
+
+        Args:
+            client: Fairness key - usually the WebSocket connection
+            func: Blocking callable
+            *args, **kwargs: Passed to func
+
+        Returns:
+            Whatever func returns (exceptions propagate to the caller)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+
+        with self._cond:
+            self._queues.setdefault(client, deque()).append((call, future, loop))
+            self._queued += 1
+            if self._queued > self._idle and len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._cond.notify()
+
+        return await future
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with workers, max_workers, queued, clients, completed
+        """
+        with self._cond:
+            return {
+                STAT_KEY_WORKERS: len(self._threads),
+                STAT_KEY_MAX_WORKERS: self.max_workers,
+                STAT_KEY_QUEUED: self._queued,
+                STAT_KEY_CLIENTS: len(self._queues),
+                STAT_KEY_COMPLETED: self._completed
+            }
+
+    def shutdown(self) -> None:
+        """
+        Cancel queued jobs and let every worker exit once it is idle.
+
+        Jobs already running finish; their results are discarded if the
+        awaiting task is gone. The executor stays usable - a later run()
+        starts new workers (zBifrost can be restarted).
+        """
+        with self._cond:
+            for queue in self._queues.values():
+                for _call, future, loop in queue:
+                    _post(loop, _cancel_future, future)
+            self._queues.clear()
+            self._queued = 0
+            self._retire = len(self._threads)
+            self._cond.notify_all()
+
+    def _start_worker(self) -> None:
+        """Start one more worker thread (lock held)."""
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{WORKER_THREAD_NAME}-{len(self._threads) + 1}",
+            daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_job(self) -> tuple:
+        """Pop the next job, rotating the served client to the back (lock held)."""
+        client, queue = next(iter(self._queues.items()))
+        job = queue.popleft()
+        del self._queues[client]
+        if queue:
+            self._queues[client] = queue
+        self._queued -= 1
+        return job
+
+    def _worker(self) -> None:
+        """Worker thread body."""
+        while True:
+            with self._cond:
+                while not self._queues:
+                    if self._retire:
+                        self._retire -= 1
+                        self._threads.remove(threading.current_thread())
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                call, future, loop = self._next_job()
+
+            if future.cancelled():
+                continue  # Awaiting task is gone (e.g. connection closed) - skip the work
+
+            try:
+                result = call()
+            except BaseException as e:  # pylint: disable=broad-except
+                _post(loop, _set_future_exception, future, e)
+            else:
+                _post(loop, _set_future_result, future, result)
+
+            with self._cond:
+                self._completed += 1
+
+
+def _post(loop: asyncio.AbstractEventLoop, callback: Callable[..., None], *args: Any) -> None:
+    """Schedule callback on loop, ignoring a loop that has already closed."""
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        pass
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
+def _cancel_future(future: asyncio.Future) -> None:
+    if not future.done():
+        future.cancel()
+
+
+# ═══════════════════════════════════════════════════════════
+# Request Pipeline (per connection)
+# ═══════════════════════════════════════════════════════════
+
+class RequestPipeline:
+    """
+    Concurrent request execution for one connection, bounded by max_in_flight.
+
+    Attributes:
+        logger: Logger instance for diagnostics
+        max_in_flight: Concurrent requests allowed for this connection
+        in_flight: Running tasks keyed by request id
+    """
+
+    def __init__(self, logger: Any, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            logger: Logger instance for diagnostics
+            max_in_flight: Concurrent requests allowed (default: 8)
+        """
+        self.logger = logger
+        self.max_in_flight: int = max(1, max_in_flight)
+        self.in_flight: Dict[Any, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    async def submit(self, request_id: Any, coro: Any) -> asyncio.Task:
+        """
+        Start coro as a task once a slot is free.
+
+        Waiting here (when max_in_flight requests are running) is the
+        backpressure: the caller stops reading from the connection until a
+        request completes.
+
+        Args:
+            request_id: Client-provided _requestId
+            coro: Handler coroutine (sends its own response)
+
+        Returns:
+            The started task
+        """
+        if self._slots.locked():
+            self.logger.debug(LOG_BACKPRESSURE.format(limit=self.max_in_flight))
+        await self._slots.acquire()
+
+        task = asyncio.create_task(coro)
+        self.in_flight[request_id] = task
+        task.add_done_callback(functools.partial(self._finished, request_id))
+        return task
+
+    async def close(self) -> None:
+        """Cancel all in-flight requests (connection closed) and wait for them."""
+        tasks = list(self.in_flight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.logger.debug(LOG_CANCELLED.format(count=len(tasks)))
+
+    def _finished(self, request_id: Any, task: asyncio.Task) -> None:
+        """Release the slot and log unexpected handler errors."""
+        self._slots.release()
+        if self.in_flight.get(request_id) is task:
+            del self.in_flight[request_id]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(LOG_TASK_FAILED.format(request_id=request_id, error=task.exception()))
@@ -11,6 +11,7 @@ Exports:
     CacheEvents: Handles cache operations (schema retrieval, cache clearing, stats)
     DiscoveryEvents: Handles model discovery and introspection requests
     DispatchEvents: Handles command dispatch and execution with caching support
+    TableEvents: Handles paging and closing of streamed zTables
 
 Architecture:
     Event handlers are organized by domain responsibility, allowing the message
@@ -26,11 +27,13 @@ from .bridge_event_client import ClientEvents
 from .bridge_event_cache import CacheEvents
 from .bridge_event_discovery import DiscoveryEvents
 from .bridge_event_dispatch import DispatchEvents
+from .bridge_event_table import TableEvents
 
 __all__ = [
     'ClientEvents',
     'CacheEvents',
     'DiscoveryEvents',
-    'DispatchEvents'
+    'DispatchEvents',
+    'TableEvents'
 ]
 
@@ -80,6 +80,7 @@ KEY_STATS = "stats"
 
 # Cache Stats Keys
 KEY_QUERY_CACHE = "query_cache"
+KEY_REQUEST_ID = "_requestId"
 
 # Log Prefixes
 LOG_PREFIX = "[CacheEvents]"
@@ -178,6 +179,13 @@ class CacheEvents:
         self.connection_info = bifrost.connection_info
         self.auth = auth_manager
 
+    @staticmethod
+    def _reply(data: Dict[str, Any], response: Dict[str, Any]) -> str:
+        """Serialize response, echoing the request's _requestId for correlation."""
+        if KEY_REQUEST_ID in data:
+            response[KEY_REQUEST_ID] = data[KEY_REQUEST_ID]
+        return json.dumps(response)
+
     async def handle_get_schema(self, ws, data: Dict[str, Any]) -> None:
         """
         Retrieve schema definition for a specified model.
@@ -204,6 +212,8 @@ class CacheEvents:
         Response Format:
             Success: {"result": {"model": "users", "fields": [...]}}
             Error: {"error": "Missing model parameter"} or {"error": "Schema not found: users"}
+            The request's _requestId (if any) is echoed, since pipelined
+            requests may be answered out of order.
         
         Raises:
             Does not raise - logs errors instead for resilience
@@ -229,7 +239,7 @@ class CacheEvents:
         model = data.get(KEY_MODEL)
         if not model:
             try:
-                await ws.send(json.dumps({KEY_ERROR: ERR_NO_MODEL}))
+                await ws.send(self._reply(data, {KEY_ERROR: ERR_NO_MODEL}))
             except Exception as e:
                 self.logger.error(f"{LOG_PREFIX_SCHEMA} {ERR_SEND_FAILED}: {str(e)}")
             return
@@ -239,13 +249,13 @@ class CacheEvents:
             schema = self.connection_info.get_schema(model)
             
             if schema:
-                await ws.send(json.dumps({KEY_RESULT: schema}))
+                await ws.send(self._reply(data, {KEY_RESULT: schema}))
                 self.logger.debug(
                     f"{LOG_PREFIX_SCHEMA} {MSG_SCHEMA_SENT}: {model} | "
                     f"User: {user_id}"
                 )
             else:
-                await ws.send(json.dumps({KEY_ERROR: f"{ERR_SCHEMA_NOT_FOUND}: {model}"}))
+                await ws.send(self._reply(data, {KEY_ERROR: f"{ERR_SCHEMA_NOT_FOUND}: {model}"}))
                 self.logger.warning(
                     f"{LOG_PREFIX_SCHEMA} {ERR_SCHEMA_NOT_FOUND}: {model} | "
                     f"User: {user_id}"
@@ -256,7 +266,7 @@ class CacheEvents:
                 f"Model: {model} | User: {user_id} | Error: {str(e)}"
             )
             try:
-                await ws.send(json.dumps({KEY_ERROR: f"{ERR_CACHE_OP_FAILED}: {str(e)}"}))
+                await ws.send(self._reply(data, {KEY_ERROR: f"{ERR_CACHE_OP_FAILED}: {str(e)}"}))
             except Exception as send_err:
                 self.logger.error(f"{LOG_PREFIX_SCHEMA} {ERR_SEND_FAILED}: {str(send_err)}")
 
@@ -357,7 +367,8 @@ class CacheEvents:
         """
         Retrieve and send cache statistics to client.
         
-        Returns hit/miss/expired/size counts for query cache, useful for
+        Returns hit/miss/expired/eviction/invalidation counters and current
+        size (entries, bytes, limits) for the query cache, useful for
         monitoring cache effectiveness and debugging performance issues.
         
         Args:
@@ -376,7 +387,8 @@ class CacheEvents:
             Available to all authenticated users for monitoring purposes.
         
         Response Format:
-            {"result": {"query_cache": {"hits": 10, "misses": 2, ...}}}
+            {"result": {"query_cache": {"hits": 10, "misses": 2, "evictions": 0,
+                                        "invalidations": 3, "entries": 8, "bytes": 5120, ...}}}
         
         Raises:
             Does not raise - logs errors instead for resilience
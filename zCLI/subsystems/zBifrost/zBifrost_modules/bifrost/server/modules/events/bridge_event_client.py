@@ -9,6 +9,7 @@ between web frontends and the zCLI backend.
 Features:
     - Input Response Routing: Routes user input from web clients to zDisplay.zPrimitives
     - Connection Info Delivery: Sends server metadata and authentication context to clients
+    - Topic Subscriptions: subscribe/unsubscribe to broadcast topics (model:, zBlock:, user:)
     - User Context Awareness: Validates and logs authentication context for all events
     - Error Handling: Comprehensive exception handling for WebSocket and zCLI operations
     - Security: Integrates with three-tier authentication (zSession, application, dual)
@@ -53,6 +54,7 @@ Module Structure:
 """
 
 from zCLI import json, Dict, Any, Optional
+from ..bridge_fanout import TOPIC_USER, user_topic
 
 # ═══════════════════════════════════════════════════════════
 # Module Constants
@@ -61,9 +63,12 @@ from zCLI import json, Dict, Any, Optional
 # Data Keys (incoming event data)
 KEY_REQUEST_ID = "requestId"
 KEY_VALUE = "value"
+KEY_TOPICS = "topics"
+KEY_CORRELATION_ID = "_requestId"
 
 # Event Names
 EVENT_CONNECTION_INFO = "connection_info"
+EVENT_SUBSCRIPTIONS = "subscriptions"
 
 # Message Keys (outgoing messages)
 MSG_KEY_EVENT = "event"
@@ -73,6 +78,7 @@ MSG_KEY_DATA = "data"
 LOG_PREFIX = "[ClientEvents]"
 LOG_PREFIX_INPUT = "[ClientEvents:Input]"
 LOG_PREFIX_CONNECTION = "[ClientEvents:Connection]"
+LOG_PREFIX_TOPICS = "[ClientEvents:Topics]"
 
 # Error Messages
 ERR_NO_REQUEST_ID = "Missing requestId in input response"
@@ -81,6 +87,8 @@ ERR_NO_DISPLAY = "zDisplay subsystem not available"
 ERR_NO_PRIMITIVES = "zDisplay.zPrimitives not available"
 ERR_SEND_FAILED = "Failed to send connection info"
 ERR_ROUTE_FAILED = "Failed to route input response"
+ERR_BAD_TOPICS = "topics must be a list of strings"
+ERR_FOREIGN_USER_TOPIC = "Cannot subscribe to another user's topic"
 
 # User Context Keys (for logging)
 CONTEXT_KEY_USER_ID = "user_id"
@@ -303,6 +311,94 @@ class ClientEvents:
                 f"User: {user_id} | Error: {str(e)}"
             )
     
+    def join_user_topic(self, ws) -> Optional[str]:
+        """
+        Subscribe an authenticated connection to its own user topic.
+        
+        Called on registration, so every connection of a user receives what
+        is published to ``user:<user_id>``. Anonymous connections join nothing.
+        
+        Args:
+            ws: WebSocket connection
+        
+        Returns:
+            The joined topic, or None for anonymous connections
+        """
+        user_id = self._extract_user_context(ws).get(CONTEXT_KEY_USER_ID, DEFAULT_USER_ID)
+        if user_id == DEFAULT_USER_ID:
+            return None
+        topic = user_topic(user_id)
+        self.bifrost.fanout.subscribe(ws, [topic])
+        return topic
+    
+    async def handle_subscribe(self, ws, data: Dict[str, Any]) -> None:
+        """
+        Subscribe the connection to broadcast topics.
+        
+        Args:
+            ws: WebSocket connection
+            data: Event data containing:
+                - topics (list[str]): e.g. ["model:users", "zBlock:Dashboard"]
+        
+        Security:
+            ``user:`` topics other than the caller's own are rejected, so a
+            client cannot listen in on another user's results.
+        
+        Message Format:
+            {"event": "subscriptions", "topics": [...all current topics...]}
+        """
+        topics = data.get(KEY_TOPICS)
+        if not isinstance(topics, list) or not all(isinstance(topic, str) for topic in topics):
+            await self._send_topics_reply(ws, data, error=ERR_BAD_TOPICS)
+            return
+        
+        own_topic = user_topic(self._extract_user_context(ws).get(CONTEXT_KEY_USER_ID, DEFAULT_USER_ID))
+        if any(topic.startswith(TOPIC_USER) and topic != own_topic for topic in topics):
+            self.logger.warning(f"{LOG_PREFIX_TOPICS} {ERR_FOREIGN_USER_TOPIC}: {topics}")
+            await self._send_topics_reply(ws, data, error=ERR_FOREIGN_USER_TOPIC)
+            return
+        
+        joined = self.bifrost.fanout.subscribe(ws, topics)
+        self.logger.debug(f"{LOG_PREFIX_TOPICS} Subscribed: {topics}")
+        await self._send_topics_reply(ws, data, topics=joined)
+    
+    async def handle_unsubscribe(self, ws, data: Dict[str, Any]) -> None:
+        """
+        Unsubscribe the connection from topics (all topics if none are given).
+        
+        Args:
+            ws: WebSocket connection
+            data: Event data containing:
+                - topics (list[str], optional): Topics to leave
+        
+        Message Format:
+            {"event": "subscriptions", "topics": [...remaining topics...]}
+        """
+        topics = data.get(KEY_TOPICS)
+        if topics is not None and (not isinstance(topics, list) or
+                                   not all(isinstance(topic, str) for topic in topics)):
+            await self._send_topics_reply(ws, data, error=ERR_BAD_TOPICS)
+            return
+        
+        remaining = self.bifrost.fanout.unsubscribe(ws, topics)
+        self.logger.debug(f"{LOG_PREFIX_TOPICS} Unsubscribed: {topics or 'all'}")
+        await self._send_topics_reply(ws, data, topics=remaining)
+    
+    async def _send_topics_reply(self, ws, data: Dict[str, Any], topics: Optional[list] = None,
+                                 error: Optional[str] = None) -> None:
+        """Send the subscription state (or an error), echoing _requestId."""
+        response: Dict[str, Any] = {MSG_KEY_EVENT: EVENT_SUBSCRIPTIONS}
+        if error:
+            response["error"] = error
+        else:
+            response[KEY_TOPICS] = topics
+        if KEY_CORRELATION_ID in data:
+            response[KEY_CORRELATION_ID] = data[KEY_CORRELATION_ID]
+        try:
+            await ws.send(json.dumps(response))
+        except Exception as e:
+            self.logger.error(f"{LOG_PREFIX_TOPICS} Failed to send subscriptions: {str(e)}")
+    
     def _extract_user_context(self, ws) -> Dict[str, str]:
         """
         Extract user authentication context from WebSocket connection.
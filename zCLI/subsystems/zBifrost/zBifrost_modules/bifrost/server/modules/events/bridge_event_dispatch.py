@@ -11,7 +11,7 @@ Features:
     - Cache-Aware Dispatch: Automatically caches read operations (list, get, search)
     - User Context Isolation: Each user/app gets isolated cache entries
     - Cache Hit/Miss Optimization: Returns cached results instantly when available
-    - Broadcast Support: Sends results to all connected clients for real-time updates
+    - Topic Fan-out: Shares results with interested clients only (see Broadcast Topics)
     - User Context Awareness: Logs authentication context for all operations
     - Error Handling: Comprehensive exception handling for resilience
 
@@ -26,13 +26,31 @@ Caching Strategy:
         - Commands starting with ^List, ^Get, ^Search
         - Commands with action="read"
         - Cached per user/app for isolation
+        - Tagged with the request's model/table
         - TTL configurable per request or global default
         - Can be disabled with no_cache=True
     
     Write Operations (non-cacheable):
-        - All other commands (create, update, delete)
+        - Commands starting with ^Create, ^Update, ^Delete, ^Insert, ^Upsert
+        - Commands with action="create"/"insert"/"update"/"delete"/"upsert"
         - Always executed fresh
-        - Invalidate related cache entries (future enhancement)
+        - Evict cached reads tagged with the same model/table (all cached
+          reads when the write names no model)
+    
+    Other commands are neither cached nor invalidating.
+
+Broadcast Topics:
+    Besides the reply to the requester, a result is published to:
+        - ``user:<user_id>`` - the same user's other connections (never for
+          anonymous users, whose per-user reads must not leak to others)
+        - ``model:<model>`` and ``zBlock:<zBlock>`` - writes only, so views
+          subscribed to that model or block can refresh
+
+Display Events:
+    zDisplay events captured while the command ran are sent after the result,
+    one ``{"event": "display", "data": ...}`` frame each. A request with
+    ``"_batch": true`` gets them all in one frame instead:
+    ``{"event": "display_batch", "events": [...]}``.
 
 Security Model:
     User context (user_id, app_name, role, auth_context) is extracted and logged
@@ -45,7 +63,7 @@ Integration:
     - CacheManager (bridge_cache.py): For caching with user isolation
     - AuthenticationManager (bridge_auth.py): For user context extraction
     - zSession/zAuth: For three-tier authentication context
-    - Broadcast: For multi-client real-time updates
+    - FanoutHub (bridge_fanout.py): For topic-based multi-client updates
 
 Example:
     ```python
@@ -81,7 +99,8 @@ Module Structure:
     - _extract_user_context: Extracts authentication context from WebSocket
 """
 
-from zCLI import asyncio, json, Dict, Any, Optional
+from zCLI import json, Dict, Any, Optional, List
+from ..bridge_fanout import block_topic, model_topic, user_topic
 
 # ═══════════════════════════════════════════════════════════
 # Module Constants
@@ -95,19 +114,30 @@ KEY_ACTION = "action"
 KEY_CACHE_TTL = "cache_ttl"
 KEY_NO_CACHE = "no_cache"
 KEY_REQUEST_ID = "_requestId"
+KEY_ZBLOCK = "zBlock"
+KEY_BATCH = "_batch"  # Client opt-in: all display events in one frame
 
 # Response Keys (outgoing messages)
 KEY_RESULT = "result"
 KEY_ERROR = "error"
 KEY_CACHED = "_cached"
+KEY_EVENT = "event"
+KEY_DATA = "data"
+KEY_EVENTS = "events"
+
+# Display event frames
+EVENT_DISPLAY = "display"
+EVENT_DISPLAY_BATCH = "display_batch"
 
 # Action Types
 ACTION_READ = "read"
+WRITE_ACTIONS = ("create", "insert", "update", "delete", "upsert")
 
 # Command Prefixes (for cache detection)
 CMD_PREFIX_LIST = "^List"
 CMD_PREFIX_GET = "^Get"
 CMD_PREFIX_SEARCH = "^Search"
+CMD_PREFIXES_WRITE = ("^Create", "^Update", "^Delete", "^Insert", "^Upsert")
 
 # zDispatch Context Keys
 CONTEXT_KEY_WEBSOCKET_DATA = "websocket_data"
@@ -208,6 +238,7 @@ class DispatchEvents:
         self.cache = bifrost.cache
         self.zcli = bifrost.zcli
         self.walker = bifrost.walker
+        self.executor = bifrost.executor
         self.auth = auth_manager
     
     async def handle_dispatch(self, ws, data: Dict[str, Any]) -> None:
@@ -227,6 +258,7 @@ class DispatchEvents:
                 - cache_ttl (int, optional): Custom cache TTL in seconds
                 - no_cache (bool, optional): Bypass cache even for read operations
                 - _requestId (str, optional): Request ID for response correlation
+                - _batch (bool, optional): Send display events as one display_batch frame
                 - ... (other command-specific parameters)
         
         Process:
@@ -299,6 +331,8 @@ class DispatchEvents:
         
         # Check cache behavior
         is_cacheable = self._is_cacheable_operation(data, zKey)
+        is_write = not is_cacheable and self._is_write_operation(data, zKey)
+        cache_tags = self.cache.query_tags(data)
         cache_ttl = data.get(KEY_CACHE_TTL, None)
         disable_cache = data.get(KEY_NO_CACHE, False)
         
@@ -322,7 +356,9 @@ class DispatchEvents:
                 
                 try:
                     await ws.send(payload)
-                    await self.bifrost.broadcast(payload, sender=ws)
+                    topics = self._broadcast_topics(data, user_id, cache_tags, is_write=False)
+                    if topics:
+                        await self.bifrost.broadcast(payload, sender=ws, topics=topics)
                     self.logger.debug(
                         f"{LOG_PREFIX_CACHE_HIT} {MSG_RESULT_SENT} | "
                         f"Command: {zKey} | User: {user_id}"
@@ -346,6 +382,9 @@ class DispatchEvents:
                 f"Command: {zKey} | User: {user_id}"
             )
         
+        # Writes that land while this read runs make its result unsafe to cache
+        read_epoch = self.cache.write_epoch
+        
         try:
             # Execute via zDispatch
             from zCLI.subsystems.zDispatch import handle_zDispatch
@@ -355,8 +394,9 @@ class DispatchEvents:
                 CONTEXT_KEY_MODE: MODE_ZBIFROST
             }
             
-            result = await asyncio.to_thread(
-                handle_zDispatch, zKey, zHorizontal,
+            # Bounded worker pool, queued per client so one busy client can't starve others
+            result = await self.executor.run(
+                ws, handle_zDispatch, zKey, zHorizontal,
                 zcli=self.zcli, walker=self.walker, context=context
             )
             
@@ -368,6 +408,8 @@ class DispatchEvents:
                 # New structure: {result: ..., events: [...]}
                 actual_result = result['result']
                 buffered_events = result['events']
+                # Streamed zTables (zTable_start) can only be paged by this connection
+                self.zcli.display.table_streams.claim(buffered_events, ws)
                 self.logger.debug(
                     f"{LOG_PREFIX_EXECUTE} Captured {len(buffered_events)} display events | "
                     f"Command: {zKey} | User: {user_id}"
@@ -376,7 +418,10 @@ class DispatchEvents:
             # Cache result if cacheable (cache only the actual result, not events)
             if is_cacheable and not disable_cache:
                 cache_key = self.cache.generate_cache_key(data, user_context)
-                self.cache.cache_query(cache_key, actual_result, ttl=cache_ttl)
+                self.cache.cache_query(
+                    cache_key, actual_result, ttl=cache_ttl,
+                    tags=cache_tags, user_context=user_context, epoch=read_epoch
+                )
                 self.logger.debug(
                     f"{LOG_PREFIX_EXECUTE} Result cached | "
                     f"Command: {zKey} | User: {user_id}"
@@ -404,6 +449,14 @@ class DispatchEvents:
                 response[KEY_REQUEST_ID] = data[KEY_REQUEST_ID]
             payload = json.dumps(response)
         
+        # Evict dependent reads (also after a failed write - it may have partly applied)
+        if is_write:
+            evicted = self.cache.invalidate_queries(cache_tags)
+            self.logger.debug(
+                f"{LOG_PREFIX_EXECUTE} Write invalidated {evicted} cached reads | "
+                f"Command: {zKey} | Tags: {sorted(cache_tags) or 'all'}"
+            )
+        
         # Send result back and broadcast
         try:
             await ws.send(payload)
@@ -414,7 +467,9 @@ class DispatchEvents:
             )
         
         try:
-            await self.bifrost.broadcast(payload, sender=ws)
+            topics = self._broadcast_topics(data, user_id, cache_tags, is_write)
+            if topics:
+                await self.bifrost.broadcast(payload, sender=ws, topics=topics)
         except Exception as broadcast_err:
             self.logger.error(
                 f"{LOG_PREFIX_EXECUTE} {ERR_BROADCAST_FAILED} | "
@@ -422,12 +477,24 @@ class DispatchEvents:
             )
         
         # Send buffered display events if any (new zBifrost capture pattern)
-        if 'buffered_events' in locals() and buffered_events:
+        if 'buffered_events' in locals() and buffered_events and data.get(KEY_BATCH):
+            try:
+                await ws.send(json.dumps({KEY_EVENT: EVENT_DISPLAY_BATCH, KEY_EVENTS: buffered_events}))
+                self.logger.debug(
+                    f"{LOG_PREFIX_EXECUTE} Sent {len(buffered_events)} display events in one frame | "
+                    f"Command: {zKey}"
+                )
+            except Exception as event_err:
+                self.logger.error(
+                    f"{LOG_PREFIX_EXECUTE} Failed to send display batch | "
+                    f"Command: {zKey} | Error: {str(event_err)}"
+                )
+        elif 'buffered_events' in locals() and buffered_events:
             for event in buffered_events:
                 try:
                     event_payload = json.dumps({
-                        'event': 'display',
-                        'data': event
+                        KEY_EVENT: EVENT_DISPLAY,
+                        KEY_DATA: event
                     })
                     await ws.send(event_payload)
                     self.logger.debug(
@@ -476,6 +543,54 @@ class DispatchEvents:
             zKey.startswith(CMD_PREFIX_SEARCH)
         )
     
+    def _is_write_operation(self, data: Dict[str, Any], zKey: str) -> bool:
+        """
+        Determine if command writes data (and must invalidate cached reads).
+        
+        Args:
+            data: Message data with potential action field
+            zKey: Command key
+        
+        Returns:
+            bool: True for create/insert/update/delete/upsert commands
+        
+        Example:
+            ```python
+            is_write = self._is_write_operation({"model": "users"}, "^DeleteUser")
+            # Returns: True
+            ```
+        """
+        return (
+            data.get(KEY_ACTION) in WRITE_ACTIONS or
+            zKey.startswith(CMD_PREFIXES_WRITE)
+        )
+    
+    def _broadcast_topics(self, data: Dict[str, Any], user_id: str, tags: Any, is_write: bool) -> List[str]:
+        """
+        Topics a dispatch result is published to (besides the reply itself).
+        
+        Args:
+            data: Message data (zBlock is used for writes)
+            user_id: Requesting user (anonymous users get no user topic)
+            tags: Model/table names from CacheManager.query_tags()
+            is_write: True if the command changed data
+        
+        Returns:
+            list: Topic names, possibly empty (then nothing is broadcast)
+        
+        Example:
+            ```python
+            self._broadcast_topics({"zBlock": "Users"}, "alice", {"users"}, True)
+            # Returns: ["user:alice", "model:users", "zBlock:Users"]
+            ```
+        """
+        topics = [] if user_id == DEFAULT_USER_ID else [user_topic(user_id)]
+        if is_write:
+            topics.extend(model_topic(tag) for tag in sorted(tags))
+            if data.get(KEY_ZBLOCK):
+                topics.append(block_topic(data[KEY_ZBLOCK]))
+        return topics
+    
     def _extract_user_context(self, ws) -> Dict[str, str]:
         """
         Extract user authentication context from WebSocket connection.
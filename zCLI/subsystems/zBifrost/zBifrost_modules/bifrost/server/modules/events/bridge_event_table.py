@@ -0,0 +1,190 @@
+# zCLI/subsystems/zComm/zComm_modules/bifrost/bridge_modules/events/bridge_event_table.py
+"""
+Streamed zTable Event Handlers for zBifrost WebSocket Bridge.
+
+In Bifrost mode, a large zTable is not sent as one event. The server opens a
+cursor over its rows (zDisplay.table_streams) and sends zTable_start, the
+first page as sequenced zTable_chunk events, and zTable_end {has_more}.
+These handlers let the client page through the rest of the table without
+running the query again.
+
+Events:
+    table_fetch {stream, rows?, _requestId?, _batch?}
+        Sends the next page as display events (zTable_chunk ..., zTable_end),
+        then replies {result: {stream, sent, has_more}}.
+    table_close {stream, _requestId?}
+        Discards the cursor (e.g. the user navigated away) and replies
+        {result: {stream, closed}}.
+
+Security Model:
+    A stream belongs to the connection whose dispatch or walker request
+    created it. Other connections get an error. Streams close when their
+    connection closes (zBifrost._cleanup_client).
+
+Integration:
+    - display_table_stream.py (TableStreams): cursor registry
+    - bifrost_bridge.py: event map, PIPELINED_EVENTS (table_fetch)
+    - bridge_pipeline.py (FairExecutor): page reads run off the event loop
+
+Example:
+    ```python
+    table_events = TableEvents(bifrost, auth_manager=auth_manager)
+    await table_events.handle_fetch(ws, {"stream": "9f2c...", "_requestId": 7})
+    await table_events.handle_close(ws, {"stream": "9f2c..."})
+    ```
+"""
+
+from zCLI import json, time, Dict, Any, Optional
+
+# ═══════════════════════════════════════════════════════════
+# Module Constants
+# ═══════════════════════════════════════════════════════════
+
+# Data Keys (incoming event data)
+KEY_STREAM = "stream"
+KEY_ROWS = "rows"  # Optional page size for this fetch
+KEY_REQUEST_ID = "_requestId"
+KEY_BATCH = "_batch"  # Client opt-in: the whole page in one frame
+
+# Response Keys (outgoing messages)
+KEY_RESULT = "result"
+KEY_ERROR = "error"
+KEY_EVENT = "event"
+KEY_DATA = "data"
+KEY_EVENTS = "events"
+KEY_DISPLAY_EVENT = "display_event"
+KEY_TIMESTAMP = "timestamp"
+KEY_SENT = "sent"
+KEY_HAS_MORE = "has_more"
+KEY_CLOSED = "closed"
+
+# Display event frames
+EVENT_DISPLAY = "display"
+EVENT_DISPLAY_BATCH = "display_batch"
+
+# Log Prefixes
+LOG_PREFIX_FETCH = "[TableEvents:Fetch]"
+LOG_PREFIX_CLOSE = "[TableEvents:Close]"
+
+# Error Messages
+ERR_NO_STREAM = "Missing stream parameter"
+ERR_INVALID_ROWS = "Invalid rows value"
+ERR_SEND_FAILED = "Failed to send response"
+
+
+# ═══════════════════════════════════════════════════════════
+# TableEvents Class
+# ═══════════════════════════════════════════════════════════
+
+class TableEvents:
+    """
+    Handles paging of streamed zTables for the zBifrost WebSocket bridge.
+
+    Attributes:
+        bifrost: zBifrost instance (provides logger, zcli, executor)
+        logger: Logger instance from bifrost
+        streams: zDisplay.table_streams registry
+        executor: FairExecutor running page reads off the event loop
+        auth: AuthenticationManager instance (kept for parity with other handlers)
+    """
+
+    def __init__(self, bifrost, auth_manager: Optional[Any] = None) -> None:
+        """
+        Initialize table events handler.
+
+        Args:
+            bifrost: zBifrost instance providing logger, zcli, executor
+            auth_manager: Optional AuthenticationManager
+        """
+        self.bifrost = bifrost
+        self.logger = bifrost.logger
+        self.zcli = bifrost.zcli
+        self.executor = bifrost.executor
+        self.auth = auth_manager
+
+    @property
+    def streams(self) -> Any:
+        """zDisplay's TableStreams registry (None without a display)."""
+        display = getattr(self.zcli, "display", None)
+        return getattr(display, "table_streams", None)
+
+    async def handle_fetch(self, ws, data: Dict[str, Any]) -> None:
+        """
+        Send the next page of a streamed zTable.
+
+        Args:
+            ws: WebSocket connection that owns the stream
+            data: Event data containing:
+                - stream (str): Stream id from zTable_start (required)
+                - rows (int, optional): Page size for this fetch
+                - _batch (bool, optional): Send the page as one display_batch frame
+                - _requestId (optional): Request ID for response correlation
+        """
+        stream_id = data.get(KEY_STREAM)
+        size = data.get(KEY_ROWS)
+        if not stream_id or self.streams is None:
+            await self._send(ws, {KEY_ERROR: ERR_NO_STREAM}, data)
+            return
+        if size is not None and (not isinstance(size, int) or isinstance(size, bool) or size < 1):
+            await self._send(ws, {KEY_ERROR: ERR_INVALID_ROWS}, data)
+            return
+
+        try:
+            # Reading rows can touch the database - keep it off the event loop
+            page = await self.executor.run(ws, self.streams.page, stream_id, size, owner=ws)
+        except (KeyError, PermissionError) as exc:
+            message = exc.args[0] if exc.args else str(exc)
+            self.logger.debug(f"{LOG_PREFIX_FETCH} {message}")
+            await self._send(ws, {KEY_ERROR: message}, data)
+            return
+
+        now = time.time()
+        events = [
+            {KEY_DISPLAY_EVENT: name, KEY_DATA: event_data, KEY_TIMESTAMP: now}
+            for name, event_data in page
+        ]
+        try:
+            if data.get(KEY_BATCH):
+                await ws.send(json.dumps({KEY_EVENT: EVENT_DISPLAY_BATCH, KEY_EVENTS: events}))
+            else:
+                for event in events:
+                    await ws.send(json.dumps({KEY_EVENT: EVENT_DISPLAY, KEY_DATA: event}))
+        except Exception as send_err:
+            self.logger.error(f"{LOG_PREFIX_FETCH} {ERR_SEND_FAILED} | Error: {str(send_err)}")
+            return
+
+        end = events[-1][KEY_DATA]
+        self.logger.debug(
+            f"{LOG_PREFIX_FETCH} Stream {stream_id} | Sent: {end[KEY_SENT]} | More: {end[KEY_HAS_MORE]}"
+        )
+        await self._send(ws, {KEY_RESULT: {
+            KEY_STREAM: stream_id,
+            KEY_SENT: end[KEY_SENT],
+            KEY_HAS_MORE: end[KEY_HAS_MORE]
+        }}, data)
+
+    async def handle_close(self, ws, data: Dict[str, Any]) -> None:
+        """
+        Discard a streamed zTable's cursor before it is exhausted.
+
+        Args:
+            ws: WebSocket connection that owns the stream
+            data: Event data containing stream (str, required) and optional _requestId
+        """
+        stream_id = data.get(KEY_STREAM)
+        if not stream_id or self.streams is None:
+            await self._send(ws, {KEY_ERROR: ERR_NO_STREAM}, data)
+            return
+
+        closed = self.streams.close(stream_id, owner=ws)
+        self.logger.debug(f"{LOG_PREFIX_CLOSE} Stream {stream_id} | Closed: {closed}")
+        await self._send(ws, {KEY_RESULT: {KEY_STREAM: stream_id, KEY_CLOSED: closed}}, data)
+
+    async def _send(self, ws, response: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Send a response, echoing the request's _requestId."""
+        if KEY_REQUEST_ID in data:
+            response[KEY_REQUEST_ID] = data[KEY_REQUEST_ID]
+        try:
+            await ws.send(json.dumps(response))
+        except Exception as send_err:
+            self.logger.error(f"{ERR_SEND_FAILED} | Error: {str(send_err)}")
@@ -14,7 +14,8 @@ Architecture:
     zComm follows the Facade pattern, providing a unified interface to multiple
     communication subsystems while delegating implementation to specialized managers:
     
-    - HTTPClient: Synchronous HTTP request handling
+    - HTTPClient: Synchronous HTTP request handling (pooled, keep-alive, retry/backoff)
+    - AsyncHTTPClient: Awaitable HTTP requests over the same pools
     - ServiceManager: Local database/cache service management
     - NetworkUtils: Port checking and network utilities
 
@@ -57,6 +58,7 @@ Public API (Network Primitives):
     
     HTTP Client (Outgoing Requests):
         - http_get(), http_post(), http_put(), http_patch(), http_delete()
+        - http_async.get(), .post(), ... (awaitable, for the zBifrost event loop)
     
     WebSocket Primitives:
         - websocket.start(), websocket.send(), websocket.broadcast()
@@ -95,7 +97,7 @@ See Also:
 
 from zCLI import Any, Dict, Optional
 from zCLI.utils import print_ready_message, validate_zcli_instance
-from .zComm_modules import ServiceManager, HTTPClient, NetworkUtils, WebSocketServer
+from .zComm_modules import ServiceManager, HTTPClient, AsyncHTTPClient, NetworkUtils, WebSocketServer
 
 # ═══════════════════════════════════════════════════════════
 # Module Constants
@@ -134,6 +136,7 @@ LOG_MSG_SERVICE_CONN_INFO = "Service '%s' connection info: %s"
 HEALTH_KEY_RUNNING = "running"
 HEALTH_KEY_ERROR = "error"
 HEALTH_KEY_HTTP_SERVER = "http_server"
+HEALTH_KEY_HTTP_CLIENT = "http_client"
 
 HEALTH_MSG_HTTP_NOT_AVAIL = "HTTP server not available"
 
@@ -157,7 +160,8 @@ class zComm:
     
     Architecture:
         Layer 0 subsystem providing communication infrastructure:
-        - HTTPClient: Synchronous HTTP requests
+        - HTTPClient: Synchronous HTTP requests (pooled keep-alive session)
+        - AsyncHTTPClient: The same requests as coroutines (zBifrost event loop)
         - ServiceManager: Local database/cache services (PostgreSQL, Redis, etc.)
         - NetworkUtils: Port checking and network utilities
     
@@ -175,6 +179,7 @@ class zComm:
         mycolor: Color code for console output
         services: ServiceManager instance (public API)
         _http_client: HTTPClient instance (private, use methods)
+        http_async: AsyncHTTPClient sharing _http_client's pools
         _network_utils: NetworkUtils instance (private, use methods)
     
     Public API Groups:
@@ -183,6 +188,7 @@ class zComm:
         - Health Checks: server_health_check, health_check_all
         - Network: check_port
         - HTTP Client: http_get, http_post, http_put, http_patch, http_delete
+        - Async HTTP Client: http_async.get/post/put/patch/delete (awaitable)
     
     Example:
         ```python
@@ -214,6 +220,7 @@ class zComm:
     logger: Any
     mycolor: str
     _http_client: HTTPClient
+    http_async: AsyncHTTPClient
     _network_utils: NetworkUtils
     services: ServiceManager
 
@@ -251,6 +258,7 @@ class zComm:
 
         # Initialize modular components
         self._http_client = HTTPClient(self.logger)
+        self.http_async = AsyncHTTPClient(self._http_client)
         self._network_utils = NetworkUtils(self.logger)
         self._websocket_server = WebSocketServer(self.logger, zcli.config.websocket)
         self.services = ServiceManager(self.logger)
@@ -471,20 +479,32 @@ class zComm:
         Get health status for all communication services.
         
         Returns:
-            Dict with combined health status for HTTP server
+            Dict with combined health status for HTTP server and HTTP client pools
         
         Example:
             ```python
             health = comm.health_check_all()
             # health = {
-            #     "http_server": {"running": True, ...}
+            #     "http_server": {"running": True, ...},
+            #     "http_client": {"connections_opened": 2, "requests": 40, "requests_reused": 38, ...}
             # }
             ```
         """
         return {
-            HEALTH_KEY_HTTP_SERVER: self.server_health_check()
+            HEALTH_KEY_HTTP_SERVER: self.server_health_check(),
+            HEALTH_KEY_HTTP_CLIENT: self._http_client.get_stats()
         }
 
+    def close_http_clients(self) -> None:
+        """
+        Release the pooled HTTP clients (called from zCLI.shutdown).
+        
+        Stops the async client's worker threads first (pending requests finish),
+        then closes the shared session's pooled connections.
+        """
+        self.http_async.close()
+        self._http_client.close()
+
     # ═══════════════════════════════════════════════════════════
     # Network Utilities - Delegated to NetworkUtils
     # ═══════════════════════════════════════════════════════════
@@ -6,9 +6,9 @@ Provides specialized managers for HTTP client, service management, and network u
 """
 
 from .comm_services import ServiceManager
-from .comm_http import HTTPClient
+from .comm_http import HTTPClient, AsyncHTTPClient
 from .comm_websocket import WebSocketServer
 from .comm_websocket_auth import WebSocketAuth
 from .helpers.network_utils import NetworkUtils
 
-__all__ = ['ServiceManager', 'HTTPClient', 'WebSocketServer', 'WebSocketAuth', 'NetworkUtils']
+__all__ = ['ServiceManager', 'HTTPClient', 'AsyncHTTPClient', 'WebSocketServer', 'WebSocketAuth', 'NetworkUtils']
@@ -5,8 +5,20 @@ HTTP client for zComm subsystem.
 Provides a complete HTTP client for making web requests (GET, POST, PUT, PATCH, DELETE).
 This is a pure communication layer with no authentication logic - auth should be handled
 by the caller (e.g., zAuth subsystem).
+
+Requests go through one pooled requests.Session per client: keep-alive connections
+are reused (no TCP/TLS handshake per call), each host gets at most pool_maxsize
+connections, and failed connects - plus 502/503/504 on idempotent methods - are
+retried with exponential backoff. Cookies are never stored between calls, as with
+module-level requests.get(). AsyncHTTPClient exposes the same methods as
+coroutines for code running on an event loop (zBifrost handlers).
 """
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
 from zCLI import Any, Dict, Optional, requests
 
 # ═══════════════════════════════════════════════════════════════════
@@ -19,6 +31,23 @@ LOG_PREFIX = "[HTTPClient]"
 # Network Configuration
 DEFAULT_TIMEOUT = 10  # seconds
 
+# Connection Pool & Retry Policy
+DEFAULT_POOL_CONNECTIONS = 10  # Hosts with a kept-alive pool
+DEFAULT_POOL_MAXSIZE = 10  # Connections per host (callers wait for a free one)
+DEFAULT_MAX_RETRIES = 2  # Retries after the first attempt
+DEFAULT_BACKOFF_FACTOR = 0.3  # Sleep 0.3s, 0.6s, 1.2s, ... between retries
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})  # Idempotent only
+URL_SCHEMES = ("http://", "https://")
+
+# Stats Keys
+STAT_POOL_MAXSIZE = "pool_maxsize"
+STAT_MAX_RETRIES = "max_retries"
+STAT_HOSTS = "hosts"
+STAT_CONNECTIONS = "connections_opened"
+STAT_REQUESTS = "requests"
+STAT_REUSED = "requests_reused"
+
 # Log Messages
 LOG_REQUEST = "Making HTTP {method} request to {url}"
 LOG_REQUEST_PAYLOAD = "Request payload: {data}"
@@ -48,14 +77,92 @@ class HTTPClient:
         ...     print(f"Status: {response.status_code}")
     """
 
-    def __init__(self, logger: Any) -> None:
+    def __init__(self, logger: Any, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF_FACTOR) -> None:
         """
-        Initialize HTTP client.
+        Initialize HTTP client (the session is created on first request).
         
         Args:
             logger: Logger instance for debug/error output
+            pool_connections: Number of hosts whose connection pools are kept
+            pool_maxsize: Maximum open connections per host
+            max_retries: Retries for failed connects and 502/503/504 (idempotent methods)
+            backoff_factor: Exponential backoff base between retries, in seconds
         """
         self.logger = logger
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._session: Optional[Any] = None
+        self._adapters: Dict[str, Any] = {}
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        """Pooled requests.Session, created on first use (keeps requests import deferred)."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Any:
+        """Build a Session with bounded per-host pools and the retry/backoff policy."""
+        from urllib3.util.retry import Retry  # pylint: disable=import-outside-toplevel
+
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,  # Return the last 5xx response instead of raising
+        )
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))  # Stateless, like requests.get()
+        for scheme in URL_SCHEMES:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=retry,
+                pool_block=True,  # Enforce the per-host limit: wait for a free connection
+            )
+            session.mount(scheme, adapter)
+            self._adapters[scheme] = adapter
+        return session
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics: per-host connections opened vs requests sent (reuse = requests - connections)."""
+        hosts: Dict[str, Dict[str, int]] = {}
+        for adapter in list(self._adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                    STAT_CONNECTIONS: pool.num_connections,
+                    STAT_REQUESTS: pool.num_requests,
+                }
+        connections = sum(host[STAT_CONNECTIONS] for host in hosts.values())
+        sent = sum(host[STAT_REQUESTS] for host in hosts.values())
+        return {
+            STAT_POOL_MAXSIZE: self.pool_maxsize,
+            STAT_MAX_RETRIES: self.max_retries,
+            STAT_CONNECTIONS: connections,
+            STAT_REQUESTS: sent,
+            STAT_REUSED: max(0, sent - connections),
+            STAT_HOSTS: hosts,
+        }
+
+    def close(self) -> None:
+        """Close pooled connections; the next request opens a new session."""
+        with self._session_lock:
+            session, self._session = self._session, None
+            self._adapters = {}
+        if session is not None:
+            session.close()
 
     def post(self, url: str, data: Optional[Dict[str, Any]] = None, 
              timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
@@ -105,7 +212,7 @@ class HTTPClient:
             self.logger.debug(f"{LOG_PREFIX} {LOG_REQUEST_PAYLOAD.format(data=data)}")
 
         try:
-            response = requests.post(url, json=data, timeout=timeout)
+            response = self.session.post(url, json=data, timeout=timeout)
             self.logger.debug(
                 f"{LOG_PREFIX} {LOG_RESPONSE_RECEIVED.format(status=response.status_code)}"
             )
@@ -170,7 +277,7 @@ class HTTPClient:
             self.logger.debug(f"{LOG_PREFIX} {LOG_REQUEST_PARAMS.format(params=params)}")
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=timeout)
+            response = self.session.get(url, params=params, headers=headers, timeout=timeout)
             self.logger.debug(
                 f"{LOG_PREFIX} {LOG_RESPONSE_RECEIVED.format(status=response.status_code)}"
             )
@@ -233,7 +340,7 @@ class HTTPClient:
             self.logger.debug(f"{LOG_PREFIX} {LOG_REQUEST_PAYLOAD.format(data=data)}")
 
         try:
-            response = requests.put(url, json=data, headers=headers, timeout=timeout)
+            response = self.session.put(url, json=data, headers=headers, timeout=timeout)
             self.logger.debug(
                 f"{LOG_PREFIX} {LOG_RESPONSE_RECEIVED.format(status=response.status_code)}"
             )
@@ -296,7 +403,7 @@ class HTTPClient:
             self.logger.debug(f"{LOG_PREFIX} {LOG_REQUEST_PAYLOAD.format(data=data)}")
 
         try:
-            response = requests.patch(url, json=data, headers=headers, timeout=timeout)
+            response = self.session.patch(url, json=data, headers=headers, timeout=timeout)
             self.logger.debug(
                 f"{LOG_PREFIX} {LOG_RESPONSE_RECEIVED.format(status=response.status_code)}"
             )
@@ -354,7 +461,7 @@ class HTTPClient:
         self.logger.debug(f"{LOG_PREFIX} {LOG_REQUEST.format(method='DELETE', url=url)}")
 
         try:
-            response = requests.delete(url, headers=headers, timeout=timeout)
+            response = self.session.delete(url, headers=headers, timeout=timeout)
             self.logger.debug(
                 f"{LOG_PREFIX} {LOG_RESPONSE_RECEIVED.format(status=response.status_code)}"
             )
@@ -369,3 +476,74 @@ class HTTPClient:
             error_msg = ERROR_REQUEST_FAILED.format(method='DELETE', url=url, error=str(e))
             self.logger.error(f"{LOG_PREFIX} {error_msg}")
             return None
+
+
+class AsyncHTTPClient:
+    """
+    Asyncio counterpart of HTTPClient, for code running on an event loop.
+    
+    Each call runs the pooled HTTPClient on a dedicated thread pool (one worker
+    per pooled connection), so Bifrost handlers await responses without blocking
+    the loop and share the same keep-alive pools and retry policy.
+    
+    Example:
+        >>> client = AsyncHTTPClient(HTTPClient(logger))
+        >>> response = await client.get("https://api.example.com/users")
+    """
+
+    def __init__(self, client: HTTPClient) -> None:
+        """
+        Initialize async client.
+        
+        Args:
+            client: Pooled HTTPClient that performs the requests
+        """
+        self.client = client
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Schedule func on the HTTP thread pool; returns an awaitable."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.client.pool_maxsize, thread_name_prefix="zHTTP"
+                    )
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None,
+                  timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+        """Async HTTPClient.get() - Response on success, None on failure."""
+        return await self._run(self.client.get, url, params=params, headers=headers, timeout=timeout)
+
+    async def post(self, url: str, data: Optional[Dict[str, Any]] = None,
+                   timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+        """Async HTTPClient.post() - Response on success, None on failure."""
+        return await self._run(self.client.post, url, data=data, timeout=timeout)
+
+    async def put(self, url: str, data: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None,
+                  timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+        """Async HTTPClient.put() - Response on success, None on failure."""
+        return await self._run(self.client.put, url, data=data, headers=headers, timeout=timeout)
+
+    async def patch(self, url: str, data: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+        """Async HTTPClient.patch() - Response on success, None on failure."""
+        return await self._run(self.client.patch, url, data=data, headers=headers, timeout=timeout)
+
+    async def delete(self, url: str, headers: Optional[Dict[str, str]] = None,
+                     timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+        """Async HTTPClient.delete() - Response on success, None on failure."""
+        return await self._run(self.client.delete, url, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        """Stop the worker threads (pending requests finish first)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -10,15 +10,15 @@ Architecture:
     Layer 2 (zBifrost): Orchestration (display/auth/data coordination)
 """
 
-from zCLI import (
-    asyncio, Any, Optional, Dict, Callable,
-    ws_serve, WebSocketServerProtocol
-)
-from typing import Set
+from zCLI import asyncio, Any, Optional, Dict, Callable, websockets
+from typing import TYPE_CHECKING, Set
 from pathlib import Path
 import ssl
 from .comm_websocket_auth import WebSocketAuth
 
+if TYPE_CHECKING:  # websockets is imported when the server starts, not with zComm
+    from zCLI import WebSocketServerProtocol
+
 # ═══════════════════════════════════════════════════════════
 # Module Constants
 # ═══════════════════════════════════════════════════════════
@@ -124,7 +124,7 @@ class WebSocketServer:
         protocol = "wss" if ssl_context else "ws"
         
         try:
-            self.server = await ws_serve(
+            self.server = await websockets.serve(
                 self._handle_client, 
                 actual_host, 
                 actual_port,
@@ -171,7 +171,7 @@ class WebSocketServer:
         except KeyboardInterrupt:
             pass  # Clean exit
     
-    async def _handle_client(self, websocket: WebSocketServerProtocol) -> None:
+    async def _handle_client(self, websocket: 'WebSocketServerProtocol') -> None:
         """
         Handle individual client connection with authentication.
         
@@ -229,7 +229,7 @@ class WebSocketServer:
     
     async def _default_handler(
         self,
-        websocket: WebSocketServerProtocol,
+        websocket: 'WebSocketServerProtocol',
         message: str
     ) -> None:
         """
@@ -241,7 +241,7 @@ class WebSocketServer:
         """
         await websocket.send(f"Echo: {message}")
     
-    async def send(self, client: WebSocketServerProtocol, message: str) -> bool:
+    async def send(self, client: 'WebSocketServerProtocol', message: str) -> bool:
         """
         Send message to specific client.
         
@@ -259,7 +259,7 @@ class WebSocketServer:
             self.logger.error(f"{LOG_PREFIX} Send failed: {e}")
             return False
     
-    async def broadcast(self, message: str, exclude: Optional[WebSocketServerProtocol] = None) -> int:
+    async def broadcast(self, message: str, exclude: Optional['WebSocketServerProtocol'] = None) -> int:
         """
         Broadcast message to all connected clients.
         
@@ -12,10 +12,13 @@ This is Layer 0 infrastructure - basic auth primitives.
 For three-tier authentication (zSession, Application, Dual), see zBifrost (Layer 2).
 """
 
+from typing import TYPE_CHECKING
 from zCLI import Any, Optional, Dict
-from zCLI import WebSocketServerProtocol
 from urllib.parse import urlparse, parse_qs
 
+if TYPE_CHECKING:  # websockets is imported when the server starts, not with zComm
+    from zCLI import WebSocketServerProtocol
+
 # ═══════════════════════════════════════════════════════════
 # Module Constants
 # ═══════════════════════════════════════════════════════════
@@ -81,7 +84,7 @@ class WebSocketAuth:
         self.logger = logger
         self.authenticated_clients: Dict[Any, Dict[str, Any]] = {}
     
-    def validate_origin(self, websocket: WebSocketServerProtocol) -> bool:
+    def validate_origin(self, websocket: 'WebSocketServerProtocol') -> bool:
         """
         Validate Origin header against allowed_origins from zConfig.
         
@@ -140,7 +143,7 @@ class WebSocketAuth:
         self.logger.warning(LOG_ORIGIN_INVALID.format(origin=origin_header))
         return False
     
-    def extract_token(self, websocket: WebSocketServerProtocol) -> Optional[str]:
+    def extract_token(self, websocket: 'WebSocketServerProtocol') -> Optional[str]:
         """
         Extract authentication token from WebSocket connection.
         
@@ -225,7 +228,7 @@ class WebSocketAuth:
         
         return True
     
-    def register_client(self, websocket: WebSocketServerProtocol, auth_info: Dict[str, Any]) -> None:
+    def register_client(self, websocket: 'WebSocketServerProtocol', auth_info: Dict[str, Any]) -> None:
         """
         Register authenticated client.
         
@@ -237,7 +240,7 @@ class WebSocketAuth:
         client_addr = auth_info.get('addr', 'unknown')
         self.logger.framework.debug(LOG_CLIENT_REGISTERED.format(addr=client_addr))
     
-    def unregister_client(self, websocket: WebSocketServerProtocol) -> None:
+    def unregister_client(self, websocket: 'WebSocketServerProtocol') -> None:
         """
         Unregister client on disconnect.
         
@@ -249,7 +252,7 @@ class WebSocketAuth:
             client_addr = auth_info.get('addr', 'unknown')
             self.logger.framework.debug(LOG_CLIENT_UNREGISTERED.format(addr=client_addr))
     
-    def get_client_info(self, websocket: WebSocketServerProtocol) -> Optional[Dict[str, Any]]:
+    def get_client_info(self, websocket: 'WebSocketServerProtocol') -> Optional[Dict[str, Any]]:
         """
         Get authentication info for registered client.
         
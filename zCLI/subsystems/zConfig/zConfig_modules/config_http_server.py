@@ -23,6 +23,10 @@ KEY_SERVE_PATH = "serve_path"
 KEY_ROUTES_FILE = "routes_file"
 KEY_ENABLED = "enabled"
 KEY_ZSHELL = "zShell"  # v1.5.8: Drop into zShell REPL (default: False = silent blocking)
+KEY_CONCURRENCY = "concurrency"  # Development mode request serving: "single" or "threaded"
+KEY_MAX_WORKERS = "max_workers"  # Worker pool size for threaded serving
+KEY_BACKLOG = "backlog"  # listen() queue size for pending connections
+KEY_PRECOMPRESS = "precompress"  # Write .gz/.br sidecars for static assets on start
 
 # Default Values
 DEFAULT_HOST = "127.0.0.1"
@@ -31,6 +35,15 @@ DEFAULT_SERVE_PATH = "."
 DEFAULT_ROUTES_FILE = None
 DEFAULT_ENABLED = False
 DEFAULT_ZSHELL = False  # v1.5.8: Default to silent blocking (standard server behavior)
+DEFAULT_CONCURRENCY = "single"  # One request at a time (plain http.server)
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_BACKLOG = 64
+DEFAULT_PRECOMPRESS = False
+
+# Concurrency Modes
+CONCURRENCY_SINGLE = "single"
+CONCURRENCY_THREADED = "threaded"
+VALID_CONCURRENCY_MODES = (CONCURRENCY_SINGLE, CONCURRENCY_THREADED)
 
 
 class HttpServerConfig:
@@ -49,6 +62,10 @@ class HttpServerConfig:
         routes_file: Optional routes configuration file (auto-detected if not specified)
         enabled: Whether zServer is enabled (if True, server ALWAYS waits)
         zShell: Whether to drop into zShell REPL (False = silent blocking)
+        concurrency: Development serving mode ("single" or "threaded" worker pool)
+        max_workers: Worker pool size when concurrency is "threaded"
+        backlog: Pending connection queue size (listen backlog)
+        precompress: Precompress static assets into .gz/.br sidecars on start
     """
     
     # Type hints for instance attributes
@@ -59,6 +76,10 @@ class HttpServerConfig:
     routes_file: Optional[str]
     enabled: bool
     zShell: bool  # v1.5.8: Drop into zShell REPL (default: False)
+    concurrency: str
+    max_workers: int
+    backlog: int
+    precompress: bool
     
     def __init__(self, zspark_obj: Dict[str, Any], logger: Any) -> None:
         """
@@ -85,6 +106,10 @@ class HttpServerConfig:
         self.routes_file = http_config.get(KEY_ROUTES_FILE, DEFAULT_ROUTES_FILE)
         self.enabled = http_config.get(KEY_ENABLED, DEFAULT_ENABLED)
         self.zShell = http_config.get(KEY_ZSHELL, DEFAULT_ZSHELL)  # v1.5.8: Interactive mode
+        self.concurrency = http_config.get(KEY_CONCURRENCY, DEFAULT_CONCURRENCY)
+        self.max_workers = http_config.get(KEY_MAX_WORKERS, DEFAULT_MAX_WORKERS)
+        self.backlog = http_config.get(KEY_BACKLOG, DEFAULT_BACKLOG)
+        self.precompress = http_config.get(KEY_PRECOMPRESS, DEFAULT_PRECOMPRESS)
         
         # Log configuration
         if self.enabled:
@@ -92,6 +117,8 @@ class HttpServerConfig:
             self.logger.info(f"{LOG_PREFIX} Serve path: {self.serve_path}")
             if self.routes_file:
                 self.logger.info(f"{LOG_PREFIX} Routes file: {self.routes_file}")
+            if self.concurrency == CONCURRENCY_THREADED:
+                self.logger.info(f"{LOG_PREFIX} Concurrency: threaded ({self.max_workers} workers, backlog {self.backlog})")
         else:
             self.logger.framework.debug(f"{LOG_PREFIX} HTTP server disabled")
         
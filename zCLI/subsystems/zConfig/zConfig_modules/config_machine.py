@@ -1,9 +1,14 @@
 # zCLI/subsystems/zConfig/zConfig_modules/config_machine.py
 """Machine-level configuration management for system identity and preferences."""
 
-from zCLI import yaml, Any, Dict
+import threading
+from zCLI import os, yaml, Any, Dict, Optional, Tuple
 from zCLI.utils import print_ready_message
-from .helpers import auto_detect_machine, create_user_machine_config, load_config_with_override
+from .helpers import (
+    auto_detect_machine, run_machine_probes, create_user_machine_config, load_config_with_override,
+    machine_fingerprint, load_machine_snapshot, save_machine_snapshot, is_snapshot_stale,
+    parse_skip_probes, SNAPSHOT_FILENAME,
+)
 from .config_paths import zConfigPaths
 
 # Module constants
@@ -12,37 +17,45 @@ READY_MESSAGE = "zMachine Ready"
 YAML_KEY = "zMachine"
 SUBSYSTEM_NAME = "MachineConfig"
 
+# Snapshot switches (zSpark key, then env var)
+ZSPARK_SNAPSHOT_KEY = "machine_snapshot"            # False: probe on every start, no file
+ZSPARK_SKIP_PROBES_KEY = "machine_skip_probes"      # e.g. ["gpu", "network"] or "gpu,network"
+ENV_VAR_SNAPSHOT = "ZOLO_MACHINE_SNAPSHOT"
+ENV_VAR_SKIP_PROBES = "ZOLO_MACHINE_SKIP_PROBES"
+ENV_FALSE_VALUES = ("0", "false", "no", "off")
+
+# Where this run's probe results came from
+SOURCE_PROBED = "probed"
+SOURCE_SNAPSHOT = "snapshot"
+
 class MachineConfig:
     """Machine-level configuration for system identity and user preferences.
-    
-    Auto-detects capabilities (browser, IDE, shell, memory, CPU) and loads user 
+
+    Auto-detects capabilities (browser, IDE, shell, memory, CPU) and loads user
     overrides from zConfig.machine.yaml. Persisted via config_persistence.py.
+
+    The expensive probes are cached in zMachine.snapshot.json (user data dir) and
+    reused while the machine fingerprint matches; a stale snapshot is used and
+    refreshed in a background thread, refresh() re-probes on demand.
     """
 
     # Type hints for instance attributes
     paths: zConfigPaths
     machine: Dict[str, Any]
+    skip_probes: Tuple[str, ...]
+    snapshot_source: str
 
     def __init__(self, paths: zConfigPaths) -> None:
         """Initialize with auto-detection and load user preferences from zConfig.machine.yaml."""
         self.paths = paths
+        self.skip_probes = parse_skip_probes(self._setting(ZSPARK_SKIP_PROBES_KEY, ENV_VAR_SKIP_PROBES))
+        snapshot_setting = self._setting(ZSPARK_SNAPSHOT_KEY, ENV_VAR_SNAPSHOT)
+        self.snapshot_enabled = str(snapshot_setting).strip().lower() not in ENV_FALSE_VALUES
+        self.snapshot_path = paths.user_data_dir / SNAPSHOT_FILENAME
+        self._refresh_thread: Optional[threading.Thread] = None
 
         # Auto-detect machine information with deployment-aware output
-        self.machine = auto_detect_machine(log_level=paths._log_level, is_production=paths._is_production)
-        
-        # Add user_data_dir from paths (needed for zPath display formatting)
-        self.machine["user_data_dir"] = str(paths.user_data_dir)
-
-        # Load and override from config file (check exists, create if missing)
-        load_config_with_override(
-            self.paths,
-            YAML_KEY,
-            create_user_machine_config,
-            self.machine,
-            self.paths.ZMACHINE_USER_FILENAME,
-            SUBSYSTEM_NAME,
-            log_level=paths._log_level
-        )
+        self.machine = self._build_machine(self._load_probes())
 
         # Print ready message (deployment-aware)
         print_ready_message(READY_MESSAGE, color="CONFIG", is_production=paths._is_production, is_testing=paths._is_testing)
@@ -59,6 +72,28 @@ class MachineConfig:
         """Update machine config value (runtime only)."""
         self.machine[key] = value
 
+    def refresh(self, background: bool = False) -> Optional[threading.Thread]:
+        """Re-run the probes and rewrite the snapshot.
+
+        In the foreground the running config is rebuilt too (user overrides from
+        zConfig.machine.yaml still apply). With background=True only the snapshot
+        file is rewritten - the next start picks it up - and the thread is returned.
+        """
+        fingerprint = machine_fingerprint(self.skip_probes)
+        if background:
+            if self._refresh_thread is None or not self._refresh_thread.is_alive():
+                self._refresh_thread = threading.Thread(
+                    target=self._probe_and_save, args=(fingerprint,), name="zMachineRefresh", daemon=True
+                )
+                self._refresh_thread.start()
+            return self._refresh_thread
+
+        machine = self._build_machine(self._probe_and_save(fingerprint))
+        self.machine.clear()
+        self.machine.update(machine)
+        self.snapshot_source = SOURCE_PROBED
+        return None
+
     def save_user_config(self) -> bool:
         """Save current machine config to user's zConfig.machine.yaml."""
         try:
@@ -76,3 +111,59 @@ class MachineConfig:
         except Exception as e:
             print(f"{LOG_PREFIX} Failed to save machine config: {e}")
             return False
+
+    # ═══════════════════════════════════════════════════════════
+    # Snapshot Helpers
+    # ═══════════════════════════════════════════════════════════
+
+    def _setting(self, zspark_key: str, env_var: str) -> Any:
+        """zSpark value if present, else the env var (None if neither is set)."""
+        zspark = self.paths.zSpark or {}
+        if zspark_key in zspark:
+            return zspark[zspark_key]
+        return os.environ.get(env_var)
+
+    def _load_probes(self) -> Dict[str, Any]:
+        """Probe results from a matching snapshot, else from probing now (and saving them)."""
+        fingerprint = machine_fingerprint(self.skip_probes)
+        snapshot = load_machine_snapshot(self.snapshot_path, fingerprint) if self.snapshot_enabled else None
+        if snapshot is None:
+            self.snapshot_source = SOURCE_PROBED
+            if not self.paths._is_production:
+                print(f"{LOG_PREFIX} Auto-detecting machine information...")
+            return self._probe_and_save(fingerprint)
+
+        self.snapshot_source = SOURCE_SNAPSHOT
+        if not self.paths._is_production:
+            print(f"{LOG_PREFIX} Using machine snapshot: {self.snapshot_path}")
+        if is_snapshot_stale(snapshot):
+            self.refresh(background=True)
+        return snapshot["probes"]
+
+    def _probe_and_save(self, fingerprint: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the (non-skipped) probes and write them to the snapshot if enabled."""
+        probes = run_machine_probes(self.skip_probes, self.paths._log_level, self.paths._is_production)
+        if self.snapshot_enabled:
+            save_machine_snapshot(self.snapshot_path, probes, fingerprint)
+        return probes
+
+    def _build_machine(self, probes: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble the machine dict from probe results and apply user overrides."""
+        machine = auto_detect_machine(
+            log_level=self.paths._log_level, is_production=self.paths._is_production, probes=probes
+        )
+
+        # Add user_data_dir from paths (needed for zPath display formatting)
+        machine["user_data_dir"] = str(self.paths.user_data_dir)
+
+        # Load and override from config file (check exists, create if missing)
+        load_config_with_override(
+            self.paths,
+            YAML_KEY,
+            create_user_machine_config,
+            machine,
+            self.paths.ZMACHINE_USER_FILENAME,
+            SUBSYSTEM_NAME,
+            log_level=self.paths._log_level
+        )
+        return machine
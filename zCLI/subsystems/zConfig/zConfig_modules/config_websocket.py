@@ -38,6 +38,9 @@ KEY_PING_TIMEOUT = "ping_timeout"
 KEY_SSL_ENABLED = "ssl_enabled"
 KEY_SSL_CERT = "ssl_cert"
 KEY_SSL_KEY = "ssl_key"
+KEY_MAX_IN_FLIGHT = "max_in_flight"
+KEY_WORKER_THREADS = "worker_threads"
+KEY_SEND_QUEUE_SIZE = "send_queue_size"
 
 # Default Values
 DEFAULT_HOST = "127.0.0.1"
@@ -51,6 +54,9 @@ DEFAULT_PING_TIMEOUT = 10
 DEFAULT_SSL_ENABLED = False  # SSL disabled by default for easier local development
 DEFAULT_SSL_CERT = None
 DEFAULT_SSL_KEY = None
+DEFAULT_MAX_IN_FLIGHT = 8  # Concurrent pipelined requests per connection
+DEFAULT_WORKER_THREADS = None  # None = min(32, cpu_count + 4)
+DEFAULT_SEND_QUEUE_SIZE = 256  # Queued broadcasts per client before it is disconnected as slow
 
 # String Parsing
 TRUTHY_VALUES = ("true", "1", "yes")
@@ -157,6 +163,9 @@ class WebSocketConfig:
             KEY_SSL_ENABLED: websocket_config.get(KEY_SSL_ENABLED, DEFAULT_SSL_ENABLED),
             KEY_SSL_CERT: websocket_config.get(KEY_SSL_CERT, DEFAULT_SSL_CERT),
             KEY_SSL_KEY: websocket_config.get(KEY_SSL_KEY, DEFAULT_SSL_KEY),
+            KEY_MAX_IN_FLIGHT: websocket_config.get(KEY_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+            KEY_WORKER_THREADS: websocket_config.get(KEY_WORKER_THREADS, DEFAULT_WORKER_THREADS),
+            KEY_SEND_QUEUE_SIZE: websocket_config.get(KEY_SEND_QUEUE_SIZE, DEFAULT_SEND_QUEUE_SIZE),
         }
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -229,3 +238,18 @@ class WebSocketConfig:
     def ping_timeout(self) -> int:
         """Ping timeout in seconds."""
         return self.config[KEY_PING_TIMEOUT]
+
+    @property
+    def max_in_flight(self) -> int:
+        """Concurrent pipelined requests allowed per connection."""
+        return self.config[KEY_MAX_IN_FLIGHT]
+
+    @property
+    def worker_threads(self) -> Optional[int]:
+        """Worker threads for blocking handler work (None = auto)."""
+        return self.config[KEY_WORKER_THREADS]
+
+    @property
+    def send_queue_size(self) -> int:
+        """Queued broadcast messages allowed per client before it is disconnected."""
+        return self.config[KEY_SEND_QUEUE_SIZE]
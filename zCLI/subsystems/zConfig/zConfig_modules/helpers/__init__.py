@@ -9,6 +9,10 @@ This package provides utility functions that support zConfig's hierarchical conf
    - Creates machine-specific configuration files with detected values
    - Provides fallback detection for cross-platform compatibility
 
+   **machine_snapshot.py** - Persisted probe results (zMachine.snapshot.json)
+   - Reuses expensive detections while the machine fingerprint matches
+   - Versioned, atomically written, refreshed when stale
+
 2. **environment_helpers.py** - Environment configuration management
    - Creates default environment config files (deployment, network, security, logging)
    - Provides templates for environment-specific settings
@@ -29,8 +33,18 @@ from .machine_detectors import (
     detect_memory_gb,
     create_user_machine_config,
     auto_detect_machine,
+    run_machine_probes,
     get_browser_launch_command,
     get_ide_launch_command,
+    MACHINE_PROBES,
+)
+from .machine_snapshot import (
+    machine_fingerprint,
+    load_machine_snapshot,
+    save_machine_snapshot,
+    is_snapshot_stale,
+    parse_skip_probes,
+    SNAPSHOT_FILENAME,
 )
 from .environment_helpers import (
     create_default_env_config,
@@ -47,8 +61,16 @@ __all__ = [
     "detect_memory_gb",
     "create_user_machine_config",
     "auto_detect_machine",
+    "run_machine_probes",
     "get_browser_launch_command",
     "get_ide_launch_command",
+    "MACHINE_PROBES",
+    "machine_fingerprint",
+    "load_machine_snapshot",
+    "save_machine_snapshot",
+    "is_snapshot_stale",
+    "parse_skip_probes",
+    "SNAPSHOT_FILENAME",
     "create_default_env_config",
     "ensure_user_directories",
     "initialize_system_ui",
@@ -35,6 +35,13 @@ KEY_REQUIRE_AUTH = "require_auth"
 KEY_ALLOWED_ORIGINS = "allowed_origins"
 KEY_SERVE_PATH = "serve_path"
 KEY_ENABLED = "enabled"
+KEY_CONCURRENCY = "concurrency"
+KEY_MAX_WORKERS = "max_workers"
+KEY_BACKLOG = "backlog"
+KEY_PRECOMPRESS = "precompress"
+
+# zServer Concurrency Modes
+VALID_CONCURRENCY_MODES = ["single", "threaded"]
 
 # Port Validation
 PORT_MIN = 1
@@ -52,6 +59,8 @@ ERROR_PORT_RANGE = "{prefix}.port: Must be {min}-{max}, got {port}"
 ERROR_PORT_CONFLICT = "Port conflict: websocket and http_server both configured to use port {port}. They must use different ports."
 ERROR_LIST_ITEMS_TYPE = "{key}: All items must be {expected_type}"
 ERROR_INVALID_TYPE_OPTIONS = "{key}: Must be {option1} or {option2}, got {actual_type}"
+ERROR_INVALID_CHOICE = "{key}: Must be one of {choices}, got '{value}'"
+ERROR_POSITIVE_INT = "{key}: Must be a positive integer, got {value}"
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -75,7 +84,7 @@ class ConfigValidator:
     - zSpace: Path exists and is directory
     - zMode: Must be "Terminal" or "zBifrost"
     - websocket: Port, host, require_auth types
-    - http_server: Port, host, serve_path, enabled types
+    - http_server: Port, host, serve_path, enabled/precompress types, concurrency limits
     - Port conflicts: websocket and http_server can't use same port
     
     Usage:
@@ -291,16 +300,41 @@ class ConfigValidator:
                         )
                     )
         
-        # Validate enabled
-        enabled = http_config.get(KEY_ENABLED)
-        if enabled is not None and not isinstance(enabled, bool):
+        # Validate boolean flags
+        for flag_key in (KEY_ENABLED, KEY_PRECOMPRESS):
+            flag = http_config.get(flag_key)
+            if flag is not None and not isinstance(flag, bool):
+                self.errors.append(
+                    ERROR_TYPE_MISMATCH.format(
+                        key=f"{KEY_HTTP_SERVER}.{flag_key}",
+                        expected_type="boolean",
+                        actual_type=type(flag).__name__
+                    )
+                )
+        
+        # Validate concurrency mode
+        concurrency = http_config.get(KEY_CONCURRENCY)
+        if concurrency is not None and concurrency not in VALID_CONCURRENCY_MODES:
             self.errors.append(
-                ERROR_TYPE_MISMATCH.format(
-                    key=f"{KEY_HTTP_SERVER}.{KEY_ENABLED}",
-                    expected_type="boolean",
-                    actual_type=type(enabled).__name__
+                ERROR_INVALID_CHOICE.format(
+                    key=f"{KEY_HTTP_SERVER}.{KEY_CONCURRENCY}",
+                    choices=VALID_CONCURRENCY_MODES,
+                    value=concurrency
                 )
             )
+        
+        # Validate worker pool limits
+        for limit_key in (KEY_MAX_WORKERS, KEY_BACKLOG):
+            limit = http_config.get(limit_key)
+            if limit is None:
+                continue
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+                self.errors.append(
+                    ERROR_POSITIVE_INT.format(
+                        key=f"{KEY_HTTP_SERVER}.{limit_key}",
+                        value=limit
+                    )
+                )
     
     def _validate_port(self, config: Dict[str, Any], prefix: str) -> None:
         """
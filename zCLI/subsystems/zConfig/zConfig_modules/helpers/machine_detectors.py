@@ -1,7 +1,7 @@
 # zCLI/subsystems/zConfig/zConfig_modules/helpers/machine_detectors.py
 """Helper functions for detecting machine capabilities and tools."""
 
-from zCLI import os, platform, shutil, Colors, subprocess, importlib, socket, Path, Dict, Any, Optional
+from zCLI import os, sys, platform, shutil, Colors, subprocess, importlib, socket, Path, Dict, Any, Optional, Tuple
 
 # ═══════════════════════════════════════════════════════════
 # Module-Level Constants
@@ -54,6 +54,18 @@ LINUX_BROWSER_DESKTOP_MAP = {
 DEFAULT_SHELL = "/bin/sh"
 DEFAULT_TIMEZONE = "system"
 
+# Probes: the expensive detections (subprocesses, PATH scans, network calls).
+# Their results are cached in the machine snapshot and each can be skipped.
+PROBE_INSTALL = "install"
+PROBE_CPU = "cpu"
+PROBE_MEMORY = "memory"
+PROBE_GPU = "gpu"
+PROBE_NETWORK = "network"
+PROBE_BROWSER = "browser"
+PROBE_IDE = "ide"
+MACHINE_PROBES = (PROBE_INSTALL, PROBE_CPU, PROBE_MEMORY, PROBE_GPU, PROBE_NETWORK, PROBE_BROWSER, PROBE_IDE)
+SKIPPED_BROWSER = "unknown"
+
 # YAML template for machine config file
 MACHINE_CONFIG_TEMPLATE = """
 # zolo-zcli Machine Configuration
@@ -979,25 +991,86 @@ def create_user_machine_config(path: Path, machine: Dict[str, Any]) -> None:
         _log_error(f"Failed to create user machine config: {e}")
 
 
-def auto_detect_machine(log_level: Optional[str] = None, is_production: bool = False) -> Dict[str, Any]:
-    """Auto-detect machine identity, Python runtime, tools, and capabilities."""
-    if not is_production:
-        print("[MachineConfig] Auto-detecting machine information...")
+def run_machine_probes(skip_probes: Tuple[str, ...] = (), log_level: Optional[str] = None,
+                       is_production: bool = False) -> Dict[str, Any]:
+    """Run the expensive detections (see MACHINE_PROBES); skipped probes get empty defaults.
+    
+    Returns a JSON-serializable dict (the machine snapshot's payload) with keys:
+    install, cpu, memory_gb, gpu, network, browser, ide.
+    """
+    skip = set(skip_probes)
 
     # Detect zCLI installation info
-    zcli_info = detect_zcli_install_info()
-    
-    # Detect CPU architecture details
-    cpu_arch = detect_cpu_architecture()
-    
+    if PROBE_INSTALL in skip:
+        zcli_info = {"python_executable": sys.executable, "zcli_install_path": "unknown", "zcli_install_type": "unknown"}
+    else:
+        zcli_info = detect_zcli_install_info()
+
+    # Detect CPU architecture details (skipped: os.cpu_count() for both counts)
+    if PROBE_CPU in skip:
+        logical = os.cpu_count() or 1
+        cpu_arch = {"cpu_physical": logical, "cpu_logical": logical, "cpu_performance": None, "cpu_efficiency": None}
+    else:
+        cpu_arch = detect_cpu_architecture()
+
     # Detect memory first (needed for Apple Silicon GPU unified memory)
-    system_memory_gb = detect_memory_gb()
-    
+    system_memory_gb = None if PROBE_MEMORY in skip else detect_memory_gb()
+
     # Detect GPU information (pass system memory for unified memory calculation)
-    gpu_info = detect_gpu(system_memory_gb=system_memory_gb)
-    
+    if PROBE_GPU in skip:
+        gpu_info = {"gpu_available": False, "gpu_type": None, "gpu_vendor": None, "gpu_memory_gb": None, "gpu_compute": []}
+    else:
+        gpu_info = detect_gpu(system_memory_gb=system_memory_gb)
+
     # Detect network interfaces and IPs
-    network_info = detect_network()
+    if PROBE_NETWORK in skip:
+        network_info = {
+            "network_interfaces": [], "network_primary": None, "network_ip_local": None,
+            "network_mac_address": None, "network_gateway": None, "network_ip_public": None,
+        }
+    else:
+        network_info = detect_network()
+
+    # Detect user tools (skipped: env vars only, no PATH or xdg-settings lookups)
+    if PROBE_BROWSER in skip:
+        browser = os.getenv("BROWSER") or SKIPPED_BROWSER
+    else:
+        browser = detect_browser(log_level, is_production)
+    if PROBE_IDE in skip:
+        ide = next((os.getenv(var) for var in IDE_ENV_VARS if os.getenv(var)), FALLBACK_EDITOR)
+    else:
+        ide = detect_ide(log_level, is_production)
+
+    return {
+        "install": zcli_info,
+        "cpu": cpu_arch,
+        "memory_gb": system_memory_gb,
+        "gpu": gpu_info,
+        "network": network_info,
+        "browser": browser,
+        "ide": ide,
+    }
+
+
+def auto_detect_machine(log_level: Optional[str] = None, is_production: bool = False,
+                        probes: Optional[Dict[str, Any]] = None,
+                        skip_probes: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Auto-detect machine identity, Python runtime, tools, and capabilities.
+    
+    Args:
+        probes: Cached run_machine_probes() result (machine snapshot); probed now if None
+        skip_probes: Probe names not to run when probing now
+    """
+    if probes is None:
+        if not is_production:
+            print("[MachineConfig] Auto-detecting machine information...")
+        probes = run_machine_probes(skip_probes, log_level, is_production)
+
+    zcli_info = probes["install"]
+    cpu_arch = probes["cpu"]
+    system_memory_gb = probes["memory_gb"]
+    gpu_info = probes["gpu"]
+    network_info = probes["network"]
     
     # Detect libc version (Linux-specific, handle Windows Store Python edge case)
     try:
@@ -1024,8 +1097,8 @@ def auto_detect_machine(log_level: Optional[str] = None, is_production: bool = F
         "zcli_install_type": zcli_info["zcli_install_type"],  # editable vs standard
 
         # User tools (system defaults, user can override)
-        "browser": detect_browser(log_level, is_production),
-        "ide": detect_ide(log_level, is_production),
+        "browser": probes["browser"],
+        "ide": probes["ide"],
         "terminal": os.getenv("TERM", "unknown"),
         "shell": os.getenv("SHELL", DEFAULT_SHELL),
         "lang": os.getenv("LANG", "unknown"),       # System language
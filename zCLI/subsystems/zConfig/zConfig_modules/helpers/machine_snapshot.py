@@ -0,0 +1,104 @@
+# zCLI/subsystems/zConfig/zConfig_modules/helpers/machine_snapshot.py
+"""Persisted machine probe results, reused across starts while the machine fingerprint matches.
+
+The probes in machine_detectors (CPU, memory, GPU, network, browser, IDE, install info)
+shell out (lscpu, nvidia-smi, ifconfig, netstat, xdg-settings) or hit the network, yet
+their answers almost never change between runs. Their combined output is written to
+zMachine.snapshot.json in the user data dir and reused while the fingerprint - hostname,
+OS, kernel, architecture, Python executable, zCLI version, skipped probes and the
+browser/editor env vars - still matches. A fingerprint mismatch or an unknown snapshot
+version means probing again.
+"""
+
+from zCLI import os, sys, json, time, platform, socket, Path, Dict, Any, List, Optional, Tuple, Union
+from zCLI.version import __version__
+from .machine_detectors import MACHINE_PROBES, IDE_ENV_VARS
+
+# ═══════════════════════════════════════════════════════════
+# Module-Level Constants
+# ═══════════════════════════════════════════════════════════
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "zMachine.snapshot.json"
+DEFAULT_SNAPSHOT_MAX_AGE_SEC = 7 * 24 * 3600  # Older snapshots are used, then refreshed in the background
+
+# Snapshot file keys
+KEY_VERSION = "version"
+KEY_CREATED = "created"
+KEY_FINGERPRINT = "fingerprint"
+KEY_PROBES = "probes"
+
+# Env vars that feed detect_browser()/detect_ide() - part of the fingerprint
+TOOL_ENV_VARS = ("BROWSER",) + IDE_ENV_VARS
+
+# Separator for skip lists given as a string ("gpu,network")
+SKIP_SEPARATOR = ","
+
+
+def parse_skip_probes(value: Union[str, List[str], Tuple[str, ...], None]) -> Tuple[str, ...]:
+    """Normalize a skip list ("gpu,network" or ["gpu", "network"]) to known probe names."""
+    if not value:
+        return ()
+    names = value.split(SKIP_SEPARATOR) if isinstance(value, str) else value
+    wanted = {str(name).strip().lower() for name in names}
+    return tuple(probe for probe in MACHINE_PROBES if probe in wanted)
+
+
+def machine_fingerprint(skip_probes: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Cheap identity of this machine/runtime (no subprocesses); a change invalidates the snapshot."""
+    return {
+        "hostname": socket.gethostname(),
+        "os": platform.system(),
+        "kernel": platform.release(),
+        "architecture": platform.machine(),
+        "python_executable": sys.executable,
+        "zcli_version": __version__,
+        "skip_probes": list(skip_probes),
+        "tool_env": {var: os.environ[var] for var in TOOL_ENV_VARS if os.environ.get(var)},
+    }
+
+
+def load_machine_snapshot(path: Path, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the snapshot at path if its version and fingerprint match, else None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get(KEY_VERSION) != SNAPSHOT_VERSION:
+        return None
+    if snapshot.get(KEY_FINGERPRINT) != fingerprint or not isinstance(snapshot.get(KEY_PROBES), dict):
+        return None
+    return snapshot
+
+
+def save_machine_snapshot(path: Path, probes: Dict[str, Any], fingerprint: Dict[str, Any]) -> bool:
+    """Write probe results atomically (temp file + replace); False if the dir is not writable."""
+    snapshot = {
+        KEY_VERSION: SNAPSHOT_VERSION,
+        KEY_CREATED: time.time(),
+        KEY_FINGERPRINT: fingerprint,
+        KEY_PROBES: probes,
+    }
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(temp_path, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def is_snapshot_stale(snapshot: Dict[str, Any], max_age: float = DEFAULT_SNAPSHOT_MAX_AGE_SEC) -> bool:
+    """True if the snapshot is older than max_age seconds (still valid, but due a refresh)."""
+    created = snapshot.get(KEY_CREATED)
+    if not isinstance(created, (int, float)):
+        return True
+    return time.time() - created > max_age
@@ -28,9 +28,11 @@ Supported Operations:
     CRUD (Create, Read, Update, Delete):
         - insert: Add new records
         - select: Query records with WHERE, JOIN, ORDER BY, LIMIT
+        - select_iter / select_batches: Stream a select lazily (cursor fetchmany)
         - update: Modify existing records
         - delete: Remove records
         - upsert: Insert or update (conflict resolution)
+        - insert_many / upsert_many: Bulk load in one transaction (rows/sec stats)
         - list_tables: List all tables in database
     
     DDL (Data Definition Language):
@@ -93,8 +95,8 @@ Connection Modes:
         - Use case: Multi-step workflows, batch operations
     
     One-Shot Mode (wizard_mode=False):
-        - New connection per operation
-        - Auto-disconnect after operation completes
+        - Connection borrowed from the process-wide pool per operation
+        - Returned to the pool after operation completes (CSV: disconnected)
         - No persistent state
         - Use case: Single commands, terminal operations
 
@@ -168,9 +170,12 @@ See Also:
     - zCLI/subsystems/zData/zData_modules/shared/parsers/: WHERE/value parsers
 """
 
+from typing import Iterable, Iterator
 from zCLI import Any, Dict, List, Optional
 from zCLI.utils.zExceptions import SchemaNotFoundError, TableNotFoundError
 from .zData_modules.shared.backends.adapter_factory import AdapterFactory
+from .zData_modules.shared.backends.base_adapter import DEFAULT_BULK_CHUNK_SIZE, DEFAULT_STREAM_BATCH_SIZE
+from .zData_modules.shared.backends.connection_pool import get_connection_pool, make_pool_key
 from .zData_modules.shared.validator import DataValidator
 from .zData_modules.shared.data_operations import DataOperations
 
@@ -204,6 +209,7 @@ OPTION_VALUE_ALL_TABLES = "all"
 # Context keys (handle_request context parameter)
 CONTEXT_KEY_WIZARD_MODE = "wizard_mode"
 CONTEXT_KEY_SCHEMA_CACHE = "schema_cache"
+CONTEXT_KEY_ISOLATED = "isolated_data"
 
 # Reserved schema keys (excluded from table lists)
 RESERVED_KEY_META = "Meta"
@@ -247,8 +253,10 @@ LOG_LOADING_SCHEMA = "Loading schema from: %s"
 LOG_INITIALIZING_ADAPTER = "Initializing %s adapter for: %s (label: %s)"
 LOG_CONNECTED_BACKEND = "[OK] Connected to %s backend: %s"
 LOG_DISCONNECTED = "Disconnected from backend"
+LOG_RELEASED_TO_POOL = "Connection returned to pool"
 LOG_DISCONNECTED_ONE_SHOT = "Disconnected (one-shot mode)"
 LOG_CONNECTION_KEPT_ALIVE = "Connection kept alive (wizard mode)"
+LOG_ISOLATED_REQUEST = "Running request on an isolated handler (one-shot mode)"
 LOG_USING_CACHED_SCHEMA = "Using cached schema from alias: $%s"
 LOG_REUSING_CONNECTION = "[REUSE] Reusing connection for $%s"
 LOG_LOADING_FROM_PINNED = "[LOAD] Loading schema from pinned_cache: $%s"
@@ -322,8 +330,8 @@ class zData:
         
         One-Shot Mode:
             - wizard_mode=False (default)
-            - New connection per operation
-            - Auto-disconnect after operation
+            - Pooled connection borrowed per operation
+            - Returned to the pool after operation
     
     Attributes:
         zcli: zCLI core instance (provides access to all subsystems)
@@ -400,6 +408,17 @@ class zData:
         if not hasattr(zcli, 'session'):
             raise ValueError(ERROR_NO_SESSION_ATTR)
 
+        # PHASE 2-5: References, empty data state, pool, display color; announce
+        self._init_state(zcli, announce=True)
+
+    def _init_state(self, zcli: Any, announce: bool = False) -> None:
+        """
+        Set up every instance attribute (shared by __init__ and spawn_handler()).
+        
+        Args:
+            zcli: Validated zCLI core instance
+            announce: Whether to zDeclare "zData Ready" (only the main instance does)
+        """
         # PHASE 2: Store zCLI instance and subsystem references
         self.zcli = zcli
         self.logger = zcli.logger
@@ -413,12 +432,19 @@ class zData:
         self.validator: Optional[DataValidator] = None
         self.operations: Optional[DataOperations] = None
         self._connected: bool = False
+        self._cache_owned: bool = False  # adapter belongs to a wizard schema_cache handler
+
+        # Pooled connections are shared process-wide (see connection_pool.py)
+        self.pool = get_connection_pool()
+        if self.pool.logger is None:
+            self.pool.configure(logger=self.logger)
 
         # PHASE 4: Display configuration
         self.mycolor = COLOR_ZDATA
 
         # PHASE 5: Announce readiness
-        self.display.zDeclare(DECLARE_ZDATA_READY, color=self.mycolor, indent=0, style=DISPLAY_STYLE_FULL)
+        if announce:
+            self.display.zDeclare(DECLARE_ZDATA_READY, color=self.mycolor, indent=0, style=DISPLAY_STYLE_FULL)
 
     # ═══════════════════════════════════════════════════════════════════════════════════
     # MAIN ENTRY POINT
@@ -448,6 +474,9 @@ class zData:
             context: Optional context dictionary with keys:
                      - wizard_mode: Boolean (default: False)
                      - schema_cache: SchemaCache instance (for wizard mode)
+                     - isolated_data: Boolean (default: False) - run on a
+                       spawn_handler() sibling in one-shot mode, leaving this
+                       instance untouched (parallel wizard pool threads)
         
         Returns:
             Operation result from adapter or "error" string on failure:
@@ -489,9 +518,18 @@ class zData:
         Notes:
             - Wizard mode requires schema_cache in context
             - Connection reuse in wizard mode improves performance
-            - One-shot mode auto-disconnects (no cleanup needed)
+            - One-shot mode returns the connection to the pool (no cleanup needed)
             - All exceptions are logged with full traceback
         """
+        # PHASE 0: Isolated request - own handler and pooled connection, one-shot
+        if context and context.get(CONTEXT_KEY_ISOLATED):
+            self.logger.debug(LOG_ISOLATED_REQUEST)
+            one_shot = {
+                key: value for key, value in context.items()
+                if key not in (CONTEXT_KEY_ISOLATED, CONTEXT_KEY_WIZARD_MODE, CONTEXT_KEY_SCHEMA_CACHE)
+            }
+            return self.spawn_handler().handle_request(request, one_shot)
+
         # PHASE 1: Announce request
         self.display.zDeclare(DECLARE_ZDATA_REQUEST, color=COLOR_ZCRUD, indent=1, style=DISPLAY_STYLE_FULL)
 
@@ -514,6 +552,8 @@ class zData:
         action = request.get(REQUEST_KEY_ACTION)
         tables = request.get(REQUEST_KEY_TABLES, [])
         if not self.operations.ensure_tables_for_action(action, tables):
+            if not wizard_mode:
+                self.disconnect()
             return RESULT_ERROR
 
         # PHASE 7: Delegate to operation handlers
@@ -604,12 +644,7 @@ class zData:
         # PHASE 1: Check if connection already exists (reuse)
         existing_handler = schema_cache.get_connection(alias_name)
         if existing_handler:
-            # Reuse existing adapter/validator/operations
-            self.adapter = existing_handler.adapter
-            self.validator = existing_handler.validator
-            self.operations = existing_handler.operations
-            self.schema = existing_handler.schema
-            self._connected = existing_handler._connected  # pylint: disable=protected-access
+            self._use_cached_handler(existing_handler)
             self.logger.info(LOG_REUSING_CONNECTION, alias_name)
             return True
 
@@ -619,13 +654,43 @@ class zData:
             self.logger.error(HINT_USE_LOAD_COMMAND, alias_name)
             return False
 
-        # PHASE 3: Load schema and store new connection
+        # PHASE 3: Load schema on a dedicated handler owned by the cache entry
+        # (loading a second alias must not release this alias's connection)
         self.logger.info(LOG_LOADING_FROM_PINNED, alias_name)
-        self.load_schema(cached_schema)
-        schema_cache.set_connection(alias_name, self)
+        handler = self.spawn_handler()
+        handler.load_schema(cached_schema)
+        schema_cache.set_connection(alias_name, handler)
+        self._use_cached_handler(handler)
         self.logger.info(LOG_CREATED_PERSISTENT, alias_name)
         return True
 
+    def _use_cached_handler(self, handler: "zData") -> None:
+        """Point this instance at a schema_cache handler's adapter/validator/operations."""
+        if self.adapter and not self._cache_owned:
+            self.disconnect()
+        self.adapter = handler.adapter
+        self.validator = handler.validator
+        self.operations = handler.operations
+        self.schema = handler.schema
+        self._connected = handler._connected  # pylint: disable=protected-access
+        self._cache_owned = True
+
+    def spawn_handler(self) -> "zData":
+        """
+        Create a sibling zData instance that owns its own adapter.
+
+        The sibling shares this instance's zCLI references and the connection
+        pool but none of its schema/adapter state, so it can run a request
+        (or hold a wizard alias connection) without touching this instance.
+        It does not announce itself on the display.
+
+        Returns:
+            zData: New instance with no schema loaded
+        """
+        handler = zData.__new__(zData)
+        handler._init_state(self.zcli)  # pylint: disable=protected-access
+        return handler
+
     def _init_from_model(self, model_path: Optional[str]) -> bool:
         """
         Initialize handler by loading schema from model path.
@@ -750,7 +815,7 @@ class zData:
         
         Notes:
             - This method is called by load_schema()
-            - Connection is established automatically (adapter.connect())
+            - Connection is borrowed from the connection pool (connected on first use)
             - Logger is set for AdapterFactory before adapter creation
             - self._connected flag is set to True on success
         """
@@ -780,16 +845,18 @@ class zData:
         # PHASE 6: Set logger for factory
         AdapterFactory.set_logger(self.logger)
 
-        # PHASE 7: Create appropriate adapter
+        # PHASE 7: Return any adapter still held from a previous schema
+        # (a wizard alias's adapter is only dropped - its schema_cache entry releases it)
+        if self.adapter:
+            self.disconnect()
+
+        # PHASE 8: Borrow a connected adapter from the pool (creates one if none idle)
+        config = {"path": data_path, "label": data_label, "meta": meta}
         try:
-            self.adapter = AdapterFactory.create_adapter(data_type, {
-                "path": data_path,
-                "label": data_label,
-                "meta": meta
-            })
-
-            # PHASE 8: Connect
-            self.adapter.connect()
+            self.adapter = self.pool.acquire(
+                make_pool_key(data_type, config),
+                lambda: AdapterFactory.create_adapter(data_type, config)
+            )
             self._connected = True
             self.logger.info(LOG_CONNECTED_BACKEND, data_type, data_path)
 
@@ -873,11 +940,12 @@ class zData:
 
     def disconnect(self) -> None:
         """
-        Disconnect from backend and close adapter connection.
+        Release the adapter: return it to the connection pool or close it.
         
-        This method closes the database connection and resets the connection flag.
-        It is called automatically in one-shot mode after each operation, or
-        manually in wizard mode when operations are complete.
+        SQL adapters go back to the process-wide pool (open transaction rolled
+        back) for the next request; CSV adapters are disconnected, which flushes
+        cached tables to disk. It is called automatically in one-shot mode after
+        each operation, or manually in wizard mode when operations are complete.
         
         Returns:
             None
@@ -892,11 +960,21 @@ class zData:
             - One-shot mode calls this automatically
             - Wizard mode requires manual disconnect
             - Safe to call multiple times (no-op if already disconnected)
+            - self.adapter is cleared - the pooled adapter may serve other requests
+            - An adapter borrowed from a wizard schema_cache handler is only
+              dropped here; SchemaCache.disconnect()/clear() releases it
         """
+        if self._cache_owned:
+            self.adapter = None
+            self._connected = False
+            self._cache_owned = False
+            return
         if self.adapter:
-            self.adapter.disconnect()
+            adapter = self.adapter
+            self.adapter = None
             self._connected = False
-            self.logger.info(LOG_DISCONNECTED)
+            self.pool.release(adapter)
+            self.logger.info(LOG_RELEASED_TO_POOL if adapter.poolable else LOG_DISCONNECTED)
 
     def get_connection_info(self) -> Dict[str, Any]:
         """
@@ -907,22 +985,25 @@ class zData:
         - adapter_type: Backend type (SQLite, PostgreSQL, CSV)
         - path: Database path or CSV directory
         - label: Human-readable label
+        - pool: Connection pool stats (idle/in_use per database, reuse_rate, ...)
         
         Returns:
-            Dictionary with connection info, or {"connected": False} if not connected
+            Dictionary with connection info, or {"connected": False, "pool": {...}}
+            if not connected
         
         Examples:
             info = zdata.get_connection_info()
             print(f"Connected: {info['connected']}")
             print(f"Adapter: {info.get('adapter_type')}")
+            print(f"Pool reuse: {info['pool']['reuse_rate']}")
         
         Notes:
             - Structure varies by adapter type
-            - Always includes "connected" key
+            - Always includes "connected" and "pool" keys
         """
-        if self.adapter:
-            return self.adapter.get_connection_info()
-        return {"connected": False}
+        info = self.adapter.get_connection_info() if self.adapter else {"connected": False}
+        info["pool"] = self.pool.get_stats()
+        return info
 
     # ═══════════════════════════════════════════════════════════════════════════════════
     # CRUD OPERATIONS (Delegated to Adapter)
@@ -1007,6 +1088,50 @@ class zData:
             raise RuntimeError(ERROR_NO_ADAPTER)
         return self.adapter.select(table, fields, **kwargs)
 
+    def select_iter(self, table: str, fields: Optional[List[str]] = None,
+                    batch_size: int = DEFAULT_STREAM_BATCH_SIZE, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a table one row dict at a time.
+        
+        Same arguments as select() (plus offset). Rows are fetched batch_size
+        at a time as the iterator is consumed - a dedicated cursor with
+        fetchmany() on SQLite, a server-side cursor on PostgreSQL - so large
+        tables are never fully materialized.
+        
+        Args:
+            table: Target table name
+            fields: Optional list of field names to select (None = all fields)
+            batch_size: Rows fetched per round trip (default 500)
+            **kwargs: where, joins, order, limit, offset (as for select())
+        
+        Returns:
+            Iterator of row dictionaries
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        
+        Examples:
+            for row in zdata.select_iter("events", where="kind = 'click'"):
+                handle(row)
+        
+        Notes:
+            - Consume (or close) the iterator before disconnect()
+        """
+        if not self.adapter:
+            raise RuntimeError(ERROR_NO_ADAPTER)
+        return self.adapter.select_iter(table, fields, batch_size=batch_size, **kwargs)
+
+    def select_batches(self, table: str, fields: Optional[List[str]] = None,
+                       batch_size: int = DEFAULT_STREAM_BATCH_SIZE, **kwargs: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream records from a table as lists of up to batch_size row dicts.
+        
+        See select_iter(); use this when the consumer works page by page.
+        """
+        if not self.adapter:
+            raise RuntimeError(ERROR_NO_ADAPTER)
+        return self.adapter.select_batches(table, fields, batch_size=batch_size, **kwargs)
+
     def update(self, table: str, fields: List[str], values: List[Any], where: Any) -> Any:
         """
         Update existing records in a table.
@@ -1120,6 +1245,62 @@ class zData:
             raise RuntimeError(ERROR_NO_ADAPTER)
         return self.adapter.upsert(table, fields, values, conflict_fields)
 
+    def insert_many(self, table: str, fields: List[str], rows: Iterable[Any],
+                    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Bulk insert rows in one transaction.
+        
+        Rows are consumed lazily and written chunk by chunk (executemany on
+        SQLite, execute_values on PostgreSQL, one DataFrame concat on CSV),
+        with a single commit at the end. Any error rolls the whole load back.
+        
+        Args:
+            table: Target table name
+            fields: List of field names
+            rows: Iterable of value lists (ordered like fields) or dicts
+            chunk_size: Rows written per batch (default 1000)
+        
+        Returns:
+            Dict with rows, chunks, elapsed (seconds) and rows_per_sec
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        
+        Examples:
+            # Load a generator without materializing it
+            stats = zdata.insert_many("events", ["kind", "ts"], ((k, t) for k, t in source))
+            print(f"{stats['rows']} rows at {stats['rows_per_sec']:.0f} rows/sec")
+        
+        Notes:
+            - No validation or hooks (use handle_request with action "import"
+              to load a file with validation)
+        """
+        if not self.adapter:
+            raise RuntimeError(ERROR_NO_ADAPTER)
+        return self.adapter.insert_many(table, fields, rows, chunk_size)
+
+    def upsert_many(self, table: str, fields: List[str], rows: Iterable[Any], conflict_fields: List[str],
+                    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Bulk insert-or-update rows in one transaction.
+        
+        Args:
+            table: Target table name
+            fields: List of field names
+            rows: Iterable of value lists (ordered like fields) or dicts
+            conflict_fields: List of fields to check for conflicts (usually primary key)
+            chunk_size: Rows written per batch (default 1000)
+        
+        Returns:
+            Dict with rows, chunks, elapsed (seconds) and rows_per_sec
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        """
+        if not self.adapter:
+            raise RuntimeError(ERROR_NO_ADAPTER)
+        return self.adapter.upsert_many(table, fields, rows, conflict_fields, chunk_size)
+
     def list_tables(self) -> List[str]:
         """
         List all tables in the database.
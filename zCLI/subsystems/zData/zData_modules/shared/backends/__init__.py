@@ -51,7 +51,7 @@ This mechanism enables zero-configuration usage while supporting plugin extensio
 
 Public API
 ----------
-This package exports 6 main items for external use:
+This package exports 8 main items for external use:
 
 **Abstract Base:**
 - BaseDataAdapter: ABC for implementing custom adapters
@@ -67,6 +67,9 @@ This package exports 6 main items for external use:
 **Plugin Support:**
 - register_custom_adapter: Register custom adapters dynamically
 
+**Connection Pool:**
+- ConnectionPool / get_connection_pool: Process-wide pool used by zData.handle_request
+
 Usage Examples
 -------------
 **1. Factory Pattern (Recommended):**
@@ -113,7 +116,7 @@ from .adapter_factory import AdapterFactory
 
 from .sqlite_adapter import SQLiteAdapter
 from .csv_adapter import CSVAdapter
-from .postgresql_adapter import PostgreSQLAdapter
+from .postgresql_adapter import PostgreSQLAdapter, reset_provisioned_databases
 
 # ============================================================
 # Imports - Registry Functions
@@ -121,6 +124,12 @@ from .postgresql_adapter import PostgreSQLAdapter
 
 from .adapter_registry import register_custom_adapter
 
+# ============================================================
+# Imports - Connection Pool
+# ============================================================
+
+from .connection_pool import ConnectionPool, get_connection_pool
+
 # ============================================================
 # Auto-Registration Trigger
 # ============================================================
@@ -144,6 +153,10 @@ __all__ = [
     "SQLiteAdapter",
     "CSVAdapter",
     "PostgreSQLAdapter",
+    "reset_provisioned_databases",
     # Plugin support (custom adapter registration)
     "register_custom_adapter",
+    # Connection pool (shared by all zData instances)
+    "ConnectionPool",
+    "get_connection_pool",
 ]
@@ -122,6 +122,23 @@ BaseDataAdapter provides 3 concrete helper methods that subclasses can use:
 
 These helpers don't need to be overridden.
 
+Bulk Loading
+-----------
+insert_many() / upsert_many() take an iterable of rows, write it in chunks and
+commit once (rollback on error), returning rows, chunks, elapsed and
+rows_per_sec. The default writes row by row; adapters override
+_insert_chunk() / _upsert_chunk() with a real batch write (executemany,
+execute_values, one DataFrame concat).
+
+Streaming Reads
+---------------
+select_batches() yields the result of a select() as lists of row dicts, so a
+large table is never held in memory twice (raw tuples + dicts) and the first
+rows are available before the last ones are read. select_iter() flattens it to
+one row at a time. The default slices select(); SQL adapters stream from a
+cursor (fetchmany on SQLite, a server-side named cursor on PostgreSQL) and the
+CSV adapter converts its filtered DataFrame one slice at a time.
+
 Integration with zData
 ----------------------
 This adapter interface is used by:
@@ -150,7 +167,11 @@ See Also
 - adapter_factory.py: Factory for creating adapters
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 from zCLI import Dict, List, Optional, Any, Path
 
 # ============================================================
@@ -224,6 +245,28 @@ LOG_OPERATION_COMPLETE = "Operation complete: %s"
 LOG_TRANSACTION_BEGIN = "Transaction started"
 LOG_TRANSACTION_COMMIT = "Transaction committed"
 LOG_TRANSACTION_ROLLBACK = "Transaction rolled back"
+LOG_BULK_COMPLETE = "Bulk %s into %s: %d rows in %d chunk(s), %.3fs (%.0f rows/sec)"
+LOG_BULK_FAILED = "Bulk %s into %s failed after %d rows, rolled back: %s"
+
+# ============================================================
+# Module Constants - Bulk Loading
+# ============================================================
+
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+BULK_OP_INSERT = "insert"
+BULK_OP_UPSERT = "upsert"
+
+BULK_KEY_ROWS = "rows"
+BULK_KEY_CHUNKS = "chunks"
+BULK_KEY_ELAPSED = "elapsed"
+BULK_KEY_ROWS_PER_SEC = "rows_per_sec"
+
+# ============================================================
+# Module Constants - Streaming Reads
+# ============================================================
+
+DEFAULT_STREAM_BATCH_SIZE = 500
 
 # ============================================================
 # Public API
@@ -320,6 +363,10 @@ class BaseDataAdapter(ABC):  # pylint: disable=unnecessary-pass
     - csv_adapter.py: CSV file-based implementation
     """
 
+    # Connection pool hints (see connection_pool.py)
+    poolable: bool = False      # Connection may be reused across requests
+    thread_bound: bool = False  # Connection may only be used by its creating thread
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -846,6 +893,190 @@ class BaseDataAdapter(ABC):  # pylint: disable=unnecessary-pass
             ...     return self.cursor.lastrowid
         """
 
+    # ============================================================
+    # DQL - Streaming Reads (Concrete, Overridable)
+    # ============================================================
+
+    def select_batches(
+        self,
+        table: Any,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        **kwargs: Any
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Select rows lazily, yielding lists of up to batch_size row dicts.
+
+        Takes the same arguments as select(). Rows are read from the backend
+        as the generator is consumed; stop early (or close() the generator) to
+        release the cursor without reading the rest.
+
+        Args:
+            table: Table name (or list of tables for JOINs)
+            fields: List of field names to return (None = all fields)
+            batch_size: Rows per yielded batch
+            **kwargs: Query options accepted by select()
+
+        Yields:
+            List[Dict[str, Any]]: Next batch of rows (never empty)
+
+        Example:
+            >>> for batch in adapter.select_batches("events", batch_size=1000):
+            ...     process(batch)
+
+        Notes:
+            - The default slices select() (no memory saving); SQL and CSV
+              adapters override it with a cursor / DataFrame slice stream
+        """
+        batch_size = max(1, int(batch_size or DEFAULT_STREAM_BATCH_SIZE))
+        rows = self.select(table, fields, **kwargs)
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    def select_iter(
+        self,
+        table: Any,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Select rows lazily, one row dict at a time (see select_batches).
+
+        Example:
+            >>> for row in adapter.select_iter("users", where="age > 18"):
+            ...     print(row["name"])
+        """
+        for batch in self.select_batches(table, fields, batch_size=batch_size, **kwargs):
+            yield from batch
+
+    # ============================================================
+    # DML - Bulk Loading (Concrete, Overridable)
+    # ============================================================
+
+    def insert_many(
+        self,
+        table: str,
+        fields: List[str],
+        rows: Iterable[Any],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Insert many rows in one transaction (bulk load).
+
+        Args:
+            table: Name of table to insert into
+            fields: List of field names (ordered)
+            rows: Iterable of rows - value sequences (ordered like fields) or
+                  dicts keyed by field name. Consumed lazily, chunk by chunk.
+            chunk_size: Rows written per batch
+
+        Returns:
+            Dict with rows, chunks, elapsed (seconds) and rows_per_sec
+
+        Raises:
+            Exception: Whatever the backend raised; nothing is committed
+
+        Example:
+            >>> adapter.insert_many("users", ["name", "age"], [("Alice", 30), ("Bob", 25)])
+            {'rows': 2, 'chunks': 1, 'elapsed': 0.0004, 'rows_per_sec': 5000.0}
+
+        Notes:
+            - The default writes row by row via insert(); SQL and CSV
+              adapters override _insert_chunk() with a real batch write
+            - Per-row hooks and validation are not run here
+              (see operations/crud_import.py)
+        """
+        return self._run_bulk(
+            BULK_OP_INSERT, table, fields, rows, chunk_size,
+            lambda chunk: self._insert_chunk(table, fields, chunk)
+        )
+
+    def upsert_many(
+        self,
+        table: str,
+        fields: List[str],
+        rows: Iterable[Any],
+        conflict_fields: List[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Insert-or-update many rows in one transaction (bulk load).
+
+        Args:
+            table: Name of table
+            fields: List of field names (ordered)
+            rows: Iterable of value sequences or dicts (see insert_many)
+            conflict_fields: Fields to check for conflicts (usually pk or unique)
+            chunk_size: Rows written per batch
+
+        Returns:
+            Dict with rows, chunks, elapsed (seconds) and rows_per_sec
+
+        Raises:
+            Exception: Whatever the backend raised; nothing is committed
+        """
+        return self._run_bulk(
+            BULK_OP_UPSERT, table, fields, rows, chunk_size,
+            lambda chunk: self._upsert_chunk(table, fields, chunk, conflict_fields)
+        )
+
+    def _insert_chunk(self, table: str, fields: List[str], chunk: List[List[Any]]) -> None:
+        """Write one batch of rows (default: one insert() per row)."""
+        for values in chunk:
+            self.insert(table, fields, values)
+
+    def _upsert_chunk(
+        self,
+        table: str,
+        fields: List[str],
+        chunk: List[List[Any]],
+        conflict_fields: List[str]
+    ) -> None:
+        """Write one batch of rows (default: one upsert() per row)."""
+        for values in chunk:
+            self.upsert(table, fields, values, conflict_fields)
+
+    def _run_bulk(
+        self,
+        operation: str,
+        table: str,
+        fields: List[str],
+        rows: Iterable[Any],
+        chunk_size: int,
+        write_chunk: Callable[[List[List[Any]]], None]
+    ) -> Dict[str, Any]:
+        """Chunk rows, write each chunk, commit once (rollback on error), time it."""
+        chunk_size = max(1, int(chunk_size or DEFAULT_BULK_CHUNK_SIZE))
+        iterator = iter(rows)
+        total = chunks = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                chunk = [_row_values(fields, row) for row in islice(iterator, chunk_size)]
+                if not chunk:
+                    break
+                write_chunk(chunk)
+                total += len(chunk)
+                chunks += 1
+            self.commit()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(LOG_BULK_FAILED, operation, table, total, e)
+            self.rollback()
+            raise
+
+        elapsed = time.perf_counter() - start
+        rate = total / elapsed if elapsed > 0 else float(total)
+        if self.logger:
+            self.logger.info(LOG_BULK_COMPLETE, operation, table, total, chunks, elapsed, rate)
+        return {
+            BULK_KEY_ROWS: total,
+            BULK_KEY_CHUNKS: chunks,
+            BULK_KEY_ELAPSED: round(elapsed, 6),
+            BULK_KEY_ROWS_PER_SEC: round(rate, 1),
+        }
+
     # ============================================================
     # TCL - Transaction Control Language (Abstract Methods)
     # ============================================================
@@ -1004,3 +1235,10 @@ class BaseDataAdapter(ABC):  # pylint: disable=unnecessary-pass
             INFO_KEY_BACKEND: self.config.get(CONFIG_KEY_BACKEND),
             INFO_KEY_STATE: STATE_CONNECTED if self.is_connected() else STATE_DISCONNECTED,
         }
+
+
+def _row_values(fields: List[str], row: Any) -> List[Any]:
+    """Bulk row → ordered value list (dict rows are looked up by field name)."""
+    if isinstance(row, Mapping):
+        return [row.get(field) for field in fields]
+    return list(row)
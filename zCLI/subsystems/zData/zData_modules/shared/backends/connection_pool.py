@@ -0,0 +1,401 @@
+# zCLI/subsystems/zData/zData_modules/shared/backends/connection_pool.py
+"""
+Process-wide connection pool for zData backend adapters.
+
+One-shot zData requests (zUI menus, zServer JSON/form routes) used to build an
+adapter, connect, run one action and disconnect. With the pool, a connected
+adapter is borrowed for the request and handed back afterwards, so the next
+request against the same database skips sqlite3.connect / psycopg2.connect and
+the PRAGMA setup.
+
+Pool Keys
+---------
+Adapters are pooled per (backend, data path, label, connection Meta), e.g.
+``("sqlite", "/home/me/.zolo/zTests", "demo", ())``. PostgreSQL keys include
+host/port/user/password from Meta so different credentials never share a
+connection.
+
+Which Adapters Are Pooled
+-------------------------
+Only adapters with ``poolable = True`` (all SQL adapters). CSVAdapter is not
+pooled: its disconnect() is what flushes DataFrames to disk, so it keeps the
+connect/disconnect-per-request lifecycle.
+
+Lifecycle Rules
+---------------
+- **min_size / max_size:** Per key. Idle adapters above min_size are closed
+  after idle_timeout seconds. When max_size adapters are already checked out,
+  an overflow adapter is created and closed on release instead of pooled.
+- **Health checks:** An idle adapter is pinged (``SELECT 1``) before reuse if
+  it has not been checked for health_check_interval seconds. File-backed
+  databases are also re-stat'ed on every borrow, so a deleted or replaced .db
+  file never gets a stale connection.
+- **Thread affinity:** Adapters with ``thread_bound = True`` (SQLite) are only
+  handed back to the thread that created them.
+- **Release:** Any open transaction is rolled back before the adapter goes
+  back to the pool (the same outcome as closing it).
+
+Usage
+-----
+    >>> pool = get_connection_pool()
+    >>> key = make_pool_key("sqlite", config)
+    >>> adapter = pool.acquire(key, lambda: AdapterFactory.create_adapter("sqlite", config))
+    >>> adapter.select("users")
+    >>> pool.release(adapter)
+    >>> pool.get_stats()["keys"]
+    1
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ============================================================
+# Module Constants - Defaults
+# ============================================================
+
+DEFAULT_MIN_SIZE = 0
+DEFAULT_MAX_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 300.0           # seconds an idle adapter is kept
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0   # seconds between pings of an idle adapter
+
+HEALTH_CHECK_SQL = "SELECT 1"
+
+# Meta keys that identify a network connection (PostgreSQL)
+DSN_META_KEYS = ("Data_Host", "Data_Port", "Data_User", "Data_Password")
+
+# ============================================================
+# Module Constants - Config/Stats Keys
+# ============================================================
+
+CONFIG_KEY_PATH = "path"
+CONFIG_KEY_LABEL = "label"
+CONFIG_KEY_META = "meta"
+
+STAT_CREATED = "created"
+STAT_REUSED = "reused"
+STAT_CLOSED = "closed"
+STAT_OVERFLOW = "overflow"
+STAT_HEALTH_FAILURES = "health_failures"
+
+# ============================================================
+# Module Constants - Log Messages
+# ============================================================
+
+LOG_CREATED = "[Pool] New %s connection (%s)"
+LOG_REUSED = "[Pool] Reusing %s connection (%s)"
+LOG_RELEASED = "[Pool] Returned %s connection to pool"
+LOG_OVERFLOW = "[Pool] Pool full for %s - using an unpooled connection"
+LOG_HEALTH_FAILED = "[Pool] Dropping unhealthy connection (%s): %s"
+LOG_ROLLBACK_FAILED = "[Pool] Rollback on release failed, closing connection: %s"
+LOG_CLOSED_ALL = "[Pool] Closed %d pooled connection(s)"
+
+# ============================================================
+# Public API
+# ============================================================
+
+__all__ = ["ConnectionPool", "get_connection_pool", "make_pool_key"]
+
+
+def make_pool_key(data_type: str, config: Dict[str, Any]) -> Tuple:
+    """
+    Build the pool key for an adapter config (as passed to AdapterFactory).
+
+    Args:
+        data_type: Backend type ("sqlite", "postgresql", ...)
+        config: Adapter config with path, label and meta
+
+    Returns:
+        Tuple: (backend, path, label, dsn items)
+    """
+    meta = config.get(CONFIG_KEY_META) or {}
+    dsn = tuple((key, str(meta[key])) for key in DSN_META_KEYS if meta.get(key) is not None)
+    return (
+        str(data_type).lower(),
+        str(config.get(CONFIG_KEY_PATH, "")),
+        str(config.get(CONFIG_KEY_LABEL, "")),
+        dsn,
+    )
+
+
+def _describe_key(key: Tuple) -> str:
+    """Human-readable key for logs/stats (credentials left out)."""
+    backend, path, label = key[0], key[1], key[2]
+    return f"{backend}:{path}/{label}"
+
+
+def _file_identity(adapter: Any) -> Optional[Tuple[int, int]]:
+    """(st_dev, st_ino) of a file-backed database, or None."""
+    if not adapter.thread_bound:
+        return None
+    try:
+        stat = os.stat(adapter.db_path)
+    except (AttributeError, OSError, TypeError):
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class _Entry:
+    """Bookkeeping for one pooled adapter."""
+
+    __slots__ = ("adapter", "key", "thread_id", "identity", "last_used", "last_checked")
+
+    def __init__(self, adapter: Any, key: Tuple):
+        now = time.monotonic()
+        self.adapter = adapter
+        self.key = key
+        self.thread_id = threading.get_ident()
+        self.identity = _file_identity(adapter)
+        self.last_used = now
+        self.last_checked = now
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of connected adapters keyed by database.
+
+    Attributes:
+        min_size: Idle adapters always kept per key
+        max_size: Maximum pooled adapters (idle + checked out) per key
+        idle_timeout: Seconds before an idle adapter above min_size is closed
+        health_check_interval: Seconds between pings of an idle adapter
+    """
+
+    def __init__(
+        self,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        logger: Optional[Any] = None
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.logger = logger
+
+        self._lock = threading.RLock()  # re-entered by _close() under acquire/_reap_idle
+        self._idle: Dict[Tuple, List[_Entry]] = defaultdict(list)
+        self._in_use: Dict[int, Optional[_Entry]] = {}  # id(adapter) → entry (None = unpooled)
+        self._counters: Dict[str, int] = defaultdict(int)
+
+    def configure(self, **settings: Any) -> None:
+        """Update min_size, max_size, idle_timeout or health_check_interval."""
+        for name, value in settings.items():
+            if name not in ("min_size", "max_size", "idle_timeout", "health_check_interval", "logger"):
+                raise ValueError(f"Unknown connection pool setting: {name}")
+            setattr(self, name, value)
+
+    # ============================================================
+    # Borrow / Return
+    # ============================================================
+
+    def acquire(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        Borrow a connected adapter for key, creating one if none is idle.
+
+        Args:
+            key: Pool key from make_pool_key()
+            factory: Creates a new (unconnected) adapter
+
+        Returns:
+            Connected adapter; hand it back with release()
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._reap_idle()
+            idle = self._idle[key]
+            for index in range(len(idle) - 1, -1, -1):
+                entry = idle[index]
+                if entry.adapter.thread_bound and entry.thread_id != thread_id:
+                    continue
+                del idle[index]
+                break
+            else:
+                entry = None
+                # Only other threads' adapters are idle - make room by dropping the oldest
+                if idle and len(idle) + self._count_in_use(key) >= self.max_size:
+                    evicted = idle.pop(0)
+                    self._close(evicted.adapter, evicted.thread_id)
+
+        if entry is not None:
+            if self._is_healthy(entry):
+                entry.last_used = time.monotonic()
+                with self._lock:
+                    self._in_use[id(entry.adapter)] = entry
+                    self._counters[STAT_REUSED] += 1
+                self._log("debug", LOG_REUSED, key[0], _describe_key(key))
+                return entry.adapter
+            self._close(entry.adapter)
+
+        adapter = factory()
+        adapter.connect()
+        with self._lock:
+            pooled = adapter.poolable and len(self._idle[key]) + self._count_in_use(key) < self.max_size
+            self._in_use[id(adapter)] = _Entry(adapter, key) if pooled else None
+            self._counters[STAT_CREATED] += 1
+            if adapter.poolable and not pooled:
+                self._counters[STAT_OVERFLOW] += 1
+        if adapter.poolable and not pooled:
+            self._log("debug", LOG_OVERFLOW, _describe_key(key))
+        self._log("debug", LOG_CREATED, key[0], _describe_key(key))
+        return adapter
+
+    def release(self, adapter: Any) -> None:
+        """
+        Return a borrowed adapter. Unpooled adapters are disconnected.
+
+        Args:
+            adapter: Adapter obtained from acquire()
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(adapter), None)
+        if entry is None:
+            self._close(adapter)
+            return
+
+        connection = adapter.connection
+        try:
+            if connection is not None and getattr(connection, "rollback", None):
+                connection.rollback()
+        except Exception as e:  # pylint: disable=broad-except
+            self._log("warning", LOG_ROLLBACK_FAILED, e)
+            self._close(adapter)
+            return
+
+        if connection is None:
+            self._close(adapter)
+            return
+
+        entry.last_used = time.monotonic()
+        with self._lock:
+            self._idle[entry.key].append(entry)
+            self._reap_idle()
+        self._log("debug", LOG_RELEASED, entry.key[0])
+
+    def close_all(self) -> int:
+        """
+        Close every idle adapter (checked-out adapters close on release).
+
+        Returns:
+            int: Number of adapters closed
+        """
+        with self._lock:
+            entries = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+            for adapter_id, entry in list(self._in_use.items()):
+                if entry is not None:
+                    self._in_use[adapter_id] = None
+        for entry in entries:
+            self._close(entry.adapter, entry.thread_id)
+        if entries:
+            self._log("debug", LOG_CLOSED_ALL, len(entries))
+        return len(entries)
+
+    # ============================================================
+    # Stats
+    # ============================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with settings, counters, and per-key idle/in-use counts
+        """
+        with self._lock:
+            per_key: Dict[str, Dict[str, int]] = {}
+            for key, idle in self._idle.items():
+                if idle:
+                    per_key.setdefault(_describe_key(key), {"idle": 0, "in_use": 0})["idle"] = len(idle)
+            for entry in self._in_use.values():
+                if entry is not None:
+                    per_key.setdefault(_describe_key(entry.key), {"idle": 0, "in_use": 0})["in_use"] += 1
+            created = self._counters[STAT_CREATED]
+            reused = self._counters[STAT_REUSED]
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "idle_timeout": self.idle_timeout,
+                "keys": len(per_key),
+                "idle": sum(v["idle"] for v in per_key.values()),
+                "in_use": sum(v["in_use"] for v in per_key.values()),
+                STAT_CREATED: created,
+                STAT_REUSED: reused,
+                STAT_CLOSED: self._counters[STAT_CLOSED],
+                STAT_OVERFLOW: self._counters[STAT_OVERFLOW],
+                STAT_HEALTH_FAILURES: self._counters[STAT_HEALTH_FAILURES],
+                "reuse_rate": f"{(reused / (created + reused) * 100):.1f}%" if created + reused else "0.0%",
+                "pools": per_key,
+            }
+
+    # ============================================================
+    # Internals
+    # ============================================================
+
+    def _count_in_use(self, key: Tuple) -> int:
+        """Pooled adapters for key currently checked out (lock held)."""
+        return sum(1 for entry in self._in_use.values() if entry is not None and entry.key == key)
+
+    def _is_healthy(self, entry: _Entry) -> bool:
+        """Connection still open, file unchanged, and ping OK when due."""
+        adapter = entry.adapter
+        reason = None
+        if not adapter.is_connected():
+            reason = "disconnected"
+        elif entry.identity is not None and _file_identity(adapter) != entry.identity:
+            reason = "database file changed"
+        elif time.monotonic() - entry.last_checked >= self.health_check_interval:
+            try:
+                cursor = adapter.connection.cursor()
+                cursor.execute(HEALTH_CHECK_SQL)
+                cursor.fetchone()
+                cursor.close()
+                entry.last_checked = time.monotonic()
+            except Exception as e:  # pylint: disable=broad-except
+                reason = str(e)
+
+        if reason is None:
+            return True
+        with self._lock:
+            self._counters[STAT_HEALTH_FAILURES] += 1
+        self._log("debug", LOG_HEALTH_FAILED, _describe_key(entry.key), reason)
+        return False
+
+    def _reap_idle(self) -> None:
+        """Close idle adapters past idle_timeout, keeping min_size per key (lock held)."""
+        now = time.monotonic()
+        for idle in self._idle.values():
+            while len(idle) > self.min_size and now - idle[0].last_used >= self.idle_timeout:
+                entry = idle.pop(0)
+                self._close(entry.adapter, entry.thread_id)
+
+    def _close(self, adapter: Any, thread_id: Optional[int] = None) -> None:
+        """Disconnect an adapter (drop it instead if bound to another thread)."""
+        with self._lock:
+            self._counters[STAT_CLOSED] += 1
+        if adapter.thread_bound and thread_id is not None and thread_id != threading.get_ident():
+            # sqlite3 refuses cross-thread close(); releasing the last reference closes it
+            adapter.cursor = None
+            adapter.connection = None
+            return
+        try:
+            adapter.disconnect()
+        except Exception as e:  # pylint: disable=broad-except
+            self._log("debug", LOG_HEALTH_FAILED, adapter.__class__.__name__, e)
+
+    def _log(self, level: str, message: str, *args: Any) -> None:
+        """Log through the configured logger, if any."""
+        if self.logger:
+            getattr(self.logger, level)(message, *args)
+
+
+_connection_pool = ConnectionPool()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Get the process-wide pool shared by every zData instance."""
+    return _connection_pool
@@ -72,6 +72,14 @@ Insert or update with conflict resolution:
 - Merge new data with existing data on conflict_fields
 - drop_duplicates(subset=conflict_fields, keep='last')
 
+**7. Resident Engine (Meta Data_Engine: resident):**
+Opt-in write path for write-heavy tables (see csv_engine.py):
+- Writes logged to {table}.csv.wal instead of rewriting the CSV
+- commit() appends new rows, or rewrites once if existing rows changed
+- Running auto-increment counter (no max() per insert)
+- Hash indexes on pk/unique columns for WHERE equality and upsert conflicts
+- Uncommitted WAL replayed on next load; rollback() discards it
+
 File Structure
 -------------
 Each table stored as a separate CSV file:
@@ -181,11 +189,19 @@ See Also
 - postgresql_adapter.py: SQL-based network storage
 """
 
-from zCLI import Dict, List, Optional, Any
-from .base_adapter import BaseDataAdapter
-
+from pathlib import Path
+from typing import Iterator
+from zCLI import Dict, List, Optional, Any, lazy_import
+from .base_adapter import BaseDataAdapter, DEFAULT_STREAM_BATCH_SIZE, CONFIG_KEY_META
+from .csv_engine import (
+    ENGINE_CLASSIC, ENGINE_RESIDENT, META_KEY_ENGINE, WAL_EXTENSION,
+    WAL_OP_DELETE, WAL_OP_INSERT, WAL_OP_UPDATE, WAL_OP_UPSERT,
+    ResidentTable
+)
+
+# pandas is loaded on first use: importing it takes ~0.5s and only CSV tables need it
 try:
-    import pandas as pd
+    pd = lazy_import("pandas")
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
@@ -270,6 +286,8 @@ LOG_ROW_INSERTED = "Inserted row into CSV table %s (row %d)"
 LOG_JOIN_MULTI_TABLE = "[JOIN] Multi-table CSV query: %s"
 LOG_TABLE_EXISTS = "CSV table '%s' exists: %s"
 LOG_FOUND_TABLES = "Found %d CSV tables: %s"
+LOG_WAL_REPLAY = "Replaying %d uncommitted WAL record(s) for CSV table %s"
+LOG_CHECKPOINT = "Checkpointed CSV table %s (%s, %d rows)"
 
 # ============================================================
 # Public API
@@ -380,6 +398,12 @@ class CSVAdapter(BaseDataAdapter):
     - _resolve_field_names: Resolve ambiguous column names
     - _apply_where_filter: Apply WHERE mask to DataFrame
 
+    **Resident Engine (Data_Engine: resident):**
+    - _resident_append/_update/_delete/_upsert: In-memory writes + WAL record
+    - _where_labels: Hash index probe for pk/unique equality, mask otherwise
+    - _checkpoint: Append or rewrite the CSV once, truncate the WAL
+    - _recover_table: Replay an uncommitted WAL on load
+
     CSV-Specific Details
     -------------------
     **File Format:**
@@ -397,7 +421,8 @@ class CSVAdapter(BaseDataAdapter):
     - No ACID transactions (file-based)
     - No concurrent write access (file locking needed)
     - Memory-bound by dataset size
-    - No indexes (full table scan for queries)
+    - No indexes in the classic engine (full table scan for queries);
+      the resident engine indexes pk/unique columns
 
     Usage Example
     ------------
@@ -428,6 +453,7 @@ class CSVAdapter(BaseDataAdapter):
             config: Configuration dict with:
                 - path (str): Base directory for CSV files
                 - label (str): Adapter label
+                - meta (dict): Schema Meta (Data_Engine: classic | resident)
             logger: Optional logger instance for diagnostic output
 
         Raises:
@@ -451,6 +477,11 @@ class CSVAdapter(BaseDataAdapter):
         self.tables: Dict[str, Any] = {}  # Cache: {table_name: DataFrame}
         self.schemas: Dict[str, Dict] = {}  # Schema: {table_name: schema_dict}
 
+        meta = config.get(CONFIG_KEY_META) or {}
+        self.engine = str(meta.get(META_KEY_ENGINE) or ENGINE_CLASSIC).lower()
+        self.resident = self.engine == ENGINE_RESIDENT
+        self._resident: Dict[str, ResidentTable] = {}  # Resident engine: {table_name: state}
+
     # ============================================================
     # Connection Management
     # ============================================================
@@ -512,9 +543,13 @@ class CSVAdapter(BaseDataAdapter):
             - Automatically saves all tables (no manual save needed)
             - Clears self.tables cache to free memory
         """
+        if self.resident:
+            self.commit()
+            self._resident.clear()
         if self.tables:
-            for table_name, df in self.tables.items():
-                self._save_table(table_name, df)
+            if not self.resident:
+                for table_name, df in self.tables.items():
+                    self._save_table(table_name, df)
             self.tables.clear()
             if self.logger:
                 self.logger.info(LOG_DISCONNECTED, self.base_path)
@@ -594,6 +629,9 @@ class CSVAdapter(BaseDataAdapter):
         csv_file = self.base_path / f"{table_name}{CSV_EXTENSION}"
         df.to_csv(csv_file, index=False)
         self.tables[table_name] = df
+        if self.resident:
+            self._table_state(table_name).wal.clear()
+            self._table_state(table_name).reset()
 
         if self.logger:
             self.logger.info(LOG_TABLE_CREATED, csv_file)
@@ -642,6 +680,9 @@ class CSVAdapter(BaseDataAdapter):
 
         self._save_table(table_name, df)
         self.tables[table_name] = df
+        if self.resident:
+            self._table_state(table_name).wal.clear()
+            self._table_state(table_name).reset(saved_rows=len(df))
         if self.logger:
             self.logger.info(LOG_TABLE_ALTERED, table_name)
 
@@ -673,6 +714,8 @@ class CSVAdapter(BaseDataAdapter):
             del self.tables[table_name]
         if table_name in self.schemas:
             del self.schemas[table_name]
+        if table_name in self._resident:
+            self._resident.pop(table_name).wal.clear()
 
     def table_exists(self, table_name: str) -> bool:
         """
@@ -748,47 +791,26 @@ class CSVAdapter(BaseDataAdapter):
             - Auto-generates ID if schema has pk=True, auto_increment=True
             - Appends row to DataFrame
             - Saves immediately to CSV (no explicit commit needed)
+            - Resident engine: buffers the row and logs it to the WAL instead
         """
-        df = self._load_table(table)
-
         if values is None:
             values = []
         if fields is None:
             fields = []
 
+        if self.resident:
+            return self._resident_append(table, fields, [values])
+
+        df = self._load_table(table)
+
         new_row = {field: value for field, value in zip(fields, values)}
         
         # Handle auto_increment for primary key fields
-        # Try schema first, then fallback to convention-based detection
-        schema = self.schemas.get(table, {})
-        auto_id_field = None
-        
-        # Check schema for explicit auto_increment field
-        for field_name, field_def in schema.items():
-            if isinstance(field_def, dict):
-                is_pk = field_def.get('pk', False) or field_def.get('primary_key', False)
-                is_auto = field_def.get('auto_increment', False) or field_def.get('autoincrement', False)
-                if is_pk and is_auto:
-                    auto_id_field = field_name
-                    break
-        
-        # Fallback: If no schema, check for 'id' column in DataFrame (convention-based)
-        if not auto_id_field and 'id' in df.columns and 'id' not in new_row:
-            auto_id_field = 'id'
-        
+        auto_id_field = self._auto_id_field(table, df, new_row)
+
         # If auto_increment field found and not provided (or empty) in insert
         if auto_id_field and (auto_id_field not in new_row or not new_row.get(auto_id_field)):
-            # Calculate next ID: max(existing_ids) + 1, or 1 if table is empty
-            if len(df) > 0 and auto_id_field in df.columns:
-                try:
-                    max_id = df[auto_id_field].max()
-                    # Handle NaN or None
-                    next_id = int(max_id) + 1 if pd.notna(max_id) else 1
-                except (ValueError, TypeError):
-                    next_id = len(df) + 1
-            else:
-                next_id = 1
-            
+            next_id = self._next_auto_id(df, auto_id_field)
             new_row[auto_id_field] = next_id
             row_id = next_id
             if self.logger:
@@ -860,13 +882,39 @@ class CSVAdapter(BaseDataAdapter):
             - ORDER BY uses pandas sort_values()
             - Returns list of dicts (row-wise)
         """
-        where = kwargs.get('where')
-        joins = kwargs.get('joins')
-        order = kwargs.get('order')
-        limit = kwargs.get('limit')
-        offset = kwargs.get('offset', 0)  # Default to 0 (no offset)
-        auto_join = kwargs.get('auto_join', False)
-        schema = kwargs.get('schema')
+        df, table_name = self._select_frame(table, fields, kwargs)
+        rows = df.to_dict('records')
+
+        if self.logger:
+            self.logger.info("Selected %d rows from %s", len(rows), table_name)
+        return rows
+
+    def select_batches(self, table, fields: Optional[List[str]] = None,
+                       batch_size: int = DEFAULT_STREAM_BATCH_SIZE, **kwargs) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a select() as lists of row dicts, converting one slice at a time.
+
+        The table is already in memory as a DataFrame; what this avoids is
+        building the full list of dicts (to_dict('records')) up front.
+        """
+        df, table_name = self._select_frame(table, fields, kwargs)
+        batch_size = max(1, int(batch_size or DEFAULT_STREAM_BATCH_SIZE))
+
+        for start in range(0, len(df), batch_size):
+            yield df.iloc[start:start + batch_size].to_dict('records')
+
+        if self.logger:
+            self.logger.info("Streamed %d rows from %s", len(df), table_name)
+
+    def _select_frame(self, table, fields: Optional[List[str]], options: Dict[str, Any]):
+        """Filtered, ordered, paginated DataFrame for select()/select_batches()."""
+        where = options.get('where')
+        joins = options.get('joins')
+        order = options.get('order')
+        limit = options.get('limit')
+        offset = options.get('offset', 0)  # Default to 0 (no offset)
+        auto_join = options.get('auto_join', False)
+        schema = options.get('schema')
 
         tables = [table] if isinstance(table, str) else table
         is_multi_table = len(tables) > 1 or joins
@@ -881,7 +929,9 @@ class CSVAdapter(BaseDataAdapter):
         else:
             df = self._load_table(table)
 
-        if where:
+        if where and self.resident and not is_multi_table:
+            df = df.loc[self._where_labels(table, df, where)]
+        elif where:
             df = self._apply_where_filter(df, where)
 
         if fields and fields != ["*"]:
@@ -901,12 +951,8 @@ class CSVAdapter(BaseDataAdapter):
             # Only offset, no limit: skip first N rows, return rest
             df = df.iloc[offset:]
 
-        rows = df.to_dict('records')
-
         table_name = " + ".join(tables) if is_multi_table else table
-        if self.logger:
-            self.logger.info("Selected %d rows from %s", len(rows), table_name)
-        return rows
+        return df, table_name
 
     def update(self, table: str, fields: List[str], values: List[Any], where: Dict[str, Any]) -> int:
         """
@@ -930,6 +976,9 @@ class CSVAdapter(BaseDataAdapter):
             - If where=None, updates ALL rows
             - Saves immediately to CSV
         """
+        if self.resident:
+            return self._resident_update(table, fields, values, where)
+
         df = self._load_table(table)
 
         if where:
@@ -970,6 +1019,9 @@ class CSVAdapter(BaseDataAdapter):
             - If where=None, deletes ALL rows (clears table)
             - Saves immediately to CSV
         """
+        if self.resident:
+            return self._resident_delete(table, where)
+
         df = self._load_table(table)
         original_count = len(df)
 
@@ -1018,7 +1070,11 @@ class CSVAdapter(BaseDataAdapter):
             - If match found: updates (UPDATE)
             - If no match: inserts (INSERT)
             - Saves immediately to CSV
+            - Resident engine: conflict check is a hash index lookup
         """
+        if self.resident:
+            return self._resident_upsert(table, fields, [values], conflict_fields)
+
         df = self._load_table(table)
         new_row = {field: value for field, value in zip(fields, values)}
 
@@ -1051,6 +1107,295 @@ class CSVAdapter(BaseDataAdapter):
 
         return int(row_id)
 
+    # ============================================================
+    # Bulk Loading (one DataFrame concat per chunk, one save on commit)
+    # ============================================================
+
+    def _insert_chunk(self, table: str, fields: List[str], chunk: List[List[Any]]) -> None:
+        """Append one batch to the cached DataFrame (saved once by commit())."""
+        if self.resident:
+            self._resident_append(table, fields, chunk)
+            return
+
+        df = self._load_table(table)
+        new_rows = [dict(zip(fields, values)) for values in chunk]
+
+        auto_id_field = self._auto_id_field(table, df, fields)
+        if auto_id_field:
+            next_id = self._next_auto_id(df, auto_id_field)
+            for row in new_rows:
+                if row.get(auto_id_field):
+                    try:
+                        next_id = max(next_id, int(row[auto_id_field]) + 1)
+                    except (ValueError, TypeError):
+                        pass
+                    continue
+                row[auto_id_field] = next_id
+                next_id += 1
+
+        self.tables[table] = self._append_rows_to_df(df, new_rows)
+
+    def _upsert_chunk(
+        self,
+        table: str,
+        fields: List[str],
+        chunk: List[List[Any]],
+        conflict_fields: List[str]
+    ) -> None:
+        """Merge one batch into the cached DataFrame (update by key, append the rest)."""
+        if self.resident:
+            self._resident_upsert(table, fields, chunk, conflict_fields)
+            return
+
+        df = self._load_table(table)
+        keys = [field for field in (conflict_fields or []) if field in fields and field in df.columns]
+        if not keys:
+            self.tables[table] = self._append_rows_to_df(df, [dict(zip(fields, values)) for values in chunk])
+            return
+
+        # Existing key → row index, built once per chunk instead of a mask per row
+        positions = dict(zip(df[keys].itertuples(index=False, name=None), df.index))
+        pending: Dict[tuple, Dict[str, Any]] = {}
+        for values in chunk:
+            row = dict(zip(fields, values))
+            key = tuple(row[field] for field in keys)
+            if key in positions:
+                for field, value in row.items():
+                    if field in df.columns:
+                        df.at[positions[key], field] = value
+            elif key in pending:
+                pending[key].update(row)
+            else:
+                pending[key] = row
+
+        self.tables[table] = self._append_rows_to_df(df, list(pending.values()))
+
+    # ============================================================
+    # Resident Engine (WAL, running id counter, hash indexes)
+    # ============================================================
+
+    def _table_state(self, table: str) -> ResidentTable:
+        """Resident bookkeeping for table (created on first use)."""
+        state = self._resident.get(table)
+        if state is None:
+            state = ResidentTable(Path(f"{self._get_csv_path(table)}{WAL_EXTENSION}"))
+            self._resident[table] = state
+        return state
+
+    def _resident_frame(self, table: str):
+        """Cached DataFrame without merging buffered inserts."""
+        if table not in self.tables:
+            self._load_table(table)
+        return self.tables[table]
+
+    def _merge_pending(self, table: str):
+        """Fold buffered inserts into the cached DataFrame (one concat)."""
+        state = self._table_state(table)
+        df = self.tables[table]
+        if state.pending:
+            df = self._append_rows_to_df(df, state.pending)
+            state.pending = []
+            self.tables[table] = df
+        return df
+
+    def _recover_table(self, table: str, df):
+        """Replay a WAL left by an uncommitted session onto a freshly read table."""
+        state = self._table_state(table)
+        state.reset(saved_rows=len(df))
+        records = list(state.wal.records())
+        if not records:
+            return df
+
+        if self.logger:
+            self.logger.warning(LOG_WAL_REPLAY, len(records), table)
+        state.wal.close()
+        for record in records:
+            op = record.get("op")
+            if op == WAL_OP_INSERT:
+                self._resident_append(table, record["fields"], record["rows"], log=False)
+            elif op == WAL_OP_UPDATE:
+                self._resident_update(table, record["fields"], record["values"], record.get("where"), log=False)
+            elif op == WAL_OP_DELETE:
+                self._resident_delete(table, record.get("where"), log=False)
+            elif op == WAL_OP_UPSERT:
+                self._resident_upsert(table, record["fields"], record["rows"], record.get("conflict"), log=False)
+        self._checkpoint(table, state)
+        return self.tables[table]
+
+    def _checkpoint(self, table: str, state: ResidentTable) -> None:
+        """Persist table: append rows new since the last save, or rewrite once."""
+        df = self._load_table(table)
+        if state.rewrite or len(df) < state.saved_rows:
+            self._save_table(table, df)
+            mode = "rewrite"
+        elif len(df) > state.saved_rows:
+            df.iloc[state.saved_rows:].to_csv(self._get_csv_path(table), mode="a", header=False, index=False)
+            mode = "append"
+        else:
+            mode = "unchanged"
+        state.wal.clear()
+        state.rewrite = False
+        state.saved_rows = len(df)
+        if self.logger:
+            self.logger.debug(LOG_CHECKPOINT, table, mode, len(df))
+
+    def _indexed_columns(self, table: str, df) -> List[str]:
+        """pk/unique columns from the schema (or the 'id' convention)."""
+        columns = [
+            field_name for field_name, field_def in self.schemas.get(table, {}).items()
+            if isinstance(field_def, dict) and field_name in df.columns and (
+                field_def.get(SCHEMA_KEY_PK) or field_def.get(SCHEMA_KEY_PRIMARY_KEY)
+                or field_def.get(SCHEMA_KEY_UNIQUE)
+            )
+        ]
+        if not columns and 'id' in df.columns:
+            columns = ['id']
+        return columns
+
+    def _where_labels(self, table: str, df, where):
+        """Row labels matching where; pk/unique equality probes a hash index first."""
+        if not where:
+            return df.index
+
+        candidates = None
+        if isinstance(where, dict):
+            for column in self._indexed_columns(table, df):
+                condition = where.get(column)
+                if condition is not None and not isinstance(condition, (dict, list)):
+                    index = self._table_state(table).index(df, (column,))
+                    candidates = index.get((condition,), [])
+                    break
+
+        if candidates is None:
+            return df.index[self._create_where_mask(df, where)]
+        subset = df.loc[candidates]
+        return subset.index[self._create_where_mask(subset, where)]
+
+    def _resident_append(self, table: str, fields: List[str], rows, log: bool = True) -> int:
+        """Buffer rows (auto id from the running counter) and log them; returns last row id."""
+        state = self._table_state(table)
+        df = self._resident_frame(table)
+        rows = [list(values) for values in rows]
+
+        auto_id_field = self._auto_id_field(table, df, fields)
+        id_field = auto_id_field or state.id_field
+        if id_field and state.next_id is None:
+            df = self._load_table(table)  # Derive the counter once from the merged frame
+            state.id_field = id_field
+            state.next_id = self._next_auto_id(df, id_field)
+
+        label = len(df) + len(state.pending)
+        row_id = label
+        appended = []
+        for values in rows:
+            row = dict(zip(fields, values))
+            if auto_id_field and not row.get(auto_id_field):
+                row[auto_id_field] = row_id = state.next_id
+                state.next_id += 1
+            else:
+                row_id = label + 1
+                if id_field and row.get(id_field):
+                    try:
+                        state.next_id = max(state.next_id, int(row[id_field]) + 1)
+                    except (ValueError, TypeError):
+                        pass
+            state.pending.append(row)
+            state.index_row(row, label)
+            appended.append(row)
+            label += 1
+
+        if log and rows:
+            # Log the assigned ids: replay must not re-derive them from the (replayed) max id
+            logged_fields = list(fields)
+            if auto_id_field and auto_id_field not in logged_fields:
+                logged_fields.append(auto_id_field)
+            logged_rows = [[row.get(field) for field in logged_fields] for row in appended]
+            state.wal.append({"op": WAL_OP_INSERT, "fields": logged_fields, "rows": logged_rows})
+        if self.logger:
+            self.logger.debug(LOG_ROW_INSERTED, table, row_id)
+        return row_id
+
+    def _resident_update(self, table: str, fields: List[str], values: List[Any], where, log: bool = True) -> int:
+        """Update matching rows in memory and log the change."""
+        state = self._table_state(table)
+        df = self._load_table(table)
+        labels = self._where_labels(table, df, where)
+        if len(labels) == 0:
+            return 0
+
+        changed = [field for field in fields if field in df.columns]
+        for field, value in zip(fields, values):
+            if field in df.columns:
+                df.loc[labels, field] = value
+
+        state.drop_indexes(changed)
+        if state.id_field in changed:
+            state.next_id = None
+        state.rewrite = True
+        if log:
+            state.wal.append({"op": WAL_OP_UPDATE, "fields": list(fields), "values": list(values), "where": where})
+        if self.logger:
+            self.logger.info("Updated %d rows in CSV table %s", len(labels), table)
+        return len(labels)
+
+    def _resident_delete(self, table: str, where, log: bool = True) -> int:
+        """Delete matching rows in memory (labels renumbered) and log the change."""
+        state = self._table_state(table)
+        df = self._load_table(table)
+        labels = self._where_labels(table, df, where)
+        if len(labels) == 0:
+            return 0
+
+        self.tables[table] = df.drop(index=labels).reset_index(drop=True)
+        state.drop_indexes()
+        state.rewrite = True
+        if log:
+            state.wal.append({"op": WAL_OP_DELETE, "where": where})
+        if self.logger:
+            self.logger.info("Deleted %d rows from CSV table %s", len(labels), table)
+        return len(labels)
+
+    def _resident_upsert(self, table: str, fields: List[str], rows, conflict_fields, log: bool = True) -> int:
+        """Update rows whose conflict key is indexed, buffer the rest; returns last row id."""
+        state = self._table_state(table)
+        df = self._resident_frame(table)
+        keys = tuple(field for field in (conflict_fields or []) if field in fields and field in df.columns)
+        if not keys:
+            return self._resident_append(table, fields, rows, log=log)
+
+        rows = [list(values) for values in rows]
+        index = state.index(df, keys)
+        frame_rows = len(df)
+        row_id = 0
+        updated = False
+        for values in rows:
+            row = dict(zip(fields, values))
+            labels = index.get(tuple(row[field] for field in keys))
+            if labels:
+                for label in labels:
+                    if label < frame_rows:
+                        for field, value in row.items():
+                            if field in df.columns:
+                                df.at[label, field] = value
+                        state.rewrite = state.rewrite or label < state.saved_rows
+                    else:
+                        state.pending[label - frame_rows].update(row)
+                updated = True
+                row_id = labels[0] + 1
+            else:
+                label = frame_rows + len(state.pending)
+                state.pending.append(row)
+                state.index_row(row, label)
+                row_id = label + 1
+
+        if updated:
+            state.drop_indexes([field for field in fields if field not in keys])
+            if state.id_field in fields:
+                state.next_id = None
+        if log and rows:
+            state.wal.append({"op": WAL_OP_UPSERT, "fields": list(fields), "rows": rows, "conflict": list(keys)})
+        return int(row_id)
+
     # ============================================================
     # Type Mapping
     # ============================================================
@@ -1119,7 +1464,14 @@ class CSVAdapter(BaseDataAdapter):
         Note:
             Unlike SQL databases, CSV saves happen immediately on each operation.
             This method explicitly flushes all cached tables to disk.
+            Resident engine: checkpoints only tables with logged changes
+            (append or one rewrite), then truncates their WAL.
         """
+        if self.resident:
+            for table_name, state in list(self._resident.items()):
+                if state.dirty:
+                    self._checkpoint(table_name, state)
+            return
         for table_name, df in self.tables.items():
             self._save_table(table_name, df)
         if self.logger:
@@ -1132,8 +1484,16 @@ class CSVAdapter(BaseDataAdapter):
         Note:
             CSV has no true rollback. This clears cache, forcing reload on next access.
             Changes already saved to CSV files cannot be undone.
+            Resident engine: uncommitted changes only live in memory and the WAL,
+            so discarding both restores the last commit.
         """
-        if self.logger:
+        if self.resident:
+            for state in self._resident.values():
+                state.wal.clear()
+            self._resident.clear()
+            if self.logger:
+                self.logger.debug("CSV adapter: rollback (discarded uncommitted changes)")
+        elif self.logger:
             self.logger.warning("CSV adapter: rollback (reloading from disk)")
         self.tables.clear()
 
@@ -1145,14 +1505,46 @@ class CSVAdapter(BaseDataAdapter):
         """Get CSV file path for table."""
         return self.base_path / f"{table_name}{CSV_EXTENSION}"
 
+    def _auto_id_field(self, table, df, provided):
+        """Auto-increment pk field for table (schema first, then 'id' convention)."""
+        schema = self.schemas.get(table, {})
+
+        # Check schema for explicit auto_increment field
+        for field_name, field_def in schema.items():
+            if isinstance(field_def, dict):
+                is_pk = field_def.get('pk', False) or field_def.get('primary_key', False)
+                is_auto = field_def.get('auto_increment', False) or field_def.get('autoincrement', False)
+                if is_pk and is_auto:
+                    return field_name
+
+        # Fallback: If no schema, check for 'id' column in DataFrame (convention-based)
+        if 'id' in df.columns and 'id' not in provided:
+            return 'id'
+        return None
+
+    def _next_auto_id(self, df, auto_id_field):
+        """Next ID: max(existing_ids) + 1, or 1 if table is empty."""
+        if len(df) > 0 and auto_id_field in df.columns:
+            try:
+                max_id = df[auto_id_field].max()
+                # Handle NaN or None
+                return int(max_id) + 1 if pd.notna(max_id) else 1
+            except (ValueError, TypeError):
+                return len(df) + 1
+        return 1
+
     def _append_row_to_df(self, df, new_row):
         """Safely append row to DataFrame (avoids FutureWarning)."""
-        # Ensure all columns present in new row
-        for col in df.columns:
-            if col not in new_row:
-                new_row[col] = None
+        return self._append_rows_to_df(df, [new_row])
+
+    def _append_rows_to_df(self, df, new_rows):
+        """Append rows to DataFrame in one concat (missing columns become None)."""
+        if not new_rows:
+            return df
 
-        new_df = pd.DataFrame([new_row], columns=df.columns)
+        # Ensure all columns present in each row
+        rows = [{col: row.get(col) for col in df.columns} for row in new_rows]
+        new_df = pd.DataFrame(rows, columns=df.columns)
 
         # If original is empty, return new one (avoids pandas FutureWarning)
         if len(df) == 0:
@@ -1164,6 +1556,8 @@ class CSVAdapter(BaseDataAdapter):
         """Load table from CSV file (with caching)."""
         # Check cache first
         if table_name in self.tables:
+            if self.resident:
+                return self._merge_pending(table_name)
             return self.tables[table_name]
 
         csv_file = self._get_csv_path(table_name)
@@ -1185,6 +1579,8 @@ class CSVAdapter(BaseDataAdapter):
 
             if self.logger:
                 self.logger.debug("Loaded CSV table %s (%d rows)", table_name, len(df))
+            if self.resident:
+                return self._recover_table(table_name, df)
             return df
 
         except Exception as e:
@@ -1614,6 +2010,7 @@ class CSVAdapter(BaseDataAdapter):
             "adapter": "CSVAdapter",
             "connected": self.is_connected(),
             "path": str(self.base_path),
+            "engine": self.engine,
             "tables_cached": len(self.tables),
             "tables_available": len(self.list_tables()) if self.base_path.exists() else 0,
         }
@@ -0,0 +1,206 @@
+# zCLI/subsystems/zData/zData_modules/shared/backends/csv_engine.py
+"""
+Resident-table engine state for CSVAdapter (write-ahead log, id counter, hash indexes).
+
+The classic CSV engine rewrites the whole file on every insert/update/delete and
+recomputes max(id) per insert, so each single-row write costs O(table size).
+With ``Data_Engine: resident`` in the schema Meta, CSVAdapter keeps each table
+in memory and uses the pieces in this module instead:
+
+- **WriteAheadLog:** Every mutation is appended as one JSON line to
+  ``{table}.csv.wal`` next to the CSV file. The CSV itself is only touched on
+  commit(): insert-only changes are appended to the end of the file, anything
+  else rewrites it once. The log is then truncated. A log left behind by a
+  process that never committed is replayed the next time the table is loaded.
+- **ResidentTable:** Per-table bookkeeping - rows inserted since the last merge
+  (appended to the DataFrame in one concat when the table is next read), the
+  running auto-increment counter, and hash indexes (key → row labels) over
+  pk/unique columns and upsert conflict keys.
+
+Row labels stay a RangeIndex in resident mode (deletes reset it), so the label
+of a buffered row is known before the concat: ``len(frame) + position``.
+
+WAL Record Format
+-----------------
+One JSON object per line::
+
+    {"op": "insert", "fields": [...], "rows": [[...], ...]}
+    {"op": "update", "fields": [...], "values": [...], "where": {...}}
+    {"op": "delete", "where": {...}}
+    {"op": "upsert", "fields": [...], "rows": [[...], ...], "conflict": [...]}
+
+Usage
+-----
+    >>> state = ResidentTable(Path("/data/users.csv.wal"))
+    >>> state.wal.append({"op": "delete", "where": {"id": 3}})
+    >>> list(state.wal.records())
+    [{'op': 'delete', 'where': {'id': 3}}]
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+from zCLI import Any, Dict, List, Optional, Tuple
+
+# ============================================================
+# Module Constants - Engine Selection
+# ============================================================
+
+META_KEY_ENGINE = "Data_Engine"
+ENGINE_CLASSIC = "classic"
+ENGINE_RESIDENT = "resident"
+
+WAL_EXTENSION = ".wal"
+
+# ============================================================
+# Module Constants - WAL Operations
+# ============================================================
+
+WAL_OP_INSERT = "insert"
+WAL_OP_UPDATE = "update"
+WAL_OP_DELETE = "delete"
+WAL_OP_UPSERT = "upsert"
+
+# ============================================================
+# Public API
+# ============================================================
+
+__all__ = [
+    "META_KEY_ENGINE",
+    "ENGINE_CLASSIC",
+    "ENGINE_RESIDENT",
+    "WAL_OP_INSERT",
+    "WAL_OP_UPDATE",
+    "WAL_OP_DELETE",
+    "WAL_OP_UPSERT",
+    "WriteAheadLog",
+    "ResidentTable",
+]
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for numpy/pandas scalars and timestamps."""
+    if hasattr(value, "item"):
+        try:
+            return value.item()
+        except (ValueError, TypeError):
+            pass
+    return str(value)
+
+
+class WriteAheadLog:
+    """
+    Append-only JSON-lines journal of uncommitted mutations for one table.
+
+    The file is opened lazily on the first append and flushed after every
+    record, so a crashed process loses nothing it had already acknowledged.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Write one record and flush it to the OS."""
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._handle.write(json.dumps(record, default=_json_default) + "\n")
+        self._handle.flush()
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield logged records in write order (a torn final line is ignored)."""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+
+    def clear(self) -> None:
+        """Close and delete the log (after a checkpoint or rollback)."""
+        self.close()
+        if self.path.exists():
+            os.remove(self.path)
+
+    def close(self) -> None:
+        """Close the file handle, keeping the log on disk."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class ResidentTable:
+    """
+    Bookkeeping for one resident table: buffered inserts, id counter, indexes.
+
+    Attributes:
+        wal: WriteAheadLog for the table
+        pending: Row dicts inserted since the last merge into the DataFrame
+        id_field: Column the running counter belongs to
+        next_id: Running auto-increment value (None = derive from the data)
+        saved_rows: Rows at the head of the frame that are already in the CSV
+        rewrite: True once an update/delete/upsert changed persisted rows
+        indexes: {column tuple: {key tuple: [row labels]}}
+    """
+
+    def __init__(self, wal_path: Path) -> None:
+        self.wal = WriteAheadLog(wal_path)
+        self.pending: List[Dict[str, Any]] = []
+        self.id_field: Optional[str] = None
+        self.next_id: Optional[int] = None
+        self.saved_rows = 0
+        self.rewrite = False
+        self.indexes: Dict[Tuple[str, ...], Dict[Tuple, List[int]]] = {}
+
+    @property
+    def dirty(self) -> bool:
+        """True when the CSV file is behind the in-memory table."""
+        return self.rewrite or bool(self.pending) or self.wal.path.exists()
+
+    def reset(self, saved_rows: int = 0) -> None:
+        """Forget buffered state (after a checkpoint, rollback or DDL)."""
+        self.pending = []
+        self.id_field = None
+        self.next_id = None
+        self.saved_rows = saved_rows
+        self.rewrite = False
+        self.indexes.clear()
+
+    # ------------------------------------------------------------
+    # Hash indexes
+    # ------------------------------------------------------------
+
+    def index(self, df, columns: Tuple[str, ...]) -> Dict[Tuple, List[int]]:
+        """Index over columns (frame rows + buffered rows), built on first use."""
+        index = self.indexes.get(columns)
+        if index is None:
+            index = {}
+            keys = zip(*(df[column].tolist() for column in columns))
+            for label, key in zip(df.index, keys):
+                index.setdefault(key, []).append(label)
+            for offset, row in enumerate(self.pending):
+                key = tuple(row.get(column) for column in columns)
+                index.setdefault(key, []).append(len(df) + offset)
+            self.indexes[columns] = index
+        return index
+
+    def index_row(self, row: Dict[str, Any], label: int) -> None:
+        """Add a newly appended row to every built index."""
+        for columns, index in self.indexes.items():
+            key = tuple(row.get(column) for column in columns)
+            index.setdefault(key, []).append(label)
+
+    def drop_indexes(self, columns: Optional[List[str]] = None) -> None:
+        """Invalidate indexes covering any of columns (all when None)."""
+        if columns is None:
+            self.indexes.clear()
+            return
+        touched = set(columns)
+        for key in [key for key in self.indexes if touched.intersection(key)]:
+            del self.indexes[key]
@@ -21,6 +21,8 @@ PostgreSQLAdapter sits at the concrete layer of the adapter hierarchy:
 - **Database auto-creation:** Creates database on first connect if missing
 - **SERIAL types:** Auto-incrementing primary keys (SERIAL, BIGSERIAL)
 - **RETURNING clause:** Get inserted row ID without separate query
+- **Bulk loading:** insert_many/upsert_many send multi-row VALUES pages (execute_values)
+- **Streaming reads:** select_batches/select_iter use a server-side (named) cursor
 - **Project info files:** Track database schema in YAML files
 - **Smart user detection:** Falls back to system user if not specified
 
@@ -28,7 +30,7 @@ PostgreSQL-Specific Features
 ---------------------------
 **1. Connection Management:**
 - Connects to PostgreSQL server (not file-based like SQLite)
-- Auto-creates database if it doesn't exist
+- Auto-creates database if it doesn't exist (once per process, see below)
 - Connection params: host, port, user, password, database
 - Default database: "postgres" (used for initial connection)
 
@@ -81,13 +83,18 @@ config = {
 If Data_User not specified, falls back to system username (via getpass.getuser()).
 This works seamlessly with macOS Homebrew PostgreSQL installations.
 
-Database Auto-Creation
----------------------
-On first connect():
-1. Connect to "postgres" database (always exists)
-2. Check if target database exists (pg_database catalog)
-3. If not, create database using CREATE DATABASE
-4. Close temp connection, connect to target database
+Database Auto-Creation (Provisioning)
+-------------------------------------
+The first connect() per (host, port, database) in a process provisions it:
+1. Connect straight to the target database
+2. Only if that fails: connect to "postgres", check pg_database, CREATE DATABASE
+3. Write .pginfo.yaml if it is missing (table DDL keeps it current afterwards)
+
+Provisioned databases are remembered process-wide, so every later connect()
+(one-shot zData requests, pool misses) is a single handshake to the target
+database with no extra round trips and no file write. If that connect fails
+(database dropped, server restarted) the database is provisioned again.
+reset_provisioned_databases() forgets the cache.
 
 Type Mapping
 -----------
@@ -181,14 +188,18 @@ See Also
 - sqlite_adapter.py: SQLite implementation (file-based)
 """
 
-from zCLI import datetime, yaml, Dict, Optional, Any
+from zCLI import datetime, yaml, Dict, Optional, Any, Tuple
 import getpass
+import threading
+from itertools import count
+from typing import Set
 from .sql_adapter import SQLAdapter
 
 # Try to import psycopg2
 try:
     import psycopg2
     from psycopg2 import sql
+    from psycopg2.extras import execute_values
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
@@ -204,6 +215,14 @@ CONN_PASSWORD = "password"
 CONN_DATABASE = "database"
 CONN_AUTOCOMMIT = "autocommit"
 
+# Server-side cursor names for select_batches() (unique per process)
+STREAM_CURSOR_PREFIX = "zdata_stream_"
+_stream_cursor_ids = count(1)
+
+# Databases provisioned by this process: (host, port, database)
+_provisioned_databases: Set[Tuple[str, str, str]] = set()
+_provision_lock = threading.Lock()
+
 # ============================================================
 # Module Constants - Default Values
 # ============================================================
@@ -261,6 +280,7 @@ INFO_KEY_TABLES = "tables"
 INFO_KEY_CREATED_AT = "created_at"
 INFO_KEY_UPDATED_AT = "updated_at"
 INFO_FILE_SUFFIX = "_info.yaml"
+PGINFO_FILENAME = ".pginfo.yaml"
 
 # ============================================================
 # Module Constants - Error Messages
@@ -282,6 +302,8 @@ LOG_CREATING_DB = "Creating database: %s"
 LOG_DB_CREATED = "[OK] Created database: %s"
 LOG_DB_EXISTS = "Database already exists: %s"
 LOG_CONNECTED = "Connected to PostgreSQL database: %s"
+LOG_PROVISIONING = "Provisioning PostgreSQL database: %s"
+LOG_REPROVISION = "Connect to provisioned database %s failed, provisioning again: %s"
 LOG_DISCONNECTED = "Disconnected from PostgreSQL: %s"
 LOG_USER_FALLBACK = "No Data_User specified, using system user: %s"
 LOG_CONFIG_DEBUG = "PostgreSQL config - database: %s, host: %s, port: %s, user: %s"
@@ -294,7 +316,13 @@ LOG_ADD_COMPOSITE_PK = "Adding composite PRIMARY KEY (%s)"
 # Public API
 # ============================================================
 
-__all__ = ["PostgreSQLAdapter"]
+__all__ = ["PostgreSQLAdapter", "reset_provisioned_databases"]
+
+
+def reset_provisioned_databases() -> None:
+    """Forget provisioned databases; the next connect() to each bootstraps it again."""
+    with _provision_lock:
+        _provisioned_databases.clear()
 
 
 class PostgreSQLAdapter(SQLAdapter):
@@ -310,6 +338,7 @@ class PostgreSQLAdapter(SQLAdapter):
     PostgreSQLAdapter provides:
     - **Initialization (1 method):** __init__() - Connection params, user detection
     - **Connection Management (3 methods):** connect(), disconnect(), get_cursor()
+    - **Provisioning (3 methods):** _provision(), _bootstrap_database(), _open_connection()
     - **DDL Operations (4 methods):** create_table(), table_exists(), list_tables(), _after_drop_table()
     - **DDL Helpers (2 methods):** _get_composite_pk(), _build_field_definitions()
     - **DML Operations (2 methods):** insert(), upsert()
@@ -325,7 +354,8 @@ class PostgreSQLAdapter(SQLAdapter):
     - Default: localhost:5432
     
     **2. Database Auto-Creation:**
-    Automatically creates database if it doesn't exist on first connect
+    Automatically creates database if it doesn't exist on first connect;
+    later connects in the process skip the check
     
     **3. SERIAL Types:**
     Integer PKs automatically use SERIAL (auto-increment):
@@ -461,10 +491,10 @@ class PostgreSQLAdapter(SQLAdapter):
         """
         Establish PostgreSQL connection (creates database if needed).
         
-        This method performs a three-step connection process:
-        1. Connect to 'postgres' database (always exists)
-        2. Check if target database exists, create if needed
-        3. Connect to target database
+        Steady state is a single handshake to the target database. The first
+        connect per (host, port, database) in this process provisions it instead
+        (see _provision()); so does a failed connect to an already provisioned
+        database, in case it was dropped since.
         
         Returns:
             psycopg2.connection: Database connection
@@ -478,63 +508,29 @@ class PostgreSQLAdapter(SQLAdapter):
             >>> # Database auto-created if it didn't exist
         
         Notes:
-            - Uses 'postgres' database for initial connection
-            - Creates database with psycopg2.sql.Identifier for safe quoting
-            - Writes project info file after successful connection
             - Sets autocommit=False for normal transaction mode
+            - .pginfo.yaml is only written during provisioning (if missing)
         """
         try:
-            # Step 1: Connect to default 'postgres' database to create our database
             if self.logger:
                 self.logger.info(LOG_CONNECTING_SERVER, self.host, self.port)
 
-            conn_params = {
-                CONN_HOST: self.host,
-                CONN_PORT: self.port,
-                CONN_USER: self.user,
-                CONN_DATABASE: DEFAULT_DATABASE  # Default database always exists
-            }
-
-            if self.password:
-                conn_params[CONN_PASSWORD] = self.password
-
-            temp_conn = psycopg2.connect(**conn_params)
-            temp_conn.autocommit = True  # Need autocommit to create database
-            temp_cursor = temp_conn.cursor()
-
-            # Step 2: Check if our database exists
-            temp_cursor.execute(SQL_CHECK_DB_EXISTS, (self.database_name,))
-
-            if not temp_cursor.fetchone():
-                # Database doesn't exist - create it
-                if self.logger:
-                    self.logger.info(LOG_CREATING_DB, self.database_name)
-                # Use sql.Identifier to safely quote database name
-                temp_cursor.execute(
-                    sql.SQL(SQL_CREATE_DATABASE).format(
-                        sql.Identifier(self.database_name)
-                    )
-                )
-                if self.logger:
-                    self.logger.info(LOG_DB_CREATED, self.database_name)
+            key = self._provision_key()
+            if key in _provisioned_databases:
+                try:
+                    self.connection = self._open_connection(self.database_name)
+                except psycopg2.OperationalError as e:
+                    if self.logger:
+                        self.logger.debug(LOG_REPROVISION, self.database_name, e)
+                    with _provision_lock:
+                        _provisioned_databases.discard(key)
+                    self._provision()
             else:
-                if self.logger:
-                    self.logger.debug(LOG_DB_EXISTS, self.database_name)
-
-            temp_cursor.close()
-            temp_conn.close()
-
-            # Step 3: Connect to our actual database
-            conn_params[CONN_DATABASE] = self.database_name
-            self.connection = psycopg2.connect(**conn_params)
-            self.connection.autocommit = False  # Normal transaction mode
+                self._provision()
 
             if self.logger:
                 self.logger.info(LOG_CONNECTED, self.database_name)
 
-            # Write project info file to Data_path
-            self._write_project_info()
-
             return self.connection
 
         except Exception as e:  # pylint: disable=broad-except
@@ -597,6 +593,80 @@ class PostgreSQLAdapter(SQLAdapter):
             self.cursor = self.connection.cursor()
         return self.cursor
     
+    # ============================================================
+    # Provisioning
+    # ============================================================
+
+    def _provision_key(self) -> Tuple[str, str, str]:
+        """Provisioning cache key: (host, port, database)."""
+        return (str(self.host), str(self.port), self.database_name)
+
+    def _connection_params(self, database: str) -> Dict[str, Any]:
+        """psycopg2.connect() keyword arguments for database."""
+        conn_params = {
+            CONN_HOST: self.host,
+            CONN_PORT: self.port,
+            CONN_USER: self.user,
+            CONN_DATABASE: database
+        }
+        if self.password:
+            conn_params[CONN_PASSWORD] = self.password
+        return conn_params
+
+    def _open_connection(self, database: str) -> Any:
+        """Open a transactional (autocommit=False) connection to database."""
+        connection = psycopg2.connect(**self._connection_params(database))
+        connection.autocommit = False  # Normal transaction mode
+        return connection
+
+    def _provision(self) -> None:
+        """
+        One-time setup of this database, then remember it process-wide.
+        
+        Connects straight to the target database and only falls back to the
+        'postgres' database bootstrap when that fails. Writes .pginfo.yaml if
+        missing. Leaves self.connection open.
+        """
+        with _provision_lock:
+            if self.logger:
+                self.logger.debug(LOG_PROVISIONING, self.database_name)
+            try:
+                self.connection = self._open_connection(self.database_name)
+            except psycopg2.OperationalError:
+                self._bootstrap_database()
+                self.connection = self._open_connection(self.database_name)
+
+            if not (self.base_path / PGINFO_FILENAME).exists():
+                self._write_project_info()
+
+            _provisioned_databases.add(self._provision_key())
+
+    def _bootstrap_database(self) -> None:
+        """Create the target database via the 'postgres' database if it does not exist."""
+        temp_conn = psycopg2.connect(**self._connection_params(DEFAULT_DATABASE))
+        try:
+            temp_conn.autocommit = True  # Need autocommit to create database
+            temp_cursor = temp_conn.cursor()
+            temp_cursor.execute(SQL_CHECK_DB_EXISTS, (self.database_name,))
+
+            if not temp_cursor.fetchone():
+                if self.logger:
+                    self.logger.info(LOG_CREATING_DB, self.database_name)
+                # Use sql.Identifier to safely quote database name
+                temp_cursor.execute(
+                    sql.SQL(SQL_CREATE_DATABASE).format(
+                        sql.Identifier(self.database_name)
+                    )
+                )
+                if self.logger:
+                    self.logger.info(LOG_DB_CREATED, self.database_name)
+            else:
+                if self.logger:
+                    self.logger.debug(LOG_DB_EXISTS, self.database_name)
+            temp_cursor.close()
+        finally:
+            temp_conn.close()
+
     # ============================================================
     # DDL Operations
     # ============================================================
@@ -756,6 +826,32 @@ class PostgreSQLAdapter(SQLAdapter):
             self.logger.info("Upserted row into %s with ID: %s", table, row_id)
         return row_id
 
+    # Bulk loading: multi-row VALUES pages via execute_values (one transaction)
+
+    def _insert_chunk(self, table, fields, chunk):
+        """Write one batch as a single multi-row INSERT."""
+        sql_stmt = f"INSERT INTO {table} ({', '.join(fields)}) VALUES %s"
+        execute_values(self.get_cursor(), sql_stmt, chunk, page_size=len(chunk))
+
+    def _upsert_chunk(self, table, fields, chunk, conflict_fields):
+        """Write one batch as a single multi-row INSERT ... ON CONFLICT."""
+        sql_stmt = (f"INSERT INTO {table} ({', '.join(fields)}) VALUES %s "
+                    f"{self._build_conflict_clause(fields, conflict_fields)}")
+        execute_values(self.get_cursor(), sql_stmt, chunk, page_size=len(chunk))
+
+    def _open_stream_cursor(self, batch_size):
+        """
+        Server-side named cursor: rows stay on the server until fetched.
+
+        WITH HOLD keeps the cursor valid if something else commits on this
+        connection while the stream is being consumed.
+        """
+        cursor = self.connection.cursor(
+            name=f"{STREAM_CURSOR_PREFIX}{next(_stream_cursor_ids)}", withhold=True
+        )
+        cursor.itersize = batch_size
+        return cursor
+
     def map_type(self, abstract_type):
         """Map abstract schema type to PostgreSQL type."""
         if not isinstance(abstract_type, str):
@@ -825,7 +921,7 @@ class PostgreSQLAdapter(SQLAdapter):
             # Ensure directory exists
             self._ensure_directory()
 
-            info_file = self.base_path / ".pginfo.yaml"
+            info_file = self.base_path / PGINFO_FILENAME
 
             # Get PostgreSQL version
             pg_version = "Unknown"
@@ -886,7 +982,7 @@ class PostgreSQLAdapter(SQLAdapter):
     def update_project_info(self):
         """Update tables list in .pginfo.yaml."""
         try:
-            info_file = self.base_path / ".pginfo.yaml"
+            info_file = self.base_path / PGINFO_FILENAME
 
             if not info_file.exists():
                 # File doesn't exist, create it
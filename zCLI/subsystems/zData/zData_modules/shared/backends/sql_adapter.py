@@ -99,6 +99,14 @@ Subclasses override these hooks for backend-specific SQL syntax:
 - **_get_placeholders(count):** Return "?, ?, ?" (SQLite) or "%s, %s, %s" (PostgreSQL)
 - **_get_single_placeholder():** Return "?" (SQLite) or "%s" (PostgreSQL)
 - **_get_last_insert_id(cursor):** Return cursor.lastrowid (SQLite) or use RETURNING (PostgreSQL)
+- **_build_upsert_sql(table, fields, conflict_fields):** ON CONFLICT statement used by upsert()/upsert_many()
+
+- **_open_stream_cursor(batch_size):** Cursor used by select_batches() (PostgreSQL: server-side)
+
+Bulk loading (insert_many / upsert_many) runs one executemany() per chunk and
+commits once at the end, instead of one execute() + commit() per row.
+Streaming reads (select_batches / select_iter) fetchmany() from their own
+cursor instead of fetchall() + one dict per row up front.
 
 Usage Examples
 -------------
@@ -149,7 +157,7 @@ See Also
 
 from abc import abstractmethod
 from zCLI import Dict, List, Optional, Any
-from .base_adapter import BaseDataAdapter
+from .base_adapter import BaseDataAdapter, DEFAULT_STREAM_BATCH_SIZE
 
 # ============================================================
 # Module Constants - SQL Keywords
@@ -266,6 +274,7 @@ LOG_ALTER_TABLE = "Executing ALTER TABLE: %s"
 LOG_ALTER_COMPLETE = "Altered table (%s): %s"
 LOG_INSERT_ROW = "Inserted row into %s with ID: %s"
 LOG_SELECT_ROWS = "Selected %d rows from %s"
+LOG_STREAM_ROWS = "Streamed %d rows from %s"
 LOG_UPDATE_ROWS = "Updated %d rows in %s"
 LOG_DELETE_ROWS = "Deleted %d rows from %s"
 LOG_UPSERT_ROW = "Upserted row into %s with ID: %s"
@@ -350,6 +359,8 @@ class SQLAdapter(BaseDataAdapter):
         >>> rows = adapter.select("users", where={"age__gte": 18}, order="name")
     """
 
+    poolable = True  # Pool release rolls back anything left uncommitted
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -553,8 +564,7 @@ class SQLAdapter(BaseDataAdapter):
     def insert(self, table, fields, values):
         """Insert row into table."""
         cur = self.get_cursor()
-        placeholders = self._get_placeholders(len(fields))
-        sql = f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({placeholders})"
+        sql = self._build_insert_sql(table, fields)
 
         if self.logger:
             self.logger.debug("Executing INSERT: %s with values: %s", sql, values)
@@ -568,15 +578,69 @@ class SQLAdapter(BaseDataAdapter):
 
     def select(self, table, fields=None, **kwargs):
         """Select rows from table(s) with optional JOIN support."""
-        where = kwargs.get('where')
-        joins = kwargs.get('joins')
-        order = kwargs.get('order')
-        limit = kwargs.get('limit')
-        offset = kwargs.get('offset')
-        auto_join = kwargs.get('auto_join', False)
-        schema = kwargs.get('schema')
+        sql, params, table_name = self._build_select_sql(table, fields, kwargs)
 
         cur = self.get_cursor()
+        if self.logger:
+            self.logger.debug("Executing SELECT: %s with params: %s", sql, params)
+        cur.execute(sql, params)
+        raw_rows = cur.fetchall()
+
+        # Convert rows to dicts for consistent display across backends
+        # Get column names from cursor description
+        if raw_rows and cur.description:
+            column_names = [desc[0] for desc in cur.description]
+            rows = [dict(zip(column_names, row)) for row in raw_rows]
+        else:
+            rows = []
+
+        if self.logger:
+            self.logger.info(LOG_SELECT_ROWS, len(rows), table_name)
+        return rows
+
+    def select_batches(self, table, fields=None, batch_size=DEFAULT_STREAM_BATCH_SIZE, **kwargs):
+        """Stream a select() from a dedicated cursor, fetchmany(batch_size) at a time."""
+        sql, params, table_name = self._build_select_sql(table, fields, kwargs)
+        batch_size = max(1, int(batch_size or DEFAULT_STREAM_BATCH_SIZE))
+
+        cur = self._open_stream_cursor(batch_size)
+        total = 0
+        try:
+            if self.logger:
+                self.logger.debug("Streaming SELECT: %s with params: %s", sql, params)
+            cur.execute(sql, params)
+            column_names = None
+            while True:
+                raw_rows = cur.fetchmany(batch_size)
+                if not raw_rows:
+                    break
+                if column_names is None:
+                    column_names = [desc[0] for desc in cur.description]
+                total += len(raw_rows)
+                yield [dict(zip(column_names, row)) for row in raw_rows]
+        finally:
+            cur.close()
+            if self.logger:
+                self.logger.info(LOG_STREAM_ROWS, total, table_name)
+
+    def _open_stream_cursor(self, batch_size):
+        """
+        Cursor for select_batches() (dialect hook).
+
+        A separate cursor, so other queries on the adapter while the stream is
+        open do not reset it. PostgreSQL overrides this with a server-side cursor.
+        """
+        return self.connection.cursor()
+
+    def _build_select_sql(self, table, fields, options):
+        """Build (sql, params, display name) for select()/select_batches()."""
+        where = options.get('where')
+        joins = options.get('joins')
+        order = options.get('order')
+        limit = options.get('limit')
+        offset = options.get('offset')
+        auto_join = options.get('auto_join', False)
+        schema = options.get('schema')
 
         # Handle multi-table queries
         tables = [table] if isinstance(table, str) else table
@@ -619,23 +683,8 @@ class SQLAdapter(BaseDataAdapter):
             if offset:
                 sql += f" OFFSET {offset}"
 
-        if self.logger:
-            self.logger.debug("Executing SELECT: %s with params: %s", sql, params)
-        cur.execute(sql, params)
-        raw_rows = cur.fetchall()
-
-        # Convert rows to dicts for consistent display across backends
-        # Get column names from cursor description
-        if raw_rows and cur.description:
-            column_names = [desc[0] for desc in cur.description]
-            rows = [dict(zip(column_names, row)) for row in raw_rows]
-        else:
-            rows = []
-
         table_name = " + ".join(tables) if is_multi_table else table
-        if self.logger:
-            self.logger.info("Selected %d rows from %s", len(rows), table_name)
-        return rows
+        return sql, params, table_name
 
     def update(self, table, fields, values, where):
         """Update rows in table."""
@@ -729,23 +778,7 @@ class SQLAdapter(BaseDataAdapter):
             raise ValueError(ERR_UPSERT_MISSING_CONFLICT)
         
         cur = self.get_cursor()
-        
-        # Build INSERT clause
-        placeholders = self._get_placeholders(len(fields))
-        field_list = ", ".join(fields)
-        sql = f"{SQL_INSERT} {SQL_INTO} {table} ({field_list}) {SQL_VALUES} ({placeholders})"
-        
-        # Build ON CONFLICT clause (SQLite 3.24+ syntax)
-        conflict_list = ", ".join(conflict_fields)
-        
-        # Build UPDATE clause (exclude conflict fields from update)
-        update_fields = [f for f in fields if f not in conflict_fields]
-        if update_fields:
-            update_clause = ", ".join([f"{f} = excluded.{f}" for f in update_fields])
-            sql += f" ON CONFLICT({conflict_list}) DO UPDATE SET {update_clause}"
-        else:
-            # All fields are conflict fields, just ignore conflicts
-            sql += f" ON CONFLICT({conflict_list}) DO NOTHING"
+        sql = self._build_upsert_sql(table, fields, conflict_fields)
         
         if self.logger:
             self.logger.debug("Executing UPSERT: %s with values: %s", sql, values)
@@ -757,6 +790,18 @@ class SQLAdapter(BaseDataAdapter):
             self.logger.info(LOG_UPSERT_ROW, table, row_id)
         return row_id
 
+    # ============================================================
+    # DML - Bulk Loading (one transaction, executemany per chunk)
+    # ============================================================
+
+    def _insert_chunk(self, table, fields, chunk):
+        """Write one batch with executemany (commit happens once in _run_bulk)."""
+        self.get_cursor().executemany(self._build_insert_sql(table, fields), chunk)
+
+    def _upsert_chunk(self, table, fields, chunk, conflict_fields):
+        """Write one batch of upserts with executemany."""
+        self.get_cursor().executemany(self._build_upsert_sql(table, fields, conflict_fields), chunk)
+
     def map_type(self, abstract_type: str) -> str:
         """
         Map abstract schema type to SQL type (public interface).
@@ -1142,6 +1187,29 @@ class SQLAdapter(BaseDataAdapter):
 
         self.connection.commit()
 
+    def _build_insert_sql(self, table, fields):
+        """INSERT statement with dialect placeholders."""
+        placeholders = self._get_placeholders(len(fields))
+        return f"{SQL_INSERT} {SQL_INTO} {table} ({', '.join(fields)}) {SQL_VALUES} ({placeholders})"
+
+    def _build_upsert_sql(self, table, fields, conflict_fields):
+        """INSERT ... ON CONFLICT statement (SQLite 3.24+ / PostgreSQL syntax)."""
+        return f"{self._build_insert_sql(table, fields)} {self._build_conflict_clause(fields, conflict_fields)}"
+
+    def _build_conflict_clause(self, fields, conflict_fields):
+        """ON CONFLICT(...) DO UPDATE SET / DO NOTHING clause."""
+        if not conflict_fields:
+            raise ValueError(ERR_UPSERT_MISSING_CONFLICT)
+        conflict_list = ", ".join(conflict_fields)
+
+        # Build UPDATE clause (exclude conflict fields from update)
+        update_fields = [f for f in fields if f not in conflict_fields]
+        if update_fields:
+            update_clause = ", ".join([f"{f} = excluded.{f}" for f in update_fields])
+            return f"ON CONFLICT({conflict_list}) DO UPDATE SET {update_clause}"
+        # All fields are conflict fields, just ignore conflicts
+        return f"ON CONFLICT({conflict_list}) DO NOTHING"
+
     def _get_placeholders(self, count):
         """Get parameter placeholders (?, ?, ? or %s, %s, %s)."""
         return ", ".join(["?" for _ in range(count)])
@@ -142,7 +142,7 @@ See Also
 - postgresql_adapter.py: PostgreSQL implementation
 """
 
-from zCLI import sqlite3, Dict, List, Any
+from zCLI import sqlite3, Dict, List, Any, Optional, Tuple
 from .sql_adapter import SQLAdapter
 
 # ============================================================
@@ -182,6 +182,9 @@ CONN_CHECK_SAME_THREAD = "check_same_thread"
 CONN_TIMEOUT = "timeout"
 DEFAULT_TIMEOUT = 5.0  # seconds
 
+# Upsert statements memoized per (table, fields, conflict_fields)
+UPSERT_SQL_CACHE_SIZE = 256
+
 # ============================================================
 # Module Constants - Error Messages
 # ============================================================
@@ -274,6 +277,19 @@ class SQLiteAdapter(SQLAdapter):
         >>> adapter.insert("users", ["name", "age"], ["John", 30])
         >>> adapter.disconnect()
     """
+
+    thread_bound = True  # sqlite3 check_same_thread
+
+    def __init__(self, config: Dict[str, Any], logger: Optional[Any] = None) -> None:
+        """
+        Initialize SQLite adapter (see SQLAdapter) with an empty upsert SQL cache.
+        
+        Args:
+            config: Configuration dict (path, label, meta)
+            logger: Optional logger instance
+        """
+        super().__init__(config, logger)
+        self._upsert_sql_cache: Dict[Tuple, str] = {}
     
     # ============================================================
     # Connection Management
@@ -588,19 +604,7 @@ class SQLiteAdapter(SQLAdapter):
             - Falls back to INSERT OR REPLACE if no conflict_fields
         """
         cur = self.get_cursor()
-
-        # Build INSERT clause
-        placeholders = ", ".join(["?" for _ in fields])
-        sql = f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({placeholders})"
-
-        # Build ON CONFLICT clause
-        if conflict_fields:
-            conflict_cols = ", ".join(conflict_fields)
-            update_set = ", ".join([f"{f} = excluded.{f}" for f in fields if f not in conflict_fields])
-            sql += f" ON CONFLICT({conflict_cols}) DO UPDATE SET {update_set}"
-        else:
-            # Default to REPLACE behavior
-            sql = f"INSERT OR REPLACE INTO {table} ({', '.join(fields)}) VALUES ({placeholders})"
+        sql = self._build_upsert_sql(table, fields, conflict_fields)
 
         if self.logger:
             self.logger.debug("Executing UPSERT: %s with values: %s", sql, values)
@@ -612,6 +616,24 @@ class SQLiteAdapter(SQLAdapter):
             self.logger.info(LOG_UPSERTED, table, row_id)
         return row_id
     
+    def _build_upsert_sql(self, table: str, fields: List[str], conflict_fields: List[str]) -> str:
+        """ON CONFLICT upsert, or INSERT OR REPLACE when no conflict_fields (memoized per shape)."""
+        key = (table, tuple(fields), tuple(conflict_fields or ()))
+        sql = self._upsert_sql_cache.get(key)
+        if sql is not None:
+            return sql
+
+        if conflict_fields:
+            sql = super()._build_upsert_sql(table, fields, conflict_fields)
+        else:
+            # Default to REPLACE behavior
+            sql = f"INSERT OR REPLACE INTO {table} ({', '.join(fields)}) VALUES ({self._get_placeholders(len(fields))})"
+
+        if len(self._upsert_sql_cache) >= UPSERT_SQL_CACHE_SIZE:
+            self._upsert_sql_cache.clear()
+        self._upsert_sql_cache[key] = sql
+        return sql
+
     # ============================================================
     # Type Mapping (SQLite Storage Classes)
     # ============================================================
@@ -14,7 +14,7 @@ FACADE ARCHITECTURE
 The DataOperations class serves as a facade that:
 1. Routes actions to appropriate operation handlers (9 operations)
 2. Executes zFunc hooks (onBeforeInsert, onAfterInsert, etc.)
-3. Delegates CRUD operations to the adapter (6 pass-through methods)
+3. Delegates CRUD operations to the adapter (9 pass-through methods)
 4. Manages table lifecycle (ensure_tables, create, drop)
 5. Handles errors gracefully with logging and recovery
 
@@ -41,6 +41,9 @@ DDL Operations (4):
 8. head      - Show table schema/columns
 9. list_tables - List all tables in the database
 
+Bulk Load:
+10. import   - Stream a CSV/JSON Lines file into a table (insert_many/upsert_many)
+
 ═══════════════════════════════════════════════════════════════════════════════
 ACTION ROUTER
 ═══════════════════════════════════════════════════════════════════════════════
@@ -85,14 +88,17 @@ Hook Execution Flow:
 ADAPTER DELEGATION
 ═══════════════════════════════════════════════════════════════════════════════
 
-The facade provides 6 pass-through methods that directly delegate to the adapter:
+The facade provides 9 pass-through methods that directly delegate to the adapter:
 
 1. insert(table, fields, values)
 2. select(table, fields, **kwargs) - with auto-join support
-3. update(table, fields, values, where)
-4. delete(table, where)
-5. upsert(table, fields, values, conflict_fields)
-6. list_tables()
+3. select_batches(table, fields, batch_size, **kwargs) - streaming select
+4. update(table, fields, values, where)
+5. delete(table, where)
+6. upsert(table, fields, values, conflict_fields)
+7. insert_many(table, fields, rows, chunk_size) - bulk, one transaction
+8. upsert_many(table, fields, rows, conflict_fields, chunk_size) - bulk, one transaction
+9. list_tables()
 
 These methods:
 - Validate adapter initialization (raise RuntimeError if missing)
@@ -175,7 +181,9 @@ Example 4: Ensure tables exist
 
 """
 
+from typing import Iterable, Iterator
 from zCLI import Any, Dict, List, Optional
+from .backends.base_adapter import DEFAULT_BULK_CHUNK_SIZE, DEFAULT_STREAM_BATCH_SIZE
 from .operations import (
     handle_insert,
     handle_read,
@@ -185,6 +193,7 @@ from .operations import (
     handle_create_table,
     handle_drop,
     handle_head,
+    handle_import,
 )
 from .operations.ddl_migrate import handle_migrate
 
@@ -205,6 +214,7 @@ ACTION_CREATE = "create"
 ACTION_DROP = "drop"
 ACTION_HEAD = "head"
 ACTION_MIGRATE = "migrate"
+ACTION_IMPORT = "import"
 
 # ────────────────────────────────────────────────────────────────────────────
 # Reserved Schema Keys (Excluded from table operations)
@@ -481,7 +491,7 @@ class DataOperations:
         action strings (e.g., "insert", "read") to their corresponding handler
         functions. It handles unknown actions and exceptions gracefully.
         
-        Action Map (10 operations):
+        Action Map (11 operations):
             - "list_tables": self.list_tables() (adapter delegation)
             - "insert": handle_insert(request, self) (CRUD operation)
             - "read": handle_read(request, self) (CRUD operation)
@@ -492,6 +502,7 @@ class DataOperations:
             - "drop": handle_drop(request, self) (DDL operation)
             - "head": handle_head(request, self) (DDL operation)
             - "migrate": handle_migrate(self, request, display) (DDL operation)
+            - "import": handle_import(request, self) (bulk load from file)
         
         Error Handling:
             - Unknown action: Logs error, returns "error" string
@@ -500,7 +511,7 @@ class DataOperations:
         
         Args:
             action: Action string identifying the operation to execute
-                    Must be one of: list_tables, insert, read, update, delete, upsert, create, drop, head, migrate
+                    Must be one of: list_tables, insert, read, update, delete, upsert, create, drop, head, migrate, import
             request: Request dictionary containing operation parameters
                      - Format depends on action (table, fields, values, where, etc.)
                      - Passed to operation handler for processing
@@ -541,6 +552,7 @@ class DataOperations:
             ACTION_DROP: lambda: handle_drop(request, self),
             ACTION_HEAD: lambda: handle_head(request, self),
             ACTION_MIGRATE: lambda: handle_migrate(self, request, self.zcli.display),
+            ACTION_IMPORT: lambda: handle_import(request, self),
         }
 
         # ─────────────────────────────────────────────────────────────────────────
@@ -819,6 +831,53 @@ class DataOperations:
             schema=schema_tables
         )
 
+    def select_batches(
+        self,
+        table: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        **kwargs: Any
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a select as lists of row dicts (adapter delegation).
+        
+        Same query options as select() plus offset; rows are fetched from the
+        backend as the generator is consumed (cursor fetchmany / server-side
+        cursor), not all at once.
+        
+        Args:
+            table: Table name to select from
+            fields: List of field names (None = all fields)
+            batch_size: Rows per yielded batch
+            **kwargs: where, joins, order, limit, offset, auto_join
+        
+        Returns:
+            Iterator[List[Dict[str, Any]]]: Row batches
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        
+        Examples:
+            for batch in ops.select_batches("events", batch_size=1000):
+                process(batch)
+        """
+        if not self.adapter:
+            raise RuntimeError(ERR_RUNTIME_NO_ADAPTER)
+
+        schema_tables = {k: v for k, v in self.schema.items() if k != RESERVED_META}
+        return self.adapter.select_batches(
+            table,
+            fields=fields,
+            batch_size=batch_size,
+            where=kwargs.get("where"),
+            joins=kwargs.get("joins"),
+            order=kwargs.get("order"),
+            limit=kwargs.get("limit"),
+            offset=kwargs.get("offset") or 0,
+            auto_join=kwargs.get("auto_join", False),
+            schema=schema_tables
+        )
+
     def update(
         self,
         table: str,
@@ -911,6 +970,63 @@ class DataOperations:
             raise RuntimeError(ERR_RUNTIME_NO_ADAPTER)
         return self.adapter.upsert(table, fields, values, conflict_fields)
 
+    def insert_many(
+        self,
+        table: str,
+        fields: List[str],
+        rows: Iterable[Any],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Bulk insert rows in one transaction (adapter delegation).
+        
+        Args:
+            table: Table name to insert into
+            fields: List of field names
+            rows: Iterable of value lists (or dicts keyed by field)
+            chunk_size: Rows written per batch
+        
+        Returns:
+            Dict[str, Any]: rows, chunks, elapsed, rows_per_sec
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        
+        Examples:
+            stats = ops.insert_many("users", ["name"], [["Alice"], ["Bob"]])
+        """
+        if not self.adapter:
+            raise RuntimeError(ERR_RUNTIME_NO_ADAPTER)
+        return self.adapter.insert_many(table, fields, rows, chunk_size)
+
+    def upsert_many(
+        self,
+        table: str,
+        fields: List[str],
+        rows: Iterable[Any],
+        conflict_fields: List[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Bulk upsert rows in one transaction (adapter delegation).
+        
+        Args:
+            table: Table name to upsert into
+            fields: List of field names
+            rows: Iterable of value lists (or dicts keyed by field)
+            conflict_fields: List of fields to check for conflicts
+            chunk_size: Rows written per batch
+        
+        Returns:
+            Dict[str, Any]: rows, chunks, elapsed, rows_per_sec
+        
+        Raises:
+            RuntimeError: If adapter not initialized
+        """
+        if not self.adapter:
+            raise RuntimeError(ERR_RUNTIME_NO_ADAPTER)
+        return self.adapter.upsert_many(table, fields, rows, conflict_fields, chunk_size)
+
     def list_tables(self) -> List[str]:
         """
         List all tables in database (adapter delegation).
@@ -15,6 +15,9 @@ Package Contents
 - **crud_delete.py**: DELETE operations with WHERE safety, no hooks (irreversible by design)
 - **crud_upsert.py**: UPSERT operations with adapter-specific conflict resolution (SQLite: OR REPLACE, PostgreSQL: ON CONFLICT)
 
+**Bulk Load (1 handler):**
+- **crud_import.py**: IMPORT a CSV/JSON Lines file via insert_many/upsert_many (streamed, validated, one transaction)
+
 **DDL Operations (3 handlers):**
 - **ddl_create.py**: CREATE TABLE operations from schema definitions, bulk creation, idempotent
 - **ddl_head.py**: HEAD operations for schema introspection, displays table structure (columns, types, nullable, defaults)
@@ -68,6 +71,7 @@ Exported Functions
 - **handle_update(ops, request, display)**: Update rows with WHERE conditions and hooks
 - **handle_delete(ops, request, display)**: Delete rows with WHERE safety (no hooks)
 - **handle_upsert(ops, request, display)**: Insert-or-update with conflict resolution
+- **handle_import(request, ops)**: Bulk-load a file into a table, returns rows/sec stats
 
 **DDL Handlers (3):**
 - **handle_create_table(ops, request, display)**: Create tables from schema definitions
@@ -105,6 +109,7 @@ from .crud_read import handle_read
 from .crud_update import handle_update
 from .crud_delete import handle_delete
 from .crud_upsert import handle_upsert
+from .crud_import import handle_import
 from .ddl_create import handle_create_table
 from .ddl_drop import handle_drop
 from .ddl_head import handle_head
@@ -122,6 +127,7 @@ __all__ = [
     "handle_update",
     "handle_delete",
     "handle_upsert",
+    "handle_import",
     
     # DDL operations
     "handle_create_table",
@@ -0,0 +1,388 @@
+# zCLI/subsystems/zData/zData_modules/shared/operations/crud_import.py
+"""
+IMPORT operation handler - stream a CSV/JSON Lines file into a table in bulk.
+
+This module implements the bulk-load path for zData. Instead of one INSERT (and
+one commit) per row, the file is read lazily, validated row by row, and handed
+to the adapter's insert_many()/upsert_many(), which writes it in chunks inside
+a single transaction.
+
+Operation Overview
+-----------------
+    1. **Table Extraction:** Table must exist (ensured from schema beforehand)
+       ↓
+    2. **File Resolution:** Plain path, ~ expanded, or @-workspace zPath
+       ↓
+    3. **Streaming Read:** csv.DictReader or one JSON object per line
+       ↓
+    4. **Coercion + Validation:** Schema types applied to text values
+       (int, float, bool), zHash fields hashed, validator.validate_insert()
+       run on every row before it reaches the adapter
+       ↓
+    5. **Bulk Write:** adapter.insert_many() / upsert_many()
+       (executemany / execute_values / one DataFrame concat per chunk)
+       ↓
+    6. **Report:** rows, chunks, elapsed, rows/sec (+ skipped rows)
+
+Request Keys
+-----------
+    file             Path to the data file (required)
+    format           "csv" | "jsonl" (default: from file extension)
+    mode             "insert" (default) | "upsert"
+    conflict_fields  Upsert key (default: the table's pk, else first column)
+    chunk_size       Rows per batch (default 1000)
+    on_error         "abort" (default, nothing is committed) | "skip"
+
+Keys are read from the request first, then from request["options"].
+
+Usage Examples
+-------------
+    >>> request = {"action": "import", "table": "users", "file": "users.csv"}
+    >>> stats = handle_import(request, ops)
+    [OK] Imported 100000 rows into users (1.84s, 54347 rows/sec)
+
+    >>> request = {"action": "import", "table": "users", "file": "@.data.users.jsonl",
+    ...            "mode": "upsert", "conflict_fields": ["email"], "on_error": "skip"}
+
+Notes
+-----
+- onBeforeInsert/onAfterInsert hooks are NOT run (they are per-row business
+  logic; use the regular insert action when they are needed)
+- With on_error "abort", the first invalid row stops the import and the
+  whole transaction is rolled back
+"""
+
+import csv
+import json
+import os
+
+from zCLI import Any, Dict, List, Optional
+
+# ============================================================
+# Module Constants - Operation Name
+# ============================================================
+
+OP_IMPORT = "IMPORT"
+
+# ============================================================
+# Module Constants - Request Keys
+# ============================================================
+
+KEY_OPTIONS = "options"
+KEY_FILE = "file"
+KEY_FORMAT = "format"
+KEY_MODE = "mode"
+KEY_CONFLICT_FIELDS = "conflict_fields"
+KEY_CHUNK_SIZE = "chunk_size"
+KEY_ON_ERROR = "on_error"
+
+# ============================================================
+# Module Constants - Option Values
+# ============================================================
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+FORMAT_EXTENSIONS = {".csv": FORMAT_CSV, ".jsonl": FORMAT_JSONL, ".ndjson": FORMAT_JSONL}
+
+MODE_INSERT = "insert"
+MODE_UPSERT = "upsert"
+
+ON_ERROR_ABORT = "abort"
+ON_ERROR_SKIP = "skip"
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 10
+
+PATH_PREFIX_WORKSPACE = "@"
+PATH_PREFIX_ZMACHINE = "~.zMachine"
+
+# ============================================================
+# Module Constants - Schema Keys / Types
+# ============================================================
+
+SCHEMA_KEY_TYPE = "type"
+SCHEMA_KEY_PK = "pk"
+SCHEMA_KEY_ZHASH = "zHash"
+ZHASH_BCRYPT = "bcrypt"
+
+TYPE_INT = ("int", "integer")
+TYPE_FLOAT = ("float", "real", "decimal")
+TYPE_BOOL = ("bool", "boolean")
+BOOL_TRUE = ("1", "true", "yes", "y", "on")
+BOOL_FALSE = ("0", "false", "no", "n", "off")
+
+# Stats keys added on top of the adapter's bulk stats
+STAT_SKIPPED = "skipped"
+STAT_FILE = "file"
+
+# ============================================================
+# Module Constants - Log Messages
+# ============================================================
+
+LOG_IMPORT_START = "Importing %s into %s (mode=%s, chunk_size=%d)"
+LOG_SUCCESS = "[OK] Imported %d rows into %s (%.2fs, %.0f rows/sec)"
+LOG_SKIPPED = "Skipped %d invalid row(s) while importing into %s"
+LOG_ROW_INVALID = "Row %d of %s failed validation: %s"
+
+# ============================================================
+# Module Constants - Error Messages
+# ============================================================
+
+ERR_NO_FILE = "No file specified for IMPORT operation"
+ERR_FILE_NOT_FOUND = "Import file not found: %s"
+ERR_UNKNOWN_FORMAT = "Unknown import format '%s' (expected csv or jsonl)"
+ERR_UNKNOWN_MODE = "Unknown import mode '%s' (expected insert or upsert)"
+ERR_NO_COLUMNS = "Import file has no columns: %s"
+ERR_BAD_JSON = "Line %d is not a JSON object"
+ERR_UNEXPECTED_FIELD = "Not a column of this import (columns come from the first record)"
+ERR_BAD_VALUE = "Cannot convert '%s' to %s"
+ERR_ABORTED = "Import into %s aborted at row %d - nothing was written"
+ERR_NO_ZAUTH = "zHash: bcrypt specified for '%s' but zAuth not available"
+
+# ============================================================
+# Imports - Helper Functions
+# ============================================================
+
+try:
+    from .helpers import extract_table_from_request, display_validation_errors
+except ImportError:
+    from helpers import extract_table_from_request, display_validation_errors
+
+# ============================================================
+# Public API
+# ============================================================
+
+__all__ = ["handle_import"]
+
+
+class _RowRejected(Exception):
+    """Raised from the row stream to abort the import (transaction rolls back)."""
+
+    def __init__(self, row_number: int, errors: Dict[str, str]):
+        super().__init__(f"row {row_number}: {errors}")
+        self.row_number = row_number
+        self.errors = errors
+
+
+# ============================================================
+# CRUD Operations - IMPORT
+# ============================================================
+
+def handle_import(request: Dict[str, Any], ops: Any) -> Any:
+    """
+    Handle IMPORT operation to bulk-load a CSV/JSON Lines file into a table.
+
+    Args:
+        request: Request dictionary (see module docstring for keys)
+        ops: Operations object providing schema, validator, logger, zcli,
+             insert_many() and upsert_many()
+
+    Returns:
+        Dict[str, Any]: Bulk stats (rows, chunks, elapsed, rows_per_sec,
+                        skipped, file) on success
+        bool: False if the file, options or a row (on_error=abort) is invalid
+
+    Examples:
+        >>> handle_import({"table": "users", "file": "users.csv"}, ops)
+        {'rows': 3, 'chunks': 1, 'elapsed': 0.0011, 'rows_per_sec': 2727.3, 'skipped': 0, 'file': '/abs/users.csv'}
+    """
+    # Phase 1: Extract and validate table name
+    table = extract_table_from_request(request, OP_IMPORT, ops, check_exists=True)
+    if not table:
+        return False
+
+    # Phase 2: Resolve options and file
+    path = _resolve_path(_option(request, KEY_FILE), ops)
+    if not path:
+        ops.logger.error(ERR_NO_FILE)
+        return False
+    if not os.path.isfile(path):
+        ops.logger.error(ERR_FILE_NOT_FOUND, path)
+        ops.display.error(ERR_FILE_NOT_FOUND % path)
+        return False
+
+    file_format = str(_option(request, KEY_FORMAT) or
+                      FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower(), "")).lower()
+    if file_format not in (FORMAT_CSV, FORMAT_JSONL):
+        ops.logger.error(ERR_UNKNOWN_FORMAT, file_format)
+        return False
+
+    mode = str(_option(request, KEY_MODE) or MODE_INSERT).lower()
+    if mode not in (MODE_INSERT, MODE_UPSERT):
+        ops.logger.error(ERR_UNKNOWN_MODE, mode)
+        return False
+
+    chunk_size = int(_option(request, KEY_CHUNK_SIZE) or DEFAULT_CHUNK_SIZE)
+    skip_invalid = str(_option(request, KEY_ON_ERROR) or ON_ERROR_ABORT).lower() == ON_ERROR_SKIP
+    table_schema = ops.schema.get(table, {})
+
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        # Phase 3: Streaming read (header/first object gives the column list)
+        fields, records = _open_records(handle, file_format)
+        if not fields:
+            ops.logger.error(ERR_NO_COLUMNS, path)
+            return False
+
+        # Phase 4: Coerce + validate lazily, row by row
+        hash_fields = [name for name in fields
+                       if isinstance(table_schema.get(name), dict)
+                       and table_schema[name].get(SCHEMA_KEY_ZHASH) == ZHASH_BCRYPT]
+        if hash_fields and not getattr(ops.zcli, "auth", None):
+            ops.logger.error(ERR_NO_ZAUTH, hash_fields[0])
+            return False
+        rejected: List[int] = []
+        rows = _validated_rows(records, fields, hash_fields, table, table_schema, ops, skip_invalid, rejected)
+
+        # Phase 5: Bulk write in one transaction
+        ops.logger.info(LOG_IMPORT_START, path, table, mode, chunk_size)
+        try:
+            if mode == MODE_UPSERT:
+                conflict_fields = _option(request, KEY_CONFLICT_FIELDS) or _default_conflict_fields(fields, table_schema)
+                if isinstance(conflict_fields, str):
+                    conflict_fields = [f.strip() for f in conflict_fields.split(",")]
+                stats = ops.upsert_many(table, fields, rows, conflict_fields, chunk_size)
+            else:
+                stats = ops.insert_many(table, fields, rows, chunk_size)
+        except _RowRejected as e:
+            ops.logger.error(ERR_ABORTED, table, e.row_number)
+            display_validation_errors(table, e.errors, ops)
+            ops.display.error(ERR_ABORTED % (table, e.row_number))
+            return False
+
+    # Phase 6: Report
+    stats[STAT_SKIPPED] = len(rejected)
+    stats[STAT_FILE] = path
+    if rejected:
+        ops.logger.warning(LOG_SKIPPED, len(rejected), table)
+    ops.logger.info(LOG_SUCCESS, stats["rows"], table, stats["elapsed"], stats["rows_per_sec"])
+    return stats
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def _option(request: Dict[str, Any], key: str) -> Any:
+    """Request key, falling back to request["options"]."""
+    if request.get(key) is not None:
+        return request[key]
+    options = request.get(KEY_OPTIONS)
+    return options.get(key) if isinstance(options, dict) else None
+
+
+def _resolve_path(path: Optional[str], ops: Any) -> Optional[str]:
+    """Resolve a plain, ~ or zPath file path (extension kept out of zPath dots)."""
+    if not path:
+        return None
+    path = str(path)
+    if path.startswith((PATH_PREFIX_WORKSPACE, PATH_PREFIX_ZMACHINE)) and getattr(ops.zcli, "zparser", None):
+        stem, extension = os.path.splitext(path)
+        return ops.zcli.zparser.resolve_data_path(stem) + extension
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def _open_records(handle: Any, file_format: str):
+    """(fields, iterator of (row_number, dict)) for the file."""
+    if file_format == FORMAT_CSV:
+        reader = csv.DictReader(handle)
+        fields = [f.strip() for f in (reader.fieldnames or []) if f and f.strip()]
+        records = ((number, {k.strip(): v for k, v in row.items() if k})
+                   for number, row in enumerate(reader, start=1))
+        return fields, records
+
+    lines = ((number, line) for number, line in enumerate(handle, start=1) if line.strip())
+    first = next(lines, None)
+    first_record = _parse_json_line(first[1]) if first else None
+    if first_record is None:
+        return [], iter(())
+
+    def records():
+        yield first[0], first_record
+        for number, line in lines:
+            yield number, _parse_json_line(line)
+
+    return list(first_record.keys()), records()
+
+
+def _parse_json_line(line: str) -> Optional[Dict[str, Any]]:
+    """One JSON Lines record (None if the line is not a JSON object)."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _validated_rows(records, fields, hash_fields, table, table_schema, ops, skip_invalid, rejected):
+    """Yield ordered value lists; invalid rows are skipped or abort the import."""
+    field_set = set(fields)
+    for number, record in records:
+        if record is None:
+            data, errors = {}, {"line": ERR_BAD_JSON % number}
+        else:
+            # A JSON record with keys the first record lacked would silently lose them
+            errors = {name: ERR_UNEXPECTED_FIELD for name in record if name not in field_set}
+            data, coerce_errors = _coerce_row(record, fields, table_schema)
+            errors.update(coerce_errors)
+        if not errors:
+            # Empty cells count as "not provided" so required fields are enforced
+            provided = {name: value for name, value in data.items() if value is not None}
+            is_valid, validation_errors = ops.validator.validate_insert(table, provided)
+            errors = validation_errors if not is_valid else {}
+
+        if errors:
+            if not skip_invalid:
+                raise _RowRejected(number, errors)
+            if len(rejected) < MAX_REPORTED_ERRORS:
+                ops.logger.warning(LOG_ROW_INVALID, number, table, errors)
+            rejected.append(number)
+            continue
+
+        for name in hash_fields:
+            if data.get(name) not in (None, ""):
+                data[name] = ops.zcli.auth.hash_password(str(data[name]))
+        yield [data.get(name) for name in fields]
+
+
+def _coerce_row(record: Dict[str, Any], fields: List[str], table_schema: Dict[str, Any]):
+    """Apply schema types to text values ("" → None). Returns (data, errors)."""
+    data: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name in fields:
+        value = record.get(name)
+        if isinstance(value, str):
+            value = value.strip()
+            if value == "":
+                value = None
+        field_def = table_schema.get(name)
+        if value is not None and isinstance(value, str) and isinstance(field_def, dict):
+            field_type = str(field_def.get(SCHEMA_KEY_TYPE, "")).strip().rstrip("!?").lower()
+            try:
+                value = _convert(value, field_type)
+            except ValueError:
+                errors[name] = ERR_BAD_VALUE % (value, field_type)
+        data[name] = value
+    return data, errors
+
+
+def _convert(value: str, field_type: str) -> Any:
+    """Text → int/float/bool for the schema type (other types unchanged)."""
+    if field_type in TYPE_INT:
+        return int(value)
+    if field_type in TYPE_FLOAT:
+        return float(value)
+    if field_type in TYPE_BOOL:
+        lowered = value.lower()
+        if lowered in BOOL_TRUE:
+            return True
+        if lowered in BOOL_FALSE:
+            return False
+        raise ValueError(value)
+    return value
+
+
+def _default_conflict_fields(fields: List[str], table_schema: Dict[str, Any]) -> List[str]:
+    """Primary key columns present in the file, else the first column."""
+    pk_fields = [name for name in fields
+                 if isinstance(table_schema.get(name), dict) and table_schema[name].get(SCHEMA_KEY_PK)]
+    return pk_fields or fields[:1]
@@ -80,6 +80,16 @@ ORDER BY and LIMIT
     - limit: Maximum rows to return
     - Common pattern: offset = (page_number - 1) * page_size
 
+Streaming
+---------
+Rows are read through ops.select_batches() (cursor fetchmany on SQLite, a
+server-side cursor on PostgreSQL), never with one fetchall():
+- **Terminal:** zTable() receives a row iterator and renders it page by page;
+  with a limit only the first page is read, the cursor is closed afterwards
+- **zBifrost:** the returned list is built from the batches directly; tables
+  over 1000 rows reach the client as zTable_chunk events (``chunk_size`` rows
+  each) and later pages are pulled with table_fetch
+
 Display Integration
 ------------------
 The handler uses zDisplay (AdvancedData) for output:
@@ -165,6 +175,8 @@ This module is used by:
 - data_operations.py: CRUD operation router
 """
 
+from itertools import chain
+from typing import Iterator
 from zCLI import Any, Dict, List, Union
 
 # ============================================================
@@ -188,10 +200,14 @@ KEY_OFFSET = "offset"
 KEY_JOINS = "joins"
 KEY_AUTO_JOIN = "auto_join"
 KEY_PAUSE = "pause"
+KEY_BATCH_SIZE = "batch_size"
+KEY_INTERACTIVE = "interactive"
+KEY_CHUNK_SIZE = "chunk_size"
 
 # Pagination limits
 DEFAULT_LIMIT = 100  # Reasonable default page size
 MAX_LIMIT = 1000     # Prevent excessive queries
+DEFAULT_BATCH_SIZE = 500  # Rows fetched per round trip when streaming
 
 # ============================================================
 # Module Constants - Session Keys
@@ -224,6 +240,7 @@ LOG_VALIDATE_TABLES = "Validating table existence: %s"
 LOG_MULTI_TABLE = "Multi-table query detected: %s"
 LOG_SINGLE_TABLE = "Single-table query: %s"
 LOG_EXECUTE_SELECT = "Executing SELECT on %s"
+LOG_STREAM_SELECT = "Streaming SELECT on %s (batch_size=%d)"
 LOG_DISPLAY_RESULTS = "Displaying %d row(s) from %s"
 LOG_SUCCESS = "[OK] Read %d row(s) from %s"
 LOG_EMPTY = "[OK] Read 0 rows from %s (table is empty or no matches)"
@@ -280,6 +297,9 @@ def handle_read(request: Dict[str, Any], ops: Any) -> Union[bool, List[Dict[str,
             - "joins" (list, optional): Manual JOIN definitions
             - "auto_join" (bool, optional): Auto-detect JOINs from FK (default False)
             - "pause" (bool, optional): Pause after display (default True)
+            - "batch_size" (int, optional): Rows fetched per round trip (default 500)
+            - "interactive" (bool, optional): Page forward through a large result
+              with [Enter] in Terminal mode (requires limit)
         ops: Operations object providing:
             - adapter: Adapter instance for table_exists() and select()
             - logger: Logger instance for diagnostic output
@@ -377,26 +397,48 @@ def handle_read(request: Dict[str, Any], ops: Any) -> Union[bool, List[Dict[str,
     joins = request.get(KEY_JOINS)  # Manual join definitions
     auto_join = request.get(KEY_AUTO_JOIN, False)  # Auto-detect from FK
 
-    # Phase 5: Execute SELECT (single or multi-table)
+    # Phase 5: Stream SELECT (single or multi-table) - rows arrive batch_size at a time
     table_arg = tables[0] if len(tables) == 1 else tables
-    ops.logger.debug(LOG_EXECUTE_SELECT, table_arg)
-    rows = ops.select(table_arg, fields, where=where, joins=joins, order=order, limit=limit, offset=offset, auto_join=auto_join)
+    batch_size = request.get(KEY_BATCH_SIZE) or DEFAULT_BATCH_SIZE
+    # The query applies OFFSET together with LIMIT, so the table numbers rows from there
+    display_offset = offset if limit else 0
+    ops.logger.debug(LOG_STREAM_SELECT, table_arg, batch_size)
+    batches = ops.select_batches(table_arg, fields, batch_size=batch_size, where=where, joins=joins,
+                                 order=order, limit=limit, offset=display_offset, auto_join=auto_join)
 
     # Phase 6: Display results (mode-aware with AdvancedData pagination)
+    zMode = ops.zcli.session.get(SESSION_ZMODE, "")
     table_display = DISPLAY_SEPARATOR.join(tables) if is_multi_table else tables[0]
-    if rows:
-        # Extract column names from first row (assuming dict rows)
-        columns = list(rows[0].keys()) if rows and isinstance(rows[0], dict) else []
-        # Pass limit and offset to AdvancedData for pagination metadata display
-        ops.zcli.display.zTable(table_display, columns, rows, limit=limit, offset=offset)
-        ops.logger.info(LOG_SUCCESS, len(rows), table_display)
+    try:
+        first = next(batches, [])
+        if zMode == MODE_ZBIFROST:
+            # Response is one JSON list - build it from batches (no raw-tuple copy)
+            rows = first + [row for batch in batches for row in batch]
+            row_count = len(rows)
+            if rows:
+                columns = list(rows[0].keys()) if isinstance(rows[0], dict) else []
+                ops.zcli.display.zTable(table_display, columns, rows, limit=limit, offset=display_offset,
+                                        chunk_size=request.get(KEY_CHUNK_SIZE))
+        else:
+            # Terminal: AdvancedData renders the stream page by page
+            counter = [0]
+            if first:
+                columns = list(first[0].keys()) if isinstance(first[0], dict) else []
+                ops.zcli.display.zTable(table_display, columns, _counted_rows(chain([first], batches), counter),
+                                        limit=limit, offset=display_offset,
+                                        interactive=request.get(KEY_INTERACTIVE, False))
+            row_count = counter[0]
+    finally:
+        batches.close()  # Release the cursor if the display stopped early
+
+    if row_count:
+        ops.logger.info(LOG_SUCCESS, row_count, table_display)
     else:
         ops.logger.info(LOG_EMPTY, table_display)
 
     # Phase 7: Pagination (pause after displaying results)
     pause = request.get(KEY_PAUSE, True)  # Default to True
     # Don't pause in zBifrost mode, when zMode is not Walker/Terminal, or when zTraceback is False
-    zMode = ops.zcli.session.get(SESSION_ZMODE, "")
     zTraceback = ops.zcli.session.get(SESSION_ZTRACEBACK, True)  # Default to True
     if pause and zTraceback and zMode in (MODE_WALKER, MODE_TERMINAL, ""):
         ops.logger.debug(LOG_PAUSE)
@@ -407,3 +449,10 @@ def handle_read(request: Dict[str, Any], ops: Any) -> Union[bool, List[Dict[str,
     if zMode == MODE_ZBIFROST:
         return rows
     return True
+
+
+def _counted_rows(batches: Iterator[List[Dict[str, Any]]], counter: List[int]) -> Iterator[Dict[str, Any]]:
+    """Flatten row batches, counting rows actually read into counter[0]."""
+    for batch in batches:
+        counter[0] += len(batch)
+        yield from batch
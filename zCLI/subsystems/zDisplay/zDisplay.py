@@ -115,10 +115,12 @@ Auto-Initialization:
     6. Emits ready message via zDeclare event
 """
 
+from typing import ContextManager
 from zCLI import Colors, Any, Dict, Optional, Callable
 from zCLI.utils import validate_zcli_instance
 from zCLI.subsystems.zConfig.zConfig_modules import SESSION_KEY_ZMODE
 from .zDisplay_modules.display_primitives import zPrimitives
+from .zDisplay_modules.display_table_stream import TableStreams
 from .zDisplay_modules.display_events import zEvents
 from .zDisplay_modules.display_delegates import zDisplayDelegates
 
@@ -196,6 +198,21 @@ EVENT_WRITE_RAW = "write_raw"
 EVENT_WRITE_LINE = "write_line"
 EVENT_WRITE_BLOCK = "write_block"
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Batched Events
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Bulk renderers whose output handle() coalesces into one terminal write and
+# one GUI frame. Interactive and time-based events (menus, dialogs, inputs,
+# progress bars, spinners) are left out - they must reach the screen as drawn.
+BATCHED_EVENTS = frozenset({
+    EVENT_TEXT, EVENT_HEADER, EVENT_LINE,
+    EVENT_ERROR, EVENT_WARNING, EVENT_SUCCESS, EVENT_INFO, EVENT_ZMARKER,
+    EVENT_LIST, EVENT_OUTLINE, EVENT_JSON, EVENT_JSON_DATA, EVENT_ZTABLE,
+    EVENT_ZDECLARE, EVENT_ZSESSION, EVENT_ZCONFIG, EVENT_ZCRUMBS,
+    EVENT_WRITE_RAW, EVENT_WRITE_LINE, EVENT_WRITE_BLOCK,
+})
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Error Messages
 # ═══════════════════════════════════════════════════════════════════════════
@@ -250,6 +267,7 @@ class zDisplay(zDisplayDelegates):
     zEvents: zEvents  # Events module
     _event_map: Dict[str, Callable]  # Event routing map
     _event_buffer: list  # Buffer for capturing events in zBifrost mode
+    table_streams: TableStreams  # Server-side cursors for streamed zTables (Bifrost)
 
     def __init__(self, zcli: Any) -> None:
         """Initialize zDisplay subsystem.
@@ -288,6 +306,9 @@ class zDisplay(zDisplayDelegates):
         # Event buffer for zBifrost mode (capture events instead of broadcasting)
         self._event_buffer = []
 
+        # Open zTable streams (Bifrost clients page through them with table_fetch)
+        self.table_streams = TableStreams(self.logger)
+
         # Unified event routing map
         self._event_map = {
             # Output events
@@ -372,6 +393,11 @@ class zDisplay(zDisplayDelegates):
             - Logs warning if event is not registered
             - Logs error if parameters are invalid for event
             - Never raises exceptions (returns None on error)
+        
+        Batching:
+            Events in BATCHED_EVENTS run inside a zPrimitives batch scope, so a
+            500-row zTable is one terminal write (and one GUI frame) instead of
+            one per line. Input prompts inside the event flush first.
         """
         if not isinstance(display_obj, dict):
             self.logger.warning(ERR_INVALID_OBJ, type(display_obj))
@@ -390,6 +416,9 @@ class zDisplay(zDisplayDelegates):
         params = {k: v for k, v in display_obj.items() if k != KEY_EVENT}
 
         try:
+            if event in BATCHED_EVENTS:
+                with self.zPrimitives.batch():
+                    return handler(**params)
             return handler(**params)
         except TypeError as error:
             self.logger.error(ERR_INVALID_PARAMS, event, error)
@@ -427,6 +456,24 @@ class zDisplay(zDisplayDelegates):
         """Clear the event buffer without returning events."""
         self._event_buffer.clear()
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Output Batching
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def batch(self) -> ContextManager[Any]:
+        """Coalesce the output of several handle() calls into one write/frame.
+        
+        Example:
+            with display.batch():
+                for record in records:
+                    display.handle({"event": "text", "content": record})
+        """
+        return self.zPrimitives.batch()
+
+    def flush(self) -> None:
+        """Emit output pending in the current batch scope."""
+        self.zPrimitives.flush()
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Convenience Method Delegates (Backward Compatibility)
     # ═══════════════════════════════════════════════════════════════════════════
@@ -181,7 +181,9 @@ class DelegateData:
         limit: Optional[int] = None, 
         offset: int = 0, 
         show_header: bool = True,
-        interactive: bool = False
+        interactive: bool = False,
+        chunk_size: Optional[int] = None,
+        stream: Optional[bool] = None
     ) -> Any:
         """Display tabular data with optional pagination.
         
@@ -193,6 +195,8 @@ class DelegateData:
             offset: Starting row offset (default: 0)
             show_header: Show column headers (default: True)
             interactive: Enable interactive navigation in Terminal mode (default: False)
+            chunk_size: Rows per zTable_chunk event when streamed to Bifrost (default: None)
+            stream: Force (True) or disable (False) Bifrost streaming (default: None = auto)
             
         Returns:
             Any: Result from handle() method
@@ -217,5 +221,7 @@ class DelegateData:
             "offset": offset,
             "show_header": show_header,
             "interactive": interactive,
+            "chunk_size": chunk_size,
+            "stream": stream,
         })
 
@@ -0,0 +1,151 @@
+# zCLI/subsystems/zDisplay/zDisplay_modules/display_buffer.py
+
+"""
+Coalescing Output Buffer for zDisplay Primitives.
+
+zPrimitives used to call ``print(..., flush=True)`` for every line, and in
+Bifrost mode to serialize and schedule one WebSocket broadcast per line or
+event - so a 500-row zTable meant hundreds of write syscalls and frames.
+DisplayBuffer collects that output while a batch scope is open and emits it
+in one piece when the scope closes.
+
+Architecture Position:
+    Layer 1 (Foundation), owned by zPrimitives. zDisplay.handle() opens a
+    batch scope around bulk renderers (text, tables, JSON, signals, ...);
+    interactive and time-based events (menus, dialogs, progress bars,
+    spinners) are never batched.
+
+Flush Points:
+    - Scope exit: the outermost batch() flushes (scopes nest).
+    - Size threshold: pending terminal text reaching flush_threshold bytes.
+    - Input prompts: zPrimitives.read_string()/read_password() flush first.
+    - Explicit: zPrimitives.flush() / zDisplay.flush(), or raw(..., flush=True).
+
+What A Flush Emits:
+    - Terminal: one write + flush of all pending text.
+    - GUI output (raw/line/block): one "block" output event with the
+      coalesced content, via gui_sink.
+    - GUI events (send_gui_event broadcasts): the pending event list, via
+      event_sink, which sends one frame for all of them.
+
+Thread Safety:
+    Batch state is thread-local. zBifrost renders from several worker threads
+    at once; each thread batches and flushes only its own output.
+
+Usage:
+    >>> buffer = DisplayBuffer(gui_sink=send_block, event_sink=send_events)
+    >>> with buffer.batch():
+    ...     buffer.write("row 1\\n", "row 1\\n")
+    ...     buffer.write("row 2\\n", "row 2\\n")
+    # One terminal write, one GUI block event
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+from zCLI import Any, Callable, Dict, List, Optional
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Module Constants
+# ═══════════════════════════════════════════════════════════════════════════
+
+DEFAULT_FLUSH_THRESHOLD = 64 * 1024  # Pending terminal characters before a forced flush
+
+
+class DisplayBuffer:
+    """Thread-local batch scopes that coalesce terminal text and GUI output."""
+
+    # Type hints for instance attributes
+    flush_threshold: int  # Pending characters that force a flush
+    gui_sink: Optional[Callable[[str], None]]  # Receives coalesced GUI text
+    event_sink: Optional[Callable[[List[Dict[str, Any]]], None]]  # Receives deferred GUI events
+
+    def __init__(
+        self,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+        gui_sink: Optional[Callable[[str], None]] = None,
+        event_sink: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ) -> None:
+        """Initialize the buffer (no scope is open).
+
+        Args:
+            flush_threshold: Pending terminal characters that force a flush
+            gui_sink: Called with the coalesced GUI text on flush
+            event_sink: Called with the deferred GUI events on flush
+        """
+        self.flush_threshold = max(1, flush_threshold)
+        self.gui_sink = gui_sink
+        self.event_sink = event_sink
+        self._local = threading.local()
+
+    def _state(self) -> Any:
+        """This thread's batch state, created on first use."""
+        state = self._local
+        if not hasattr(state, "depth"):
+            state.depth = 0
+            state.chunks = []
+            state.size = 0
+            state.gui = []
+            state.events = []
+        return state
+
+    @property
+    def active(self) -> bool:
+        """True while this thread is inside a batch scope."""
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def batch(self) -> Iterator["DisplayBuffer"]:
+        """Buffer output until the outermost scope exits, then flush it."""
+        state = self._state()
+        state.depth += 1
+        try:
+            yield self
+        finally:
+            state.depth -= 1
+            if state.depth == 0:
+                self.flush()
+
+    def write(self, text: str, gui_text: Optional[str] = None) -> bool:
+        """Queue terminal text (and GUI text when given).
+
+        Returns:
+            False outside a batch scope - the caller writes through instead
+        """
+        if not self.active:
+            return False
+        state = self._local
+        if text:
+            state.chunks.append(text)
+            state.size += len(text)
+        if gui_text is not None:
+            state.gui.append(gui_text)
+        if state.size >= self.flush_threshold:
+            self.flush()
+        return True
+
+    def defer_event(self, event_data: Dict[str, Any]) -> bool:
+        """Queue a GUI event broadcast; False outside a batch scope."""
+        if not self.active:
+            return False
+        self._local.events.append(event_data)
+        return True
+
+    def pending(self) -> int:
+        """Pending terminal characters for this thread."""
+        return getattr(self._local, "size", 0)
+
+    def flush(self) -> None:
+        """Emit this thread's pending output; a no-op when nothing is pending."""
+        state = self._state()
+        chunks, gui, events = state.chunks, state.gui, state.events
+        state.chunks, state.gui, state.events = [], [], []
+        state.size = 0
+
+        if chunks:
+            print("".join(chunks), end="", flush=True)
+        if gui and self.gui_sink is not None:
+            self.gui_sink("".join(gui))
+        if events and self.event_sink is not None:
+            self.event_sink(events)
+
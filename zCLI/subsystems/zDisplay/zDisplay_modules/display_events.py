@@ -449,7 +449,7 @@ class zEvents:
     # Convenience Delegates - AdvancedData
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def zTable(self, title: str, columns: List[str], rows: List[List[Any]], limit: Optional[int] = None, offset: int = 0, show_header: bool = True, interactive: bool = False) -> Any:
+    def zTable(self, title: str, columns: List[str], rows: List[List[Any]], limit: Optional[int] = None, offset: int = 0, show_header: bool = True, interactive: bool = False, chunk_size: Optional[int] = None, stream: Optional[bool] = None) -> Any:
         """Display data in table format with pagination support.
         
         Convenience delegate to AdvancedData.zTable for backward compatibility.
@@ -462,11 +462,13 @@ class zEvents:
             offset: Row offset for pagination (default: 0)
             show_header: Show column headers (default: True)
             interactive: Enable keyboard navigation in Terminal mode (default: False)
+            chunk_size: Rows per zTable_chunk event when streamed to Bifrost
+            stream: Force (True) or disable (False) Bifrost streaming (default: auto)
             
         Returns:
             Any: Result from AdvancedData.zTable method
         """
-        return self.AdvancedData.zTable(title, columns, rows, limit, offset, show_header, interactive)
+        return self.AdvancedData.zTable(title, columns, rows, limit, offset, show_header, interactive, chunk_size, stream)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Convenience Delegates - zSystem
@@ -57,6 +57,8 @@ Dual-Mode I/O Methods:
         - raw(content, flush): Raw output, no formatting (preferred API)
         - line(content): Single line with newline (preferred API)
         - block(content): Multi-line block with final newline (preferred API)
+        - batch(): Scope that coalesces output into one write/frame
+        - flush(): Emit pending batched output now
         
         Legacy aliases (backward compatibility):
         - write_raw → raw
@@ -66,6 +68,8 @@ Dual-Mode I/O Methods:
         Behavior:
             1. ALWAYS output to terminal (print)
             2. IF in Bifrost mode, ALSO send via WebSocket
+            3. Inside batch(), both are queued in a DisplayBuffer and emitted
+               as one terminal write + one GUI block event on flush
     
     Input Methods (synchronous OR asynchronous):
         - read_string(prompt): Read text input
@@ -149,7 +153,9 @@ Backward-Compatible Aliases:
         - .read → .read_string
 """
 
-from zCLI import json, time, getpass, asyncio, uuid, os, shutil, subprocess, Any, Dict, Union, Optional
+from typing import ContextManager
+from zCLI import json, time, getpass, asyncio, uuid, os, shutil, subprocess, Any, Dict, List, Union, Optional
+from .display_buffer import DisplayBuffer
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Mode Constants
@@ -166,6 +172,7 @@ MODE_EMPTY = ""
 EVENT_TYPE_OUTPUT = "output"
 EVENT_TYPE_INPUT_REQUEST = "input_request"
 EVENT_TYPE_ZDISPLAY = "zdisplay"
+EVENT_TYPE_DISPLAY_BATCH = "display_batch"
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Write Type Constants
@@ -195,13 +202,14 @@ KEY_PROMPT = "prompt"
 KEY_DISPLAY_EVENT = "display_event"
 KEY_DATA = "data"
 KEY_MASKED = "masked"
+KEY_EVENTS = "events"
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Default Constants
 # ═══════════════════════════════════════════════════════════════════════════
 
 DEFAULT_PROMPT = ""
-DEFAULT_FLUSH = True
+DEFAULT_FLUSH = None  # Write through outside batch(), buffer inside it
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Terminal Sizing (Header/Banner Safety)
@@ -219,6 +227,7 @@ class zPrimitives:
     display: Any  # Parent zDisplay instance
     pending_input_requests: Dict[str, Any]  # Unused, kept for compatibility
     response_futures: Dict[str, 'asyncio.Future']  # Active GUI input futures
+    buffer: DisplayBuffer  # Coalesces output inside batch() scopes
 
     def __init__(self, display_instance: Any) -> None:
         """Initialize zPrimitives with reference to parent display instance.
@@ -230,6 +239,11 @@ class zPrimitives:
         # Track pending input requests for GUI mode
         self.pending_input_requests = {}
         self.response_futures = {}
+        # Batched output: one terminal write, one GUI block, one event frame per flush
+        self.buffer = DisplayBuffer(
+            gui_sink=lambda text: self._write_gui(text, WRITE_TYPE_BLOCK),
+            event_sink=self._broadcast_events
+        )
 
     def _is_gui_mode(self) -> bool:
         """Check if running in zBifrost (non-interactive WebSocket) mode.
@@ -306,7 +320,7 @@ class zPrimitives:
     # Output Primitives - Terminal + Optional GUI
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def raw(self, content: str, flush: bool = DEFAULT_FLUSH) -> None:
+    def raw(self, content: str, flush: Optional[bool] = DEFAULT_FLUSH) -> None:
         """Write raw content with no formatting or newline.
         
         Dual-mode behavior:
@@ -315,15 +329,22 @@ class zPrimitives:
         
         Args:
             content: Text to write (no newline added)
-            flush: Whether to flush terminal output immediately
+            flush: Whether to flush terminal output immediately. None (default)
+                flushes outside batch() and buffers inside it; True inside a
+                batch is an explicit flush point (e.g. a partial-line prompt).
             
         Example:
             z.display.raw("Loading")
             z.display.raw("...")
             z.display.raw(" Done!\n")
         """
+        if self.buffer.write(content, content if self._is_gui_mode() else None):
+            if flush:
+                self.buffer.flush()
+            return
+
         # Terminal output (always)
-        print(content, end='', flush=flush)
+        print(content, end='', flush=flush is not False)
 
         # GUI output (if in GUI mode)
         if self._is_gui_mode():
@@ -347,6 +368,9 @@ class zPrimitives:
         if not terminal_content.endswith('\n'):
             terminal_content = terminal_content + '\n'
 
+        if self.buffer.write(terminal_content, terminal_content if self._is_gui_mode() else None):
+            return
+
         # Terminal output (always)
         print(terminal_content, end='', flush=True)
 
@@ -369,6 +393,9 @@ class zPrimitives:
         if terminal_content and not terminal_content.endswith('\n'):
             terminal_content = terminal_content + '\n'
 
+        if self.buffer.write(terminal_content, terminal_content if self._is_gui_mode() else None):
+            return
+
         # Terminal output (always)
         print(terminal_content, end='', flush=True)
 
@@ -376,6 +403,29 @@ class zPrimitives:
         if self._is_gui_mode():
             self._write_gui(content.rstrip('\n') if content else "", WRITE_TYPE_BLOCK)
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Output Batching
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def batch(self) -> ContextManager[DisplayBuffer]:
+        """Context manager that coalesces output until the outermost scope exits.
+        
+        Inside the scope raw/line/block output is queued; on exit it is emitted
+        as one terminal write and (in Bifrost mode) one GUI block event, and
+        deferred send_gui_event broadcasts go out as one frame. Scopes nest
+        and are per-thread.
+        
+        Example:
+            with z.display.zPrimitives.batch():
+                for row in rows:
+                    z.display.zPrimitives.line(row)
+        """
+        return self.buffer.batch()
+
+    def flush(self) -> None:
+        """Emit output pending in the current batch scope (no-op outside one)."""
+        self.buffer.flush()
+
     # ═══════════════════════════════════════════════════════════════════════════
     # GUI Communication Primitives
     # ═══════════════════════════════════════════════════════════════════════════
@@ -574,19 +624,10 @@ class zPrimitives:
             # Buffer event for collection (backward compatibility with zWalker)
             self.display.buffer_event(event_data)
             
-            # ALSO broadcast immediately for custom handlers (new capability)
-            if self.display and hasattr(self.display, 'zcli'):
-                zcli = self.display.zcli
-                if zcli and hasattr(zcli, 'comm') and hasattr(zcli.comm, 'broadcast_websocket'):
-                    try:
-                        loop = asyncio.get_running_loop()
-                        asyncio.run_coroutine_threadsafe(
-                            zcli.bifrost.orchestrator.broadcast(json.dumps(event_data)),
-                            loop
-                        )
-                    except RuntimeError:
-                        # No running event loop - buffering still works
-                        pass
+            # ALSO broadcast for custom handlers (new capability) - deferred to
+            # one frame per flush inside batch(), immediate otherwise
+            if not self.buffer.defer_event(event_data):
+                self._broadcast(json.dumps(event_data))
             
             return True
             
@@ -595,6 +636,29 @@ class zPrimitives:
 
         return False
 
+    def _broadcast_events(self, events: List[Dict[str, Any]]) -> None:
+        """Broadcast deferred GUI events: a lone event as-is, several as one display_batch frame."""
+        if len(events) == 1:
+            self._broadcast(json.dumps(events[0]))
+        else:
+            self._broadcast(json.dumps({KEY_EVENT: EVENT_TYPE_DISPLAY_BATCH, KEY_EVENTS: events}))
+
+    def _broadcast(self, payload: str) -> None:
+        """Schedule payload on zBifrost's broadcast when called from a running event loop.
+        
+        Silent no-op without a zBifrost instance or running loop (worker threads,
+        tests) - buffered events still reach clients via collect_buffered_events().
+        """
+        zcli = getattr(self.display, 'zcli', None) if self.display else None
+        if not zcli or not hasattr(zcli, 'comm') or not hasattr(zcli.comm, 'broadcast_websocket'):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            asyncio.run_coroutine_threadsafe(zcli.bifrost.orchestrator.broadcast(payload), loop)
+        except Exception:
+            # No running event loop / no bifrost - GUI output is best-effort
+            pass
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Input Primitives - Terminal OR GUI (Dual Return Types)
     # ═══════════════════════════════════════════════════════════════════════════
@@ -626,6 +690,9 @@ class zPrimitives:
             else:
                 name = result  # Terminal mode
         """
+        # Batched output must be visible before the prompt
+        self.buffer.flush()
+
         # Terminal input (always available as fallback)
         if not self._is_gui_mode():
             if prompt:
@@ -671,6 +738,9 @@ class zPrimitives:
             else:
                 password = result  # Terminal mode (getpass)
         """
+        # Batched output must be visible before the prompt
+        self.buffer.flush()
+
         # Terminal input (always available as fallback)
         if not self._is_gui_mode():
             if prompt:
@@ -0,0 +1,315 @@
+# zCLI/subsystems/zDisplay/zDisplay_modules/display_table_stream.py
+
+"""
+Server-Side Table Cursors for Chunked zTable Streaming (Bifrost Mode).
+
+AdvancedData.zTable used to put every row into one zTable GUI event, so a
+read of tens of thousands of rows became one huge JSON frame. A large table
+is now streamed instead. Its rows stay behind a server-side cursor
+(TableStream) and go out one page at a time, split into sequenced chunks:
+
+    zTable_start  {stream, title, columns, ..., chunk_size, page_size, total}
+    zTable_chunk  {stream, seq, rows}               (seq = 1, 2, 3, ...)
+    zTable_end    {stream, seq, sent, has_more}     (end of this page)
+
+The first page is sent with the command's display events. The client asks
+for the next page with a Bifrost ``table_fetch`` request, which reads on from
+the same cursor - the query is not run again. A cursor is closed when its
+rows run out, on ``table_close``, when its connection closes, after
+idle_timeout seconds without a fetch, or when max_streams cursors are open
+(least recently used first).
+
+Architecture Position:
+    Layer 1 (Foundation), owned by zDisplay as ``display.table_streams``.
+    Written to by AdvancedData.zTable (GUI mode), read by zBifrost's
+    TableEvents (table_fetch / table_close).
+
+Thread Safety:
+    The registry and each cursor have their own lock: fetches of different
+    streams run in parallel, fetches of one stream are serialized. Row
+    iterators must tolerate being resumed from another thread (lists and
+    PostgreSQL server-side cursors do; SQLite cursors are thread-bound).
+
+Usage:
+    >>> streams = TableStreams(logger)
+    >>> stream = streams.open(rows, start={"title": "Users", "columns": cols})
+    >>> streams.page(stream.id)      # first page: start, chunks, end
+    >>> streams.page(stream.id)      # next page: chunks, end
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable
+from zCLI import Any, Dict, List, Optional, Tuple
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Module Constants
+# ═══════════════════════════════════════════════════════════════════════════
+
+DEFAULT_CHUNK_SIZE = 200        # Rows per zTable_chunk event
+DEFAULT_PAGE_SIZE = 1000        # Rows per page (first page and each table_fetch)
+MAX_PAGE_SIZE = 10000           # Upper bound for a client-requested page
+DEFAULT_MAX_STREAMS = 64        # Open cursors before the least recently used is closed
+DEFAULT_IDLE_TIMEOUT = 300.0    # Seconds a cursor may sit unread
+
+# Event names
+EVENT_TABLE_START = "zTable_start"
+EVENT_TABLE_CHUNK = "zTable_chunk"
+EVENT_TABLE_END = "zTable_end"
+
+# Event keys
+KEY_STREAM = "stream"
+KEY_SEQ = "seq"
+KEY_ROWS = "rows"
+KEY_SENT = "sent"
+KEY_HAS_MORE = "has_more"
+KEY_TOTAL = "total"
+KEY_CHUNK_SIZE = "chunk_size"
+KEY_PAGE_SIZE = "page_size"
+KEY_DISPLAY_EVENT = "display_event"
+KEY_DATA = "data"
+
+# Stats keys
+STAT_OPEN = "open"
+STAT_OPENED = "opened"
+STAT_PAGES = "pages"
+STAT_EXPIRED = "expired"
+
+# Log messages
+LOG_OPENED = "[TableStreams] Opened %s (chunk=%d, page=%d)"
+LOG_CLOSED = "[TableStreams] Closed %s (%d rows sent)"
+LOG_EXPIRED = "[TableStreams] Expired %s (idle or over %d open streams)"
+
+# Error messages
+ERR_UNKNOWN_STREAM = "Unknown or expired table stream: {stream_id}"
+ERR_NOT_OWNER = "Table stream {stream_id} belongs to another connection"
+
+# Page event: (event name, event data)
+PageEvent = Tuple[str, Dict[str, Any]]
+
+
+class TableStream:
+    """One server-side cursor: remaining rows plus chunk/page bookkeeping."""
+
+    # Type hints for instance attributes
+    id: str  # Stream id (sent to the client)
+    chunk_size: int  # Rows per chunk event
+    page_size: int  # Rows per page
+    owner: Any  # Connection allowed to fetch (None until claimed)
+    seq: int  # Last chunk sequence number sent
+    sent: int  # Rows sent so far
+
+    def __init__(self, rows: Iterable[Any], start: Dict[str, Any], chunk_size: int, page_size: int) -> None:
+        """Wrap rows (list or iterator) in a cursor.
+
+        Args:
+            rows: Table rows - iterated lazily, one page per page() call
+            start: zTable_start metadata (title, columns, limit, ...)
+            chunk_size: Rows per zTable_chunk event
+            page_size: Rows per page
+        """
+        self.id = uuid.uuid4().hex
+        self.chunk_size = max(1, chunk_size)
+        self.page_size = max(1, page_size)
+        self.owner = None
+        self.seq = 0
+        self.sent = 0
+        self.touched = time.monotonic()
+        self.lock = threading.Lock()
+        self._source = rows
+        self._rows = iter(rows)
+        self._pending: List[Any] = []
+        self._start: Optional[Dict[str, Any]] = dict(start, **{
+            KEY_STREAM: self.id,
+            KEY_CHUNK_SIZE: self.chunk_size,
+            KEY_PAGE_SIZE: self.page_size,
+            KEY_TOTAL: len(rows) if isinstance(rows, (list, tuple)) else None,
+        })
+
+    def next_page(self, size: Optional[int] = None) -> Tuple[List[PageEvent], bool]:
+        """Read the next page (lock held by the caller).
+
+        Returns:
+            (events, has_more) - zTable_start on the first page, the page's
+            chunks, then zTable_end
+        """
+        size = min(max(1, size or self.page_size), MAX_PAGE_SIZE)
+        events: List[PageEvent] = []
+        if self._start is not None:
+            events.append((EVENT_TABLE_START, self._start))
+            self._start = None
+
+        page = self._pending + list(islice(self._rows, size - len(self._pending)))
+        self._pending = list(islice(self._rows, 1))  # Lookahead: is there more?
+        has_more = bool(self._pending)
+
+        for index in range(0, len(page), self.chunk_size):
+            self.seq += 1
+            events.append((EVENT_TABLE_CHUNK, {
+                KEY_STREAM: self.id,
+                KEY_SEQ: self.seq,
+                KEY_ROWS: page[index:index + self.chunk_size],
+            }))
+        self.sent += len(page)
+        events.append((EVENT_TABLE_END, {
+            KEY_STREAM: self.id,
+            KEY_SEQ: self.seq,
+            KEY_SENT: self.sent,
+            KEY_HAS_MORE: has_more,
+        }))
+        self.touched = time.monotonic()
+        return events, has_more
+
+    def close(self) -> None:
+        """Release the row source (closes generators and their DB cursors)."""
+        self._pending = []
+        close = getattr(self._source, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+        self._rows = iter(())
+
+
+class TableStreams:
+    """Registry of open TableStream cursors, bounded by count and idle time."""
+
+    def __init__(
+        self,
+        logger: Any,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            logger: Logger instance for diagnostics
+            max_streams: Open cursors before the least recently used is closed
+            idle_timeout: Seconds a cursor may go unread before it is closed
+        """
+        self.logger = logger
+        self.max_streams = max(1, max_streams)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._streams: "OrderedDict[str, TableStream]" = OrderedDict()
+        self.stats: Dict[str, int] = {STAT_OPENED: 0, STAT_PAGES: 0, STAT_EXPIRED: 0}
+
+    def open(
+        self,
+        rows: Iterable[Any],
+        start: Dict[str, Any],
+        chunk_size: Optional[int] = None,
+        page_size: Optional[int] = None
+    ) -> TableStream:
+        """Register a cursor over rows; nothing is read until page()."""
+        stream = TableStream(rows, start, chunk_size or DEFAULT_CHUNK_SIZE, page_size or DEFAULT_PAGE_SIZE)
+        with self._lock:
+            expired = self._expire_locked()
+            self._streams[stream.id] = stream
+            while len(self._streams) > self.max_streams:
+                expired.append(self._streams.popitem(last=False)[1])
+            self.stats[STAT_OPENED] += 1
+        self._close_expired(expired)
+        self.logger.debug(LOG_OPENED, stream.id, stream.chunk_size, stream.page_size)
+        return stream
+
+    def page(self, stream_id: str, size: Optional[int] = None, owner: Any = None) -> List[PageEvent]:
+        """Read the next page of a stream; an exhausted stream is closed.
+
+        Args:
+            stream_id: Id from zTable_start
+            size: Rows for this page (default: the stream's page_size)
+            owner: Requesting connection (checked once the stream is claimed)
+
+        Raises:
+            KeyError: Unknown, finished or expired stream
+            PermissionError: Stream claimed by another connection
+        """
+        with self._lock:
+            expired = self._expire_locked()
+            stream = self._streams.get(stream_id)
+            if stream is not None:
+                self._streams.move_to_end(stream_id)
+        self._close_expired(expired)
+
+        if stream is None:
+            raise KeyError(ERR_UNKNOWN_STREAM.format(stream_id=stream_id))
+        if owner is not None and stream.owner is not None and stream.owner is not owner:
+            raise PermissionError(ERR_NOT_OWNER.format(stream_id=stream_id))
+
+        with stream.lock:
+            events, has_more = stream.next_page(size)
+        with self._lock:
+            self.stats[STAT_PAGES] += 1
+        if not has_more:
+            self.close(stream_id)
+        return events
+
+    def claim(self, display_events: List[Dict[str, Any]], owner: Any) -> int:
+        """Bind the streams started in display_events (buffered GUI events) to owner.
+
+        Returns:
+            Number of streams claimed
+        """
+        claimed = 0
+        with self._lock:
+            for event in display_events:
+                if not isinstance(event, dict) or event.get(KEY_DISPLAY_EVENT) != EVENT_TABLE_START:
+                    continue
+                stream = self._streams.get((event.get(KEY_DATA) or {}).get(KEY_STREAM))
+                if stream is not None and stream.owner is None:
+                    stream.owner = owner
+                    claimed += 1
+        return claimed
+
+    def close(self, stream_id: str, owner: Any = None) -> bool:
+        """Close one stream; False if unknown or owned by another connection."""
+        with self._lock:
+            stream = self._streams.get(stream_id)
+            if stream is None or (owner is not None and stream.owner is not None and stream.owner is not owner):
+                return False
+            del self._streams[stream_id]
+        stream.close()
+        self.logger.debug(LOG_CLOSED, stream_id, stream.sent)
+        return True
+
+    def release(self, owner: Any) -> int:
+        """Close every stream owned by owner (connection closed); returns how many."""
+        with self._lock:
+            owned = [stream for stream in self._streams.values() if stream.owner is owner]
+            for stream in owned:
+                del self._streams[stream.id]
+        for stream in owned:
+            stream.close()
+        return len(owned)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Open cursor count plus opened/pages/expired counters."""
+        with self._lock:
+            return dict(self.stats, **{STAT_OPEN: len(self._streams)})
+
+    # ───────────────────────────────────────────────────────────────────────
+    # Internals
+    # ───────────────────────────────────────────────────────────────────────
+
+    def _expire_locked(self) -> List[TableStream]:
+        """Remove streams idle longer than idle_timeout (lock held); returns them."""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [stream for stream in self._streams.values() if stream.touched < cutoff]
+        for stream in expired:
+            del self._streams[stream.id]
+        return expired
+
+    def _close_expired(self, expired: List[TableStream]) -> None:
+        """Close expired/evicted streams outside the registry lock."""
+        for stream in expired:
+            stream.close()
+            self.logger.debug(LOG_EXPIRED, stream.id, self.max_streams)
+        if expired:
+            with self._lock:
+                self.stats[STAT_EXPIRED] += len(expired)
+
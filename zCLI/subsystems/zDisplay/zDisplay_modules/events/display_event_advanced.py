@@ -279,7 +279,9 @@ AdvancedData is thread-safe when used through zDisplay singleton:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-from typing import Any, Optional, List, Dict, Union
+from collections import deque
+from itertools import islice
+from typing import Any, Optional, List, Dict, Iterable, Iterator, Union
 
 # ═══════════════════════════════════════════════════════════════════════════
 #                           MODULE CONSTANTS
@@ -309,6 +311,8 @@ DEFAULT_OFFSET: int = 0
 DEFAULT_SHOWING_START: int = 1
 DEFAULT_SEPARATOR_WIDTH: int = 60
 DEFAULT_TRUNCATE_SUFFIX: str = "..."
+DEFAULT_STREAM_PAGE_SIZE: int = 100  # Rows rendered per page when streaming without a limit
+DEFAULT_GUI_STREAM_THRESHOLD: int = 1000  # Bifrost: larger row lists are streamed in chunks
 
 # Colors and styles
 DEFAULT_HEADER_COLOR: str = "CYAN"
@@ -319,6 +323,10 @@ MSG_NO_COLUMNS: str = "No columns defined for table"
 MSG_NO_ROWS: str = "No rows to display"
 MSG_MORE_ROWS: str = "... {count} more rows"
 MSG_SHOWING_RANGE: str = "{title} (showing {start}-{end} of {total})"
+MSG_STREAM_RANGE: str = "{title} (showing {start}-{end})"
+MSG_STREAM_TITLE: str = "{title} (streaming)"
+MSG_STREAM_MORE: str = "... more rows"
+MSG_STREAM_TOTAL: str = "{count} rows"
 
 # Navigation constants (interactive mode)
 NAV_PROMPT: str = "Navigate: [n]ext | [p]revious | [f]irst | [l]ast | [#] jump | [q]uit: "
@@ -327,6 +335,7 @@ NAV_INVALID: str = "Invalid command. Use: n, p, f, l, # (page number), or q"
 NAV_ALREADY_FIRST: str = "Already on first page"
 NAV_ALREADY_LAST: str = "Already on last page"
 NAV_INVALID_PAGE: str = "Invalid page. Enter 1-{total_pages}"
+NAV_STREAM_PROMPT: str = "[Enter] next page | [q]uit: "
 
 # Characters
 CHAR_SEPARATOR: str = "─"
@@ -639,11 +648,13 @@ class AdvancedData:
         self,
         title: str,
         columns: List[str],
-        rows: List[Union[Dict[str, Any], List[Any]]],
+        rows: Iterable[Union[Dict[str, Any], List[Any]]],
         limit: Optional[int] = None,
         offset: int = DEFAULT_OFFSET,
         show_header: bool = True,
-        interactive: bool = False
+        interactive: bool = False,
+        chunk_size: Optional[int] = None,
+        stream: Optional[bool] = None
     ) -> None:
         """
         Display data table with optional pagination and formatting for Terminal/Bifrost modes.
@@ -727,7 +738,9 @@ class AdvancedData:
         Args:
             title: Table title (displayed in header)
             columns: List of column names (e.g., ["id", "username", "email"])
-            rows: List of row data (dicts or lists, typically dicts from SQL cursor)
+            rows: List of row data (dicts or lists, typically dicts from SQL cursor),
+                  or an iterator of rows (e.g. zData select_iter) - rendered as it
+                  is consumed, never fully materialized in Terminal mode
             limit: Maximum rows to display (None=all, negative=last N, positive=from offset)
             offset: Starting row index (0-based, default 0)
             show_header: Whether to display column headers (default True)
@@ -735,6 +748,12 @@ class AdvancedData:
                         Commands: [n]ext, [p]revious, [f]irst, [l]ast, [#] jump to page, [q]uit
                         Only works with limit > 0 (pagination must be enabled)
                         Ignored in Bifrost mode
+            chunk_size: Bifrost streaming - rows per zTable_chunk event
+                        (default: display_table_stream.DEFAULT_CHUNK_SIZE)
+            stream: Bifrost streaming - True always streams, False always sends
+                    one zTable event, None (default) streams iterators and row
+                    lists longer than DEFAULT_GUI_STREAM_THRESHOLD. Ignored in
+                    Terminal mode
         
         Returns:
             None (output is rendered to Terminal or sent to Bifrost)
@@ -780,12 +799,41 @@ class AdvancedData:
             - Truncation is naive ("..." at end, Week 6.6: smart truncation for UUIDs/IDs)
             - Interactive pagination available with interactive=True (Terminal-only)
             - Bifrost mode sends raw data (frontend handles rendering/pagination)
+            - Streamed Bifrost tables send zTable_start, the first page as
+              sequenced zTable_chunk events, and zTable_end {has_more}; the
+              client pulls further pages with the table_fetch event, which
+              reads on from a server-side cursor (see display_table_stream)
+            - Iterator rows (Terminal): limit>0 shows one page and stops reading;
+              interactive=True pages forward only ([Enter]/q); no limit renders
+              every row as it arrives; negative limit keeps a last-N window.
+              offset only numbers the rows - the query already skipped them.
         
         Week 6.6 Enhancements (Remaining):
             - Add column_types parameter for data type formatting
             - Add column_widths parameter for auto-sizing
             - Add editable parameter for Bifrost cell editing
         """
+        # Streamed rows (iterator) - rendered as consumed in Terminal mode
+        streaming = not isinstance(rows, (list, tuple))
+        if self.zPrimitives._is_gui_mode():
+            if stream is None:
+                stream = streaming or len(rows) > DEFAULT_GUI_STREAM_THRESHOLD
+            table_streams = getattr(self.display, "table_streams", None)
+            if stream and table_streams is not None:
+                self._send_table_stream(table_streams, rows, chunk_size, {
+                    KEY_TITLE: title,
+                    KEY_COLUMNS: columns,
+                    KEY_LIMIT: limit,
+                    KEY_OFFSET: offset,
+                    KEY_SHOW_HEADER: show_header,
+                    "interactive": interactive
+                })
+                return
+            # Single-event path needs the full list
+            if streaming:
+                rows = list(rows)
+                streaming = False
+
         # Try Bifrost mode first - send clean event
         if self.zPrimitives.send_gui_event(EVENT_ZTABLE, {
             KEY_TITLE: title,
@@ -805,6 +853,10 @@ class AdvancedData:
             self._signal_warning(MSG_NO_COLUMNS, indent=0)
             return
         
+        if streaming:
+            self._render_stream(title, columns, iter(rows), limit, offset, show_header, interactive)
+            return
+        
         # Paginate rows using Pagination helper
         page_info = self.pagination.paginate(rows, limit, offset)
         paginated_rows = page_info[KEY_ITEMS]
@@ -941,6 +993,132 @@ class AdvancedData:
         # Add closing blank line
         self._output_text("", break_after=False)
     
+    def _send_table_stream(
+        self,
+        table_streams: Any,
+        rows: Iterable[Union[Dict[str, Any], List[Any]]],
+        chunk_size: Optional[int],
+        start: Dict[str, Any]
+    ) -> None:
+        """
+        Bifrost: open a server-side cursor over rows and send its first page.
+        
+        Sends zTable_start, the first page as zTable_chunk events and
+        zTable_end. Inside zDisplay.handle() these leave as one display_batch
+        frame. Later pages are read by the table_fetch Bifrost event.
+        
+        Args:
+            table_streams: zDisplay.table_streams registry
+            rows: Row list or iterator (kept open until exhausted or closed)
+            chunk_size: Rows per zTable_chunk event (None = registry default)
+            start: zTable_start metadata (title, columns, limit, ...)
+        """
+        table_stream = table_streams.open(rows, start, chunk_size=chunk_size)
+        for event_name, data in table_streams.page(table_stream.id):
+            self.zPrimitives.send_gui_event(event_name, data)
+    
+    def _render_stream(
+        self,
+        title: str,
+        columns: List[str],
+        rows: Iterator[Union[Dict[str, Any], List[Any]]],
+        limit: Optional[int],
+        offset: int,
+        show_header: bool,
+        interactive: bool
+    ) -> None:
+        """
+        Render rows from an iterator without holding more than one page.
+        
+        A result that fits in one page renders exactly like a list. Larger
+        results follow the three pagination modes:
+          • limit > 0: first page + "... more rows" (rest is never read), or
+            page forward with [Enter] when interactive=True
+          • limit < 0: last N rows, kept in a bounded window while consuming
+          • limit None: every row rendered as it arrives, row count at the end
+        
+        Args:
+            title: Table title
+            columns: List of column names
+            rows: Row iterator (already positioned at offset)
+            limit: Page size / last-N (see zTable)
+            offset: Number of rows the query skipped (for "showing X-Y")
+            show_header: Whether to show column headers
+            interactive: Page forward on [Enter] (Terminal-only)
+        """
+        offset = offset or 0
+        
+        if limit is not None and limit < 0:
+            window = deque(maxlen=-limit)
+            total = 0
+            for row in rows:
+                window.append(row)
+                total += 1
+            page_info = self.pagination.paginate(list(window), None)
+            page_info[KEY_TOTAL] = offset + total
+            if window:
+                page_info[KEY_SHOWING_START] = offset + total - len(window) + PAGINATION_OFFSET_BASE
+                page_info[KEY_SHOWING_END] = offset + total
+            self._render_table_page(title, columns, page_info, page_info[KEY_ITEMS], show_header)
+            return
+        
+        page_size = limit if limit and limit > 0 else DEFAULT_STREAM_PAGE_SIZE
+        page = list(islice(rows, page_size))
+        lookahead = list(islice(rows, 1))
+        
+        # Fits in one page: total is known, same output as a list
+        if not lookahead:
+            page_info = self.pagination.paginate(page, None)
+            if page:
+                page_info[KEY_TOTAL] = offset + len(page)
+                page_info[KEY_SHOWING_START] = offset + PAGINATION_OFFSET_BASE
+                page_info[KEY_SHOWING_END] = offset + len(page)
+            self._render_table_page(title, columns, page_info, page, show_header)
+            return
+        
+        # First page only - the rest of the stream is never read
+        if limit and limit > 0 and not interactive:
+            self._render_stream_title(MSG_STREAM_RANGE.format(
+                title=title, start=offset + PAGINATION_OFFSET_BASE, end=offset + len(page)
+            ), columns, show_header)
+            self._render_stream_rows(page, columns)
+            self._signal_info(MSG_STREAM_MORE, indent=1)
+            self._output_text("", break_after=False)
+            return
+        
+        # Render page by page as rows arrive (prompting between pages if interactive)
+        self._render_stream_title(MSG_STREAM_TITLE.format(title=title), columns, show_header)
+        count = 0
+        while page:
+            self._render_stream_rows(page, columns)
+            count += len(page)
+            if not lookahead:
+                break
+            if interactive and limit and limit > 0:
+                if self.zPrimitives.read_string(NAV_STREAM_PROMPT).strip().lower() == "q":
+                    self._signal_info(MSG_STREAM_MORE, indent=1)
+                    self._output_text("", break_after=False)
+                    return
+            page = lookahead + list(islice(rows, page_size - 1))
+            lookahead = list(islice(rows, 1))
+        self._signal_info(MSG_STREAM_TOTAL.format(count=count), indent=1)
+        self._output_text("", break_after=False)
+    
+    def _render_stream_title(self, title: str, columns: List[str], show_header: bool) -> None:
+        """Title header and column headers for a streamed table."""
+        self._output_text("", break_after=False)
+        if self.BasicOutputs:
+            self.BasicOutputs.header(title, color=DEFAULT_HEADER_COLOR, style=DEFAULT_TABLE_STYLE)
+        if show_header:
+            header_row = self._format_row(columns, columns, is_header=True)
+            self._output_text(header_row, indent=1, break_after=False)
+            self._output_text(CHAR_SEPARATOR * DEFAULT_SEPARATOR_WIDTH, indent=1, break_after=False)
+    
+    def _render_stream_rows(self, rows: List[Union[Dict[str, Any], List[Any]]], columns: List[str]) -> None:
+        """Formatted rows for a streamed table."""
+        for row in rows:
+            self._output_text(self._format_row(row, columns), indent=1, break_after=False)
+    
     def _format_row(
         self,
         row: Union[Dict[str, Any], List[Any], Any],
@@ -2,7 +2,11 @@
 
 """External Python function loader and executor."""
 
-from zCLI import inspect
+from .zFunc_modules.func_cache import CallableCache, injection_plan
+from .zFunc_modules.func_loop import AsyncLoopRunner, DEFAULT_TIMEOUT, DEFAULT_DRAIN_TIMEOUT
+
+# zSpark key for async loop settings: {"timeout": seconds|None, "drain_timeout": seconds}
+ZSPARK_ASYNC_LOOP_KEY = "async_loop"
 
 
 class zFunc:
@@ -16,6 +20,16 @@ class zFunc:
         self.display = zcli.display
         self.zparser = zcli.zparser
         self.mycolor = "ZFUNC"
+        # Resolved callables per (file, function); modules shared with zLoader's plugin cache
+        loader_cache = getattr(getattr(zcli, "loader", None), "cache", None)
+        self.callables = CallableCache(self.logger, plugin_cache=getattr(loader_cache, "plugin_cache", None))
+        # Long-lived event loop for coroutine-returning functions (drained by zCLI.shutdown)
+        loop_config = (getattr(zcli, "zspark_obj", None) or {}).get(ZSPARK_ASYNC_LOOP_KEY) or {}
+        self.loop_runner = AsyncLoopRunner(
+            self.logger,
+            default_timeout=loop_config.get("timeout", DEFAULT_TIMEOUT),
+            drain_timeout=loop_config.get("drain_timeout", DEFAULT_DRAIN_TIMEOUT),
+        )
         self.display.zDeclare("zFunc Ready", color=self.mycolor, indent=0, style="full")
 
     def handle(self, zHorizontal, zContext=None):
@@ -79,23 +93,23 @@ class zFunc:
     def _resolve_callable_with_display(self, func_path, function_name):
         """Resolve callable with display header."""
         self.display.zDeclare("Resolve Callable", color=self.mycolor, indent=1, style="single")
-        from .zFunc_modules.func_resolver import resolve_callable
-        return resolve_callable(func_path, function_name, self.logger)
+        func, _plan = self.callables.resolve(func_path, function_name)
+        return func
 
     def _execute_function(self, func, args, zContext=None):
         """Execute function with optional session/zcli/context injection."""
         import asyncio
         
-        sig = inspect.signature(func)
+        plan = injection_plan(func)  # Memoized inspect.signature() result
         kwargs = {}
 
         # Auto-inject zcli if function accepts it
-        if 'zcli' in sig.parameters:
+        if 'zcli' in plan:
             self.logger.debug("Auto-injecting zcli instance to function")
             kwargs['zcli'] = self.zcli
 
         # Auto-inject session if function accepts it
-        if 'session' in sig.parameters:
+        if 'session' in plan:
             inject_session = True
             if args and isinstance(args[0], dict) and 'session' in args[0]:
                 inject_session = False
@@ -105,7 +119,7 @@ class zFunc:
                 kwargs['session'] = self.session
         
         # Auto-inject context if function accepts it (for zWizard/zHat access)
-        if 'context' in sig.parameters and zContext:
+        if 'context' in plan and zContext:
             self.logger.debug("Auto-injecting context to function")
             kwargs['context'] = zContext
 
@@ -119,23 +133,10 @@ class zFunc:
         else:
             result = func(*args)
         
-        # Handle async functions (coroutines)
+        # Handle async functions (coroutines) on the shared zCLI event loop
         if asyncio.iscoroutine(result):
-            self.logger.debug("Function returned coroutine - awaiting in event loop")
-            try:
-                # Check if event loop is already running (zBifrost mode)
-                loop = asyncio.get_running_loop()
-                self.logger.debug("Event loop is running - using run_coroutine_threadsafe")
-                
-                # Use run_coroutine_threadsafe to execute coroutine from sync context
-                import concurrent.futures
-                future = asyncio.run_coroutine_threadsafe(result, loop)
-                return future.result(timeout=300)  # 5 min timeout
-                
-            except RuntimeError:
-                # No event loop running - use asyncio.run (Terminal mode)
-                self.logger.debug("No running event loop - using asyncio.run()")
-                return asyncio.run(result)
+            self.logger.debug("Function returned coroutine - running on zCLI event loop")
+            return self.loop_runner.run(result)
         
         return result
 
@@ -20,6 +20,8 @@ import point, simplifying internal imports within the zFunc subsystem.
 1. **Tier 1 (Foundation)**: Core building blocks
    - func_resolver.py: Function resolution and loading
    - func_args.py: Argument parsing with context injection
+   - func_cache.py: Callable cache + injection plans
+   - func_loop.py: Persistent event loop for async functions
 
 2. **Tier 2 (Package Aggregator)**: This module ⬅️
    - Aggregates and exposes all Tier 1 components
@@ -34,7 +36,7 @@ import point, simplifying internal imports within the zFunc subsystem.
 
 Public API Overview
 -------------------
-This module exposes 3 functions from Tier 1:
+This module exposes 6 names from Tier 1:
 
 **Argument Parsing** (from func_args.py):
 - `parse_arguments()`: Parse function arguments with context injection support
@@ -49,6 +51,15 @@ This module exposes 3 functions from Tier 1:
   - Uses importlib for module loading
   - Validates file existence, spec, loader, function existence
 
+**Callable Cache** (from func_cache.py):
+- `CallableCache`: Resolved callables keyed by (file path, function name),
+  revalidated by mtime/size, modules shared with zLoader's PluginCache
+- `injection_plan()`: Memoized zcli/session/context parameter detection
+
+**Async Execution** (from func_loop.py):
+- `AsyncLoopRunner`: Long-lived event loop thread for coroutine results, with
+  timeouts/cancellation, loop-scoped resources and graceful drain
+
 Usage Patterns
 --------------
 **Standard Import Pattern**:
@@ -130,6 +141,18 @@ from .func_args import parse_arguments, split_arguments
 
 from .func_resolver import resolve_callable
 
+# ============================================================================
+# Tier 1: Foundation - Callable Cache
+# ============================================================================
+
+from .func_cache import CallableCache, injection_plan
+
+# ============================================================================
+# Tier 1: Foundation - Async Execution
+# ============================================================================
+
+from .func_loop import AsyncLoopRunner
+
 # ============================================================================
 # Public API
 # ============================================================================
@@ -138,4 +161,7 @@ __all__ = [
     "parse_arguments",    # Argument parsing with context injection (5 special types)
     "split_arguments",    # Argument string splitting with bracket matching
     "resolve_callable",   # Function resolution and loading via importlib
+    "CallableCache",      # (file, function) → callable + injection plan, mtime/size validated
+    "injection_plan",     # Memoized zcli/session/context parameter detection
+    "AsyncLoopRunner",    # Shared event loop thread for coroutine-returning functions
 ]
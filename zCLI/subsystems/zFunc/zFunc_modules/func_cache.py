@@ -0,0 +1,252 @@
+# zCLI/subsystems/zFunc/zFunc_modules/func_cache.py
+
+"""
+Compiled-Callable Cache for zFunc.
+
+resolve_callable() executes the target file on every call, and zFunc used to
+run inspect.signature() on every call as well - so each ``&plugin.fn(...)``
+step in a zUI menu or wizard re-imported the whole plugin. CallableCache keeps
+the resolved function and its injection plan instead.
+
+Architecture Position
+--------------------
+**Tier 1: Foundation** - used by the zFunc facade (Tier 3) in place of a
+direct resolve_callable() call.
+
+Cache Keys & Freshness
+----------------------
+- **Key**: (absolute file path, function name)
+- **Validation**: ``os.stat()`` per lookup; the entry is reused while the
+  file's ``st_mtime_ns`` and ``st_size`` are unchanged, otherwise the module
+  is loaded again. Functions from one file share a single module load.
+- **Eviction**: LRU, ``max_size`` entries (default 256).
+
+Sharing With zLoader.PluginCache
+--------------------------------
+Modules are loaded through zLoader's PluginCache (``zcli.loader.cache.
+plugin_cache``), so a file used both as a ``&plugin`` (zParser) and as a
+zFunc target is executed once and gets the same ``module.zcli`` injection.
+If another file with the same name is already registered there (a
+PluginCache name collision), the module is loaded privately via
+func_resolver.load_module() instead of failing.
+
+Injection Plans
+---------------
+injection_plan(func) returns the subset of ``zcli``/``session``/``context``
+that the function accepts - the result of inspect.signature(), computed
+once per function object.
+
+Usage Examples
+--------------
+    >>> cache = CallableCache(logger, plugin_cache=zcli.loader.cache.plugin_cache)
+    >>> func, plan = cache.resolve("/path/to/tools.py", "greet")
+    >>> "zcli" in plan
+    True
+    >>> cache.get_stats()["hits"]
+    0
+"""
+
+import threading
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from zCLI import os, inspect, Any, Callable, Dict, Optional, Tuple
+from .func_resolver import (
+    load_module, ERROR_MSG_FILE_NOT_FOUND, ERROR_MSG_FUNCTION_NOT_FOUND, ERROR_MSG_RESOLUTION_FAILED
+)
+
+
+# ============================================================================
+# Module Constants
+# ============================================================================
+
+DEFAULT_MAX_SIZE: int = 256
+
+# Parameters zFunc injects when a function declares them
+INJECTABLE_PARAMS: Tuple[str, ...] = ("zcli", "session", "context")
+
+# Error substring raised by PluginCache.load_and_cache on a name collision
+PLUGIN_COLLISION_MARKER: str = "collision"
+
+# Stats keys
+STAT_HITS: str = "hits"
+STAT_MISSES: str = "misses"
+STAT_LOADS: str = "loads"
+STAT_RELOADS: str = "reloads"
+STAT_SHARED: str = "shared"
+STAT_EVICTIONS: str = "evictions"
+
+# Log messages
+LOG_HIT: str = "[CallableCache HIT] %s > %s"
+LOG_LOAD: str = "[CallableCache LOAD] %s > %s"
+LOG_STALE: str = "[CallableCache STALE] %s (file changed)"
+LOG_PRIVATE: str = "[CallableCache] Plugin name taken by another file, loading %s privately"
+
+
+# ============================================================================
+# Injection Plans
+# ============================================================================
+
+_plans: "WeakKeyDictionary[Callable[..., Any], frozenset]" = WeakKeyDictionary()
+
+
+def injection_plan(func: Callable[..., Any]) -> frozenset:
+    """
+    Names from INJECTABLE_PARAMS that func accepts (memoized per function).
+
+    Raises whatever inspect.signature() raises for non-introspectable callables.
+    """
+    try:
+        return _plans[func]
+    except (KeyError, TypeError):
+        pass
+
+    parameters = inspect.signature(func).parameters
+    plan = frozenset(name for name in INJECTABLE_PARAMS if name in parameters)
+    try:
+        _plans[func] = plan
+    except TypeError:
+        pass  # Not weak-referenceable (some builtins) - recompute next time
+    return plan
+
+
+# ============================================================================
+# Callable Cache
+# ============================================================================
+
+class CallableCache:
+    """
+    LRU cache of (file path, function name) → (callable, injection plan).
+
+    A lock serializes lookups and loads, so zServer worker threads resolving
+    the same file never execute it twice.
+    """
+
+    def __init__(self, logger: Any, plugin_cache: Optional[Any] = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.logger = logger
+        self.plugin_cache = plugin_cache
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Callable[..., Any], frozenset]]" = OrderedDict()
+        self._modules: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.stats: Dict[str, int] = {
+            STAT_HITS: 0, STAT_MISSES: 0, STAT_LOADS: 0,
+            STAT_RELOADS: 0, STAT_SHARED: 0, STAT_EVICTIONS: 0,
+        }
+
+    def resolve(self, file_path: str, func_name: str) -> Tuple[Callable[..., Any], frozenset]:
+        """
+        Return (callable, injection plan), loading the file only when needed.
+
+        Raises the same errors as resolve_callable(): FileNotFoundError,
+        AttributeError (function missing) or the module's own import errors.
+        """
+        path = os.path.abspath(file_path)
+        with self._lock:
+            return self._resolve(path, func_name)
+
+    def _resolve(self, path: str, func_name: str) -> Tuple[Callable[..., Any], frozenset]:
+        """resolve() body, called with the lock held."""
+        stamp = self._stamp(path)
+        key = (path, func_name)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self._entries.move_to_end(key)
+            self.stats[STAT_HITS] += 1
+            self.logger.debug(LOG_HIT, path, func_name)
+            return entry[1], entry[2]
+
+        self.stats[STAT_MISSES] += 1
+        try:
+            module = self._module(path, stamp)
+            if not hasattr(module, func_name):
+                raise AttributeError(ERROR_MSG_FUNCTION_NOT_FOUND.format(func_name=func_name, file_path=path))
+        except Exception as e:
+            self.logger.error(ERROR_MSG_RESOLUTION_FAILED, path, func_name, str(e), exc_info=True)
+            raise
+
+        func = getattr(module, func_name)
+        plan = injection_plan(func)
+        self._entries[key] = (stamp, func, plan)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats[STAT_EVICTIONS] += 1
+        self.logger.debug(LOG_LOAD, path, func_name)
+        return func, plan
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """Drop entries for one file (all files when None)."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._modules.clear()
+                return
+            path = os.path.abspath(file_path)
+            self._modules.pop(path, None)
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/load counters plus current size."""
+        return dict(self.stats, size=len(self._entries), modules=len(self._modules), max_size=self.max_size)
+
+    # ------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------
+
+    def _stamp(self, path: str) -> Tuple[int, int]:
+        """(mtime_ns, size) of path; FileNotFoundError if it is gone."""
+        try:
+            info = os.stat(path)
+        except OSError as e:
+            self.invalidate(path)
+            raise FileNotFoundError(ERROR_MSG_FILE_NOT_FOUND.format(file_path=path)) from e
+        return info.st_mtime_ns, info.st_size
+
+    def _module(self, path: str, stamp: Tuple[int, int]) -> Any:
+        """Module for path at stamp (one load per file version)."""
+        known = self._modules.get(path)
+        if known is not None and known[0] == stamp:
+            return known[1]
+        if known is not None:
+            self.stats[STAT_RELOADS] += 1
+            self.logger.debug(LOG_STALE, path)
+
+        module = self._load(path, stale=known[1] if known is not None else None)
+        self._modules[path] = (stamp, module)
+        self.stats[STAT_LOADS] += 1
+        return module
+
+    def _load(self, path: str, stale: Optional[Any]) -> Any:
+        """Load through the PluginCache when possible, privately otherwise."""
+        if self.plugin_cache is None:
+            return load_module(path)
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        module = self.plugin_cache.get(name)
+        if module is not None and module is stale:
+            # PluginCache only checks mtime; the file's size changed under us
+            self.plugin_cache.invalidate(name)
+            module = None
+        if module is not None:
+            if os.path.abspath(getattr(module, "__file__", "") or "") == path:
+                self.stats[STAT_SHARED] += 1
+                return module
+            self.logger.debug(LOG_PRIVATE, path)
+            return load_module(path)
+
+        try:
+            return self.plugin_cache.load_and_cache(path, name)
+        except ValueError as e:
+            if PLUGIN_COLLISION_MARKER in str(e).lower():
+                self.logger.debug(LOG_PRIVATE, path)
+                return load_module(path)
+            raise (e.__cause__ or e)  # Surface the module's own error, as resolve_callable does
+
+
+# ============================================================================
+# Module Metadata
+# ============================================================================
+
+__all__ = ["CallableCache", "injection_plan", "INJECTABLE_PARAMS"]
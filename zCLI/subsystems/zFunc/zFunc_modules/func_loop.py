@@ -0,0 +1,332 @@
+# zCLI/subsystems/zFunc/zFunc_modules/func_loop.py
+
+"""
+Persistent Event Loop for async zFunc/plugin coroutines.
+
+zFunc used to call ``asyncio.run(result)`` for every coroutine-returning
+function. That builds and tears down a whole event loop per call, and closes
+every aiohttp session, connection pool or background task the plugin created
+on it. AsyncLoopRunner owns one long-lived loop in a daemon thread instead;
+sync callers submit coroutines to it and block on the result.
+
+Architecture Position
+--------------------
+**Tier 1: Foundation** - used by the zFunc facade (Tier 3) in place of
+asyncio.run(); drained by zCLI.shutdown().
+
+Lifecycle
+---------
+- **Start**: lazily, on the first run()/submit()/resource() call.
+- **Run**: ``run(coro, timeout)`` submits with run_coroutine_threadsafe() and
+  waits. On timeout (or KeyboardInterrupt) the task is cancelled on the loop
+  and TimeoutError is raised to the caller.
+- **Shutdown**: ``shutdown(drain_timeout)`` waits for in-flight tasks, cancels
+  whatever is still running after drain_timeout, closes loop-scoped resources,
+  then stops and joins the thread. A later run() starts a fresh loop.
+
+Loop-Scoped Resources
+---------------------
+Objects bound to an event loop (aiohttp.ClientSession, asyncpg pools, ...)
+must be created and closed on the loop that uses them. ``resource(name,
+factory)`` creates one on first use - factory may be sync or async - and
+returns the same object on every later call; coroutines already running on
+the loop use ``await aresource(name, factory)`` instead. On shutdown each resource is
+closed with the given closer, or its own ``aclose()``/``close()`` (awaited
+when it returns an awaitable), in reverse creation order.
+
+Usage Examples
+--------------
+    >>> runner = AsyncLoopRunner(logger, default_timeout=30)
+    >>> runner.run(fetch_user(42))
+    {'id': 42, ...}
+    >>> session = runner.resource("http", aiohttp.ClientSession)
+    >>> runner.shutdown(drain_timeout=5)
+    {'drained': 0, 'cancelled': 0, 'resources': 1}
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections import OrderedDict
+from zCLI import inspect, Any, Callable, Dict, Optional, Tuple
+
+
+# ============================================================================
+# Module Constants
+# ============================================================================
+
+DEFAULT_TIMEOUT: float = 300.0
+DEFAULT_DRAIN_TIMEOUT: float = 5.0
+THREAD_NAME: str = "zFunc-loop"
+
+# Extra seconds shutdown() waits for resource closers after draining
+RESOURCE_CLOSE_GRACE: float = 5.0
+
+# Sentinel: "use default_timeout" (None means wait forever)
+_DEFAULT = object()
+
+# Shutdown summary keys
+SUMMARY_DRAINED: str = "drained"
+SUMMARY_CANCELLED: str = "cancelled"
+SUMMARY_RESOURCES: str = "resources"
+
+# Log messages
+LOG_STARTED: str = "[AsyncLoop] Event loop thread started"
+LOG_STOPPED: str = "[AsyncLoop] Event loop stopped (drained=%d, cancelled=%d, resources=%d)"
+LOG_TIMEOUT: str = "[AsyncLoop] Coroutine exceeded %.1fs - cancelled"
+LOG_NESTED: str = "[AsyncLoop] run() called from the loop thread - using a temporary loop"
+LOG_RESOURCE: str = "[AsyncLoop] Created loop resource '%s'"
+LOG_RESOURCE_CLOSE_FAILED: str = "[AsyncLoop] Failed to close resource '%s': %s"
+
+# Error messages
+ERROR_MSG_TIMEOUT: str = "Coroutine did not finish within {timeout}s and was cancelled"
+ERROR_MSG_RESOURCE_ON_LOOP: str = "resource() would block the event loop - use 'await aresource()' in coroutines"
+
+
+# ============================================================================
+# Async Loop Runner
+# ============================================================================
+
+class AsyncLoopRunner:
+    """
+    One event loop in a daemon thread, shared by all sync-context coroutine runs.
+
+    Thread-safe: zServer workers and the Terminal thread may call run() at the
+    same time; their coroutines interleave on the same loop.
+    """
+
+    def __init__(self, logger: Any, default_timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 drain_timeout: float = DEFAULT_DRAIN_TIMEOUT) -> None:
+        self.logger = logger
+        self.default_timeout = default_timeout
+        self.drain_timeout = drain_timeout
+        self._lock = threading.Lock()
+        self._resource_lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._resources: "OrderedDict[str, Tuple[Any, Optional[Callable[[Any], Any]]]]" = OrderedDict()
+
+    @property
+    def running(self) -> bool:
+        """True while the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return the loop."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(target=self._serve, args=(loop, ready), name=THREAD_NAME, daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+                self.logger.debug(LOG_STARTED)
+            return self._loop
+
+    def submit(self, coro: Any) -> "concurrent.futures.Future":
+        """Schedule coro on the loop without waiting (returns a concurrent Future)."""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def run(self, coro: Any, timeout: Any = _DEFAULT) -> Any:
+        """
+        Run coro on the loop and return its result.
+
+        Args:
+            coro: Coroutine object
+            timeout: Seconds to wait (default_timeout when omitted, None = no limit)
+
+        Raises:
+            TimeoutError: The coroutine overran timeout; it has been cancelled
+            Whatever the coroutine raises
+        """
+        if timeout is _DEFAULT:
+            timeout = self.default_timeout
+
+        if self._thread is threading.current_thread():
+            # Blocking the loop on its own task would deadlock
+            self.logger.debug(LOG_NESTED)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as helper:
+                return helper.submit(asyncio.run, coro).result()
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.logger.warning(LOG_TIMEOUT, timeout)
+            raise TimeoutError(ERROR_MSG_TIMEOUT.format(timeout=timeout)) from None
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+
+    def cancel_all(self) -> int:
+        """Cancel every task currently on the loop; returns how many."""
+        loop = self._loop
+        if loop is None:
+            return 0
+
+        async def _cancel() -> int:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            return len(tasks)
+
+        return asyncio.run_coroutine_threadsafe(_cancel(), loop).result()
+
+    # ------------------------------------------------------------------------
+    # Loop-scoped resources
+    # ------------------------------------------------------------------------
+
+    def resource(self, name: str, factory: Callable[[], Any],
+                 closer: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Return the resource registered as name, creating it on first use.
+
+        factory runs on the loop thread (so loop-bound objects attach to the
+        shared loop); it may return a value or an awaitable.
+        """
+        if self._thread is threading.current_thread():
+            raise RuntimeError(ERROR_MSG_RESOURCE_ON_LOOP)
+
+        with self._resource_lock:
+            entry = self._resources.get(name)
+            if entry is not None:
+                return entry[0]
+
+            async def _create() -> Any:
+                value = factory()
+                if inspect.isawaitable(value):
+                    value = await value
+                return value
+
+            value = self.run(_create())
+            self._resources[name] = (value, closer)
+            self.logger.debug(LOG_RESOURCE, name)
+            return value
+
+    async def aresource(self, name: str, factory: Callable[[], Any],
+                        closer: Optional[Callable[[Any], Any]] = None) -> Any:
+        """resource() for coroutines running on the loop."""
+        entry = self._resources.get(name)
+        if entry is not None:
+            return entry[0]
+
+        value = factory()
+        if inspect.isawaitable(value):
+            value = await value
+        with self._resource_lock:
+            entry = self._resources.get(name)
+            if entry is None:
+                self._resources[name] = (value, closer)
+                self.logger.debug(LOG_RESOURCE, name)
+                return value
+        # Another coroutine registered it while we awaited the factory
+        await self._close_resource(name, value, closer)
+        return entry[0]
+
+    def has_resource(self, name: str) -> bool:
+        """True if name is registered."""
+        return name in self._resources
+
+    def release(self, name: str) -> bool:
+        """Close and forget one resource; False if it was not registered."""
+        with self._resource_lock:
+            entry = self._resources.pop(name, None)
+        if entry is None:
+            return False
+        self.run(self._close_resource(name, *entry))
+        return True
+
+    # ------------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------------
+
+    def shutdown(self, drain_timeout: Optional[float] = None) -> Dict[str, int]:
+        """
+        Drain in-flight tasks, close resources and stop the loop thread.
+
+        Tasks still running after drain_timeout are cancelled.
+        """
+        if drain_timeout is None:
+            drain_timeout = self.drain_timeout
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        summary = {SUMMARY_DRAINED: 0, SUMMARY_CANCELLED: 0, SUMMARY_RESOURCES: 0}
+        if loop is None:
+            return summary
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._drain(drain_timeout), loop)
+            summary = future.result(timeout=drain_timeout + RESOURCE_CLOSE_GRACE)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=RESOURCE_CLOSE_GRACE)
+            if not thread.is_alive():
+                loop.close()
+
+        self.logger.debug(LOG_STOPPED, summary[SUMMARY_DRAINED], summary[SUMMARY_CANCELLED],
+                          summary[SUMMARY_RESOURCES])
+        return summary
+
+    # ------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Loop thread body."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    async def _drain(self, drain_timeout: float) -> Dict[str, int]:
+        """Wait for tasks, cancel stragglers, close resources (runs on the loop)."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        pending = set()
+        if tasks:
+            _done, pending = await asyncio.wait(tasks, timeout=drain_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        with self._resource_lock:
+            resources = list(self._resources.items())
+            self._resources.clear()
+        for name, (value, closer) in reversed(resources):
+            await self._close_resource(name, value, closer)
+
+        await asyncio.get_running_loop().shutdown_asyncgens()
+        return {
+            SUMMARY_DRAINED: len(tasks) - len(pending),
+            SUMMARY_CANCELLED: len(pending),
+            SUMMARY_RESOURCES: len(resources),
+        }
+
+    async def _close_resource(self, name: str, value: Any, closer: Optional[Callable[[Any], Any]]) -> None:
+        """Close one resource with closer, aclose() or close(); errors are logged."""
+        try:
+            if closer is not None:
+                result = closer(value)
+            elif hasattr(value, "aclose"):
+                result = value.aclose()
+            elif hasattr(value, "close"):
+                result = value.close()
+            else:
+                return
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(LOG_RESOURCE_CLOSE_FAILED, name, e)
+
+
+# ============================================================================
+# Module Metadata
+# ============================================================================
+
+__all__ = ["AsyncLoopRunner", "DEFAULT_TIMEOUT", "DEFAULT_DRAIN_TIMEOUT"]
@@ -39,12 +39,10 @@ Security Considerations
 
 Caching Behavior
 ----------------
-Python's importlib automatically caches loaded modules in sys.modules. This means:
-
-- **First call**: Module is loaded from disk and cached
-- **Subsequent calls**: Cached module is reused (fast)
-- **Cache key**: Based on module_name (derived from file basename)
-- **Implication**: Changes to the file require Python restart or manual cache invalidation
+resolve_callable() itself does not cache: every call executes the file again
+(modules are not registered in sys.modules). zFunc.handle() goes through
+func_cache.CallableCache instead, which keeps resolved callables per
+(file path, function name) and only reloads when the file's mtime/size change.
 
 Integration Points
 ------------------
@@ -103,6 +101,37 @@ ERROR_MSG_RESOLUTION_FAILED: str = "Failed to resolve callable from '%s > %s': %
 # Public API
 # ============================================================================
 
+def load_module(file_path: str) -> Any:
+    """
+    Load and execute a Python file as a module (no caching).
+
+    Module name is the file's basename without extension. Raises
+    FileNotFoundError if the file is missing and ValueError if importlib cannot
+    build a spec/loader for it; errors raised by the module's own top-level
+    code propagate unchanged.
+    """
+    # Validation 1: Check file existence
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(ERROR_MSG_FILE_NOT_FOUND.format(file_path=file_path))
+
+    # Load module from file
+    module_name = os.path.splitext(os.path.basename(file_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+
+    # Validation 2: Check if spec was created successfully
+    if spec is None:
+        raise ValueError(ERROR_MSG_SPEC_NONE.format(file_path=file_path))
+
+    # Validation 3: Check if spec has a loader
+    if spec.loader is None:
+        raise ValueError(ERROR_MSG_LOADER_NONE.format(file_path=file_path))
+
+    # Create module from spec and execute it
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def resolve_callable(
     file_path: str,
     func_name: str,
@@ -187,15 +216,14 @@ def resolve_callable(
         
     Notes
     -----
-    - **Caching**: Loaded modules are cached by importlib in sys.modules.
-      Subsequent calls with the same file_path will reuse the cached module.
+    - **Caching**: None here - the file is executed on every call. Use
+      func_cache.CallableCache for repeated calls.
       
     - **Security**: This function executes code from the target file during import.
       Only use with trusted sources. Consider path whitelisting in production.
       
     - **Module Name**: The module name is derived from the file's basename
-      (without extension). This means files with the same basename will share
-      the same cache entry.
+      (without extension).
       
     - **Top-level Code**: Any code at module level in the target file will
       execute during import. Avoid side effects in target files.
@@ -208,25 +236,8 @@ def resolve_callable(
         logger_instance.debug(DEBUG_MSG_FILE_PATH, file_path)
         logger_instance.debug(DEBUG_MSG_FUNCTION_NAME, func_name)
 
-        # Validation 1: Check file existence
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(ERROR_MSG_FILE_NOT_FOUND.format(file_path=file_path))
-
-        # Load module from file
-        module_name = os.path.splitext(os.path.basename(file_path))[0]
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        
-        # Validation 2: Check if spec was created successfully
-        if spec is None:
-            raise ValueError(ERROR_MSG_SPEC_NONE.format(file_path=file_path))
-        
-        # Validation 3: Check if spec has a loader
-        if spec.loader is None:
-            raise ValueError(ERROR_MSG_LOADER_NONE.format(file_path=file_path))
-        
-        # Create module from spec and execute it
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Validations 1-3 + module execution
+        module = load_module(file_path)
 
         # Validation 4: Check if function exists in module before attempting getattr
         if not hasattr(module, func_name):
@@ -285,4 +296,4 @@ def resolve_callable(
 # Module Metadata
 # ============================================================================
 
-__all__ = ["resolve_callable"]
+__all__ = ["load_module", "resolve_callable"]
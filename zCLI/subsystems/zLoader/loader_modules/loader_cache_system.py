@@ -40,6 +40,10 @@ Key Features
 5. **Pattern-Based Clearing**: Supports wildcard patterns for bulk cache invalidation
    (e.g., "ui_*" clears all UI files).
 
+6. **Derived Plans**: get_plan() keeps objects compiled from a cached value's
+   members (zWizard BlockPlans for zBlocks of a cached UI) next to the entry and
+   drops them whenever the entry goes (stale mtime, invalidate, clear, eviction).
+
 Design Decisions
 ----------------
 1. **OrderedDict for LRU**: Python's OrderedDict with move_to_end() provides O(1)
@@ -163,7 +167,7 @@ Version History
 - v1.5.3: Original implementation (186 lines, basic LRU + mtime)
 """
 
-from zCLI import os, time, OrderedDict, Any, Dict, Optional
+from zCLI import os, time, OrderedDict, Any, Callable, Dict, Optional, Tuple
 from zCLI.subsystems.zConfig.zConfig_modules import SESSION_KEY_ZCACHE, ZCACHE_KEY_SYSTEM
 
 # ============================================================================
@@ -180,6 +184,7 @@ LOG_PREFIX_EVICT: str = "[SystemCache EVICT]"
 LOG_PREFIX_INVALIDATE: str = "[SystemCache INVALIDATE]"
 LOG_PREFIX_CLEAR: str = "[SystemCache CLEAR]"
 LOG_PREFIX_ERROR: str = "[SystemCache ERROR]"
+LOG_PREFIX_PLAN: str = "[SystemCache PLAN]"
 
 # Statistics Keys
 STAT_KEY_HITS: str = "hits"
@@ -190,6 +195,9 @@ STAT_KEY_NAMESPACE: str = "namespace"
 STAT_KEY_SIZE: str = "size"
 STAT_KEY_MAX_SIZE: str = "max_size"
 STAT_KEY_HIT_RATE: str = "hit_rate"
+STAT_KEY_PLANS: str = "plans"
+STAT_KEY_PLAN_HITS: str = "plan_hits"
+STAT_KEY_PLAN_COMPILES: str = "plan_compiles"
 
 # Entry Keys (cache entry structure)
 ENTRY_KEY_DATA: str = "data"
@@ -225,6 +233,7 @@ class SystemCache:
         logger (Any): Logger instance for debug/error messages
         max_size (int): Maximum number of entries before LRU eviction (default: 100)
         stats (Dict[str, int]): Statistics dict tracking hits, misses, evictions, invalidations
+        _plans (Dict[int, Tuple[str, Any, Any]]): id(member) → (entry key, member, plan)
 
     Cache Strategy:
         - **LRU Eviction**: Oldest accessed entry evicted when cache exceeds max_size
@@ -262,9 +271,14 @@ class SystemCache:
             STAT_KEY_HITS: 0,
             STAT_KEY_MISSES: 0,
             STAT_KEY_EVICTIONS: 0,
-            STAT_KEY_INVALIDATIONS: 0
+            STAT_KEY_INVALIDATIONS: 0,
+            STAT_KEY_PLAN_HITS: 0,
+            STAT_KEY_PLAN_COMPILES: 0
         }
 
+        # Plans compiled from cached values (not stored in session - not serializable)
+        self._plans: Dict[int, Tuple[str, Any, Any]] = {}
+
         # Ensure namespace exists in session
         self._ensure_namespace()
 
@@ -415,12 +429,14 @@ class SystemCache:
                             key, cached_mtime, current_mtime
                         )
                         del cache[key]
+                        self._drop_plans(key)
                         return default
                 except OSError:
                     # File doesn't exist anymore - invalidate
                     self.stats[STAT_KEY_INVALIDATIONS] += 1
                     self.logger.debug(LOG_PREFIX_INVALID + " %s (file not found)", key)
                     del cache[key]
+                    self._drop_plans(key)
                     return default
 
             # Cache hit - move to end (most recent)
@@ -483,15 +499,17 @@ class SystemCache:
                 except OSError:
                     pass  # File doesn't exist, skip mtime tracking
 
-            # Store entry and mark as most recent
+            # Store entry and mark as most recent (plans of a replaced value are obsolete)
             cache[key] = entry
             cache.move_to_end(key)
+            self._drop_plans(key)
 
             self.logger.debug(LOG_PREFIX_SET + " %s", key)
 
             # Evict oldest entries if over limit (LRU)
             while len(cache) > self.max_size:
                 evicted_key, evicted_entry = cache.popitem(last=False)
+                self._drop_plans(evicted_key)
                 self.stats[STAT_KEY_EVICTIONS] += 1
                 self.logger.debug(
                     LOG_PREFIX_EVICT + " %s (age: %.1fs, hits: %d)",
@@ -520,6 +538,7 @@ class SystemCache:
             cache = self._cache
             if key in cache:
                 del cache[key]
+                self._drop_plans(key)
                 self.stats[STAT_KEY_INVALIDATIONS] += 1
                 self.logger.debug(LOG_PREFIX_INVALIDATE + " %s", key)
         except Exception as e:
@@ -561,6 +580,7 @@ class SystemCache:
                 keys_to_delete = [k for k in cache.keys() if self._matches_pattern(k, pattern)]
                 for key in keys_to_delete:
                     del cache[key]
+                    self._drop_plans(key)
                 self.logger.debug(
                     LOG_PREFIX_CLEAR + " %d entries matching '%s'",
                     len(keys_to_delete), pattern
@@ -569,11 +589,67 @@ class SystemCache:
                 # Clear entire cache
                 count = len(cache)
                 cache.clear()
+                self._plans.clear()
                 self.logger.debug(LOG_PREFIX_CLEAR + " %d entries", count)
 
         except Exception as e:
             self.logger.debug(LOG_PREFIX_ERROR + " clear - %s", e)
 
+    def get_plan(self, member: Any, compile_fn: Callable[[Any], Any]) -> Any:
+        """
+        Get a plan compiled from a member of a cached value, compiling it on first use.
+
+        The plan lives as long as the cache entry whose value contains member
+        (e.g. a zBlock dict of a cached UI file). Members of no cached entry are
+        compiled on every call and not stored.
+
+        Args:
+            member (Any): Object the plan is derived from (identity is the key)
+            compile_fn (Callable[[Any], Any]): Builds the plan; the plan's
+                matches(member) is checked on reuse if it defines one
+
+        Returns:
+            Any: The compiled plan
+
+        Examples:
+            >>> ui = cache.get("zUI_/app/zUI.main.yaml", filepath=path)
+            >>> plan = cache.get_plan(ui["Root"], compile_block_plan)
+        """
+        held = self._plans.get(id(member))
+        if held is not None and held[1] is member:
+            plan = held[2]
+            matches = getattr(plan, "matches", None)
+            if matches is None or matches(member):
+                self.stats[STAT_KEY_PLAN_HITS] += 1
+                return plan
+
+        plan = compile_fn(member)
+        self.stats[STAT_KEY_PLAN_COMPILES] += 1
+        owner = self._find_owner(member)
+        if owner is not None:
+            self._plans[id(member)] = (owner, member, plan)
+            self.logger.debug(LOG_PREFIX_PLAN + " compiled for %s", owner)
+        return plan
+
+    def _find_owner(self, member: Any) -> Optional[str]:
+        """Key of the cached entry whose (dict) value holds member, or None."""
+        try:
+            for key, entry in self._cache.items():
+                data = entry.get(ENTRY_KEY_DATA)
+                if data is member:
+                    return key
+                if isinstance(data, dict) and any(value is member for value in data.values()):
+                    return key
+        except Exception as e:
+            self.logger.debug(LOG_PREFIX_ERROR + " plan owner - %s", e)
+        return None
+
+    def _drop_plans(self, key: str) -> None:
+        """Forget plans derived from the entry at key."""
+        if self._plans:
+            for member_id in [mid for mid, held in self._plans.items() if held[0] == key]:
+                del self._plans[member_id]
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Return comprehensive cache statistics.
@@ -588,6 +664,8 @@ class SystemCache:
                 - hit_rate (str): Hit rate percentage (formatted as "87.2%")
                 - evictions (int): Total LRU evictions
                 - invalidations (int): Total explicit/automatic invalidations
+                - plans (int): Compiled plans currently held (see get_plan())
+                - plan_hits / plan_compiles (int): Plan reuse vs compilation
 
         Examples:
             >>> stats = cache.get_stats()
@@ -609,7 +687,10 @@ class SystemCache:
                 STAT_KEY_MISSES: self.stats[STAT_KEY_MISSES],
                 STAT_KEY_HIT_RATE: f"{hit_rate:.1f}%",
                 STAT_KEY_EVICTIONS: self.stats[STAT_KEY_EVICTIONS],
-                STAT_KEY_INVALIDATIONS: self.stats[STAT_KEY_INVALIDATIONS]
+                STAT_KEY_INVALIDATIONS: self.stats[STAT_KEY_INVALIDATIONS],
+                STAT_KEY_PLANS: len(self._plans),
+                STAT_KEY_PLAN_HITS: self.stats[STAT_KEY_PLAN_HITS],
+                STAT_KEY_PLAN_COMPILES: self.stats[STAT_KEY_PLAN_COMPILES]
             }
         except Exception:
             return {}
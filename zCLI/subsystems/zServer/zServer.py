@@ -14,6 +14,11 @@ from pathlib import Path
 from functools import partial
 
 from .zServer_modules.handler import LoggingHTTPRequestHandler
+from .zServer_modules.threaded_server import PooledHTTPServer, DEFAULT_MAX_WORKERS, DEFAULT_BACKLOG
+
+# Development mode concurrency (mirrors zConfig.http_server.concurrency)
+CONCURRENCY_SINGLE = "single"
+CONCURRENCY_THREADED = "threaded"
 
 
 class zServer:
@@ -26,10 +31,13 @@ class zServer:
     - Integrates with zCLI logger
     - CORS enabled for local development
     - Directory listing disabled for security
+    - Optional thread-pool serving (concurrency="threaded")
+    - Optional precompressed static assets (precompress=True → .gz/.br sidecars)
     """
     
     def __init__(self, logger, *, zcli, config=None, port=None, host=None, serve_path=None, 
-                 static_folder=None, template_folder=None, routes_file=None):
+                 static_folder=None, template_folder=None, routes_file=None,
+                 concurrency=None, max_workers=None, backlog=None, precompress=None):
         """
         Initialize zServer subsystem (v1.5.8: Independent subsystem with config object support).
         
@@ -43,6 +51,10 @@ class zServer:
             static_folder: Static files folder (deprecated: use config object)
             template_folder: Jinja2 templates folder (deprecated: use config object)
             routes_file: Optional zServer.*.yaml file (deprecated: use config object)
+            concurrency: "single" (default) or "threaded" worker pool (deprecated: use config object)
+            max_workers: Worker pool size for threaded mode (deprecated: use config object)
+            backlog: Pending connection queue size (deprecated: use config object)
+            precompress: Precompress static assets on start (deprecated: use config object)
         
         Note:
             Prefer using config object for full zCLI integration.
@@ -59,6 +71,10 @@ class zServer:
             self.host = config.host
             self.serve_path = config.serve_path
             self.routes_file = config.routes_file  # Kept for backward compatibility
+            self.concurrency = getattr(config, 'concurrency', CONCURRENCY_SINGLE)
+            self.max_workers = getattr(config, 'max_workers', DEFAULT_MAX_WORKERS)
+            self.backlog = getattr(config, 'backlog', DEFAULT_BACKLOG)
+            self.precompress = getattr(config, 'precompress', False)
         else:
             # Backward compatibility: individual parameters (assume enabled if instantiated this way)
             self.enabled = True
@@ -66,8 +82,13 @@ class zServer:
             self.host = host if host is not None else "127.0.0.1"
             serve_path = serve_path if serve_path is not None else "."
             self.routes_file = routes_file  # Kept for backward compatibility
+            self.concurrency = concurrency if concurrency is not None else CONCURRENCY_SINGLE
+            self.max_workers = max_workers if max_workers is not None else DEFAULT_MAX_WORKERS
+            self.backlog = backlog if backlog is not None else DEFAULT_BACKLOG
+            self.precompress = bool(precompress)
         
         self.router = None
+        self.compression_report = None  # Set by precompress_static()
         self.static_folder = static_folder if static_folder is not None else "static"
         self.template_folder = template_folder if template_folder is not None else "templates"
         self.ui_folder = "UI"  # zUI zVaF files folder (convention)
@@ -343,6 +364,9 @@ class zServer:
                 
                 self.logger.info(f"[zServer] Schema initialized: {filename} ({len(table_names)} table(s))")
                 
+                # Hand the connection to the zData pool for the first requests
+                self.zcli.data.disconnect()
+                
             except Exception as e:
                 self.logger.warning(f"[zServer] Failed to initialize schema {filename}: {e}")
                 import traceback
@@ -388,6 +412,10 @@ class zServer:
             self.logger.warning("[zServer] Server is already running")
             return
         
+        # Build step: write .gz/.br sidecars before the first request
+        if self.precompress:
+            self.precompress_static()
+        
         # Check deployment mode and route to correct server type
         deployment = self._get_deployment().lower()
         
@@ -396,6 +424,28 @@ class zServer:
         else:
             self._start_development()
     
+    def precompress_static(self):
+        """
+        Precompress static assets into .gz/.br sidecars (build/startup step).
+        
+        Unchanged files (same content hash) are skipped on re-runs. Handlers
+        then serve the best sidecar per request via Accept-Encoding.
+        
+        Returns:
+            list: Per-asset report (original, gzip, br, saved bytes)
+        """
+        from .zServer_modules.compression import precompress_assets, resolve_manifest_dir
+        
+        static_root = os.path.join(self.serve_path, self.static_folder)
+        try:
+            self.compression_report = precompress_assets(
+                static_root, logger=self.logger, manifest_dir=resolve_manifest_dir(self.zcli)
+            )
+        except Exception as e:
+            self.logger.warning(f"[zServer] Precompress failed: {e}")
+            self.compression_report = []
+        return self.compression_report
+    
     def _start_production(self):
         """
         Start Gunicorn subprocess (Production mode).
@@ -453,8 +503,18 @@ class zServer:
                 serve_path=self.serve_path
             )
             
-            # Create HTTP server
-            self.server = HTTPServer((self.host, self.port), handler)
+            # Create HTTP server (single-threaded or bounded worker pool)
+            if self.concurrency == CONCURRENCY_THREADED:
+                self.server = PooledHTTPServer(
+                    (self.host, self.port),
+                    handler,
+                    max_workers=self.max_workers,
+                    backlog=self.backlog,
+                    logger=self.logger
+                )
+                self.logger.info(f"[zServer] Threaded serving: {self.max_workers} workers, backlog {self.backlog}")
+            else:
+                self.server = HTTPServer((self.host, self.port), handler)
             self._running = True
             
             # Start server in background thread
@@ -721,12 +781,33 @@ app = zServerWSGIApp(server_config)
                 - port (int): Server port
                 - url (str|None): Server URL (None if not running)
                 - serve_path (str): Directory being served
+                - concurrency (str): "single" or "threaded"
+                - workers (dict|None): Worker pool stats (threaded mode, while running)
+                - templates (dict|None): Jinja2 template cache hits/misses (once rendered)
+                - static_files (dict): Static file stat cache entries/hits/misses
+                - compression (dict|None): Precompress totals (once precompress_static() ran)
+                - pages (dict): Rendered-page cache entries/bytes/hits/misses
         """
+        from .zServer_modules.template_cache import get_template_cache_stats
+        from .zServer_modules.static_files import get_stat_cache
+        from .zServer_modules.compression import summarize_report
+        from .zServer_modules.page_cache import get_page_cache
+        
+        workers = None
+        if self._running and isinstance(self.server, PooledHTTPServer):
+            workers = self.server.get_stats()
+        
         return {
             "running": self._running,
             "host": self.host,
             "port": self.port,
             "url": self.get_url() if self._running else None,
-            "serve_path": self.serve_path
+            "serve_path": self.serve_path,
+            "concurrency": self.concurrency,
+            "workers": workers,
+            "templates": get_template_cache_stats(os.path.join(self.serve_path, self.template_folder)),
+            "static_files": get_stat_cache().get_stats(),
+            "compression": summarize_report(self.compression_report) if self.compression_report is not None else None,
+            "pages": get_page_cache().get_stats()
         }
 
@@ -5,12 +5,24 @@ zServer modules for HTTP server functionality
 """
 
 from .handler import LoggingHTTPRequestHandler
+from .threaded_server import PooledHTTPServer
+from .template_cache import get_template_cache, get_template_cache_stats
+from .static_files import get_stat_cache
+from .compression import precompress_assets, format_compression_report
+from .page_cache import get_page_cache
 from .wsgi_app import zServerWSGIApp
 from .gunicorn_manager import GunicornManager
 from .error_pages import get_error_page, has_error_page, DEFAULT_ERROR_PAGES
 
 __all__ = [
     'LoggingHTTPRequestHandler',
+    'PooledHTTPServer',
+    'get_template_cache',
+    'get_template_cache_stats',
+    'get_stat_cache',
+    'precompress_assets',
+    'format_compression_report',
+    'get_page_cache',
     'zServerWSGIApp',
     'GunicornManager',
     'get_error_page',
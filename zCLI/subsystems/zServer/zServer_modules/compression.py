@@ -0,0 +1,444 @@
+# zCLI/subsystems/zServer/zServer_modules/compression.py
+
+"""
+Response compression for zServer: precompressed sidecars + on-the-fly HTML
+
+Build/startup step:
+    precompress_assets() walks a folder (static/, zTheme, Bifrost client) and
+    writes `<file>.gz` (and `<file>.br` when the optional `brotli` package is
+    installed) next to each compressible asset. A manifest keyed by content
+    hash lets re-runs skip unchanged files; it is kept in a cache directory
+    outside the served folder (one file per root), never next to the assets.
+
+Request time:
+    select_variant() negotiates Accept-Encoding against the sidecars that exist
+    (and are newer than their source) so the handler / WSGI app can send the
+    smallest variant with no CPU cost. compress_body() compresses dynamic HTML
+    (PageRenderer) on the fly when no sidecar can exist.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from .static_files import FileInfo, get_stat_cache
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+# Sidecar suffix per encoding, in server preference order
+SIDECAR_SUFFIXES = {ENCODING_BROTLI: ".br", ENCODING_GZIP: ".gz"}
+ENCODING_PREFERENCE = (ENCODING_BROTLI, ENCODING_GZIP)
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css", ".js", ".mjs", ".json", ".html", ".htm", ".svg", ".txt",
+    ".xml", ".yaml", ".yml", ".map", ".ttf", ".otf", ".eot", ".ico",
+)
+COMPRESS_MIN_SIZE = 1024  # Smaller bodies are not worth the header + CPU overhead
+
+# Build step compresses once, so use maximum ratio; dynamic HTML trades ratio for speed
+PRECOMPRESS_GZIP_LEVEL = 9
+PRECOMPRESS_BROTLI_QUALITY = 11
+DYNAMIC_GZIP_LEVEL = 6
+DYNAMIC_BROTLI_QUALITY = 4
+
+MANIFEST_SUBDIR = "zcompress"          # <cache dir>/zcompress/<root hash>.json
+HASH_LENGTH = 16
+
+
+# =============================================================================
+# ACCEPT-ENCODING NEGOTIATION
+# =============================================================================
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Parse Accept-Encoding into {coding: qvalue}.
+
+    Args:
+        accept_encoding: Header value (e.g., "gzip, br;q=0.9, *;q=0")
+
+    Returns:
+        dict: Lower-cased codings mapped to their q-values
+    """
+    codings: Dict[str, float] = {}
+    if not accept_encoding:
+        return codings
+
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        qvalue = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                qvalue = float(params[2:])
+            except ValueError:
+                qvalue = 0.0
+        codings[coding] = qvalue
+    return codings
+
+
+def choose_encoding(accept_encoding: Optional[str], available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Pick the best encoding the client accepts from `available`.
+
+    Highest q-value wins; ties go to server preference (br before gzip).
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        available: Encodings the server can send for this response
+
+    Returns:
+        Optional[str]: Chosen encoding, or None for identity
+    """
+    codings = parse_accept_encoding(accept_encoding)
+    if not codings:
+        return None
+
+    wildcard = codings.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in available:
+            continue
+        qvalue = codings.get(encoding, wildcard)
+        if qvalue > best_q:
+            best, best_q = encoding, qvalue
+    return best
+
+
+def is_compressible(path: str) -> bool:
+    """Whether a file extension benefits from compression."""
+    return path.lower().endswith(COMPRESSIBLE_EXTENSIONS)
+
+
+# =============================================================================
+# REQUEST-TIME HELPERS
+# =============================================================================
+
+def select_variant(info: FileInfo, accept_encoding: Optional[str]) -> Tuple[FileInfo, Optional[str], bool]:
+    """
+    Pick the precompressed sidecar to send for a static file.
+
+    Sidecars older than their source are ignored, so an edited asset is served
+    uncompressed until the next precompress run instead of going stale.
+
+    Args:
+        info: FileInfo of the original file
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        Tuple of (info_to_send, content_encoding, vary):
+            - info_to_send: Sidecar FileInfo (with original content type and a
+              per-encoding ETag), or the original info
+            - content_encoding: "br"/"gzip", or None for identity
+            - vary: True when sidecars exist (response must Vary: Accept-Encoding)
+    """
+    if not is_compressible(info.path):
+        return info, None, False
+
+    stat_cache = get_stat_cache()
+    variants: Dict[str, FileInfo] = {}
+    for encoding, suffix in SIDECAR_SUFFIXES.items():
+        sidecar = stat_cache.get(info.path + suffix)
+        if sidecar is not None and not sidecar.is_dir and sidecar.mtime >= info.mtime:
+            variants[encoding] = sidecar
+
+    if not variants:
+        return info, None, False
+
+    encoding = choose_encoding(accept_encoding, tuple(variants))
+    if encoding is None:
+        return info, None, True
+
+    sidecar = variants[encoding]
+    return sidecar._replace(
+        content_type=info.content_type,
+        etag=f'{info.etag[:-1]}-{SIDECAR_SUFFIXES[encoding][1:]}"'
+    ), encoding, True
+
+
+def compress_body(body: bytes, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress a dynamic response body (e.g., PageRenderer HTML) on the fly.
+
+    Args:
+        body: Uncompressed response body
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        Tuple of (body, content_encoding) - encoding is None when sent as-is
+    """
+    if len(body) < COMPRESS_MIN_SIZE:
+        return body, None
+
+    available = (ENCODING_BROTLI, ENCODING_GZIP) if BROTLI_AVAILABLE else (ENCODING_GZIP,)
+    encoding = choose_encoding(accept_encoding, available)
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(body, quality=DYNAMIC_BROTLI_QUALITY), encoding
+    if encoding == ENCODING_GZIP:
+        return gzip.compress(body, compresslevel=DYNAMIC_GZIP_LEVEL, mtime=0), encoding
+    return body, None
+
+
+# =============================================================================
+# BUILD / STARTUP STEP
+# =============================================================================
+
+def _content_hash(data: bytes) -> str:
+    """Short sha256 of file content (manifest key for change detection)."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def resolve_manifest_dir(zcli: Any) -> Optional[str]:
+    """
+    Resolve the manifest directory from zCLI paths (user cache dir).
+
+    Args:
+        zcli: zCLI instance (may be None or lack config paths)
+
+    Returns:
+        Optional[str]: <user_cache_dir>/zcompress, or None for the default
+    """
+    try:
+        cache_dir = zcli.config.sys_paths.user_cache_dir
+    except Exception:
+        return None
+    if not isinstance(cache_dir, (str, os.PathLike)):
+        return None
+    return os.path.join(os.fspath(cache_dir), MANIFEST_SUBDIR)
+
+
+def manifest_path(root: str, manifest_dir: Optional[str] = None) -> str:
+    """
+    Path of the precompress manifest for a served folder.
+
+    Args:
+        root: Absolute folder being precompressed
+        manifest_dir: Manifest directory (default: <tmp>/zcompress)
+
+    Returns:
+        str: <manifest_dir>/<hash of root>.json - outside the served folder
+    """
+    directory = manifest_dir or os.path.join(tempfile.gettempdir(), MANIFEST_SUBDIR)
+    return os.path.join(directory, f"{_content_hash(root.encode('utf-8'))}.json")
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    """Load a precompress manifest (empty if missing/corrupt)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sidecar(path: str, data: bytes, mtime: float) -> None:
+    """Write a sidecar atomically, stamped no older than its source."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    os.utime(path, (mtime, mtime))
+
+
+def precompress_assets(
+    root: str,
+    min_size: int = COMPRESS_MIN_SIZE,
+    write: bool = True,
+    logger: Optional[Any] = None,
+    manifest_dir: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Precompress every compressible asset under root into .gz/.br sidecars.
+
+    Files whose content hash matches the manifest (and whose sidecars still
+    exist) are skipped. A sidecar is only kept when it is smaller than the
+    original.
+
+    Args:
+        root: Folder to walk (e.g., serve_path/static or the zTheme folder)
+        min_size: Skip files smaller than this many bytes
+        write: False = dry run (compute sizes, write nothing)
+        logger: Optional zCLI logger
+        manifest_dir: Where the manifest lives (see resolve_manifest_dir())
+
+    Returns:
+        list: One report entry per asset:
+            {"path", "hash", "original", "gzip", "br", "saved", "cached"}
+    """
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        return []
+
+    manifest_file = manifest_path(root, manifest_dir)
+    manifest = _load_manifest(manifest_file)
+    new_manifest: Dict[str, Any] = {}
+    report: List[Dict[str, Any]] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if not is_compressible(path):
+                continue
+
+            try:
+                st = os.stat(path)
+                if st.st_size < min_size:
+                    continue
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                if logger:
+                    logger.warning(f"[zServer] Precompress skipped {path}: {e}")
+                continue
+
+            rel_path = os.path.relpath(path, root)
+            digest = _content_hash(data)
+            previous = manifest.get(rel_path)
+
+            cached = bool(
+                previous and previous.get("hash") == digest
+                and all(os.path.exists(path + SIDECAR_SUFFIXES[enc]) for enc in previous.get("encodings", []))
+            )
+
+            if cached:
+                sizes = {enc: previous.get(enc) for enc in SIDECAR_SUFFIXES}
+            else:
+                sizes = {ENCODING_GZIP: None, ENCODING_BROTLI: None}
+                compressed = {
+                    ENCODING_GZIP: gzip.compress(data, compresslevel=PRECOMPRESS_GZIP_LEVEL, mtime=0)
+                }
+                if BROTLI_AVAILABLE:
+                    compressed[ENCODING_BROTLI] = brotli.compress(data, quality=PRECOMPRESS_BROTLI_QUALITY)
+
+                for encoding, payload in compressed.items():
+                    sidecar_path = path + SIDECAR_SUFFIXES[encoding]
+                    if len(payload) >= len(data):
+                        if write and os.path.exists(sidecar_path):
+                            os.remove(sidecar_path)
+                        continue
+                    sizes[encoding] = len(payload)
+                    if write:
+                        _write_sidecar(sidecar_path, payload, st.st_mtime)
+
+            encodings = [enc for enc, size in sizes.items() if size]
+            best = min([size for size in sizes.values() if size] or [len(data)])
+            entry = {
+                "path": rel_path,
+                "hash": digest,
+                "original": len(data),
+                ENCODING_GZIP: sizes.get(ENCODING_GZIP),
+                ENCODING_BROTLI: sizes.get(ENCODING_BROTLI),
+                "saved": len(data) - best,
+                "cached": cached,
+            }
+            report.append(entry)
+            new_manifest[rel_path] = {
+                "hash": digest,
+                "encodings": encodings,
+                ENCODING_GZIP: entry[ENCODING_GZIP],
+                ENCODING_BROTLI: entry[ENCODING_BROTLI],
+            }
+
+    if write:
+        try:
+            os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(new_manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            if logger:
+                logger.warning(f"[zServer] Could not write precompress manifest: {e}")
+        # Sidecars were (re)written - drop stale stat entries
+        get_stat_cache().invalidate()
+
+    if logger:
+        summary = summarize_report(report)
+        logger.info(
+            f"[zServer] Precompressed {summary['assets']} assets in {root}: "
+            f"{summary['original']} → {summary['compressed']} bytes ({summary['saved_pct']} saved)"
+        )
+
+    return report
+
+
+def summarize_report(report: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Totals for a precompress report.
+
+    Returns:
+        dict: assets, original, compressed, saved, saved_pct
+    """
+    original = sum(entry["original"] for entry in report)
+    saved = sum(entry["saved"] for entry in report)
+    return {
+        "assets": len(report),
+        "original": original,
+        "compressed": original - saved,
+        "saved": saved,
+        "saved_pct": f"{(saved / original * 100):.1f}%" if original else "0.0%",
+    }
+
+
+def format_compression_report(report: List[Dict[str, Any]]) -> str:
+    """
+    Render a precompress report as a bytes-saved-per-asset table.
+
+    Args:
+        report: Output of precompress_assets()
+
+    Returns:
+        str: Multi-line table with a totals row
+    """
+    def _size(value):
+        return "-" if not value else str(value)
+
+    width = max([len(entry["path"]) for entry in report] + [len("asset")])
+    lines = [
+        f"{'asset':<{width}} | {'original':>9} | {'gzip':>9} | {'br':>9} | {'saved':>9} | {'saved %':>7}",
+        "-" * (width + 62),
+    ]
+    for entry in report:
+        pct = entry["saved"] / entry["original"] * 100 if entry["original"] else 0.0
+        lines.append(
+            f"{entry['path']:<{width}} | {entry['original']:>9} | {_size(entry[ENCODING_GZIP]):>9} | "
+            f"{_size(entry[ENCODING_BROTLI]):>9} | {entry['saved']:>9} | {pct:>6.1f}%"
+        )
+
+    summary = summarize_report(report)
+    lines.append("-" * (width + 62))
+    lines.append(
+        f"{'TOTAL':<{width}} | {summary['original']:>9} | {'':>9} | {'':>9} | "
+        f"{summary['saved']:>9} | {summary['saved_pct']:>7}"
+    )
+    return "\n".join(lines)
+
+
+# Module exports
+__all__ = [
+    'BROTLI_AVAILABLE',
+    'parse_accept_encoding',
+    'choose_encoding',
+    'is_compressible',
+    'select_variant',
+    'compress_body',
+    'precompress_assets',
+    'summarize_report',
+    'format_compression_report',
+]
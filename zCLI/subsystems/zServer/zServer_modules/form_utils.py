@@ -46,6 +46,7 @@ KEY_ON_SUCCESS = "onSuccess"
 KEY_ON_ERROR = "onError"
 KEY_REDIRECT = "redirect"
 KEY_TEMPLATE = "template"
+KEY_PATH_PARAMS = "_params"  # Set by HTTPRouter.match_route() for /users/<id> routes
 
 # Content types
 CONTENT_TYPE_FORM = "application/x-www-form-urlencoded"
@@ -171,7 +172,7 @@ def process_form_submission(
     Process declarative form submission (zDialog pattern for web).
     
     Workflow:
-        1. Create zConv from form_data
+        1. Create zConv from form_data (+ path params from the matched route)
         2. Validate against zSchema (if model starts with '@')
         3. Execute onSubmit via zDispatch (if validation passes)
         4. Return redirect URL or error
@@ -199,7 +200,8 @@ def process_form_submission(
         >>> success, redirect, error = process_form_submission(route, form_data, zcli, logger)
     """
     # Create zConv (same pattern as zDialog)
-    zConv = form_data.copy()
+    # Path params (/users/<id>) come from the matched URL and win over posted fields
+    zConv = {**form_data, **(route.get(KEY_PATH_PARAMS) or {})}
     logger.debug(LOG_MSG_CREATE_ZCONV, len(zConv))
     
     # Get model for validation
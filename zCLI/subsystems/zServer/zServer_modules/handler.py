@@ -7,6 +7,12 @@ Custom HTTP request handler with logging integration
 from http.server import SimpleHTTPRequestHandler
 import os
 
+from .static_files import (
+    get_stat_cache, is_not_modified, parse_range, build_file_headers, sendfile_to_socket
+)
+from .compression import select_variant, compress_body
+from .page_cache import etag_matches
+
 
 class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
     """HTTP request handler with zCLI logger integration + routing (v1.5.5: Flask conventions)"""
@@ -132,7 +138,6 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
         Maps /static/js/hello.js → {serve_path}/static/js/hello.js
         """
         import os
-        import mimetypes
         from urllib.parse import unquote
         
         # Remove /static/ prefix to get relative path
@@ -151,37 +156,25 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
         if not file_path.startswith(static_root):
             return self.send_error(403, "Access denied")
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists (cached stat)
+        info = get_stat_cache().get(file_path)
+        if info is None:
             return self.send_error(404, f"File not found: {self.path}")
         
         # Check if it's a directory (not allowed)
-        if os.path.isdir(file_path):
+        if info.is_dir:
             return self.send_error(403, "Directory listing is disabled")
         
-        # Serve the file
+        # JavaScript is always revalidated during development (cheap 304 via ETag)
+        if file_path.endswith('.js'):
+            cache_control = "no-cache, must-revalidate"
+            extra_headers = {"X-Dev-Cache": "disabled"}  # Debug header
+        else:
+            cache_control = "public, max-age=3600"  # Cache for 1 hour
+            extra_headers = None
+        
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
-            # Determine content type
-            content_type, _ = mimetypes.guess_type(file_path)
-            if not content_type:
-                content_type = 'application/octet-stream'
-            
-            self.send_response(200)
-            self.send_header("Content-type", content_type)
-            self.send_header("Content-length", len(content))
-            
-            # Disable caching for JavaScript files during development
-            if file_path.endswith('.js'):
-                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                self.send_header("X-Dev-Cache", "disabled")  # Debug header
-            else:
-                self.send_header("Cache-Control", "public, max-age=3600")  # Cache for 1 hour
-            
-            self.end_headers()
-            self.wfile.write(content)
+            self._send_file(info, cache_control=cache_control, extra_headers=extra_headers)
             
             if self.zcli_logger:
                 self.zcli_logger.debug(f"[Handler] Served static file: {self.path}")
@@ -198,7 +191,6 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
         Maps /UI/zUI.index.yaml → {serve_path}/UI/zUI.index.yaml
         """
         import os
-        import mimetypes
         from urllib.parse import unquote
         
         # Remove /UI/ prefix to get relative path (case-insensitive match)
@@ -225,28 +217,18 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
         if not file_path.startswith(ui_root):
             return self.send_error(403, "Access denied")
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists (cached stat)
+        info = get_stat_cache().get(file_path)
+        if info is None:
             return self.send_error(404, f"UI file not found: {self.path}")
         
         # Check if it's a directory (not allowed)
-        if os.path.isdir(file_path):
+        if info.is_dir:
             return self.send_error(403, "Directory listing is disabled")
         
-        # Serve the YAML file
+        # Serve the YAML file (no-cache: always revalidated via ETag during development)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Force YAML content type
-            content_type = 'application/x-yaml'
-            
-            self.send_response(200)
-            self.send_header("Content-type", content_type)
-            self.send_header("Content-length", len(content.encode('utf-8')))
-            self.send_header("Cache-Control", "no-cache")  # Don't cache UI files during development
-            self.end_headers()
-            self.wfile.write(content.encode('utf-8'))
+            self._send_file(info, content_type='application/x-yaml', cache_control="no-cache")
             
             if self.zcli_logger:
                 self.zcli_logger.debug(f"[Handler] Served UI file: {self.path}")
@@ -256,6 +238,64 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
                 self.zcli_logger.error(f"[Handler] Error serving UI file: {e}")
             return self.send_error(500, f"Error serving UI file: {str(e)}")
     
+    def _send_file(self, info, content_type=None, cache_control=None, extra_headers=None):
+        """
+        Send a file with validators, conditional (304) and Range (206) support.
+        
+        Body is sent zero-copy via socket.sendfile (os.sendfile where available).
+        
+        Args:
+            info: FileInfo from the stat cache
+            content_type: Override Content-type (default: guessed from extension)
+            cache_control: Cache-Control header value
+            extra_headers: Optional dict of additional headers
+        """
+        # Precompressed sidecar (.br/.gz) when the client accepts it
+        info, content_encoding, vary = select_variant(info, self.headers.get("Accept-Encoding"))
+        
+        headers = build_file_headers(info, cache_control)
+        if vary:
+            headers["Vary"] = "Accept-Encoding"
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        # Conditional request → 304 Not Modified
+        if is_not_modified(info, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")):
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        
+        # Range request → 206 Partial Content / 416 Range Not Satisfiable
+        try:
+            byte_range = parse_range(self.headers.get("Range"), self.headers.get("If-Range"), info)
+        except ValueError:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{info.size}")
+            self.send_header("Content-length", "0")
+            self.end_headers()
+            return
+        
+        start, length = byte_range if byte_range else (0, info.size)
+        
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-type", content_type or info.content_type)
+        self.send_header("Content-length", str(length))
+        if content_encoding:
+            self.send_header("Content-Encoding", content_encoding)
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{start + length - 1}/{info.size}")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        
+        if self.command == 'HEAD' or length == 0:
+            return
+        
+        self.wfile.flush()
+        sendfile_to_socket(self.connection, info.path, start, length)
+    
     def _handle_routed_request(self):
         """Handle request using HTTPRouter with RBAC enforcement"""
         # DEBUG: Log route matching attempt
@@ -264,7 +304,7 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
             self.zcli_logger.info(f"[Handler] Router has {len(self.router.auto_discovered_routes)} auto-discovered routes")
         
         # Match route
-        route = self.router.match_route(self.path)
+        route = self.router.match_route(self.path, self.command)
         if not route:
             # No route found - 404
             if hasattr(self, 'zcli_logger') and self.zcli_logger:
@@ -290,30 +330,18 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
             # Serve static file directly
             file_path = self.router.resolve_file_path(route)
             
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # Check if file exists (cached stat)
+            info = get_stat_cache().get(os.path.abspath(file_path))
+            if info is None:
                 return self.send_error(404, f"File not found: {file_path}")
             
             # Check if it's a directory (not allowed for static routes)
-            if os.path.isdir(file_path):
+            if info.is_dir:
                 return self.send_error(403, "Directory listing is disabled")
             
             # Serve the file directly
             try:
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Determine content type
-                import mimetypes
-                content_type, _ = mimetypes.guess_type(file_path)
-                if not content_type:
-                    content_type = 'application/octet-stream'
-                
-                self.send_response(200)
-                self.send_header("Content-type", content_type)
-                self.send_header("Content-length", len(content))
-                self.end_headers()
-                self.wfile.write(content)
+                self._send_file(info)
                 
             except Exception as e:
                 if hasattr(self, 'zcli_logger') and self.zcli_logger:
@@ -428,19 +456,20 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
             
             # Get templates directory from serve_path (Flask convention)
             import os
-            from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+            from jinja2 import TemplateNotFound
+            from .template_cache import get_template_cache, resolve_bytecode_dir
             
             templates_dir = os.path.join(self.serve_path, self.template_folder)
             
-            # Create Jinja2 environment
-            env = Environment(loader=FileSystemLoader(templates_dir))
+            # Shared long-lived Jinja2 environment (compiled-template cache)
+            template_cache = get_template_cache(templates_dir, resolve_bytecode_dir(zcli))
             
             # Add cache-busting timestamp
             import time
             context['timestamp'] = int(time.time() * 1000)
             
             # Render template
-            template = env.get_template(template_name)
+            template = template_cache.get_template(template_name)
             html_content = template.render(**context)
             
             # Auto-inject zUI config script before </head> (if zSession values present)
@@ -497,7 +526,8 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
         try:
             # Import needed modules
             import os
-            from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+            from jinja2 import TemplateNotFound
+            from .template_cache import get_template_cache, resolve_bytecode_dir
             
             # Get zcli instance for session access
             zcli = self.router.zcli if hasattr(self.router, 'zcli') else None
@@ -534,15 +564,15 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
             # Get templates directory from serve_path
             templates_dir = os.path.join(self.serve_path, self.template_folder)
             
-            # Create Jinja2 environment
-            env = Environment(loader=FileSystemLoader(templates_dir))
+            # Shared long-lived Jinja2 environment (compiled-template cache)
+            template_cache = get_template_cache(templates_dir, resolve_bytecode_dir(zcli))
             
             # Add cache-busting timestamp
             import time
             context['timestamp'] = int(time.time() * 1000)
             
             # Render template with context (Jinja2 support)
-            template = env.get_template(template_name)
+            template = template_cache.get_template(template_name)
             html_content = template.render(**context)
             
             # Auto-inject zUI config script before </head> (same as template routes)
@@ -655,15 +685,32 @@ class LoggingHTTPRequestHandler(SimpleHTTPRequestHandler):
             routes = self.router.routes.get('routes', {}) if hasattr(self.router, 'routes') else {}
             renderer = PageRenderer(self.router.zcli, routes=routes)
             
-            # Render zUI to HTML
-            html_content = renderer.render_page(zVaFile, zBlock)
+            # Render zUI to HTML (cached per file mtime, zBlock and role)
+            page = renderer.render_page_cached(zVaFile, zBlock, params=route.get("_params"))
+            
+            # Browser revalidation → 304 Not Modified
+            if etag_matches(self.headers.get("If-None-Match"), page.etag):
+                self.send_response(304)
+                self.send_header("ETag", page.etag)
+                self.send_header("Cache-Control", "private, no-cache")
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+            
+            # Compress on the fly (no sidecar possible for rendered HTML)
+            body, content_encoding = compress_body(page.body, self.headers.get("Accept-Encoding"))
             
             # Send HTML response
             self.send_response(200)
             self.send_header("Content-type", "text/html")
-            self.send_header("Content-length", len(html_content.encode('utf-8')))
+            self.send_header("Content-length", len(body))
+            self.send_header("ETag", f"W/{page.etag}" if content_encoding else page.etag)
+            self.send_header("Cache-Control", "private, no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            if content_encoding:
+                self.send_header("Content-Encoding", content_encoding)
             self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
+            self.wfile.write(body)
             
         except Exception as e:
             # Log error and send 500
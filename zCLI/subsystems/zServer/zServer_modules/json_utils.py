@@ -10,7 +10,7 @@ Philosophy:
 Architecture:
     - Parse YAML data definitions
     - Support dynamic values (from zConfig, zSession, etc.)
-    - Support placeholders ({query.param}, {session.user_id})
+    - Support placeholders ({query.param}, {path.id}, {session.user_id})
     - Render JSON responses directly
 
 Integration:
@@ -39,6 +39,7 @@ from datetime import datetime
 # JSON route keys
 KEY_DATA = "data"
 KEY_STATUS = "status"
+KEY_PATH_PARAMS = "_params"  # Set by HTTPRouter.match_route() for /users/<id> routes
 
 # Default status
 DEFAULT_STATUS = 200
@@ -91,7 +92,10 @@ def render_json_response(
     if query_params is None:
         query_params = {}
     
-    resolved_data = _resolve_placeholders(data, zcli, query_params, logger)
+    # Path params (/users/<id>) resolve as {path.id}
+    path_params = route.get(KEY_PATH_PARAMS) or {}
+    
+    resolved_data = _resolve_placeholders(data, zcli, query_params, logger, path_params)
     
     # Get status code
     status_code = route.get(KEY_STATUS, DEFAULT_STATUS)
@@ -157,13 +161,15 @@ def _resolve_placeholders(
     data: Any,
     zcli: Any,
     query_params: Dict[str, str],
-    logger: Any
+    logger: Any,
+    path_params: Dict[str, Any] = None
 ) -> Any:
     """
     Resolve placeholders in data structure.
     
     Supports:
         - {query.param} - Query parameters
+        - {path.param} - Path parameters (/users/<id> → {path.id})
         - {session} - Entire session dictionary
         - {session.key} - Individual session values
         - {config.key} - Config values
@@ -175,6 +181,7 @@ def _resolve_placeholders(
         zcli: zCLI instance
         query_params: Query parameters
         logger: Logger instance
+        path_params: Path parameters from the matched route
     
     Returns:
         Any: Data with placeholders resolved
@@ -188,14 +195,14 @@ def _resolve_placeholders(
     # Handle dict
     if isinstance(data, dict):
         return {
-            key: _resolve_placeholders(value, zcli, query_params, logger)
+            key: _resolve_placeholders(value, zcli, query_params, logger, path_params)
             for key, value in data.items()
         }
     
     # Handle list
     elif isinstance(data, list):
         return [
-            _resolve_placeholders(item, zcli, query_params, logger)
+            _resolve_placeholders(item, zcli, query_params, logger, path_params)
             for item in data
         ]
     
@@ -210,6 +217,11 @@ def _resolve_placeholders(
                 param_name = placeholder[6:]  # Remove 'query.'
                 return query_params.get(param_name, '')
             
+            # Path parameters (typed: <int:id> stays an int)
+            elif placeholder.startswith('path.'):
+                param_name = placeholder[5:]  # Remove 'path.'
+                return (path_params or {}).get(param_name, '')
+            
             # Session values
             elif placeholder == 'session':
                 # Return entire session dictionary (safely serialize)
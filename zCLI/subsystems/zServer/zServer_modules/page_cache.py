@@ -0,0 +1,178 @@
+# zCLI/subsystems/zServer/zServer_modules/page_cache.py
+
+"""
+Rendered-page cache for PageRenderer (type: dynamic routes)
+
+Rendering a dynamic route loads the zUI file and walks every block element.
+For a given file/block/role the output rarely changes, so the finished HTML
+is kept in a size-capped LRU:
+
+    key = (resolved zUI path, file mtime_ns, zBlock, auth role, path params)
+
+Editing the zUI file changes its mtime, so the old entry can no longer be
+hit; it is dropped as soon as the new version is stored. Every entry carries
+a content-hash ETag for cheap browser revalidation (304).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+PAGE_CACHE_MAX_ENTRIES = 256
+PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32 MB of rendered HTML
+ETAG_HASH_LENGTH = 16
+
+ROLE_ANONYMOUS = "anonymous"
+ROLE_AUTHENTICATED = "authenticated"  # Logged in, no role assigned
+
+
+class CachedPage(NamedTuple):
+    """Rendered HTML body with its validator."""
+    body: bytes
+    etag: str
+
+
+def make_page(html: str) -> CachedPage:
+    """Encode rendered HTML and compute its strong content-hash ETag."""
+    body = html.encode("utf-8")
+    return CachedPage(body=body, etag=f'"{hashlib.sha1(body).hexdigest()[:ETAG_HASH_LENGTH]}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of If-None-Match against an ETag (W/ prefix ignored)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag == etag or tag == f"W/{etag}":
+            return True
+    return False
+
+
+def resolve_role_key(zcli: Any) -> str:
+    """
+    Role component of the cache key (what HTTPRouter.check_access sees).
+
+    Args:
+        zcli: zCLI instance
+
+    Returns:
+        str: "anonymous", "authenticated", or the current role(s)
+    """
+    auth = getattr(zcli, "auth", None)
+    if auth is None:
+        return ROLE_ANONYMOUS
+    try:
+        if not auth.is_authenticated():
+            return ROLE_ANONYMOUS
+        role = auth.get_current_role()
+    except Exception:
+        return ROLE_ANONYMOUS
+
+    if isinstance(role, (tuple, list)):
+        role = "|".join(str(r) for r in role if r)
+    return str(role) if role else ROLE_AUTHENTICATED
+
+
+class PageCache:
+    """
+    Thread-safe LRU of rendered pages, capped by entry count and total bytes.
+
+    Attributes:
+        max_entries: Maximum number of cached pages
+        max_bytes: Maximum total size of cached HTML
+    """
+
+    def __init__(self, max_entries: int = PAGE_CACHE_MAX_ENTRIES, max_bytes: int = PAGE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, CachedPage]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[CachedPage]:
+        """Get a cached page (None on miss)."""
+        with self._lock:
+            page = self._entries.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key: Tuple, page: CachedPage) -> None:
+        """
+        Store a page, dropping older versions of the same file and evicting LRU.
+
+        Args:
+            key: (path, mtime_ns, zBlock, role, params)
+            page: Rendered page
+        """
+        if len(page.body) > self.max_bytes:
+            return
+
+        path = key[0]
+        with self._lock:
+            # Older mtimes of this file are unreachable - free them now
+            for stale in [k for k in self._entries if k[0] == path and k[1] != key[1]]:
+                self._bytes -= len(self._entries.pop(stale).body)
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.body)
+
+            self._entries[key] = page
+            self._bytes += len(page.body)
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop every entry for one zUI file (or everything when path is None)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [k for k in self._entries if k[0] == path]:
+                self._bytes -= len(self._entries.pop(key).body)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (entries, bytes, hits, misses, hit_rate)."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{(self.hits / requests * 100):.1f}%" if requests else "0.0%",
+            }
+
+
+_page_cache = PageCache()
+
+
+def get_page_cache() -> PageCache:
+    """Get the process-wide page cache shared by handler and WSGI app."""
+    return _page_cache
+
+
+# Module exports
+__all__ = [
+    'CachedPage',
+    'PageCache',
+    'get_page_cache',
+    'make_page',
+    'etag_matches',
+    'resolve_role_key',
+]
@@ -19,14 +19,19 @@ Integration:
     - Called by: HTTPRouter for type: dynamic routes
     - Uses: zLoader (file loading), zWalker (block execution)
     - Session: Sets SESSION_KEY_ZMODE = "Web"
+    - Cache: render_page_cached() reuses HTML per (file, mtime, zBlock, role)
 
 v1.5.4 Phase 3 - MVP Implementation
 """
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Tuple
+from html import escape
 import io
+import os
 import sys
 
+from .page_cache import CachedPage, get_page_cache, make_page, resolve_role_key
+
 
 class PageRenderer:
     """
@@ -36,6 +41,7 @@ class PageRenderer:
         zcli: zCLI instance
         logger: Logger instance
         html_buffer: StringIO buffer for capturing HTML output
+        path_params: Route path params, substituted as {path.name} in display content
     """
     
     def __init__(self, zcli: Any, routes: Dict = None):
@@ -49,6 +55,7 @@ class PageRenderer:
         self.zcli = zcli
         self.logger = zcli.logger if hasattr(zcli, 'logger') else None
         self.html_buffer = None
+        self.path_params: Dict[str, Any] = {}  # From /users/<id> style routes
         
         # Build reverse mapping: zVaFile → HTTP route for dual-mode navigation
         self._file_to_route_map = {}
@@ -66,7 +73,8 @@ class PageRenderer:
     def render_page(
         self,
         zVaFile: str,
-        zBlock: str = "zVaF"
+        zBlock: str = "zVaF",
+        params: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Render a zUI file as HTML.
@@ -74,6 +82,7 @@ class PageRenderer:
         Args:
             zVaFile: Path to zUI file (e.g., "./zUI.web_dashboard.yaml")
             zBlock: Block to execute (default: "zVaF")
+            params: Route path params (e.g., {"id": 42} for /users/<int:id>)
         
         Returns:
             str: Complete HTML page
@@ -82,35 +91,96 @@ class PageRenderer:
             renderer = PageRenderer(zcli)
             html = renderer.render_page("./zUI.web_dashboard.yaml", "zVaF")
         """
+        self.path_params = params or {}
+        html, _ = self._render(self._resolve_zvafile(zVaFile), zBlock)
+        return html
+    
+    def render_page_cached(
+        self,
+        zVaFile: str,
+        zBlock: str = "zVaF",
+        role: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> CachedPage:
+        """
+        Render a zUI file as HTML through the shared page cache.
+        
+        Cache key: (resolved file path, mtime, zBlock, role, path params). Editing the zUI
+        file changes its mtime, so the next request re-renders. Error pages
+        and files that cannot be stat'ed are never cached.
+        
+        Args:
+            zVaFile: Path to zUI file (e.g., "./zUI.web_dashboard.yaml")
+            zBlock: Block to execute (default: "zVaF")
+            role: Auth role key (default: resolved from zcli.auth)
+            params: Route path params (part of the cache key)
+        
+        Returns:
+            CachedPage: HTML body (bytes) and strong ETag
+        """
+        self.path_params = params or {}
+        resolved = self._resolve_zvafile(zVaFile)
+        if role is None:
+            role = resolve_role_key(self.zcli)
+        
+        file_path = resolved if os.path.isfile(resolved) else f"{resolved}.yaml"
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            html, _ = self._render(resolved, zBlock)
+            return make_page(html)
+        
+        cache = get_page_cache()
+        key = (os.path.abspath(file_path), mtime_ns, zBlock, role, tuple(sorted(self.path_params.items())))
+        page = cache.get(key)
+        if page is not None:
+            if self.logger:
+                self.logger.debug(f"[PageRenderer] Cache hit: {zVaFile} -> {zBlock} ({role})")
+            return page
+        
+        html, ok = self._render(resolved, zBlock)
+        page = make_page(html)
+        if ok:
+            cache.put(key, page)
+        return page
+    
+    def _resolve_zvafile(self, zVaFile: str) -> str:
+        """Make ./relative zUI paths absolute using zSpace."""
+        if zVaFile.startswith("./"):
+            zSpace = self.zcli.session.get("zSpace", os.getcwd())
+            zVaFile = os.path.join(zSpace, zVaFile[2:])  # Remove ./
+            if self.logger:
+                self.logger.debug(f"[PageRenderer] Resolved path: {zVaFile}")
+        return zVaFile
+    
+    def _render(self, zVaFile: str, zBlock: str) -> Tuple[str, bool]:
+        """
+        Load and render a (resolved) zUI file.
+        
+        Returns:
+            Tuple[str, bool]: (HTML page, True if rendered without error)
+        """
         if self.logger:
             self.logger.info(f"[PageRenderer] Rendering: {zVaFile} -> {zBlock}")
         
         try:
             # Step 1: Load zUI file
-            # If path is relative (starts with ./), make it absolute using zSpace
-            if zVaFile.startswith("./"):
-                import os
-                zSpace = self.zcli.session.get("zSpace", os.getcwd())
-                zVaFile = os.path.join(zSpace, zVaFile[2:])  # Remove ./
-                if self.logger:
-                    self.logger.debug(f"[PageRenderer] Resolved path: {zVaFile}")
-            
             zui_data = self.zcli.loader.handle(zVaFile)
             
             if not zui_data:
-                return self._render_error("Failed to load zUI file")
+                return self._render_error("Failed to load zUI file"), False
             
             # Step 2: TODO - Execute zUI in Web mode
             # For now, return a simple HTML template
             html_content = self._execute_zui_web_mode(zui_data, zBlock, zVaFile)
             
             # Step 3: Wrap in HTML template
-            return self._wrap_in_template(html_content, zBlock)
+            return self._wrap_in_template(html_content, zBlock), True
             
         except Exception as e:
             if self.logger:
                 self.logger.error(f"[PageRenderer] Error: {e}")
-            return self._render_error(f"Rendering error: {str(e)}")
+            return self._render_error(f"Rendering error: {str(e)}"), False
     
     def _execute_zui_web_mode(
         self,
@@ -272,13 +342,21 @@ class PageRenderer:
         html += '</ul></nav>'
         return html
     
+    def _apply_path_params(self, content: Any) -> Any:
+        """Substitute {path.name} tokens with (HTML-escaped) route path params."""
+        if not self.path_params or not isinstance(content, str) or "{path." not in content:
+            return content
+        for name, value in self.path_params.items():
+            content = content.replace(f"{{path.{name}}}", escape(str(value)))
+        return content
+    
     def _render_display_event(self, event_data: Dict[str, Any]) -> str:
         """Render zDisplay event as HTML."""
         if not isinstance(event_data, dict):
             return ""
         
         event_type = event_data.get("event", "text")
-        content = event_data.get("content", "")
+        content = self._apply_path_params(event_data.get("content", ""))
         indent = event_data.get("indent", 0)
         
         # Convert event types to HTML
@@ -0,0 +1,255 @@
+# zCLI/subsystems/zServer/zServer_modules/route_trie.py
+
+"""
+Compiled route table for HTTPRouter - segment trie with params and mounts
+
+Built once when the router is created (zServer._load_routes), then matched in
+O(path segments) per request instead of scanning route definitions.
+
+Route key syntax (zServer.*.yaml):
+    /about                  Exact path
+    /users/<id>             Path parameter (string, one segment)
+    /users/<int:id>         Typed parameter (int)
+    /files/<path:rest>      Rest of the path (must be last)
+    /docs/*                 Prefix mount (matches /docs and everything below)
+    /*                      Catch-all (the existing wildcard)
+    POST /api/users         Method-specific route (any HTTP method prefix)
+
+Fully static routes are also indexed in a flat dict, so exact hits cost one
+lookup. Matching priority at each segment: static > parameter > mount.
+Routes without a method prefix answer every method; a method-specific route
+wins over them.
+Trailing slashes and query strings are ignored.
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+ANY_METHOD = "*"
+HTTP_METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
+MOUNT_SEGMENT = "*"
+PARAM_PATTERN = re.compile(r"^<(?:(?P<converter>[a-z]+):)?(?P<name>[A-Za-z_][A-Za-z0-9_]*)>$")
+
+CONVERTER_STR = "str"
+CONVERTER_INT = "int"
+CONVERTER_PATH = "path"
+CONVERTERS = {
+    CONVERTER_STR: str,
+    CONVERTER_INT: int,
+}
+
+
+class RouteMatch(NamedTuple):
+    """Result of a successful route lookup."""
+    route: Dict[str, Any]
+    params: Dict[str, Any]
+    pattern: str
+
+
+class _Node:
+    """One path segment in the trie."""
+
+    __slots__ = ("children", "params", "routes", "mounts")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.params: List[Tuple[str, str, "_Node"]] = []  # (name, converter, child)
+        self.routes: Dict[str, Tuple[Dict[str, Any], str]] = {}  # method → (route, pattern)
+        self.mounts: Dict[str, Tuple[Dict[str, Any], str, Optional[str]]] = {}  # method → (route, pattern, param)
+
+
+def split_route_key(key: str) -> Tuple[str, str]:
+    """
+    Split a route key into (method, path pattern).
+
+    Examples:
+        >>> split_route_key("POST /api/users")
+        ('POST', '/api/users')
+        >>> split_route_key("/about")
+        ('*', '/about')
+    """
+    parts = key.strip().split(None, 1)
+    if len(parts) == 2 and parts[0].upper() in HTTP_METHODS:
+        return parts[0].upper(), parts[1].strip()
+    return ANY_METHOD, key.strip()
+
+
+def split_path(path: str) -> List[str]:
+    """Split a request path into segments (query string and outer slashes dropped)."""
+    path = path.split("?", 1)[0].split("#", 1)[0].strip("/")
+    return path.split("/") if path else []
+
+
+class RouteTrie:
+    """
+    Segment trie of route definitions.
+
+    Attributes:
+        route_count: Number of inserted routes
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._static: Dict[str, Dict[str, Tuple[Dict[str, Any], str]]] = {}  # Exact-path fast lookup
+        self.route_count = 0
+
+    def insert(self, key: str, route: Dict[str, Any]) -> bool:
+        """
+        Add a route. The first route inserted for a pattern/method wins.
+
+        Args:
+            key: Route key from the routes file (e.g., "GET /users/<int:id>")
+            route: Route definition
+
+        Returns:
+            bool: True if inserted, False if an equal route already existed
+
+        Raises:
+            ValueError: Unknown converter, or <path:...>/* not in last position
+        """
+        method, pattern = split_route_key(key)
+        segments = split_path(pattern)
+        node = self._root
+
+        for index, segment in enumerate(segments):
+            is_last = index == len(segments) - 1
+
+            if segment == MOUNT_SEGMENT:
+                if not is_last:
+                    raise ValueError(f"Mount '*' must be the last segment: {key}")
+                return self._add(node.mounts, method, (route, pattern, None))
+
+            param = PARAM_PATTERN.match(segment)
+            if not param:
+                node = node.children.setdefault(segment, _Node())
+                continue
+
+            converter = param.group("converter") or CONVERTER_STR
+            name = param.group("name")
+            if converter == CONVERTER_PATH:
+                if not is_last:
+                    raise ValueError(f"<path:{name}> must be the last segment: {key}")
+                return self._add(node.mounts, method, (route, pattern, name))
+            if converter not in CONVERTERS:
+                raise ValueError(f"Unknown converter '{converter}' in route: {key}")
+
+            for existing_name, existing_converter, child in node.params:
+                if (existing_name, existing_converter) == (name, converter):
+                    node = child
+                    break
+            else:
+                child = _Node()
+                # int params are tried before str so /<int:id> and /<slug> can coexist
+                if converter == CONVERTER_INT:
+                    node.params.insert(0, (name, converter, child))
+                else:
+                    node.params.append((name, converter, child))
+                node = child
+
+        inserted = self._add(node.routes, method, (route, pattern))
+        if inserted and not any(PARAM_PATTERN.match(segment) for segment in segments):
+            self._static.setdefault("/" + "/".join(segments), {})[method] = (route, pattern)
+        return inserted
+
+    def _add(self, table: Dict[str, Any], method: str, entry: Tuple) -> bool:
+        """Store entry for method unless one exists (first insert wins)."""
+        if method in table:
+            return False
+        table[method] = entry
+        self.route_count += 1
+        return True
+
+    def match(self, path: str, method: Optional[str] = None) -> Optional[RouteMatch]:
+        """
+        Find the route for a request path.
+
+        Args:
+            path: Request path (query string allowed)
+            method: HTTP method (None = method-agnostic lookup)
+
+        Returns:
+            Optional[RouteMatch]: (route, params, pattern) or None
+        """
+        method = method.upper() if method else None
+
+        # Exact static routes: one dict lookup instead of a trie walk
+        static = self._static.get(path)
+        segments = split_path(path)
+        if static is None:
+            static = self._static.get("/" + "/".join(segments))
+        entry = _pick(static, method) if static else None
+        if entry:
+            return RouteMatch(entry[0], {}, entry[1])
+
+        return self._match(self._root, segments, 0, method, {})
+
+    def _match(self, node: _Node, segments: List[str], index: int,
+               method: Optional[str], params: Dict[str, Any]) -> Optional[RouteMatch]:
+        """Depth-first match with backtracking (static > param > mount)."""
+        if index == len(segments):
+            entry = _pick(node.routes, method)
+            if entry:
+                return RouteMatch(entry[0], dict(params), entry[1])
+            return self._mount_match(node, segments, index, method, params)
+
+        segment = segments[index]
+
+        child = node.children.get(segment)
+        if child is not None:
+            result = self._match(child, segments, index + 1, method, params)
+            if result:
+                return result
+
+        for name, converter, child in node.params:
+            try:
+                params[name] = CONVERTERS[converter](segment)
+            except ValueError:
+                continue
+            result = self._match(child, segments, index + 1, method, params)
+            if result:
+                return result
+            del params[name]
+
+        return self._mount_match(node, segments, index, method, params)
+
+    def _mount_match(self, node: _Node, segments: List[str], index: int,
+                     method: Optional[str], params: Dict[str, Any]) -> Optional[RouteMatch]:
+        """Match a prefix mount at node, capturing the remaining path."""
+        entry = _pick(node.mounts, method)
+        if not entry:
+            return None
+        route, pattern, param_name = entry
+        matched = dict(params)
+        if param_name:
+            matched[param_name] = "/".join(segments[index:])
+        return RouteMatch(route, matched, pattern)
+
+
+def _pick(table: Dict[str, Any], method: Optional[str]) -> Optional[Tuple]:
+    """Method-specific entry first, then the any-method entry."""
+    if not table:
+        return None
+    if method and method in table:
+        return table[method]
+    if ANY_METHOD in table:
+        return table[ANY_METHOD]
+    if method is None:
+        return table.get("GET")
+    if method == "HEAD":
+        return table.get("GET")
+    return None
+
+
+# Module exports
+__all__ = [
+    'RouteTrie',
+    'RouteMatch',
+    'split_route_key',
+    'split_path',
+    'ANY_METHOD',
+]
@@ -11,12 +11,17 @@ Architecture:
     - Match incoming paths to route definitions
     - Enforce RBAC before serving content
     - Serve error pages on access denial
-    - Support exact match, wildcard, and default routes
+    - Support exact, parameterized (/users/<id>), prefix-mount (/docs/*),
+      method-specific (POST /api/users), wildcard, and default routes
+    - Routes are compiled once into a segment trie (route_trie.RouteTrie)
 
 Route Matching Priority:
-    1. Exact match ("/about" → "/about")
-    2. Wildcard match ("/*" → any path)
-    3. Default route (Meta.default_route)
+    1. Exact match ("/about" → "/about"), incl. auto-discovered zBlocks
+    2. Path parameters ("/users/<int:id>" → "/users/42", id=42)
+    3. Prefix mounts ("/docs/*" → "/docs/a/b"; "/*" → any path)
+    4. Default route (Meta.default_route)
+
+    Extracted params are attached to the returned route as route["_params"].
 
 RBAC Integration:
     Uses zcli.auth.has_role() and zcli.auth.is_authenticated()
@@ -36,6 +41,8 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from .route_trie import RouteTrie
+
 # =============================================================================
 # MODULE CONSTANTS
 # =============================================================================
@@ -49,6 +56,7 @@ KEY_ERROR_PAGES = "error_pages"
 KEY_TYPE = "type"
 KEY_FILE = "file"
 KEY_RBAC = "_rbac"
+KEY_PATH_PARAMS = "_params"  # Path params extracted by match_route()
 
 # RBAC keys
 RBAC_KEY_REQUIRE_AUTH = "require_auth"
@@ -103,9 +111,10 @@ class HTTPRouter:
         logger: Logger instance
         meta: Metadata (base_path, default_route, error_pages)
         route_map: Map of path → route definition
+        route_table: Compiled RouteTrie (explicit + auto-discovered routes)
     
     Methods:
-        match_route(path): Find route definition for request path
+        match_route(path, method): Find route definition for request path
         check_access(route): Check RBAC and return (has_access, error_page)
         resolve_file_path(route): Get absolute file path for route
     """
@@ -141,6 +150,9 @@ class HTTPRouter:
         # Discover zBlock routes from walker routes with auto_discover_blocks
         self._discover_walker_blocks()
         
+        # Compile route table once (explicit routes take precedence)
+        self.route_table = self._compile_routes()
+        
         route_count = len(self.route_map) + len(self.auto_discovered_routes)
         self.logger.info(f"[HTTPRouter] Initialized with {len(self.route_map)} explicit + {len(self.auto_discovered_routes)} auto-discovered = {route_count} total routes")
     
@@ -238,46 +250,57 @@ class HTTPRouter:
                 import traceback
                 self.logger.error(f"[Router] Traceback: {traceback.format_exc()}")
     
-    def match_route(self, path: str) -> Optional[Dict[str, Any]]:
+    def _compile_routes(self) -> RouteTrie:
+        """
+        Build the route trie from explicit and auto-discovered routes.
+        
+        Returns:
+            RouteTrie: Compiled route table
+        """
+        table = RouteTrie()
+        for routes in (self.route_map, self.auto_discovered_routes):
+            for route_key, route_config in routes.items():
+                if not isinstance(route_config, dict):
+                    continue
+                try:
+                    table.insert(route_key, route_config)
+                except ValueError as e:
+                    self.logger.error(f"[HTTPRouter] Invalid route '{route_key}': {e}")
+        return table
+    
+    def match_route(self, path: str, method: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Match request path to route definition.
         
         Matching Priority:
-            1. Exact match (explicit routes)
-            2. Auto-discovered zBlock routes (from zWalker)
-            3. Wildcard match (/*)
+            1. Exact match (explicit routes, then auto-discovered zBlocks)
+            2. Path parameters (/users/<id>)
+            3. Prefix mounts (/docs/*, then the /* wildcard)
             4. Default route (from Meta)
         
         Args:
-            path: HTTP request path (e.g., "/about")
+            path: HTTP request path (e.g., "/about"); query string is ignored
+            method: HTTP method for method-specific routes (None = any)
         
         Returns:
-            Optional[Dict[str, Any]]: Route definition or None
+            Optional[Dict[str, Any]]: Route definition or None. When the
+                pattern has parameters, a copy with route["_params"] is returned.
         
         Examples:
             >>> router = HTTPRouter(routes, zcli, logger)
             >>> route = router.match_route("/admin")
             >>> route["file"]
             "admin.html"
-            >>> route["_rbac"]
-            {"require_role": "admin"}
+            >>> router.match_route("/users/42")["_params"]
+            {"id": 42}
         """
-        # 1. Exact match (explicit routes)
-        if path in self.route_map:
-            route = self.route_map[path]
-            self.logger.debug(LOG_MSG_ROUTE_MATCHED, path, route.get(KEY_FILE, "N/A"))
-            return route
-        
-        # 2. Auto-discovered zBlock routes (from zWalker with auto_discover_blocks)
-        if path in self.auto_discovered_routes:
-            route = self.auto_discovered_routes[path]
-            self.logger.debug(LOG_MSG_ROUTE_MATCHED, path, f"auto-discovered zBlock: {route.get('zBlock')}")
-            return route
-        
-        # 3. Wildcard match
-        if WILDCARD_PATTERN in self.route_map:
-            route = self.route_map[WILDCARD_PATTERN]
-            self.logger.debug(LOG_MSG_ROUTE_MATCHED, path, "wildcard")
+        # 1-3. Compiled route table
+        match = self.route_table.match(path, method)
+        if match:
+            route = match.route
+            self.logger.debug(LOG_MSG_ROUTE_MATCHED, path, match.pattern)
+            if match.params:
+                route = {**route, KEY_PATH_PARAMS: match.params}
             return route
         
         # 4. Default route
@@ -287,8 +310,8 @@ class HTTPRouter:
             self.logger.debug(LOG_MSG_ROUTE_MATCHED, path, default_route)
             return route
         
-        # No match
-        self.logger.warning(LOG_MSG_NO_MATCH, path)
+        # No match (404 is logged by the handler)
+        self.logger.debug(LOG_MSG_NO_MATCH, path)
         return None
     
     def check_access(self, route: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
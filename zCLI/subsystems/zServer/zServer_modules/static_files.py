@@ -0,0 +1,255 @@
+# zCLI/subsystems/zServer/zServer_modules/static_files.py
+
+"""
+Static file helpers for zServer: stat cache, validators, conditional & range requests
+
+Shared by the http.server handler (zero-copy via socket.sendfile) and the WSGI
+app (wsgi.file_wrapper) so both serve static assets the same way:
+
+    - Strong ETag (inode-size-mtime) + Last-Modified on every file response
+    - If-None-Match / If-Modified-Since → 304 Not Modified (no body)
+    - Range: bytes=... → 206 Partial Content (single range), 416 if unsatisfiable
+    - Small TTL'd LRU of stat results so hot assets skip filesystem checks
+"""
+
+import mimetypes
+import os
+import stat as stat_module
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+STAT_CACHE_SIZE = 1024  # Max cached stat entries
+STAT_CACHE_TTL = 1.0  # Seconds before a cached stat is re-validated
+FILE_BLOCK_SIZE = 64 * 1024  # Chunk size for WSGI streaming
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+RANGE_UNIT = "bytes="
+
+
+class FileInfo(NamedTuple):
+    """Cached stat result for a served file."""
+    path: str
+    is_dir: bool
+    size: int
+    mtime: float
+    etag: str
+    last_modified: str
+    content_type: str
+
+
+class StatCache:
+    """
+    Small thread-safe LRU of stat results with a short TTL.
+
+    Missing paths are not cached, so newly created files are served immediately.
+    """
+
+    def __init__(self, max_entries: int = STAT_CACHE_SIZE, ttl: float = STAT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, FileInfo]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str) -> Optional[FileInfo]:
+        """
+        Get FileInfo for path (None if it does not exist).
+
+        Args:
+            path: Absolute file path
+
+        Returns:
+            Optional[FileInfo]: Cached or fresh stat info
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and now - entry[0] < self.ttl:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+            return None
+
+        info = _build_file_info(path, st)
+        with self._lock:
+            self._entries[path] = (now, info)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return info
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop one path (or everything when path is None)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics (entries, hits, misses)."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_stat_cache = StatCache()
+
+
+def get_stat_cache() -> StatCache:
+    """Get the process-wide stat cache shared by handler and WSGI app."""
+    return _stat_cache
+
+
+def _build_file_info(path: str, st: os.stat_result) -> FileInfo:
+    """Build FileInfo (validators + content type) from a stat result."""
+    content_type, _ = mimetypes.guess_type(path)
+    return FileInfo(
+        path=path,
+        is_dir=stat_module.S_ISDIR(st.st_mode),
+        size=st.st_size,
+        mtime=st.st_mtime,
+        etag=f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"',
+        last_modified=formatdate(st.st_mtime, usegmt=True),
+        content_type=content_type or DEFAULT_CONTENT_TYPE,
+    )
+
+
+def is_not_modified(info: FileInfo, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """
+    Evaluate conditional request headers (RFC 9110 precedence).
+
+    If-None-Match wins over If-Modified-Since when both are present.
+
+    Args:
+        info: FileInfo of the requested file
+        if_none_match: If-None-Match header value
+        if_modified_since: If-Modified-Since header value
+
+    Returns:
+        bool: True if a 304 Not Modified should be sent
+    """
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or info.etag in tags or f"W/{info.etag}" in tags
+
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError):
+            return False
+        if since is None:
+            return False
+        return int(info.mtime) <= since.timestamp()
+
+    return False
+
+
+def parse_range(range_header: Optional[str], if_range: Optional[str], info: FileInfo) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header.
+
+    Args:
+        range_header: Range header value (e.g., "bytes=0-1023")
+        if_range: If-Range header value (range ignored unless it matches)
+        info: FileInfo of the requested file
+
+    Returns:
+        Optional[Tuple[int, int]]: (start, length), or None to send the full file
+
+    Raises:
+        ValueError: Range is syntactically valid but unsatisfiable (→ 416)
+    """
+    if not range_header or not range_header.startswith(RANGE_UNIT):
+        return None
+    if if_range and if_range.strip() not in (info.etag, info.last_modified):
+        return None
+
+    spec = range_header[len(RANGE_UNIT):].strip()
+    if "," in spec:
+        return None  # Multi-range not supported - serve full content
+
+    start_str, sep, end_str = spec.partition("-")
+    if not sep:
+        return None
+
+    try:
+        first = int(start_str) if start_str else None
+        last = int(end_str) if end_str else None
+    except ValueError:
+        return None  # Malformed range - ignore and serve full content
+
+    if first is None:
+        # Suffix range: last N bytes
+        if not last:
+            raise ValueError(f"Unsatisfiable range: {range_header}")
+        start = max(0, info.size - last)
+        end = info.size - 1
+    else:
+        start = first
+        end = min(last, info.size - 1) if last is not None else info.size - 1
+
+    if start >= info.size or start > end:
+        raise ValueError(f"Unsatisfiable range: {range_header}")
+
+    return start, end - start + 1
+
+
+def build_file_headers(info: FileInfo, cache_control: Optional[str]) -> Dict[str, str]:
+    """Validator and caching headers common to 200/206/304 responses."""
+    headers = {
+        "ETag": info.etag,
+        "Last-Modified": info.last_modified,
+        "Accept-Ranges": "bytes",
+    }
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def iter_file_range(path: str, start: int, length: int, block_size: int = FILE_BLOCK_SIZE) -> Iterator[bytes]:
+    """Stream [start, start+length) from path in blocks (WSGI fallback path)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(block_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def sendfile_to_socket(sock: Any, path: str, start: int, length: int) -> None:
+    """
+    Zero-copy send of [start, start+length) using socket.sendfile (os.sendfile
+    where supported, plain send() fallback otherwise).
+    """
+    with open(path, "rb") as f:
+        sock.sendfile(f, offset=start, count=length)
+
+
+# Module exports
+__all__ = [
+    'FileInfo',
+    'StatCache',
+    'get_stat_cache',
+    'is_not_modified',
+    'parse_range',
+    'build_file_headers',
+    'iter_file_range',
+    'sendfile_to_socket',
+]
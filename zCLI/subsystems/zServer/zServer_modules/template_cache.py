@@ -0,0 +1,181 @@
+# zCLI/subsystems/zServer/zServer_modules/template_cache.py
+
+"""
+Shared Jinja2 template environments for zServer routes
+
+One long-lived jinja2.Environment per templates directory, shared by the
+http.server handler and the WSGI app, so compiled templates survive across
+requests instead of being re-lexed and recompiled on every hit.
+
+Caching layers:
+    - In-memory: Jinja's compiled-template LRU (per environment)
+    - On-disk: FileSystemBytecodeCache (survives restarts / Gunicorn workers)
+    - Reload: auto_reload re-checks the template's mtime and only recompiles
+      when the file actually changed
+
+Hit/miss counters are exposed via get_template_cache_stats() and surface in
+zServer.health_check().
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+BYTECODE_CACHE_SUBDIR = "jinja2"
+TEMPLATE_CACHE_SIZE = 400  # Compiled templates kept in memory per environment
+
+# Shared registry: abs templates_dir → TemplateCache
+_registry: Dict[str, "TemplateCache"] = {}
+_registry_lock = threading.Lock()
+
+
+class TemplateCache:
+    """
+    Long-lived Jinja2 environment for one templates directory with hit/miss stats.
+
+    A miss is any request that required reading the template source (first
+    load, or file mtime changed); everything else is served from the compiled
+    in-memory cache.
+
+    Attributes:
+        templates_dir: Absolute templates directory
+        env: Shared jinja2.Environment
+    """
+
+    def __init__(self, templates_dir: str, bytecode_dir: Optional[str] = None):
+        """
+        Initialize template cache.
+
+        Args:
+            templates_dir: Absolute path to templates folder
+            bytecode_dir: Directory for compiled bytecode (None = Jinja temp dir)
+        """
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        self.templates_dir = templates_dir
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._misses = 0
+
+        cache = self
+
+        class _CountingLoader(FileSystemLoader):
+            """FileSystemLoader that counts source loads (= compiled-cache misses)."""
+
+            def get_source(self, environment, template):
+                with cache._lock:
+                    cache._misses += 1
+                return super().get_source(environment, template)
+
+        if bytecode_dir:
+            os.makedirs(bytecode_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_dir) if bytecode_dir else FileSystemBytecodeCache()
+
+        self.env = Environment(
+            loader=_CountingLoader(templates_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=True,
+            cache_size=TEMPLATE_CACHE_SIZE
+        )
+
+    def get_template(self, template_name: str) -> Any:
+        """
+        Get compiled template (raises jinja2.TemplateNotFound if missing).
+
+        Args:
+            template_name: Template file name relative to templates_dir
+
+        Returns:
+            jinja2.Template: Compiled template
+        """
+        with self._lock:
+            self._requests += 1
+        return self.env.get_template(template_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: templates_dir, requests, hits, misses, hit_rate
+        """
+        with self._lock:
+            requests = self._requests
+            misses = min(self._misses, requests)
+        hits = requests - misses
+        return {
+            "templates_dir": self.templates_dir,
+            "requests": requests,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": f"{(hits / requests * 100):.1f}%" if requests else "0.0%",
+        }
+
+
+def get_template_cache(templates_dir: str, bytecode_dir: Optional[str] = None) -> TemplateCache:
+    """
+    Get (or create) the shared TemplateCache for a templates directory.
+
+    Args:
+        templates_dir: Templates folder (serve_path/template_folder)
+        bytecode_dir: Optional bytecode cache directory (used on first creation)
+
+    Returns:
+        TemplateCache: Shared instance for this directory
+    """
+    key = os.path.abspath(templates_dir)
+    cache = _registry.get(key)
+    if cache is not None:
+        return cache
+
+    with _registry_lock:
+        cache = _registry.get(key)
+        if cache is None:
+            cache = TemplateCache(key, bytecode_dir)
+            _registry[key] = cache
+        return cache
+
+
+def get_template_cache_stats(templates_dir: str) -> Optional[Dict[str, Any]]:
+    """Get stats for a templates directory (None if no template was ever rendered)."""
+    cache = _registry.get(os.path.abspath(templates_dir))
+    return cache.get_stats() if cache else None
+
+
+def resolve_bytecode_dir(zcli: Any) -> Optional[str]:
+    """
+    Resolve bytecode cache directory from zCLI paths (user cache dir).
+
+    Args:
+        zcli: zCLI instance (may be None or lack config paths)
+
+    Returns:
+        Optional[str]: <user_cache_dir>/jinja2, or None to use Jinja's default
+    """
+    try:
+        cache_dir = zcli.config.sys_paths.user_cache_dir
+    except Exception:
+        return None
+    if not isinstance(cache_dir, (str, os.PathLike)):
+        return None
+    return os.path.join(os.fspath(cache_dir), BYTECODE_CACHE_SUBDIR)
+
+
+def clear_template_caches() -> None:
+    """Drop all shared environments (tests / hot reconfiguration)."""
+    with _registry_lock:
+        _registry.clear()
+
+
+# Module exports
+__all__ = [
+    'TemplateCache',
+    'get_template_cache',
+    'get_template_cache_stats',
+    'resolve_bytecode_dir',
+    'clear_template_caches',
+]
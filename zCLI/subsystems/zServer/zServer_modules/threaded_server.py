@@ -0,0 +1,146 @@
+# zCLI/subsystems/zServer/zServer_modules/threaded_server.py
+
+"""
+Thread-pool HTTP server for zServer Development mode
+
+Drop-in replacement for http.server.HTTPServer that hands each accepted
+connection to a bounded worker pool, so one slow route (form processing,
+PageRenderer, template rendering) no longer blocks every other client.
+
+Bounding:
+    - max_workers: Requests processed concurrently (pool size)
+    - backlog: Kernel listen() queue for connections waiting on a free worker
+
+When every worker is busy the accept loop stops pulling connections off the
+socket, so excess clients wait in the kernel backlog instead of piling up in
+an unbounded in-process queue.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer
+from typing import Any, Dict, Optional
+
+# =============================================================================
+# MODULE CONSTANTS
+# =============================================================================
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_BACKLOG = 64
+WORKER_THREAD_PREFIX = "zServer-worker"
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that processes requests on a bounded ThreadPoolExecutor.
+
+    Routing, RBAC and handler semantics are unchanged: every request still goes
+    through the same handler class, only the thread it runs on differs.
+
+    Attributes:
+        max_workers: Number of worker threads
+        request_queue_size: listen() backlog (set from backlog argument)
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        backlog: int = DEFAULT_BACKLOG,
+        logger: Optional[Any] = None
+    ):
+        """
+        Initialize pooled HTTP server.
+
+        Args:
+            server_address: (host, port) tuple
+            handler_class: Request handler class (or partial)
+            max_workers: Maximum concurrent requests (default: 16)
+            backlog: listen() queue size for pending connections (default: 64)
+            logger: Optional zCLI logger for worker errors
+        """
+        # Must be set before HTTPServer.__init__ calls server_activate()/listen()
+        self.request_queue_size = backlog
+        self.max_workers = max_workers
+        self.logger = logger
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=WORKER_THREAD_PREFIX
+        )
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._stats_lock = threading.Lock()
+        self._active = 0
+        self._peak_active = 0
+        self._served = 0
+        self._errors = 0
+
+        try:
+            super().__init__(server_address, handler_class)
+        except Exception:
+            self._executor.shutdown(wait=False)
+            raise
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker (blocks accept loop when pool is full)."""
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Executor already shut down (server stopping) - drop the connection
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        """Run a single request on a worker thread."""
+        with self._stats_lock:
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            with self._stats_lock:
+                self._errors += 1
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._stats_lock:
+                self._active -= 1
+                self._served += 1
+            self._slots.release()
+
+    def handle_error(self, request, client_address):
+        """Route worker errors through zCLI logger when available."""
+        if self.logger:
+            import traceback
+            self.logger.error(f"[zServer] Worker error for {client_address}: {traceback.format_exc()}")
+        else:
+            super().handle_error(request, client_address)
+
+    def server_close(self):
+        """Close listening socket, then drain in-flight requests."""
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get worker pool statistics.
+
+        Returns:
+            dict: max_workers, backlog, active, peak_active, served, errors
+        """
+        with self._stats_lock:
+            return {
+                "max_workers": self.max_workers,
+                "backlog": self.request_queue_size,
+                "active": self._active,
+                "peak_active": self._peak_active,
+                "served": self._served,
+                "errors": self._errors,
+            }
+
+
+# Module exports
+__all__ = ['PooledHTTPServer', 'DEFAULT_MAX_WORKERS', 'DEFAULT_BACKLOG']
@@ -9,6 +9,13 @@ NO code duplication - reuses existing handler, router, and renderer.
 
 from typing import Any, Callable, Iterable, List, Tuple
 
+from .static_files import (
+    FILE_BLOCK_SIZE, get_stat_cache, is_not_modified, parse_range,
+    build_file_headers, iter_file_range
+)
+from .compression import select_variant, compress_body
+from .page_cache import etag_matches
+
 
 class zServerWSGIApp:
     """
@@ -64,9 +71,11 @@ class zServerWSGIApp:
             # Handle request using zServer's existing logic
             status, headers, body = self._handle_request(path, method, environ)
             
-            # Convert to WSGI format
+            # Convert to WSGI format (file responses are already iterables)
             start_response(status, headers)
-            return [body]
+            if isinstance(body, bytes):
+                return [body]
+            return body
         
         except Exception as e:
             # Error handling
@@ -95,7 +104,7 @@ class zServerWSGIApp:
         """
         # Handle /static/* files directly (Flask convention)
         if path.startswith('/static/'):
-            return self._handle_static_file(path)
+            return self._handle_static_file(path, environ)
         
         # Handle favicon.ico
         if path == '/favicon.ico':
@@ -106,7 +115,7 @@ class zServerWSGIApp:
             return self._error_response_tuple(404, "No routes configured")
         
         # Route matching (uses existing HTTPRouter)
-        route = self.router.match_route(path)
+        route = self.router.match_route(path, method)
         if not route:
             return self._error_response_tuple(404, f"Route not found: {path}")
         
@@ -125,7 +134,7 @@ class zServerWSGIApp:
             # For now, just render the template (full execution comes in Phase 3)
             return self._handle_template_route(route)
         elif route_type == 'static':
-            return self._handle_static_route(route)
+            return self._handle_static_route(route, environ)
         elif route_type == 'content':
             return self._handle_content_route(route)
         elif route_type == 'form':
@@ -133,22 +142,23 @@ class zServerWSGIApp:
         elif route_type == 'json':
             return self._handle_json_route(route, path)
         elif route_type == 'dynamic':
-            return self._handle_dynamic_route(route)
+            return self._handle_dynamic_route(route, environ)
         else:
             return self._error_response_tuple(501, f"Route type '{route_type}' not supported")
     
     def _handle_template_route(self, route: dict) -> Tuple[str, List[Tuple[str, str]], bytes]:
         """Handle template route using Jinja2."""
         try:
-            from jinja2 import Environment, FileSystemLoader
             import os
+            from .template_cache import get_template_cache, resolve_bytecode_dir
             
             template_name = route.get("template", "")
             context = route.get("context", {})
             
             templates_dir = os.path.join(self.serve_path, self.template_folder)
-            env = Environment(loader=FileSystemLoader(templates_dir))
-            template = env.get_template(template_name)
+            zcli = getattr(self.zserver, 'zcli', None)
+            template_cache = get_template_cache(templates_dir, resolve_bytecode_dir(zcli))
+            template = template_cache.get_template(template_name)
             html_content = template.render(**context)
             
             body = html_content.encode('utf-8')
@@ -163,30 +173,18 @@ class zServerWSGIApp:
             self.logger.error(f"[WSGI] Template error: {e}")
             return self._error_response_tuple(500, f"Template error: {str(e)}")
     
-    def _handle_static_route(self, route: dict) -> Tuple[str, List[Tuple[str, str]], bytes]:
+    def _handle_static_route(self, route: dict, environ: dict) -> Tuple[str, List[Tuple[str, str]], Any]:
         """Handle static file route."""
         try:
             import os
-            import mimetypes
             
             file_path = self.router.resolve_file_path(route)
             
-            if not os.path.exists(file_path):
+            info = get_stat_cache().get(os.path.abspath(file_path))
+            if info is None or info.is_dir:
                 return self._error_response_tuple(404, f"File not found: {file_path}")
             
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
-            content_type, _ = mimetypes.guess_type(file_path)
-            if not content_type:
-                content_type = 'application/octet-stream'
-            
-            headers = [
-                ('Content-Type', content_type),
-                ('Content-Length', str(len(content))),
-            ]
-            
-            return ('200 OK', headers, content)
+            return self._file_response(info, environ)
         
         except Exception as e:
             self.logger.error(f"[WSGI] Static file error: {e}")
@@ -204,7 +202,7 @@ class zServerWSGIApp:
         
         return ('200 OK', headers, body)
     
-    def _handle_dynamic_route(self, route: dict) -> Tuple[str, List[Tuple[str, str]], bytes]:
+    def _handle_dynamic_route(self, route: dict, environ: dict) -> Tuple[str, List[Tuple[str, str]], bytes]:
         """Handle dynamic zWalker route."""
         try:
             from .page_renderer import PageRenderer
@@ -214,13 +212,25 @@ class zServerWSGIApp:
             
             routes = self.router.routes.get('routes', {}) if hasattr(self.router, 'routes') else {}
             renderer = PageRenderer(self.zserver.zcli, routes=routes)
-            html_content = renderer.render_page(zVaFile, zBlock)
+            page = renderer.render_page_cached(zVaFile, zBlock, params=route.get("_params"))
             
-            body = html_content.encode('utf-8')
+            if etag_matches(environ.get('HTTP_IF_NONE_MATCH'), page.etag):
+                return ('304 Not Modified', [
+                    ('ETag', page.etag),
+                    ('Cache-Control', 'private, no-cache'),
+                    ('Vary', 'Accept-Encoding'),
+                ], b'')
+            
+            body, content_encoding = compress_body(page.body, environ.get('HTTP_ACCEPT_ENCODING'))
             headers = [
                 ('Content-Type', 'text/html; charset=utf-8'),
                 ('Content-Length', str(len(body))),
+                ('ETag', f'W/{page.etag}' if content_encoding else page.etag),
+                ('Cache-Control', 'private, no-cache'),
+                ('Vary', 'Accept-Encoding'),
             ]
+            if content_encoding:
+                headers.append(('Content-Encoding', content_encoding))
             
             return ('200 OK', headers, body)
         
@@ -252,37 +262,84 @@ class zServerWSGIApp:
         
         return (status, headers, body)
     
-    def _handle_static_file(self, path: str) -> Tuple[str, List[Tuple[str, str]], bytes]:
+    def _handle_static_file(self, path: str, environ: dict) -> Tuple[str, List[Tuple[str, str]], Any]:
         """Handle /static/* requests (Flask convention)."""
         try:
             import os
-            import mimetypes
             
             # Remove /static/ prefix and build file path
             file_rel_path = path[8:]  # Remove "/static/"
-            file_path = os.path.join(self.serve_path, self.static_folder, file_rel_path)
+            static_root = os.path.abspath(os.path.join(self.serve_path, self.static_folder))
+            file_path = os.path.abspath(os.path.join(static_root, file_rel_path))
             
-            if not os.path.exists(file_path):
-                return self._error_response_tuple(404, f"Static file not found: {path}")
-            
-            with open(file_path, 'rb') as f:
-                content = f.read()
+            # Security: Prevent directory traversal
+            if not file_path.startswith(static_root):
+                return self._error_response_tuple(403, "Access denied")
             
-            content_type, _ = mimetypes.guess_type(file_path)
-            if not content_type:
-                content_type = 'application/octet-stream'
-            
-            headers = [
-                ('Content-Type', content_type),
-                ('Content-Length', str(len(content))),
-            ]
+            info = get_stat_cache().get(file_path)
+            if info is None or info.is_dir:
+                return self._error_response_tuple(404, f"Static file not found: {path}")
             
-            return ('200 OK', headers, content)
+            return self._file_response(info, environ, cache_control="public, max-age=3600")
         
         except Exception as e:
             self.logger.error(f"[WSGI] Error serving static file {path}: {e}")
             return self._error_response_tuple(500, f"Error serving static file: {str(e)}")
     
+    def _file_response(
+        self,
+        info: Any,
+        environ: dict,
+        cache_control: str = None
+    ) -> Tuple[str, List[Tuple[str, str]], Any]:
+        """
+        Build a streamed file response with ETag/Last-Modified, 304 and Range support.
+        
+        Full-file bodies use wsgi.file_wrapper when the server provides it
+        (Gunicorn uses sendfile); partial bodies are streamed in blocks.
+        
+        Args:
+            info: FileInfo from the stat cache
+            environ: WSGI environment dict
+            cache_control: Optional Cache-Control header value
+        
+        Returns:
+            Tuple of (status_line, headers, body_iterable)
+        """
+        # Precompressed sidecar (.br/.gz) when the client accepts it
+        info, content_encoding, vary = select_variant(info, environ.get('HTTP_ACCEPT_ENCODING'))
+        
+        headers = list(build_file_headers(info, cache_control).items())
+        if vary:
+            headers.append(('Vary', 'Accept-Encoding'))
+        
+        if is_not_modified(info, environ.get('HTTP_IF_NONE_MATCH'), environ.get('HTTP_IF_MODIFIED_SINCE')):
+            return ('304 Not Modified', headers, b'')
+        
+        try:
+            byte_range = parse_range(environ.get('HTTP_RANGE'), environ.get('HTTP_IF_RANGE'), info)
+        except ValueError:
+            return ('416 Range Not Satisfiable', [
+                ('Content-Range', f'bytes */{info.size}'),
+                ('Content-Length', '0'),
+            ], b'')
+        
+        headers.append(('Content-Type', info.content_type))
+        if content_encoding:
+            headers.append(('Content-Encoding', content_encoding))
+        
+        if byte_range:
+            start, length = byte_range
+            headers.append(('Content-Length', str(length)))
+            headers.append(('Content-Range', f'bytes {start}-{start + length - 1}/{info.size}'))
+            return ('206 Partial Content', headers, iter_file_range(info.path, start, length))
+        
+        headers.append(('Content-Length', str(info.size)))
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper:
+            return ('200 OK', headers, file_wrapper(open(info.path, 'rb'), FILE_BLOCK_SIZE))
+        return ('200 OK', headers, iter_file_range(info.path, 0, info.size))
+    
     def _handle_favicon(self) -> Tuple[str, List[Tuple[str, str]], bytes]:
         """Handle /favicon.ico request."""
         try:
@@ -32,6 +32,8 @@ Architecture
 4. **wizard_transactions.py**: Transaction management for data operations
 5. **wizard_rbac.py**: Role-based access control enforcement
 6. **wizard_exceptions.py**: Custom exception types
+7. **wizard_plan.py**: Compiled zBlock execution plans (key index, menu anchors)
+8. **wizard_parallel.py**: Dependency-aware concurrent steps for `_parallel` wizards
 
 ### Navigation Flow
 ```
@@ -300,14 +302,23 @@ Notes
 
 from typing import Any, Dict, Optional
 
+from zCLI import time
+
 from .zWizard_modules.wizard_hat import WizardHat
-from .zWizard_modules.wizard_interpolation import interpolate_zhat
+from .zWizard_modules.wizard_interpolation import get_zhat_template
 from .zWizard_modules.wizard_transactions import (
     check_transaction_start,
     commit_transaction,
     rollback_transaction,
 )
-from .zWizard_modules.wizard_rbac import check_rbac_access
+from .zWizard_modules.wizard_rbac import check_rbac_access, RBAC_KEY
+from .zWizard_modules.wizard_plan import get_block_plan
+from .zWizard_modules.wizard_parallel import (
+    build_step_graph,
+    run_parallel_steps,
+    resolve_max_workers,
+    META_KEY_PARALLEL,
+)
 from .zWizard_modules.wizard_exceptions import (
     WizardInitializationError,
     ERR_MISSING_INSTANCE
@@ -349,6 +360,7 @@ RBAC_ACCESS_DENIED: str = "access_denied"
 CONTEXT_KEY_WIZARD_MODE: str = SESSION_KEY_WIZARD_MODE  # Use zConfig constant
 CONTEXT_KEY_SCHEMA_CACHE: str = "schema_cache"
 CONTEXT_KEY_ZHAT: str = "zHat"
+CONTEXT_KEY_ISOLATED_DATA: str = "isolated_data"  # zData: own handler (parallel pool steps)
 
 # Navigation Callback Keys
 CALLBACK_ON_BACK: str = "on_back"
@@ -372,6 +384,11 @@ COLOR_ERROR: str = "ERROR"
 LOG_MSG_PROCESSING_KEY: str = "Processing key: %s"
 LOG_MSG_MENU_SELECTED: str = "Menu selected key: %s - jumping to it"
 LOG_MSG_DISPATCH_ERROR: str = "Error for key '%s': %s"
+LOG_MSG_WIZARD_COMPLETED: str = "zWizard completed %d steps in %.1f ms (%s)"
+
+# Run Modes
+MODE_SEQUENTIAL: str = "sequential"
+MODE_PARALLEL: str = "parallel"
 
 # Display Indentation Levels
 INDENT_LEVEL_0: int = 0
@@ -389,6 +406,8 @@ class zWizard:
     logger: Any
     display: Optional[Any]
     schema_cache: Optional[Any]
+    system_cache: Optional[Any]
+    last_run_stats: Optional[Dict[str, Any]]
 
     def __init__(self, zcli: Optional[Any] = None, walker: Optional[Any] = None) -> None:
         """Initialize zWizard subsystem with either zcli or walker instance."""
@@ -399,8 +418,9 @@ class zWizard:
             self.zSession = zcli.session
             self.logger = zcli.logger
             self.display = zcli.display
-            # Get schema_cache from cache orchestrator
+            # Get schema_cache (and system_cache for block plans) from cache orchestrator
             self.schema_cache = zcli.loader.cache.schema_cache
+            self.system_cache = zcli.loader.cache.system_cache
         elif walker:
             self.zcli = None
             self.walker = walker
@@ -415,11 +435,16 @@ class zWizard:
             # Get schema_cache from walker's loader (if available)
             if hasattr(walker, 'loader') and hasattr(walker.loader, 'cache'):
                 self.schema_cache = walker.loader.cache.schema_cache
+                self.system_cache = getattr(walker.loader.cache, "system_cache", None)
             else:
                 self.schema_cache = None
+                self.system_cache = None
         else:
             raise WizardInitializationError(ERR_MISSING_INSTANCE)
 
+        # End-to-end latency of the last handle() run (see handle())
+        self.last_run_stats = None
+
         # Display ready message (only for direct zWizard instances, not subclasses like zWalker)
         if self.display and self.__class__.__name__ == "zWizard":
             self.display.zDeclare(MSG_READY, color=SUBSYSTEM_COLOR, indent=0, style="full")
@@ -501,9 +526,12 @@ class zWizard:
             - wizard_examples.py: Comprehensive usage patterns
         """
         dispatch_fn = self._get_dispatch_fn(dispatch_fn, context)
-        # Filter out metadata keys (underscore prefix) - they don't execute, only configure
-        keys_list = [k for k in items_dict.keys() if not k.startswith('_')]
-        idx = keys_list.index(start_key) if start_key and start_key in keys_list else 0
+        # Compiled once per block (cached with the parsed UI): keys without metadata
+        # (underscore prefix), key → index and menu anchors
+        plan = get_block_plan(items_dict, self.system_cache)
+        keys_list = plan.keys
+        key_index = plan.index
+        idx = key_index.get(start_key, 0) if start_key else 0
 
         # Main loop
         while idx < len(keys_list):
@@ -517,14 +545,15 @@ class zWizard:
             # ════════════════════════════════════════════════════════════
             # RBAC Enforcement (v1.5.4 Week 3.3)
             # ════════════════════════════════════════════════════════════
-            # Check if this item has RBAC requirements
-            rbac_check_result = check_rbac_access(
-                key, value, self.zcli, self.walker, self.logger, self.display
-            )
-            if rbac_check_result == RBAC_ACCESS_DENIED:
-                # Skip this item and move to next
-                idx += 1
-                continue
+            # Only items with RBAC requirements are checked (read live, not from the plan)
+            if isinstance(value, dict) and value.get(RBAC_KEY):
+                rbac_check_result = check_rbac_access(
+                    key, value, self.zcli, self.walker, self.logger, self.display
+                )
+                if rbac_check_result == RBAC_ACCESS_DENIED:
+                    # Skip this item and move to next
+                    idx += 1
+                    continue
 
             # Execute action via dispatch
             try:
@@ -536,9 +565,9 @@ class zWizard:
                 continue
 
             # Check if result is a key jump (e.g., menu selection)
-            if isinstance(result, str) and result in keys_list and result not in NAVIGATION_SIGNALS:
+            if isinstance(result, str) and result in key_index and result not in NAVIGATION_SIGNALS:
                 self.logger.debug(LOG_MSG_MENU_SELECTED, result)
-                idx = keys_list.index(result)
+                idx = key_index[result]
                 continue
 
             # Handle navigation result
@@ -556,19 +585,10 @@ class zWizard:
             # ════════════════════════════════════════════════════════════
             # Menu Looping: Check if we should return to a menu
             # ════════════════════════════════════════════════════════════
-            # After executing a menu selection (key jump), check if there's
-            # a menu in this block that we should loop back to, instead of
-            # continuing sequentially through the keys.
-            
-            # Search backwards from current position for a menu key
-            menu_idx = None
-            for i in range(idx - 1, -1, -1):
-                check_key = keys_list[i]
-                # Detect menu pattern: contains both ~ (anchor) and * (menu) modifiers
-                if '~' in check_key and '*' in check_key:
-                    menu_idx = i
-                    break
-            
+            # After executing a menu selection (key jump), loop back to the
+            # nearest menu (~ anchor + * menu modifiers) before this key in the
+            # block instead of continuing sequentially through the keys.
+            menu_idx = plan.menu_anchor[idx]
             if menu_idx is not None:
                 # Found a menu - loop back to it for next selection
                 self.logger.debug(f"Menu detected at index {menu_idx}, looping back to: {keys_list[menu_idx]}")
@@ -735,9 +755,14 @@ class zWizard:
             - **Transactions**: Atomic multi-step operations with automatic rollback
             - **Meta Keys**: Keys starting with _ are filtered (configuration only)
             - **Schema Cache**: Database connections reused across steps
+            - **Parallel Mode**: Independent steps run concurrently (_parallel)
+            - **Latency**: self.last_run_stats holds steps, mode and elapsed_ms
         
         Meta Keys:
             - _transaction (bool): Enable transaction mode
+            - _parallel (bool | int): Run independent steps concurrently
+              (int = worker count); see wizard_parallel.py
+            - _after (str | list, inside a step): Explicit dependency in _parallel mode
             - _config (Any): Configuration (not executed)
             - Any key starting with "_" is treated as metadata
         
@@ -759,25 +784,26 @@ class zWizard:
         if display:
             display.zDeclare(MSG_HANDLE_WIZARD, color=SUBSYSTEM_COLOR, indent=INDENT_LEVEL_1, style=STYLE_FULL)
 
+        start = time.perf_counter()
         try:
             zHat = WizardHat()  # Use dual-access container
             use_transaction = zWizard_obj.get("_transaction", False)
+            use_parallel = zWizard_obj.get(META_KEY_PARALLEL, False)
             transaction_alias = None
 
-            for step_key, step_value in zWizard_obj.items():
-                if step_key.startswith("_"):
-                    continue
-
-                if display:
-                    display.zDeclare(MSG_WIZARD_STEP % step_key, color=SUBSYSTEM_COLOR, indent=INDENT_LEVEL_2, style=STYLE_SINGLE)
-
-                step_value = interpolate_zhat(step_value, zHat, self.logger)
+            def run_step(step_key: str, step_value: Any, hat: WizardHat, isolated: bool = False) -> Any:
+                nonlocal transaction_alias
+                template = get_zhat_template(step_value)
+                if template.deps:
+                    step_value = template.render(hat, self.logger)
 
                 step_context = {
                     CONTEXT_KEY_WIZARD_MODE: True,
                     CONTEXT_KEY_SCHEMA_CACHE: self.schema_cache,
-                    CONTEXT_KEY_ZHAT: zHat  # Pass zHat to context for zFunc access
-                } if self.schema_cache else {CONTEXT_KEY_WIZARD_MODE: True, CONTEXT_KEY_ZHAT: zHat}
+                    CONTEXT_KEY_ZHAT: hat  # Pass zHat to context for zFunc access
+                } if self.schema_cache else {CONTEXT_KEY_WIZARD_MODE: True, CONTEXT_KEY_ZHAT: hat}
+                if isolated:
+                    step_context[CONTEXT_KEY_ISOLATED_DATA] = True
 
                 if transaction_alias is None:
                     transaction_alias = check_transaction_start(
@@ -785,10 +811,41 @@ class zWizard:
                         self.schema_cache, self.logger
                     )
 
-                result = self._execute_step(step_key, step_value, step_context)
-                zHat.add(step_key, result)  # Add with key for dual access
+                return self._execute_step(step_key, step_value, step_context)
+
+            def declare(step_key: str) -> None:
+                if display:
+                    display.zDeclare(MSG_WIZARD_STEP % step_key, color=SUBSYSTEM_COLOR, indent=INDENT_LEVEL_2, style=STYLE_SINGLE)
+
+            if use_parallel:
+                # $model steps run on this thread (only they can start the transaction);
+                # pool steps run zData requests on handlers of their own
+                graph = build_step_graph(zWizard_obj)
+                zHat, run_stats = run_parallel_steps(
+                    graph,
+                    lambda i, hat: run_step(graph.keys[i], graph.values[i], hat, not graph.serial[i]),
+                    resolve_max_workers(use_parallel, len(graph.keys)),
+                    self.logger,
+                    on_start=lambda i: declare(graph.keys[i]),
+                )
+            else:
+                run_stats = {}
+                for step_key, step_value in zWizard_obj.items():
+                    if step_key.startswith("_"):
+                        continue
+                    declare(step_key)
+                    result = run_step(step_key, step_value, zHat)
+                    zHat.add(step_key, result)  # Add with key for dual access
 
             commit_transaction(use_transaction, transaction_alias, self.schema_cache, self.logger)
+
+            run_stats.update({
+                "steps": len(zHat),
+                "mode": MODE_PARALLEL if use_parallel else MODE_SEQUENTIAL,
+                "elapsed_ms": (time.perf_counter() - start) * 1000,
+            })
+            self.last_run_stats = run_stats
+            self.logger.debug(LOG_MSG_WIZARD_COMPLETED, len(zHat), run_stats["elapsed_ms"], run_stats["mode"])
             self.logger.debug("zWizard completed with zHat: %s", zHat)
             return zHat
 
@@ -14,6 +14,8 @@ Module Organization:
 4. **wizard_rbac.py**: Role-based access control enforcement
 5. **wizard_exceptions.py**: Custom exception hierarchy
 6. **wizard_examples.py**: Comprehensive usage patterns and examples
+7. **wizard_plan.py**: Compiled zBlock execution plans for execute_loop()
+8. **wizard_parallel.py**: Dependency graph + thread pool for `_parallel` wizards
 
 Exported Components:
 -------------------
@@ -23,14 +25,20 @@ Exported Components:
 - WizardInitializationError: Initialization failures
 - WizardExecutionError: Execution failures
 - WizardRBACError: Access control violations
+- BlockPlan: Compiled zBlock (key index, menu anchors)
+- ZHatTemplate: Compiled zHat interpolation template for one step value
+- StepGraph: Wizard steps with zHat/_after/transaction dependencies
 
 ### Functions
 - interpolate_zhat(): Template variable interpolation
+- compile_zhat_template() / get_zhat_template(): Build or fetch a ZHatTemplate
 - check_transaction_start(): Detect transaction start
 - commit_transaction(): Commit active transaction
 - rollback_transaction(): Rollback on error
 - check_rbac_access(): Enforce RBAC before step execution
 - display_access_denied(): Display access denial messages
+- compile_block_plan() / get_block_plan(): Build or fetch a BlockPlan
+- build_step_graph() / run_parallel_steps(): Parallel wizard execution
 
 Usage:
 ------
@@ -58,13 +66,20 @@ Version: v1.5.4 Week 6.14 Phase 3 (Polish)
 """
 
 from .wizard_hat import WizardHat
-from .wizard_interpolation import interpolate_zhat
+from .wizard_interpolation import (
+    interpolate_zhat,
+    ZHatTemplate,
+    compile_zhat_template,
+    get_zhat_template,
+)
 from .wizard_transactions import (
     check_transaction_start,
     commit_transaction,
     rollback_transaction,
 )
 from .wizard_rbac import check_rbac_access, display_access_denied
+from .wizard_plan import BlockPlan, compile_block_plan, get_block_plan
+from .wizard_parallel import StepGraph, build_step_graph, run_parallel_steps
 from .wizard_exceptions import (
     zWizardError,
     WizardInitializationError,
@@ -75,11 +90,20 @@ from .wizard_exceptions import (
 __all__ = [
     "WizardHat",
     "interpolate_zhat",
+    "ZHatTemplate",
+    "compile_zhat_template",
+    "get_zhat_template",
     "check_transaction_start",
     "commit_transaction",
     "rollback_transaction",
     "check_rbac_access",
     "display_access_denied",
+    "BlockPlan",
+    "compile_block_plan",
+    "get_block_plan",
+    "StepGraph",
+    "build_step_graph",
+    "run_parallel_steps",
     "zWizardError",
     "WizardInitializationError",
     "WizardExecutionError",
@@ -20,6 +20,23 @@ Interpolation Syntax
 - **Type Preservation**: Maintains original data structure types
 - **Safe Fallback**: Returns "None" string for missing keys (with warning)
 - **Flexible Keys**: Supports both numeric and string key access
+- **By-Reference Values**: A string that is exactly one reference (`"zHat[rows]"`)
+  resolves to the stored value itself - no repr() of large result sets
+
+Compiled Templates
+------------------
+zWizard.handle() does not re-walk step values with a regex on every run. Each
+step value is compiled once into a ZHatTemplate:
+
+- **deps**: zHat keys the step references (empty = the step is used as-is,
+  no walk and no copy)
+- **Static subtrees are shared**: Only dicts/lists on a path to a reference are
+  shallow-copied when rendering; everything else is the original object
+- **Pre-split strings**: Literal segments and references are found once, so
+  rendering is a join, not a re.sub()
+
+get_zhat_template() keeps compiled templates in a small identity-keyed LRU, so
+a wizard loaded from a cached UI file compiles its steps only on the first run.
 
 Works at Any Nesting Level
 --------------------------
@@ -46,16 +63,16 @@ config = {
     "id": "zHat[user_id]"
 }
 result = interpolate_zhat(config, zHat, logger)
-# Result: {"user": "42", "id": "'alice'"}
+# Result: {"user": "alice", "id": 42}  (whole-string references keep the value)
 ```
 
 ### List Interpolation
 ```python
 zHat.add("file1", "/path/to/file1")
 zHat.add("file2", "/path/to/file2")
-files = ["zHat[file1]", "zHat[file2]"]
+files = ["cat zHat[file1]", "zHat[file2]"]
 result = interpolate_zhat(files, zHat, logger)
-# Result: ["'/path/to/file1'", "'/path/to/file2'"]
+# Result: ["cat '/path/to/file1'", "/path/to/file2"]
 ```
 
 ### Nested Structure Interpolation
@@ -82,6 +99,7 @@ Error Handling
 Constants Reference
 -------------------
 - ZHAT_PATTERN: Regex pattern for matching zHat references
+- TEMPLATE_CACHE_SIZE: Compiled templates kept by get_zhat_template()
 - ZHAT_FALLBACK: Default value for missing keys
 - LOG_MSG_KEY_NOT_FOUND: Warning message for missing keys
 - STR_QUOTE_CHARS: Characters to strip from quoted keys
@@ -90,16 +108,18 @@ Dependencies
 -----------
 - **re**: Regular expression module for pattern matching
 - **WizardHat**: Container with dual/triple access for step results
+- **OrderedDict**: LRU of compiled templates
 
 Layer: 2, Position: 2 (zWizard subsystem)
 Week: 6.14
 Version: v1.5.4 Phase 1 (Industry-Grade)
 """
 
-from typing import Any
-from zCLI import re
+import threading
+from typing import FrozenSet, Tuple
+from zCLI import re, Any, Optional, Union, OrderedDict
 
-__all__ = ["interpolate_zhat"]
+__all__ = ["interpolate_zhat", "ZHatTemplate", "compile_zhat_template", "get_zhat_template"]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -110,6 +130,7 @@ __all__ = ["interpolate_zhat"]
 # Matches: zHat[numeric] OR zHat["key"] OR zHat['key'] OR zHat[key]
 # Group 1 captures: digits OR quoted string OR unquoted word
 ZHAT_PATTERN: str = r"zHat\[(['\"]?\w+['\"]?)\]"
+ZHAT_REGEX = re.compile(ZHAT_PATTERN)
 
 # Fallback Values
 ZHAT_FALLBACK: str = "None"
@@ -120,6 +141,153 @@ LOG_MSG_KEY_NOT_FOUND: str = "zHat key not found during interpolation: %s"
 # String Processing
 STR_QUOTE_CHARS: str = "'\""
 
+# Template Cache
+TEMPLATE_CACHE_SIZE: int = 256
+
+# Compiled Node Types
+NODE_REF: str = "ref"
+NODE_STR: str = "str"
+NODE_DICT: str = "dict"
+NODE_LIST: str = "list"
+
+_template_cache: "OrderedDict[int, Tuple[Any, ZHatTemplate]]" = OrderedDict()
+_template_cache_lock = threading.Lock()  # parallel wizard steps share the cache
+
+
+def _parse_key(raw: str) -> Union[int, str]:
+    """Reference key as used for lookup: int for zHat[0], unquoted str otherwise."""
+    if raw.isdigit():
+        return int(raw)
+    return raw.strip(STR_QUOTE_CHARS)
+
+
+def _resolve(key: Union[int, str], zHat: Any, logger: Any) -> Tuple[bool, Any]:
+    """Look up one reference; returns (found, value)."""
+    if isinstance(key, int):
+        # Numeric index (backward compatible)
+        return (True, zHat[key]) if key < len(zHat) else (False, None)
+    if key in zHat:
+        return True, zHat[key]
+    logger.warning(LOG_MSG_KEY_NOT_FOUND, key)
+    return False, None
+
+
+def _compile(value: Any, deps: set) -> Optional[tuple]:
+    """Compile value into a render node, or None if it holds no zHat reference."""
+    if isinstance(value, str):
+        if "zHat[" not in value:
+            return None
+        whole = ZHAT_REGEX.fullmatch(value)
+        if whole:
+            key = _parse_key(whole.group(1))
+            deps.add(key)
+            return (NODE_REF, key)
+        parts = []
+        last = 0
+        for match in ZHAT_REGEX.finditer(value):
+            key = _parse_key(match.group(1))
+            deps.add(key)
+            parts.append((value[last:match.start()], key))
+            last = match.end()
+        if not parts:
+            return None
+        return (NODE_STR, tuple(parts), value[last:])
+
+    if isinstance(value, dict):
+        children = tuple(
+            (k, node) for k, node in ((k, _compile(v, deps)) for k, v in value.items()) if node is not None
+        )
+        return (NODE_DICT, children) if children else None
+
+    if isinstance(value, list):
+        children = tuple(
+            (i, node) for i, node in ((i, _compile(v, deps)) for i, v in enumerate(value)) if node is not None
+        )
+        return (NODE_LIST, children) if children else None
+
+    return None
+
+
+def _render(node: tuple, value: Any, zHat: Any, logger: Any) -> Any:
+    """Render one compiled node against the value it was compiled from."""
+    kind = node[0]
+    if kind == NODE_REF:
+        found, resolved = _resolve(node[1], zHat, logger)
+        return resolved if found else ZHAT_FALLBACK
+    if kind == NODE_STR:
+        out = []
+        for literal, key in node[1]:
+            found, resolved = _resolve(key, zHat, logger)
+            out.append(literal)
+            out.append(repr(resolved) if found else ZHAT_FALLBACK)
+        out.append(node[2])
+        return "".join(out)
+    # dict / list: shallow copy, replace only the children holding references
+    rendered = dict(value) if kind == NODE_DICT else list(value)
+    for k, child in node[1]:
+        rendered[k] = _render(child, value[k], zHat, logger)
+    return rendered
+
+
+class ZHatTemplate:
+    """Compiled zHat interpolation template for one step value."""
+
+    __slots__ = ("source", "deps", "_node")
+
+    def __init__(self, source: Any) -> None:
+        """Compile source (one walk, one regex scan per string containing 'zHat[')."""
+        deps: set = set()
+        self.source = source
+        self._node = _compile(source, deps)
+        self.deps: FrozenSet[Union[int, str]] = frozenset(deps)
+
+    def render(self, zHat: Any, logger: Any) -> Any:
+        """
+        Interpolate against zHat.
+
+        Returns source itself when it has no references; otherwise a copy that
+        shares every subtree without references with source.
+        """
+        if self._node is None:
+            return self.source
+        return _render(self._node, self.source, zHat, logger)
+
+    def __repr__(self) -> str:
+        return f"ZHatTemplate(deps={sorted(map(str, self.deps))})"
+
+
+def compile_zhat_template(step_value: Any) -> ZHatTemplate:
+    """Compile a step value into a ZHatTemplate (uncached)."""
+    return ZHatTemplate(step_value)
+
+
+def get_zhat_template(step_value: Any) -> ZHatTemplate:
+    """
+    Get the compiled template for step_value, compiling it on first use.
+
+    Templates are cached by object identity (the cache holds step_value, so the
+    id cannot be reused while cached). Containers from a cached UI file are the
+    same objects on every run, so their steps compile once. Safe to call from
+    parallel step threads.
+    """
+    if not isinstance(step_value, (dict, list)):
+        # Scalars are cheap to compile; don't let them churn the cache
+        return ZHatTemplate(step_value)
+
+    with _template_cache_lock:
+        held = _template_cache.get(id(step_value))
+        if held is not None and held[0] is step_value:
+            _template_cache.move_to_end(id(step_value))
+            return held[1]
+
+    # Compile outside the lock; a racing thread may compile the same step too
+    template = ZHatTemplate(step_value)
+    with _template_cache_lock:
+        _template_cache[id(step_value)] = (step_value, template)
+        if len(_template_cache) > TEMPLATE_CACHE_SIZE:
+            _template_cache.popitem(last=False)
+    return template
+
 
 def interpolate_zhat(step_value: Any, zHat: Any, logger: Any) -> Any:
     """
@@ -134,6 +302,9 @@ def interpolate_zhat(step_value: Any, zHat: Any, logger: Any) -> Any:
     - Top-level strings: "zHat[0]"
     - Nested in dicts: {zDisplay: {content: "zHat[fetch_files]"}}
     - Nested in lists: ["zHat[0]", "zHat[1]"]
+
+    References embedded in text are replaced by repr() of the value; a string
+    that is exactly one reference resolves to the value itself.
     
     Args:
         step_value: Value to interpolate (str, dict, list, or primitive)
@@ -141,42 +312,7 @@ def interpolate_zhat(step_value: Any, zHat: Any, logger: Any) -> Any:
         logger: Logger instance for warnings
         
     Returns:
-        Interpolated value (same type as input)
+        Interpolated value (same type as input; subtrees without references
+        are shared with step_value)
     """
-    # Handle strings (base case - actual interpolation happens here)
-    if isinstance(step_value, str):
-        def repl(match: Any) -> str:
-            key = match.group(1)
-            
-            # Handle numeric index (backward compatible)
-            if key.isdigit():
-                idx = int(key)
-                return repr(zHat[idx]) if idx < len(zHat) else ZHAT_FALLBACK
-            
-            # Handle string key (remove quotes if present)
-            key_clean = key.strip(STR_QUOTE_CHARS)
-            
-            # Check if key exists in zHat
-            if key_clean in zHat:
-                return repr(zHat[key_clean])
-            
-            # Key not found - return None
-            logger.warning(LOG_MSG_KEY_NOT_FOUND, key_clean)
-            return ZHAT_FALLBACK
-        
-        # Use constant pattern for regex substitution
-        return re.sub(ZHAT_PATTERN, repl, step_value)
-    
-    # Handle dicts (recursive case)
-    elif isinstance(step_value, dict):
-        return {k: interpolate_zhat(v, zHat, logger) for k, v in step_value.items()}
-    
-    # Handle lists (recursive case)
-    elif isinstance(step_value, list):
-        return [interpolate_zhat(item, zHat, logger) for item in step_value]
-    
-    # Other types (int, bool, None, etc.) - return as-is
-    else:
-        return step_value
-
-
+    return compile_zhat_template(step_value).render(zHat, logger)
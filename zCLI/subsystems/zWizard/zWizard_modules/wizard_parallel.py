@@ -0,0 +1,316 @@
+# zCLI/subsystems/zWizard/zWizard_modules/wizard_parallel.py
+
+"""
+Wizard Parallel - Dependency-Aware Concurrent Step Execution
+============================================================
+
+zWizard.handle() runs steps one after another. With `_parallel: true` the
+wizard builds a dependency graph and runs independent steps concurrently on a
+bounded thread pool, so several zData reads, zFunc HTTP calls or file loads that
+are later combined overlap instead of adding up.
+
+Dependencies
+------------
+A step waits for:
+
+- **zHat references**: `zHat[step_name]` to an earlier step; `zHat[2]` waits
+  for steps 0-2 (positional access needs the whole prefix)
+- **_after**: Explicit ordering - `_after: step_name` or a list of names, for
+  steps that read zHat from a zFunc context or have side-effect ordering
+- **$model steps**: zData steps on a `$model` alias share that alias's
+  schema_cache connection (and, with `_transaction: true`, its transaction),
+  so they run one after another in declaration order on the calling thread;
+  other steps still overlap
+
+References to later or unknown steps are not dependencies (they resolve to the
+"None" fallback, exactly as in sequential mode).
+
+Determinism
+-----------
+- **WizardHat order**: Results are added in declaration order after the run,
+  so zHat[0..n] is identical to sequential mode
+- **Step views**: A step is interpolated (and receives a context zHat) built
+  from the steps completed when it is scheduled - always including all of its
+  dependencies
+- **Errors**: The first failing step stops scheduling; running steps finish,
+  not-started steps are cancelled and the error is raised (rollback as usual)
+
+zData Isolation
+---------------
+Pool steps get `isolated_data: True` in their context: zData runs their
+requests on a handler of their own (spawn_handler()) in one-shot mode, with a
+connection checked out of the pool on that thread, instead of on the shared
+zcli.data instance.
+
+Async Functions
+--------------
+zFunc runs coroutine functions on its shared background event loop, so async
+steps dispatched from pool threads run concurrently on that loop; the pool
+thread only waits for the result.
+
+Usage
+-----
+```yaml
+_parallel: true          # or a worker count, e.g. _parallel: 4
+users: {zData: {action: read, model: users}}
+teams: {zData: {action: read, model: teams}}
+report:
+  zFunc: "&reports.build(zHat[users], zHat[teams])"
+notify:
+  _after: report
+  zFunc: "&mail.send_report()"
+```
+
+Layer: 2, Position: 2 (zWizard subsystem)
+"""
+
+import heapq
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import FrozenSet, Set
+
+from zCLI import Any, Callable, Dict, List, Optional, Tuple, time
+
+from .wizard_exceptions import WizardExecutionError, ERR_INVALID_CONFIG
+from .wizard_hat import WizardHat
+from .wizard_interpolation import get_zhat_template
+from .wizard_transactions import KEY_ZDATA, KEY_MODEL, PREFIX_TXN_MODEL
+
+__all__ = ["StepGraph", "build_step_graph", "run_parallel_steps", "resolve_max_workers"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MODULE CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Meta Keys
+META_KEY_PARALLEL: str = "_parallel"
+META_KEY_AFTER: str = "_after"
+META_KEY_PREFIX: str = "_"
+
+# Pool Sizing
+DEFAULT_MAX_WORKERS: int = 8
+THREAD_NAME_PREFIX: str = "zWizard"
+
+# Error Messages
+ERR_UNKNOWN_AFTER: str = "step '%s' has _after '%s', which is not a step of this wizard"
+ERR_DEPENDENCY_CYCLE: str = "dependency cycle between steps: %s"
+
+# Log Messages
+LOG_PARALLEL_PLAN: str = "[zWizard] Parallel mode: %d steps, %d workers, %d serialized"
+
+
+def resolve_max_workers(parallel_flag: Any, step_count: int) -> int:
+    """Worker count for a `_parallel` value (True = default, int = explicit)."""
+    if isinstance(parallel_flag, bool) or not isinstance(parallel_flag, int):
+        workers = DEFAULT_MAX_WORKERS
+    else:
+        workers = parallel_flag
+    return max(1, min(workers, step_count))
+
+
+def _is_alias_step(step_value: Any) -> bool:
+    """True for zData steps on a $model (a schema_cache alias connection)."""
+    if isinstance(step_value, dict) and isinstance(step_value.get(KEY_ZDATA), dict):
+        model = step_value[KEY_ZDATA].get(KEY_MODEL)
+        return isinstance(model, str) and model.startswith(PREFIX_TXN_MODEL)
+    return False
+
+
+class StepGraph:
+    """Wizard steps with their dependencies (by declaration index)."""
+
+    __slots__ = ("keys", "values", "deps", "dependents", "serial")
+
+    def __init__(self, keys: List[str], values: List[Any], deps: List[Set[int]], serial: List[bool]) -> None:
+        self.keys = keys
+        self.values = values
+        self.deps: List[FrozenSet[int]] = [frozenset(d) for d in deps]
+        self.serial = serial
+        self.dependents: List[List[int]] = [[] for _ in keys]
+        for i, step_deps in enumerate(self.deps):
+            for dep in step_deps:
+                self.dependents[dep].append(i)
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        """Raise WizardExecutionError if _after edges form a cycle."""
+        remaining = [len(d) for d in self.deps]
+        ready = [i for i, count in enumerate(remaining) if count == 0]
+        seen = 0
+        while ready:
+            i = ready.pop()
+            seen += 1
+            for child in self.dependents[i]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if seen != len(self.keys):
+            stuck = [self.keys[i] for i, count in enumerate(remaining) if count]
+            raise WizardExecutionError(ERR_INVALID_CONFIG % (ERR_DEPENDENCY_CYCLE % ", ".join(stuck)))
+
+
+def build_step_graph(zWizard_obj: Dict[str, Any]) -> StepGraph:
+    """
+    Build the dependency graph of a wizard's steps.
+
+    $model zData steps are marked serial and chained in declaration order.
+
+    Args:
+        zWizard_obj: Wizard steps (meta keys with _ prefix are skipped)
+
+    Returns:
+        StepGraph: Step keys, dispatchable values (without _after) and dependencies
+    """
+    keys: List[str] = []
+    values: List[Any] = []
+    for key, value in zWizard_obj.items():
+        if not key.startswith(META_KEY_PREFIX):
+            keys.append(key)
+            values.append(value)
+    position = {key: i for i, key in enumerate(keys)}
+
+    deps: List[Set[int]] = []
+    serial: List[bool] = []
+    last_serial: Optional[int] = None
+    for i, (key, value) in enumerate(zip(keys, values)):
+        step_deps: Set[int] = set()
+        for ref in get_zhat_template(value).deps:
+            if isinstance(ref, int):
+                if ref < i:
+                    step_deps.update(range(ref + 1))
+            elif position.get(ref, i) < i:
+                step_deps.add(position[ref])
+
+        if isinstance(value, dict) and META_KEY_AFTER in value:
+            after = value[META_KEY_AFTER]
+            for name in ([after] if isinstance(after, str) else after or []):
+                if name not in position:
+                    raise WizardExecutionError(ERR_INVALID_CONFIG % (ERR_UNKNOWN_AFTER % (key, name)))
+                step_deps.add(position[name])
+            values[i] = {k: v for k, v in value.items() if k != META_KEY_AFTER}
+
+        is_serial = _is_alias_step(values[i])
+        if is_serial:
+            if last_serial is not None:
+                step_deps.add(last_serial)
+            last_serial = i
+        step_deps.discard(i)
+        deps.append(step_deps)
+        serial.append(is_serial)
+
+    return StepGraph(keys, values, deps, serial)
+
+
+def _completed_view(graph: StepGraph, results: List[Any], done: List[bool]) -> WizardHat:
+    """WizardHat of the completed steps, in declaration order."""
+    view = WizardHat()
+    for i, key in enumerate(graph.keys):
+        if done[i]:
+            view.add(key, results[i])
+    return view
+
+
+def run_parallel_steps(
+    graph: StepGraph,
+    run_step: Callable[[int, WizardHat], Any],
+    max_workers: int,
+    logger: Any,
+    on_start: Optional[Callable[[int], None]] = None
+) -> Tuple[WizardHat, Dict[str, Any]]:
+    """
+    Run the graph's steps, overlapping independent ones.
+
+    Serial ($model) steps run on the calling thread; all others on a
+    ThreadPoolExecutor of max_workers. All bookkeeping happens on the calling
+    thread, pool threads only execute run_step.
+
+    Args:
+        graph: Step graph from build_step_graph()
+        run_step: Executes step i against a zHat view, returns its result
+        max_workers: Pool size
+        logger: Logger instance
+        on_start: Optional callback when step i is scheduled (display)
+
+    Returns:
+        Tuple[WizardHat, Dict[str, Any]]: Results in declaration order and run
+        stats (steps, workers, max_in_flight, serialized, elapsed_ms)
+    """
+    count = len(graph.keys)
+    results: List[Any] = [None] * count
+    done = [False] * count
+    remaining = [len(d) for d in graph.deps]
+    ready = [i for i in range(count) if remaining[i] == 0]
+    heapq.heapify(ready)
+    in_flight: Dict[Any, int] = {}
+    max_in_flight = 0
+    error: Optional[BaseException] = None
+    serialized = sum(graph.serial)
+
+    logger.debug(LOG_PARALLEL_PLAN, count, max_workers, serialized)
+    start = time.perf_counter()
+
+    def complete(i: int, result: Any) -> None:
+        results[i] = result
+        done[i] = True
+        for child in graph.dependents[i]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                heapq.heappush(ready, child)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=THREAD_NAME_PREFIX) as pool:
+        while error is None and (ready or in_flight):
+            # Submit every ready pool step; keep the first ready serial step
+            serial_step: Optional[int] = None
+            deferred: List[int] = []
+            while ready:
+                i = heapq.heappop(ready)
+                if graph.serial[i]:
+                    if serial_step is None:
+                        serial_step = i
+                    else:
+                        deferred.append(i)
+                    continue
+                if on_start:
+                    on_start(i)
+                in_flight[pool.submit(run_step, i, _completed_view(graph, results, done))] = i
+            for i in deferred:
+                heapq.heappush(ready, i)
+            running = min(len(in_flight), max_workers) + (serial_step is not None)
+            max_in_flight = max(max_in_flight, running)
+
+            if serial_step is not None:
+                if on_start:
+                    on_start(serial_step)
+                try:
+                    complete(serial_step, run_step(serial_step, _completed_view(graph, results, done)))
+                except Exception as e:  # pylint: disable=broad-except
+                    error = e
+                continue
+
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in sorted(finished, key=in_flight.get):
+                i = in_flight.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    error = error or exc
+                else:
+                    complete(i, future.result())
+
+        if error is not None:
+            for future in in_flight:
+                future.cancel()
+
+    if error is not None:
+        raise error
+
+    zHat = WizardHat()
+    for key, result in zip(graph.keys, results):
+        zHat.add(key, result)
+    stats = {
+        "steps": count,
+        "workers": max_workers,
+        "max_in_flight": max_in_flight,
+        "serialized": serialized,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+    return zHat, stats
@@ -0,0 +1,110 @@
+# zCLI/subsystems/zWizard/zWizard_modules/wizard_plan.py
+
+"""
+Wizard Plan - Compiled zBlock Execution Plans
+=============================================
+
+execute_loop() walks a zBlock (ordered dict of zKeys) with key jumps (menu
+selections) and menu looping (return to the nearest `~...*` anchor after a
+selected item runs). Doing that straight off the dict means rebuilding the key
+list on every call, `list.index()` for every jump and a backwards scan for the
+anchor after every step - O(n²) per pass over a large menu, repeated on every
+walker loop.
+
+A BlockPlan is everything execute_loop() needs that depends only on the block's
+structure, computed once:
+
+- **keys**: Executable keys in order (metadata keys with `_` prefix dropped)
+- **index**: key → position, for O(1) jumps and start_key lookups
+- **menu_anchor**: For each position, the nearest menu key before it (or None)
+
+`_rbac` is not part of the plan: execute_loop() reads it from the live value,
+so requirements added to a cached block are always enforced.
+
+Plan Caching
+-----------
+Blocks of UI files loaded through zLoader are values of a SystemCache entry.
+get_block_plan() stores the plan in that SystemCache next to the parsed UI, so
+it is dropped whenever the UI entry is (mtime change, invalidate, clear, LRU
+eviction). A cached plan is only reused while the block's key sequence is
+unchanged (keys renamed, added or removed in place recompile it). Ad-hoc dicts (shell wizards, tests) are compiled per call - still
+linear instead of quadratic.
+
+Usage
+-----
+```python
+plan = get_block_plan(items_dict, system_cache)
+idx = plan.index.get(start_key, 0)
+menu_idx = plan.menu_anchor[idx]
+```
+
+Layer: 2, Position: 2 (zWizard subsystem)
+"""
+
+from typing import Any, Dict, Optional
+
+__all__ = ["BlockPlan", "compile_block_plan", "get_block_plan"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MODULE CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Key Markers
+META_KEY_PREFIX: str = "_"
+MENU_ANCHOR_MARKER: str = "~"
+MENU_MARKER: str = "*"
+
+
+def is_menu_key(key: str) -> bool:
+    """True for menu keys - both the ~ (anchor) and * (menu) modifiers."""
+    return MENU_ANCHOR_MARKER in key and MENU_MARKER in key
+
+
+class BlockPlan:
+    """Precomputed structure of one zBlock for execute_loop()."""
+
+    __slots__ = ("keys", "index", "menu_anchor", "_all_keys")
+
+    def __init__(self, items_dict: Dict[str, Any]) -> None:
+        """Compile items_dict (one pass over its keys)."""
+        self._all_keys = tuple(items_dict)
+        self.keys = tuple(k for k in self._all_keys if not k.startswith(META_KEY_PREFIX))
+        self.index = {key: i for i, key in enumerate(self.keys)}
+
+        anchors = []
+        last_menu: Optional[int] = None
+        for i, key in enumerate(self.keys):
+            anchors.append(last_menu)
+            if is_menu_key(key):
+                last_menu = i
+        self.menu_anchor = tuple(anchors)
+
+    def matches(self, items_dict: Dict[str, Any]) -> bool:
+        """Staleness guard for a cached plan (same keys in the same order)."""
+        return tuple(items_dict) == self._all_keys
+
+    def __repr__(self) -> str:
+        menus = sum(1 for key in self.keys if is_menu_key(key))
+        return f"BlockPlan(keys={len(self.keys)}, menus={menus})"
+
+
+def compile_block_plan(items_dict: Dict[str, Any]) -> BlockPlan:
+    """Compile a zBlock into a BlockPlan."""
+    return BlockPlan(items_dict)
+
+
+def get_block_plan(items_dict: Dict[str, Any], system_cache: Optional[Any] = None) -> BlockPlan:
+    """
+    Get the plan for items_dict, cached in system_cache when the block belongs to a cached UI.
+
+    Args:
+        items_dict: zBlock being executed
+        system_cache: zLoader SystemCache (None = compile without caching)
+
+    Returns:
+        BlockPlan: Compiled plan
+    """
+    if system_cache is None:
+        return compile_block_plan(items_dict)
+    return system_cache.get_plan(items_dict, compile_block_plan)
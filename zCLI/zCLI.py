@@ -11,17 +11,27 @@ zCLI Core Engine - Top-Level Orchestrator
 
 Thread-safe via contextvars.ContextVar. Supports Terminal and zBifrost (WebSocket) modes.
 Graceful shutdown via SIGINT/SIGTERM handlers (reverse initialization order).
+
+Lazy mode (zSpark "lazy": True or ZOLO_LAZY=1): only zConfig, zComm and zDisplay
+are built at startup; every other subsystem is imported and built on first
+attribute access (z.data, z.walker, ...). startup_report() lists the import and
+init cost of each subsystem (zSpark "startup_report": True or
+ZOLO_STARTUP_REPORT=1 prints it to stderr after init).
 """
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import importlib
 import logging
+import os
 import signal
 import sys
+import threading
+import time
 import contextvars
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from zCLI.utils.zTraceback import ExceptionContext
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -50,10 +60,11 @@ SIGNAL_INT: str = "SIGINT"
 SIGNAL_TERM: str = "SIGTERM"
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Shutdown Component Keys (4) - For status tracking dict
+# Shutdown Component Keys (5) - For status tracking dict
 # ─────────────────────────────────────────────────────────────────────────────
 SHUTDOWN_WEBSOCKET: str = "websocket"
 SHUTDOWN_HTTP_SERVER: str = "http_server"
+SHUTDOWN_ASYNC_LOOP: str = "async_loop"
 SHUTDOWN_DATABASE: str = "database"
 SHUTDOWN_LOGGER: str = "logger"
 
@@ -87,7 +98,7 @@ LOG_WARN_SIGNAL_DUPLICATE: str = "[%s] Shutdown already in progress..."
 LOG_WARN_ASYNC_SHUTDOWN_SKIPPED: str = "[Shutdown] Async shutdown skipped (loop running)"
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Logger Messages - Debug (9)
+# Logger Messages - Debug (11)
 # ─────────────────────────────────────────────────────────────────────────────
 LOG_DEBUG_SESSION_ID: str = "  zS_id: %s"
 LOG_DEBUG_SESSION_MODE: str = "  zMode: %s"
@@ -99,12 +110,16 @@ LOG_DEBUG_HTTP_NOT_RUNNING: str = "[Shutdown] HTTP server not running"
 LOG_DEBUG_HTTP_NOT_INIT: str = "[Shutdown] HTTP server not initialized"
 LOG_DEBUG_DB_NOT_CONNECTED: str = "[Shutdown] No active database connections"
 LOG_DEBUG_DB_NOT_INIT: str = "[Shutdown] Database subsystem not initialized"
+LOG_DEBUG_ASYNC_LOOP_NOT_RUNNING: str = "[Shutdown] Async event loop not started"
+LOG_DEBUG_ASYNC_LOOP_DRAINED: str = "[Shutdown] Async loop drained: %s"
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Shutdown Messages (6)
+# Shutdown Messages (8)
 # ─────────────────────────────────────────────────────────────────────────────
 SHUTDOWN_MSG_WEBSOCKET_CLOSE: str = "[Shutdown] Closing WebSocket server..."
 SHUTDOWN_MSG_HTTP_STOP: str = "[Shutdown] Stopping HTTP server..."
+SHUTDOWN_MSG_HTTP_CLIENT_CLOSE: str = "[Shutdown] Closing pooled HTTP clients..."
+SHUTDOWN_MSG_ASYNC_LOOP_DRAIN: str = "[Shutdown] Draining async event loop..."
 SHUTDOWN_MSG_DB_CLOSE: str = "[Shutdown] Closing database connections..."
 SHUTDOWN_MSG_LOGGER_FLUSH: str = "[Shutdown] Flushing logger..."
 SHUTDOWN_MSG_STATUS_REPORT: str = "[Shutdown] Cleanup Status:"
@@ -117,11 +132,13 @@ SHUTDOWN_SEPARATOR: str = "=" * 70
 SHUTDOWN_OPERATION_PREFIX: str = "[Shutdown]"
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Error Messages (6)
+# Error Messages (8)
 # ─────────────────────────────────────────────────────────────────────────────
 ERROR_SHUTDOWN_SIGNAL: str = "Error during %s shutdown"
 ERROR_WEBSOCKET_SHUTDOWN: str = "WebSocket shutdown"
 ERROR_HTTP_SHUTDOWN: str = "HTTP server shutdown"
+ERROR_HTTP_CLIENT_SHUTDOWN: str = "HTTP client cleanup"
+ERROR_ASYNC_LOOP_SHUTDOWN: str = "Async event loop drain"
 ERROR_DB_SHUTDOWN: str = "Database connection cleanup"
 ERROR_LOGGER_SHUTDOWN: str = "Logger cleanup"
 ERROR_SIGNAL_RECEIVED: str = "[%s] Received shutdown signal"
@@ -139,6 +156,24 @@ LAYER_3_ORCHESTRATION: str = "Layer 3: Orchestration"
 # ─────────────────────────────────────────────────────────────────────────────
 ZSPARK_PLUGINS_KEY: str = "plugins"
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Startup Keys (4) - Lazy init and startup report switches
+# ─────────────────────────────────────────────────────────────────────────────
+ZSPARK_LAZY_KEY: str = "lazy"
+ZSPARK_STARTUP_REPORT_KEY: str = "startup_report"
+ENV_VAR_LAZY: str = "ZOLO_LAZY"
+ENV_VAR_STARTUP_REPORT: str = "ZOLO_STARTUP_REPORT"
+ENV_TRUE_VALUES: Tuple[str, ...] = ("1", "true", "yes", "on")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Startup Report (5)
+# ─────────────────────────────────────────────────────────────────────────────
+REPORT_TITLE: str = "zCLI startup ({mode}): {count} subsystems initialized in {total:.1f} ms"
+REPORT_HEADER: str = "{:>10} | {:>10} | {:>10} | subsystem"
+REPORT_ROW: str = "{:>7.1f} ms | {:>7.1f} ms | {:>7.1f} ms | {}{}"
+REPORT_DEFERRED: str = "deferred until first use: {names}"
+REPORT_ON_DEMAND: str = " (on first use)"
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Context Variable Name (1)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -185,6 +220,9 @@ class zCLI:
     
     Thread-safe via contextvars. Supports context manager protocol.
     Signal handlers (SIGINT/SIGTERM) registered automatically.
+    
+    Lazy mode defers Layer 1+ subsystems (except zDisplay) to first attribute
+    access; see startup_report() for per-subsystem import/init cost.
     """
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -193,6 +231,7 @@ class zCLI:
     logger: logging.Logger          # Set by zConfig
     session: Dict[str, Any]         # Set by zConfig
     zTraceback: Any                 # Set by zConfig (zTraceback instance)
+    startup_timings: Dict[str, Dict[str, Any]]  # Subsystem → import/init seconds
 
     def __init__(self, zSpark_obj: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -211,6 +250,12 @@ class zCLI:
         # Initialize zSpark_obj config dict
         self.zspark_obj = zSpark_obj or {}
 
+        # Subsystem bookkeeping (lazy mode builds most subsystems on first access)
+        self.lazy = self._startup_flag(ZSPARK_LAZY_KEY, ENV_VAR_LAZY)
+        self.startup_timings = {}
+        self._lazy_subsystems: Dict[str, Tuple[str, str, Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._subsystem_lock = threading.RLock()
+
         # Shutdown coordination
         self._shutdown_requested = False
         self._shutdown_in_progress = False
@@ -224,95 +269,81 @@ class zCLI:
         # ─────────────────────────────────────────────────────────────
         # Initialize zConfig FIRST (provides machine config, environment config, session, logger, and traceback)
         # After this call, self.session, self.logger, and self.zTraceback are ready to use
-        from .subsystems.zConfig import zConfig
-        self.config = zConfig(zcli=self, zSpark_obj=zSpark_obj)
+        self._init_subsystem("config", ".subsystems.zConfig", "zConfig", zcli=self, zSpark_obj=zSpark_obj)
 
         # Initialize zComm (Communication infrastructure for zBifrost and zData)
-        from .subsystems.zComm import zComm
-        self.comm = zComm(self)
+        self._init_subsystem("comm", ".subsystems.zComm", "zComm", self)
 
         # ─────────────────────────────────────────────────────────────
         # Layer 1: Core Subsystems
         # ─────────────────────────────────────────────────────────────
-        # Initialize display subsystem
-        from .subsystems.zDisplay import zDisplay
-        self.display = zDisplay(self)
+        # Initialize display subsystem (always eager - every subsystem renders through it)
+        self._init_subsystem("display", ".subsystems.zDisplay", "zDisplay", self)
         self.mycolor = "MAIN"
 
         # Initialize authentication subsystem
-        from .subsystems.zAuth import zAuth
-        self.auth = zAuth(self)
+        self._init_subsystem("auth", ".subsystems.zAuth", "zAuth", self, lazy=self.lazy)
 
         # Initialize dispatch subsystem
-        from .subsystems.zDispatch import zDispatch
-        self.dispatch = zDispatch(self)
+        self._init_subsystem("dispatch", ".subsystems.zDispatch", "zDispatch", self, lazy=self.lazy)
 
         # Initialize navigation subsystem
-        from .subsystems.zNavigation import zNavigation
-        self.navigation = zNavigation(self)
+        self._init_subsystem("navigation", ".subsystems.zNavigation", "zNavigation", self, lazy=self.lazy)
 
         # Initialize parser subsystem
-        from .subsystems.zParser import zParser
-        self.zparser = zParser(self)
+        self._init_subsystem("zparser", ".subsystems.zParser", "zParser", self, lazy=self.lazy)
 
         # Initialize loader subsystem
-        from .subsystems.zLoader import zLoader
-        self.loader = zLoader(self)
+        self._init_subsystem("loader", ".subsystems.zLoader", "zLoader", self, lazy=self.lazy)
 
         # Initialize function subsystem
-        from .subsystems.zFunc import zFunc
-        self.zfunc = zFunc(self)
+        self._init_subsystem("zfunc", ".subsystems.zFunc", "zFunc", self, lazy=self.lazy)
 
         # Initialize dialog subsystem
-        from .subsystems.zDialog import zDialog
-        self.dialog = zDialog(self)
+        self._init_subsystem("dialog", ".subsystems.zDialog", "zDialog", self, lazy=self.lazy)
 
         # Initialize open subsystem
-        from .subsystems.zOpen import zOpen
-        self.open = zOpen(self)
+        self._init_subsystem("open", ".subsystems.zOpen", "zOpen", self, lazy=self.lazy)
 
 
         # ─────────────────────────────────────────────────────────────
         # Layer 2: Core Abstraction
         # ─────────────────────────────────────────────────────────────
         # Initialize utility subsystem (provides plugin system for other subsystems)
-        from .subsystems.zUtils import zUtils
-        self.utils = zUtils(self)    # Plugin system - available to all Layer 2+ subsystems
+        self._init_subsystem("utils", ".subsystems.zUtils", "zUtils", self, lazy=self.lazy)
         self._load_plugins()         # Load plugins immediately after plugin system is ready
 
         # Initialize wizard subsystem (loop engine - no upper dependencies)
-        from .subsystems.zWizard import zWizard
-        self.wizard = zWizard(self)
+        self._init_subsystem("wizard", ".subsystems.zWizard", "zWizard", self, lazy=self.lazy)
 
         # Initialize data subsystem (may use zWizard for interactive operations)
-        from .subsystems.zData import zData
-        self.data = zData(self)
+        self._init_subsystem("data", ".subsystems.zData", "zData", self, lazy=self.lazy)
 
         # Initialize zBifrost WebSocket bridge orchestrator (Layer 2)
         # Coordinates Terminal↔Web communication using z.comm infrastructure
-        from .subsystems.zBifrost import zBifrost
-        self.bifrost = zBifrost(self)
+        self._init_subsystem("bifrost", ".subsystems.zBifrost", "zBifrost", self, lazy=self.lazy)
 
         # Initialize shell and command executor (depends on zUtils, zWizard, zData)
-        from .subsystems.zShell import zShell
-        self.shell = zShell(self)
+        self._init_subsystem("shell", ".subsystems.zShell", "zShell", self, lazy=self.lazy)
 
         # Layer 3: Orchestration
         # Initialize walker subsystem
-        from .subsystems.zWalker import zWalker
-        self.walker = zWalker(self)  # Modern walker with unified navigation (can use plugins immediately)
+        self._init_subsystem("walker", ".subsystems.zWalker", "zWalker", self, lazy=self.lazy)
 
         # Initialize zServer (HTTP/WSGI server subsystem) - Layer 1
         # v1.5.8: Independent subsystem (was factory method in zComm)
-        from .subsystems.zServer import zServer
-        self.server = zServer(
+        http_config = self.config.http_server if hasattr(self.config, 'http_server') else None
+        http_enabled = bool(http_config and http_config.enabled)
+        self._init_subsystem(
+            "server", ".subsystems.zServer", "zServer",
             logger=self.logger,
             zcli=self,
-            config=self.config.http_server if hasattr(self.config, 'http_server') else None
+            config=http_config,
+            lazy=self.lazy and not http_enabled
         )
         
         # Auto-start if enabled in config
-        if hasattr(self.config, 'http_server') and self.config.http_server.enabled:
+        if http_enabled:
             self.server.start()
             self.logger.info(LOG_HTTP_START, f"http://{self.server.host}:{self.server.port}")
             
@@ -326,9 +357,13 @@ class zCLI:
         # Register signal handlers for graceful shutdown
         self._register_signal_handlers()
         
+        if self._startup_flag(ZSPARK_STARTUP_REPORT_KEY, ENV_VAR_STARTUP_REPORT):
+            print(self.startup_report(), file=sys.stderr)
+
         # v1.5.8: Declarative lifecycle - server ALWAYS waits if enabled
         # This must be the LAST step in __init__ so all subsystems are ready
-        if self.server and hasattr(self.config, 'http_server'):
+        # (a deferred zServer was never started - nothing to wait for)
+        if self._loaded("server") and hasattr(self.config, 'http_server'):
             if self.config.http_server.zShell:
                 # Drop into zShell REPL (server runs in background thread)
                 print("\n" + "="*70)
@@ -356,6 +391,8 @@ class zCLI:
         """
         try:
             plugin_paths = self.zspark_obj.get(ZSPARK_PLUGINS_KEY) or []
+            if not plugin_paths:
+                return  # Nothing to load (and lazy mode keeps zUtils deferred)
             if isinstance(plugin_paths, (list, tuple)):
                 self.utils.load_plugins(plugin_paths)
             elif isinstance(plugin_paths, str):
@@ -379,6 +416,89 @@ class zCLI:
         self.logger.framework.debug(LOG_DEBUG_SESSION_MODE, self.session[SESSION_KEY_ZMODE])
         self.logger.framework.debug(LOG_DEBUG_SESSION_MACHINE, self.session[SESSION_KEY_ZMACHINE].get("hostname"))
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # SUBSYSTEM INITIALIZATION (eager or lazy)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _startup_flag(self, zspark_key: str, env_var: str) -> bool:
+        """zSpark_obj[zspark_key] if set, else the env_var switch."""
+        if zspark_key in self.zspark_obj:
+            return bool(self.zspark_obj[zspark_key])
+        return os.environ.get(env_var, "").strip().lower() in ENV_TRUE_VALUES
+
+    def _init_subsystem(self, attr: str, module: str, class_name: str, *args: Any,
+                        lazy: bool = False, **kwargs: Any) -> None:
+        """
+        Build subsystem attr now, or register it for first access when lazy.
+        
+        module is imported relative to this package, then class_name(*args, **kwargs)
+        is assigned to self.<attr>. Import and init times go to startup_timings.
+        """
+        if lazy:
+            self._lazy_subsystems[attr] = (module, class_name, args, kwargs)
+            return
+        self._build_subsystem(attr, module, class_name, args, kwargs, on_demand=False)
+
+    def _build_subsystem(self, attr: str, module: str, class_name: str, args: Tuple[Any, ...],
+                         kwargs: Dict[str, Any], on_demand: bool) -> Any:
+        """Import, construct and time one subsystem; returns the instance."""
+        started = time.perf_counter()
+        subsystem_class = getattr(importlib.import_module(module, __package__), class_name)
+        imported = time.perf_counter()
+        instance = subsystem_class(*args, **kwargs)
+        finished = time.perf_counter()
+        setattr(self, attr, instance)
+        self.startup_timings[attr] = {
+            "import": imported - started,
+            "init": finished - imported,
+            "on_demand": on_demand,
+        }
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        """Build a deferred (lazy mode) subsystem on first access."""
+        pending = self.__dict__.get("_lazy_subsystems")
+        if not pending or name not in pending:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with self._subsystem_lock:
+            if name in self.__dict__:  # Built by another thread meanwhile
+                return self.__dict__[name]
+            module, class_name, args, kwargs = pending[name]
+            instance = self._build_subsystem(name, module, class_name, args, kwargs, on_demand=True)
+            del pending[name]  # Only once built - a failed init is retried on next access
+            return instance
+
+    def _loaded(self, attr: str) -> Any:
+        """Subsystem attr if it has been built, else None (never triggers lazy init)."""
+        return self.__dict__.get(attr)
+
+    def startup_report(self) -> str:
+        """
+        Per-subsystem startup cost, in the spirit of python -X importtime.
+        
+        One row per built subsystem (import ms, init ms, total ms) in build order;
+        lazily built ones are marked, still-deferred ones are listed at the end.
+        A lazy build's init time includes any deferred subsystems it pulls in.
+        """
+        rows: List[str] = []
+        total = 0.0
+        for attr, timing in self.startup_timings.items():
+            subsystem_total = timing["import"] + timing["init"]
+            total += subsystem_total
+            rows.append(REPORT_ROW.format(
+                timing["import"] * 1000, timing["init"] * 1000, subsystem_total * 1000,
+                attr, REPORT_ON_DEMAND if timing["on_demand"] else ""
+            ))
+        lines = [
+            REPORT_TITLE.format(mode="lazy" if self.lazy else "eager",
+                                count=len(self.startup_timings), total=total * 1000),
+            REPORT_HEADER.format("import", "init", "total"),
+            *rows,
+        ]
+        if self._lazy_subsystems:
+            lines.append(REPORT_DEFERRED.format(names=", ".join(self._lazy_subsystems)))
+        return "\n".join(lines)
+
     # ═══════════════════════════════════════════════════════════════════════
     # PUBLIC API METHODS
     # ═══════════════════════════════════════════════════════════════════════
@@ -456,7 +576,7 @@ class zCLI:
         """
         Gracefully shutdown all subsystems in reverse init order.
         
-        Cleanup: WebSocket → HTTP → Database → Logger. Each wrapped in ExceptionContext
+        Cleanup: WebSocket → HTTP clients → HTTP server → Async loop → Database → Logger. Each wrapped in ExceptionContext
         (failures don't halt shutdown). Idempotent via _shutdown_in_progress flag.
         
         Returns Dict[str, bool] with component status, or None if already in progress.
@@ -473,6 +593,7 @@ class zCLI:
         cleanup_status = {
             SHUTDOWN_WEBSOCKET: False,
             SHUTDOWN_HTTP_SERVER: False,
+            SHUTDOWN_ASYNC_LOOP: False,
             SHUTDOWN_DATABASE: False,
             SHUTDOWN_LOGGER: False
         }
@@ -518,17 +639,28 @@ class zCLI:
                 self.logger.debug(LOG_DEBUG_WEBSOCKET_NOT_INIT)
                 cleanup_status[SHUTDOWN_WEBSOCKET] = True
         
+        # Pooled outbound HTTP clients (zComm) - sit next to the WebSocket teardown
+        with ExceptionContext(
+            self.zTraceback,
+            operation=ERROR_HTTP_CLIENT_SHUTDOWN,
+            default_return=None
+        ):
+            if self.comm and hasattr(self.comm, 'close_http_clients'):
+                self.logger.framework.debug(SHUTDOWN_MSG_HTTP_CLIENT_CLOSE)
+                self.comm.close_http_clients()
+        
         # 2. Stop HTTP server (zServer)
         with ExceptionContext(
             self.zTraceback,
             operation=ERROR_HTTP_SHUTDOWN,
             default_return=None
         ):
-            if self.server:
-                if self.server._running:  # pylint: disable=protected-access
+            server = self._loaded('server')
+            if server:
+                if server._running:  # pylint: disable=protected-access
                     print("   ✓ Stopping HTTP server...")
                     self.logger.framework.debug(SHUTDOWN_MSG_HTTP_STOP)
-                    self.server.stop()
+                    server.stop()
                     cleanup_status[SHUTDOWN_HTTP_SERVER] = True
                 else:
                     self.logger.debug(LOG_DEBUG_HTTP_NOT_RUNNING)
@@ -537,29 +669,46 @@ class zCLI:
                 self.logger.debug(LOG_DEBUG_HTTP_NOT_INIT)
                 cleanup_status[SHUTDOWN_HTTP_SERVER] = True
         
-        # 3. Close database connections (zData)
+        # 3. Drain the async event loop (zFunc coroutines + loop-scoped resources)
+        with ExceptionContext(
+            self.zTraceback,
+            operation=ERROR_ASYNC_LOOP_SHUTDOWN,
+            default_return=None
+        ):
+            loop_runner = getattr(self._loaded('zfunc'), 'loop_runner', None)
+            if loop_runner is not None and loop_runner.running:
+                print("   ✓ Draining async tasks...")
+                self.logger.framework.debug(SHUTDOWN_MSG_ASYNC_LOOP_DRAIN)
+                summary = loop_runner.shutdown()
+                self.logger.framework.debug(LOG_DEBUG_ASYNC_LOOP_DRAINED, summary)
+            else:
+                self.logger.debug(LOG_DEBUG_ASYNC_LOOP_NOT_RUNNING)
+            cleanup_status[SHUTDOWN_ASYNC_LOOP] = True
+        
+        # 4. Close database connections (zData)
         with ExceptionContext(
             self.zTraceback,
             operation=ERROR_DB_SHUTDOWN,
             default_return=None
         ):
-            if hasattr(self, 'data') and self.data:
-                if hasattr(self.data, 'adapter') and self.data.adapter:
+            data = self._loaded('data')
+            if data:
+                if hasattr(data, 'adapter') and data.adapter:
                     print("   ✓ Closing database connections...")
                     self.logger.framework.debug(SHUTDOWN_MSG_DB_CLOSE)
-                    if hasattr(self.data.adapter, 'disconnect'):
-                        self.data.adapter.disconnect()
-                    elif hasattr(self.data.adapter, 'close'):
-                        self.data.adapter.close()
+                    data.disconnect()
                     cleanup_status[SHUTDOWN_DATABASE] = True
                 else:
                     self.logger.debug(LOG_DEBUG_DB_NOT_CONNECTED)
                     cleanup_status[SHUTDOWN_DATABASE] = True
+                # Pooled connections outlive requests - close them too
+                if getattr(data, 'pool', None) is not None:
+                    data.pool.close_all()
             else:
                 self.logger.debug(LOG_DEBUG_DB_NOT_INIT)
                 cleanup_status[SHUTDOWN_DATABASE] = True
         
-        # 4. Flush and close logger
+        # 5. Flush and close logger
         with ExceptionContext(
             self.zTraceback,
             operation=ERROR_LOGGER_SHUTDOWN,
@@ -580,7 +729,7 @@ class zCLI:
                         handler.flush()
                 cleanup_status[SHUTDOWN_LOGGER] = True
         
-        # 5. Uninstall exception hook if installed
+        # 6. Uninstall exception hook if installed
         if hasattr(self, 'zTraceback') and self.zTraceback:
             self.zTraceback.uninstall_exception_hook()
         
@@ -1,6 +1,6 @@
 # zTestRunner/plugins/zauth_tests.py
 """
-Comprehensive A-to-K zAuth Test Suite (70 tests - 100% REAL TESTS)
+Comprehensive A-to-L zAuth Test Suite (72 tests - 100% REAL TESTS)
 Declarative approach - uses existing zcli.auth with comprehensive validation
 Covers all 4 zAuth modules + Three-Tier Architecture + RBAC + Integration workflows
 
@@ -16,8 +16,9 @@ Covers all 4 zAuth modules + Three-Tier Architecture + RBAC + Integration workfl
 - I. Integration Workflows (6 tests) - 100% real (newly implemented)
 - J. Real Bcrypt Tests (3 tests) - Actual hashing/verification
 - K. Real SQLite Tests (3 tests) - Actual persistence round-trips
+- L. Permission Snapshot (2 tests) - Query counts, write-through and TTL invalidation
 
-**NO STUB TESTS** - All 70 tests perform real validation with assertions.
+**NO STUB TESTS** - All 72 tests perform real validation with assertions.
 
 Results accumulated in zHat by zWizard for final display.
 """
@@ -1891,6 +1892,123 @@ def test_real_sqlite_concurrent_sessions(zcli=None, context=None):
         return _store_result(zcli, "Real: SQLite Concurrent", "ERROR", f"Exception: {str(e)}")
 
 
+# L. Permission Snapshot Tests (2 tests)
+class _PermissionTable:
+    """In-memory user_permissions table that counts SELECTs (stands in for zcli.data)."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.selects = 0
+
+    def select(self, table, fields=None, where=None, **kwargs):
+        self.selects += 1
+        if isinstance(where, str):  # grant_permission's existence check - treat as not granted yet
+            return []
+        return [dict(row) for row in self.rows if row["user_id"] == where["user_id"]]
+
+    def insert(self, table, fields, values):
+        self.rows.append(dict(zip(fields, values)))
+
+    def delete(self, table, where):
+        pass  # revoke_permission passes a SQL string; tests drop rows directly
+
+
+def _snapshot_rbac(zcli, rows, ttl=60.0):
+    """RBAC over an in-memory permissions table, authenticated in dual mode (ids 'z1' and 'a1')."""
+    from types import SimpleNamespace
+    from zCLI.subsystems.zAuth.zAuth_modules.auth_rbac import RBAC
+    table = _PermissionTable(rows)
+    session = {SESSION_KEY_ZAUTH: {
+        ZAUTH_KEY_ZSESSION: {ZAUTH_KEY_AUTHENTICATED: True, ZAUTH_KEY_ID: "z1"},
+        ZAUTH_KEY_APPLICATIONS: {"shop": {ZAUTH_KEY_AUTHENTICATED: True, ZAUTH_KEY_ID: "a1"}},
+        ZAUTH_KEY_ACTIVE_CONTEXT: CONTEXT_DUAL,
+        ZAUTH_KEY_ACTIVE_APP: "shop",
+    }}
+    rbac = RBAC(SimpleNamespace(session=session, logger=zcli.logger, data=table,
+                                zspark_obj={"permission_cache_ttl": ttl}))
+    rbac._permissions_db_initialized = True
+    return rbac, table
+
+
+def test_permission_snapshot_batched(zcli=None, context=None):
+    """Permission lists and dual-mode checks cost one SELECT per user, then none."""
+    if not zcli or not zcli.auth:
+        return _store_result(None, "Snapshot: Batched Lookups", "ERROR", "No auth")
+
+    try:
+        rbac, table = _snapshot_rbac(zcli, [
+            {"user_id": "z1", "permission": "reports.view"},
+            {"user_id": "a1", "permission": "orders.refund"},
+        ])
+        checks = [
+            rbac.has_permission(["users.delete", "users.edit", "orders.refund"]),  # app user grants
+            rbac.has_permission("reports.view"),                                     # zSession user grants
+            rbac.has_permission(["users.delete", "system.shutdown"]) is False,
+        ]
+        for _ in range(50):
+            checks.append(rbac.has_permission("orders.refund"))
+
+        stats = rbac.get_permission_cache_stats()
+        if not all(checks):
+            return _store_result(zcli, "Snapshot: Batched Lookups", "FAILED", "Wrong permission result")
+        if table.selects != 2 or stats["db_queries"] != 2:
+            return _store_result(zcli, "Snapshot: Batched Lookups", "FAILED",
+                                 f"Expected 2 SELECTs, got {table.selects}")
+        if stats["hits"] < 100:
+            return _store_result(zcli, "Snapshot: Batched Lookups", "FAILED", f"Hits: {stats['hits']}")
+        return _store_result(zcli, "Snapshot: Batched Lookups", "PASSED",
+                             f"53 checks, 2 SELECTs, hit rate {stats['hit_rate']}")
+    except Exception as e:
+        return _store_result(zcli, "Snapshot: Batched Lookups", "ERROR", f"Exception: {str(e)}")
+
+
+def test_permission_snapshot_invalidation(zcli=None, context=None):
+    """Grant/revoke write through, invalidate other instances, and the TTL expires snapshots."""
+    if not zcli or not zcli.auth:
+        return _store_result(None, "Snapshot: Invalidation", "ERROR", "No auth")
+
+    try:
+        rbac, table = _snapshot_rbac(zcli, [{"user_id": "z1", "permission": "reports.view"}])
+        other, other_table = _snapshot_rbac(zcli, [{"user_id": "z1", "permission": "reports.view"}])
+        before = (rbac.has_permission("users.delete"), other.has_permission("users.delete"))
+
+        # Write-through: the granting instance sees it without a reload
+        selects = table.selects
+        granted = rbac.grant_permission("z1", "users.delete", granted_by="admin")
+        after_grant = rbac.has_permission("users.delete")
+        write_through = table.selects == selects + 1  # only grant's own existence check
+
+        # Another instance reloads (version bumped) and sees its own table's state
+        other_table.rows.append({"user_id": "z1", "permission": "users.delete"})
+        other_sees = other.has_permission("users.delete")
+
+        table.rows = [row for row in table.rows if row["permission"] != "users.delete"]
+        rbac.revoke_permission("z1", "users.delete")
+        after_revoke = rbac.has_permission("users.delete")
+
+        # TTL: an expired snapshot is reloaded (picks up another process's change)
+        short, short_table = _snapshot_rbac(zcli, [], ttl=0.05)
+        short.has_permission("data.export")
+        short_table.rows.append({"user_id": "z1", "permission": "data.export"})
+        time.sleep(0.1)
+        ttl_reload = short.has_permission("data.export")
+
+        if before != (False, False) or not granted:
+            return _store_result(zcli, "Snapshot: Invalidation", "FAILED", f"Setup: {before}, {granted}")
+        if not (after_grant and write_through):
+            return _store_result(zcli, "Snapshot: Invalidation", "FAILED", "Grant not written through")
+        if not other_sees:
+            return _store_result(zcli, "Snapshot: Invalidation", "FAILED", "Other instance kept stale snapshot")
+        if after_revoke:
+            return _store_result(zcli, "Snapshot: Invalidation", "FAILED", "Revoke not written through")
+        if not ttl_reload:
+            return _store_result(zcli, "Snapshot: Invalidation", "FAILED", "TTL did not expire snapshot")
+        return _store_result(zcli, "Snapshot: Invalidation", "PASSED",
+                             "Write-through grant/revoke, version and TTL invalidation")
+    except Exception as e:
+        return _store_result(zcli, "Snapshot: Invalidation", "ERROR", f"Exception: {str(e)}")
+
+
 # ═══════════════════════════════════════════════════════════
 # Display Test Results (Final Step)
 # ═══════════════════════════════════════════════════════════
@@ -1929,7 +2047,7 @@ def display_test_results(zcli=None, context=None):
     
     # Display header
     print("\n" + "=" * 80)
-    print("zAuth Comprehensive Test Suite - 70 Tests")
+    print("zAuth Comprehensive Test Suite - 72 Tests")
     print("=" * 80 + "\n")
     
     # Group results by category
@@ -1944,7 +2062,8 @@ def display_test_results(zcli=None, context=None):
         "H. Context Management (6 tests)": ["Context:"],
         "I. Integration Workflows (6 tests)": ["Integration:"],
         "J. Real Bcrypt Tests (3 tests)": ["Real: Bcrypt"],
-        "K. Real SQLite Tests (3 tests)": ["Real: SQLite"]
+        "K. Real SQLite Tests (3 tests)": ["Real: SQLite"],
+        "L. Permission Snapshot (2 tests)": ["Snapshot:"]
     }
     
     for cat_name, prefixes in categories.items():
@@ -1982,7 +2101,7 @@ def display_test_results(zcli=None, context=None):
     else:
         print(f"\n[PARTIAL] {passed}/{total} tests passed ({pass_rate:.1f}%)\n")
     
-    print(f"[INFO] Coverage: All 4 zAuth modules + real integration tests (A-to-K comprehensive coverage)\n")
+    print(f"[INFO] Coverage: All 4 zAuth modules + real integration tests (A-to-L comprehensive coverage)\n")
     print(f"[INFO] Unit Tests: Facade, Password Security (bcrypt), Session Persistence (SQLite), Three-Tier Auth\n")
     print(f"[INFO] Integration Tests: zSession, Application, Dual-Mode, RBAC, Context Management\n")
     print(f"[INFO] Real Tests: Actual bcrypt hashing/verification + SQLite persistence validation\n")
@@ -2126,6 +2126,525 @@ def test_integration_session_comm_persistence(zcli=None, context=None):
                            f"Exception: {str(e)}")
 
 
+# ===============================================================
+# Q. Bridge Query Cache - Bounds & Write Invalidation (3 tests)
+# ===============================================================
+
+def test_query_cache_lru_bounds(zcli=None, context=None):
+    """Test query cache evicts LRU entries past max_entries/max_bytes."""
+    if not zcli:
+        return _store_result(None, "Query Cache: LRU Bounds", "ERROR", "No zcli")
+    
+    try:
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules.bridge_cache import CacheManager
+        manager = CacheManager(zcli.logger, max_entries=3, max_bytes=1000)
+        
+        for i in range(3):
+            manager.cache_query(f"key{i}", {"row": i})
+        manager.get_query("key0")  # key0 becomes most recently used
+        manager.cache_query("key3", {"row": 3})
+        
+        if manager.get_query("key1") is not None:
+            return _store_result(zcli, "Query Cache: LRU Bounds", "FAILED", "LRU entry not evicted")
+        if manager.get_query("key0") != {"row": 0}:
+            return _store_result(zcli, "Query Cache: LRU Bounds", "FAILED", "Recently used entry evicted")
+        if manager.cache_query("huge", "x" * 2000):
+            return _store_result(zcli, "Query Cache: LRU Bounds", "FAILED", "Over-budget result was cached")
+        
+        stats = manager.get_all_stats()["query_cache"]
+        if stats["entries"] != 3 or stats["evictions"] != 1 or stats["bytes"] > 1000:
+            return _store_result(zcli, "Query Cache: LRU Bounds", "FAILED", f"Unexpected stats: {stats}")
+    except Exception as e:
+        return _store_result(zcli, "Query Cache: LRU Bounds", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Query Cache: LRU Bounds", "PASSED", "Entry and byte limits enforced (LRU)")
+
+
+def test_query_cache_write_invalidation(zcli=None, context=None):
+    """Test writes evict cached reads for the same model (and stale in-flight reads)."""
+    if not zcli:
+        return _store_result(None, "Query Cache: Write Invalidation", "ERROR", "No zcli")
+    
+    try:
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules.bridge_cache import CacheManager
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules.events.bridge_event_dispatch import DispatchEvents
+        manager = CacheManager(zcli.logger)
+        
+        users_read = {"zKey": "^ListUsers", "model": "users"}
+        orders_read = {"zKey": "^ListOrders", "model": "orders"}
+        manager.cache_query("users", [1], tags=manager.query_tags(users_read))
+        manager.cache_query("orders", [2], tags=manager.query_tags(orders_read))
+        manager.cache_query("dashboard", [3], tags=manager.query_tags({"zKey": "^Dashboard"}))
+        
+        write = {"zKey": "^DeleteUser", "model": "users"}
+        if not DispatchEvents._is_write_operation(None, write, write["zKey"]):
+            return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", "^DeleteUser not detected as write")
+        
+        epoch = manager.write_epoch  # A read starts...
+        manager.invalidate_queries(manager.query_tags(write))  # ...a write lands...
+        if manager.cache_query("users", [1], tags={"users"}, epoch=epoch):  # ...the read finishes
+            return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", "Stale in-flight read was cached")
+        if manager.get_query("users") is not None or manager.get_query("orders") != [2]:
+            return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", "Wrong entries invalidated")
+        if manager.get_query("dashboard") is not None:
+            return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", "Untagged read survived a tagged write")
+        
+        manager.invalidate_queries()  # Write with unknown model
+        if manager.get_query("orders") is not None:
+            return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", "Untagged write kept entries")
+    except Exception as e:
+        return _store_result(zcli, "Query Cache: Write Invalidation", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Query Cache: Write Invalidation", "PASSED", "Model-tagged and untagged reads evicted by writes")
+
+
+def test_query_cache_sweep_and_owner_clear(zcli=None, context=None):
+    """Test sweep_expired() and metadata-based user/app clearing."""
+    if not zcli:
+        return _store_result(None, "Query Cache: Sweep & Owner Clear", "ERROR", "No zcli")
+    
+    try:
+        import time
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules.bridge_cache import CacheManager
+        manager = CacheManager(zcli.logger)
+        
+        alice = {"user_id": "alice", "app_name": "shop"}
+        bob = {"user_id": "bob", "app_name": "blog"}
+        manager.cache_query("short", 1, ttl=0.01, user_context=alice)
+        manager.cache_query("alice", 2, user_context=alice)
+        manager.cache_query("bob", 3, user_context=bob)
+        time.sleep(0.02)
+        
+        if manager.sweep_expired() != 1:
+            return _store_result(zcli, "Query Cache: Sweep & Owner Clear", "FAILED", "Expired entry not swept")
+        if manager.clear_user_cache("alice") != 1 or manager.clear_app_cache("blog") != 1:
+            return _store_result(zcli, "Query Cache: Sweep & Owner Clear", "FAILED", "Owner clearing missed entries")
+        if manager.get_all_stats()["query_cache"]["entries"] != 0:
+            return _store_result(zcli, "Query Cache: Sweep & Owner Clear", "FAILED", "Entries left behind")
+    except Exception as e:
+        return _store_result(zcli, "Query Cache: Sweep & Owner Clear", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Query Cache: Sweep & Owner Clear", "PASSED", "Sweeper and owner clearing work")
+
+
+# ===============================================================
+# R. Bridge Request Pipelining - Fairness & Backpressure (3 tests)
+# ===============================================================
+
+def test_pipeline_fair_executor_round_robin(zcli=None, context=None):
+    """Test FairExecutor serves queued jobs round-robin across clients."""
+    if not zcli:
+        return _store_result(None, "Pipeline: Fair Executor", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        import threading
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules import FairExecutor
+        executor = FairExecutor(max_workers=1)
+        started, gate, order = threading.Event(), threading.Event(), []
+        
+        def blocker():
+            started.set()
+            gate.wait(5)
+        
+        async def scenario():
+            busy = asyncio.create_task(executor.run("a", blocker))
+            await asyncio.to_thread(started.wait, 5)  # The only worker is now busy
+            jobs = [asyncio.create_task(executor.run(client, order.append, name))
+                    for client, name in (("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"))]
+            await asyncio.sleep(0.01)  # Let every job reach the queue
+            gate.set()
+            await asyncio.gather(busy, *jobs)
+        
+        asyncio.run(scenario())
+        executor.shutdown()
+        
+        if order != ["a1", "b1", "a2", "a3"]:
+            return _store_result(zcli, "Pipeline: Fair Executor", "FAILED", f"Unfair order: {order}")
+        if executor.get_stats()["completed"] != 5:
+            return _store_result(zcli, "Pipeline: Fair Executor", "FAILED", f"Stats: {executor.get_stats()}")
+    except Exception as e:
+        return _store_result(zcli, "Pipeline: Fair Executor", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Pipeline: Fair Executor", "PASSED", "Busy client cannot starve others")
+
+
+def test_pipeline_in_flight_backpressure(zcli=None, context=None):
+    """Test RequestPipeline holds the reader once max_in_flight requests run."""
+    if not zcli:
+        return _store_result(None, "Pipeline: Backpressure", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules import RequestPipeline
+        
+        async def scenario():
+            pipeline = RequestPipeline(zcli.logger, max_in_flight=2)
+            releases = [asyncio.Event() for _ in range(3)]
+            await pipeline.submit("r1", releases[0].wait())
+            await pipeline.submit("r2", releases[1].wait())
+            third = asyncio.create_task(pipeline.submit("r3", releases[2].wait()))
+            await asyncio.sleep(0.01)
+            blocked = not third.done() and len(pipeline.in_flight) == 2
+            
+            releases[0].set()  # r1 completes, freeing a slot for r3
+            await asyncio.wait_for(third, 1)
+            admitted = set(pipeline.in_flight) == {"r2", "r3"}
+            
+            await pipeline.close()
+            return blocked, admitted, len(pipeline.in_flight)
+        
+        blocked, admitted, remaining = asyncio.run(scenario())
+        if not blocked:
+            return _store_result(zcli, "Pipeline: Backpressure", "FAILED", "Third request admitted past the limit")
+        if not admitted:
+            return _store_result(zcli, "Pipeline: Backpressure", "FAILED", "Freed slot not reused")
+        if remaining:
+            return _store_result(zcli, "Pipeline: Backpressure", "FAILED", "close() left requests in flight")
+    except Exception as e:
+        return _store_result(zcli, "Pipeline: Backpressure", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Pipeline: Backpressure", "PASSED", "max_in_flight enforced per connection")
+
+
+def test_pipeline_out_of_order_responses(zcli=None, context=None):
+    """Test pipelined requests reply as they finish, correlated by _requestId."""
+    if not zcli:
+        return _store_result(None, "Pipeline: Out-of-Order Replies", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        import json
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.bifrost_bridge import zBifrost
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules import RequestPipeline
+        bifrost = zBifrost(zcli.logger)
+        
+        class FakeWebSocket:
+            def __init__(self):
+                self.sent = []
+            
+            async def send(self, message):
+                self.sent.append(json.loads(message))
+        
+        async def fake_dispatch(ws, data):
+            await asyncio.sleep(data["delay"])
+            if data["delay"] < 0:
+                raise ValueError("boom")
+            await ws.send(json.dumps({"result": data["zKey"], "_requestId": data["_requestId"]}))
+        
+        async def scenario():
+            ws = FakeWebSocket()
+            bifrost.pipelines[ws] = RequestPipeline(zcli.logger, max_in_flight=4)
+            bifrost._event_map["dispatch"] = fake_dispatch
+            for request_id, delay in (("slow", 0.05), ("fast", 0), ("bad", -1)):
+                message = {"event": "dispatch", "zKey": request_id, "delay": delay, "_requestId": request_id}
+                await bifrost.handle_message(ws, json.dumps(message))
+            await asyncio.gather(*bifrost.pipelines[ws].in_flight.values())
+            return ws.sent
+        
+        sent = asyncio.run(scenario())
+        order = [reply.get("_requestId") for reply in sent]
+        if order != ["fast", "bad", "slow"]:
+            return _store_result(zcli, "Pipeline: Out-of-Order Replies", "FAILED", f"Reply order: {order}")
+        if "error" not in sent[1]:
+            return _store_result(zcli, "Pipeline: Out-of-Order Replies", "FAILED", "Failed request sent no error")
+    except Exception as e:
+        return _store_result(zcli, "Pipeline: Out-of-Order Replies", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Pipeline: Out-of-Order Replies", "PASSED", "Replies correlated by _requestId")
+
+
+# ===============================================================
+# S. Bridge Fan-out - Topics & Slow Consumers (3 tests)
+# ===============================================================
+
+class _FanoutWebSocket:
+    """Minimal WebSocket double for fan-out tests."""
+    
+    def __init__(self, stall=False):
+        self.sent = []
+        self.closed = False
+        self.close_code = None
+        self.stall = stall
+    
+    async def send(self, message):
+        if self.stall:
+            import asyncio
+            await asyncio.sleep(3600)
+        self.sent.append(message)
+    
+    async def close(self, code=1000, reason=""):
+        self.closed, self.close_code = True, code
+
+
+def test_fanout_topic_delivery(zcli=None, context=None):
+    """Test topic broadcasts reach subscribers only, once each, sharing one payload."""
+    if not zcli:
+        return _store_result(None, "Fan-out: Topic Delivery", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.bifrost_bridge import zBifrost
+        bifrost = zBifrost(zcli.logger)
+        users_view, orders_view, both_views, sender = (_FanoutWebSocket() for _ in range(4))
+        bifrost.clients.update({users_view, orders_view, both_views, sender})
+        bifrost.fanout.subscribe(users_view, ["model:users"])
+        bifrost.fanout.subscribe(orders_view, ["model:orders"])
+        bifrost.fanout.subscribe(both_views, ["model:users", "model:orders"])
+        bifrost.fanout.subscribe(sender, ["model:users"])
+        
+        async def scenario():
+            await bifrost.broadcast({"event": "changed"}, sender=sender, topics=["model:users", "model:orders"])
+            await bifrost.broadcast("users only", topics="model:users")
+            bifrost.fanout.unsubscribe(users_view, ["model:users"])
+            await bifrost.broadcast("after unsubscribe", topics="model:users")
+            await asyncio.sleep(0.01)  # Let the writer tasks drain
+            bifrost.fanout.close_all()
+        
+        asyncio.run(scenario())
+        
+        if users_view.sent != ['{"event": "changed"}', "users only"]:
+            return _store_result(zcli, "Fan-out: Topic Delivery", "FAILED", f"users view got {users_view.sent}")
+        if orders_view.sent != ['{"event": "changed"}']:
+            return _store_result(zcli, "Fan-out: Topic Delivery", "FAILED", f"orders view got {orders_view.sent}")
+        if len(both_views.sent) != 3 or both_views.sent[0] is not users_view.sent[0]:
+            return _store_result(zcli, "Fan-out: Topic Delivery", "FAILED", "Duplicate delivery or payload re-serialized")
+        if sender.sent != ["users only", "after unsubscribe"]:
+            return _store_result(zcli, "Fan-out: Topic Delivery", "FAILED", f"sender got {sender.sent}")
+    except Exception as e:
+        return _store_result(zcli, "Fan-out: Topic Delivery", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Fan-out: Topic Delivery", "PASSED", "Subscribers only, once each, one payload")
+
+
+def test_fanout_slow_consumer_disconnect(zcli=None, context=None):
+    """Test a stalled client is disconnected without delaying the others."""
+    if not zcli:
+        return _store_result(None, "Fan-out: Slow Consumer", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.modules.bridge_fanout import (
+            FanoutHub, WS_CLOSE_SLOW_CONSUMER
+        )
+        hub = FanoutHub(zcli.logger, max_queue=2)
+        fast, slow = _FanoutWebSocket(), _FanoutWebSocket(stall=True)
+        
+        async def scenario():
+            for i in range(5):
+                hub.publish(f"msg{i}", [fast, slow])
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            stats = hub.get_stats()
+            hub.close_all()
+            return stats
+        
+        stats = asyncio.run(scenario())
+        
+        if fast.sent != [f"msg{i}" for i in range(5)]:
+            return _store_result(zcli, "Fan-out: Slow Consumer", "FAILED", f"Fast client got {fast.sent}")
+        if not slow.closed or slow.close_code != WS_CLOSE_SLOW_CONSUMER:
+            return _store_result(zcli, "Fan-out: Slow Consumer", "FAILED", "Stalled client not disconnected")
+        if stats["slow_disconnects"] != 1 or stats["clients"] != 1:
+            return _store_result(zcli, "Fan-out: Slow Consumer", "FAILED", f"Unexpected stats: {stats}")
+    except Exception as e:
+        return _store_result(zcli, "Fan-out: Slow Consumer", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Fan-out: Slow Consumer", "PASSED", "Stalled client dropped (1013), others unaffected")
+
+
+def test_fanout_subscription_events(zcli=None, context=None):
+    """Test subscribe/unsubscribe events and per-user dispatch topics."""
+    if not zcli:
+        return _store_result(None, "Fan-out: Subscription Events", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        import json
+        from zCLI.subsystems.zBifrost.zBifrost_modules.bifrost.server.bifrost_bridge import zBifrost
+        bifrost = zBifrost(zcli.logger)
+        ws = _FanoutWebSocket()
+        bifrost.auth.register_client(ws, {"context": "zSession", "zsession_user": {"username": "alice"}})
+        
+        async def scenario():
+            bifrost.events['client'].join_user_topic(ws)
+            await bifrost.handle_message(ws, json.dumps({"event": "subscribe", "topics": ["model:users"]}))
+            await bifrost.handle_message(ws, json.dumps({"event": "subscribe", "topics": ["user:bob"]}))
+            await bifrost.handle_message(ws, json.dumps(
+                {"event": "unsubscribe", "topics": ["model:users"], "_requestId": "r1"}
+            ))
+        
+        asyncio.run(scenario())
+        replies = [json.loads(message) for message in ws.sent]
+        
+        if replies[0].get("topics") != ["model:users", "user:alice"]:
+            return _store_result(zcli, "Fan-out: Subscription Events", "FAILED", f"subscribe reply: {replies[0]}")
+        if "error" not in replies[1] or bifrost.fanout.subscribers("user:bob"):
+            return _store_result(zcli, "Fan-out: Subscription Events", "FAILED", "Foreign user topic accepted")
+        if replies[2].get("topics") != ["user:alice"] or replies[2].get("_requestId") != "r1":
+            return _store_result(zcli, "Fan-out: Subscription Events", "FAILED", f"unsubscribe reply: {replies[2]}")
+        
+        dispatch = bifrost.events['dispatch']
+        read_topics = dispatch._broadcast_topics({}, "anonymous", {"users"}, is_write=False)
+        write_topics = dispatch._broadcast_topics({"zBlock": "Users"}, "alice", {"users"}, is_write=True)
+        if read_topics or write_topics != ["user:alice", "model:users", "zBlock:Users"]:
+            return _store_result(zcli, "Fan-out: Subscription Events", "FAILED",
+                                 f"Dispatch topics: {read_topics} / {write_topics}")
+    except Exception as e:
+        return _store_result(zcli, "Fan-out: Subscription Events", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "Fan-out: Subscription Events", "PASSED", "Own topics only; anonymous reads stay private")
+
+
+# ===============================================================
+# T. HTTP Client Pool - Keep-Alive, Retries & Async (3 tests)
+# ===============================================================
+
+def _start_local_http_server(statuses=None):
+    """Start a keep-alive HTTP/1.1 server on a free port; returns (server, url, state).
+    
+    statuses: status codes for the first requests (then 200); state counts hits/connections.
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    state = {"hits": 0, "connections": 0, "statuses": list(statuses or [])}
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+        
+        def setup(self):
+            super().setup()
+            state["connections"] += 1
+        
+        def _reply(self):
+            state["hits"] += 1
+            status = state["statuses"].pop(0) if state["statuses"] else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.send_header("Set-Cookie", "sid=leak")
+            self.end_headers()
+        
+        do_GET = do_POST = _reply
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/", state
+
+
+def test_http_pool_keep_alive(zcli=None, context=None):
+    """Test pooled session: connections reused, no cookies kept, stats in health_check_all()."""
+    if not zcli:
+        return _store_result(None, "HTTP Pool: Keep-Alive Reuse", "ERROR", "No zcli")
+    
+    try:
+        from zCLI.subsystems.zComm.zComm_modules.comm_http import HTTPClient
+        server, url, state = _start_local_http_server()
+        client = HTTPClient(zcli.logger)
+        try:
+            statuses = [client.get(url).status_code for _ in range(10)]
+            stats = client.get_stats()
+            cookies = len(client.session.cookies)
+        finally:
+            client.close()
+            server.shutdown()
+        
+        if statuses != [200] * 10:
+            return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "FAILED", f"Statuses: {statuses}")
+        if state["connections"] != 1 or stats["connections_opened"] != 1 or stats["requests_reused"] != 9:
+            return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "FAILED",
+                                 f"{state['connections']} connections for 10 requests ({stats})")
+        if cookies:
+            return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "FAILED", "Cookie kept between calls")
+        if "http_client" not in zcli.comm.health_check_all():
+            return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "FAILED", "No http_client in health_check_all()")
+    except Exception as e:
+        return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "HTTP Pool: Keep-Alive Reuse", "PASSED", "10 requests over 1 connection")
+
+
+def test_http_pool_retry_policy(zcli=None, context=None):
+    """Test retry/backoff: 503 retried for GET, never for POST."""
+    if not zcli:
+        return _store_result(None, "HTTP Pool: Retry Policy", "ERROR", "No zcli")
+    
+    try:
+        from zCLI.subsystems.zComm.zComm_modules.comm_http import HTTPClient
+        server, url, state = _start_local_http_server(statuses=[503, 503])
+        client = HTTPClient(zcli.logger, max_retries=2, backoff_factor=0.01)
+        try:
+            get_status = client.get(url).status_code
+            get_hits = state["hits"]
+            state["statuses"] = [503]
+            post_status = client.post(url, data={"a": 1}).status_code
+            post_hits = state["hits"] - get_hits
+        finally:
+            client.close()
+            server.shutdown()
+        
+        if get_status != 200 or get_hits != 3:
+            return _store_result(zcli, "HTTP Pool: Retry Policy", "FAILED", f"GET: {get_status} after {get_hits} hits")
+        if post_status != 503 or post_hits != 1:
+            return _store_result(zcli, "HTTP Pool: Retry Policy", "FAILED", f"POST retried: {post_hits} hits")
+    except Exception as e:
+        return _store_result(zcli, "HTTP Pool: Retry Policy", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "HTTP Pool: Retry Policy", "PASSED", "GET retried twice, POST sent once")
+
+
+def test_http_pool_async_client(zcli=None, context=None):
+    """Test AsyncHTTPClient: concurrent awaits share the pooled connections."""
+    if not zcli:
+        return _store_result(None, "HTTP Pool: Async Client", "ERROR", "No zcli")
+    
+    try:
+        import asyncio
+        from zCLI.subsystems.zComm.zComm_modules.comm_http import HTTPClient, AsyncHTTPClient
+        server, url, state = _start_local_http_server()
+        client = HTTPClient(zcli.logger, pool_maxsize=4)
+        async_client = AsyncHTTPClient(client)
+        
+        async def scenario():
+            return await asyncio.gather(*(async_client.get(url) for _ in range(20)))
+        
+        try:
+            responses = asyncio.run(scenario())
+        finally:
+            async_client.close()
+            client.close()
+            server.shutdown()
+        
+        if [response.status_code for response in responses] != [200] * 20:
+            return _store_result(zcli, "HTTP Pool: Async Client", "FAILED", "Not all requests succeeded")
+        if state["connections"] > 4:
+            return _store_result(zcli, "HTTP Pool: Async Client", "FAILED",
+                                 f"{state['connections']} connections (limit 4)")
+        if not hasattr(zcli.comm, "http_async"):
+            return _store_result(zcli, "HTTP Pool: Async Client", "FAILED", "zComm has no http_async")
+        
+        # zCLI.shutdown() releases the facade's clients via close_http_clients()
+        server, url, state = _start_local_http_server()
+        try:
+            asyncio.run(zcli.comm.http_async.get(url))
+            zcli.comm.close_http_clients()
+        finally:
+            server.shutdown()
+        if zcli.comm.http_async._executor is not None or zcli.comm._http_client._session is not None:
+            return _store_result(zcli, "HTTP Pool: Async Client", "FAILED",
+                                 "close_http_clients() left the pool open")
+    except Exception as e:
+        return _store_result(zcli, "HTTP Pool: Async Client", "FAILED", f"Error: {str(e)}")
+    
+    return _store_result(zcli, "HTTP Pool: Async Client", "PASSED",
+                         f"20 awaited requests over {state['connections']} connections")
+
+
 # ===============================================================
 # Display Test Results (Final Step)
 # ===============================================================
@@ -2172,7 +2691,11 @@ def display_test_results(zcli=None, context=None):
         "M. Bridge Cache - Security (8 tests) [SECURITY]": [],
         "N. Bridge Messages (6 tests)": [],
         "O. Event Handlers (8 tests)": [],
-        "P. Integration Tests (8 tests)": []
+        "P. Integration Tests (8 tests)": [],
+        "Q. Bridge Query Cache (3 tests)": [],
+        "R. Bridge Request Pipelining (3 tests)": [],
+        "S. Bridge Fan-out (3 tests)": [],
+        "T. HTTP Client Pool (3 tests)": []
     }
     
     # Categorize
@@ -2192,6 +2715,10 @@ def display_test_results(zcli=None, context=None):
         elif "Bifrost Bridge:" in test: categories["J. zBifrost Bridge (8 tests)"].append(r)
         elif "Connection:" in test: categories["K. Bridge Connection (4 tests)"].append(r)
         elif "Auth:" in test: categories["L. Bridge Auth - Three-Tier (10 tests) [CRITICAL]"].append(r)
+        elif "Query Cache:" in test: categories["Q. Bridge Query Cache (3 tests)"].append(r)
+        elif "Pipeline:" in test: categories["R. Bridge Request Pipelining (3 tests)"].append(r)
+        elif "Fan-out:" in test: categories["S. Bridge Fan-out (3 tests)"].append(r)
+        elif "HTTP Pool:" in test: categories["T. HTTP Client Pool (3 tests)"].append(r)
         elif "Cache:" in test: categories["M. Bridge Cache - Security (8 tests) [SECURITY]"].append(r)
         elif "Messages:" in test: categories["N. Bridge Messages (6 tests)"].append(r)
         elif "Events:" in test: categories["O. Event Handlers (8 tests)"].append(r)
@@ -2227,7 +2754,7 @@ def display_test_results(zcli=None, context=None):
     else:
         print(f"\n[FAILURE] {failed + errors} test(s) did not pass")
     
-    print(f"\n[INFO] Coverage: All 15 zComm modules + 8 integration tests (A-to-P comprehensive coverage)")
+    print(f"\n[INFO] Coverage: All 15 zComm modules + 8 integration tests (A-to-T comprehensive coverage)")
     print(f"[INFO] Including: Three-Tier Auth, Cache Security, PostgreSQL, Bifrost Bridge, All Event Handlers")
     print(f"[INFO] Integration Tests: Real port checks, health execution, WebSocket lifecycle, HTTP client, service manager, session persistence")
     print("\n[INFO] Review results above.")
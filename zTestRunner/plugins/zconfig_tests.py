@@ -1170,6 +1170,133 @@ def test_integration_config_file_round_trip(zcli=None, context=None):
                            f"Exception: {str(e)}")
 
 
+# ═══════════════════════════════════════════════════════════
+# P. Startup Tests - Lazy Init & Startup Report (2 tests)
+# ═══════════════════════════════════════════════════════════
+
+def test_startup_lazy_subsystems(zcli=None, context=None):
+    """Test lazy mode: Layer 1+ subsystems are built on first attribute access."""
+    if not zcli:
+        return _store_result(None, "Startup: Lazy Subsystems", "ERROR", "No zcli")
+    
+    try:
+        from zCLI import zCLI
+        lazy_zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR', 'lazy': True})
+        
+        eager = [name for name in ("config", "comm", "display") if name not in lazy_zcli.__dict__]
+        if eager:
+            return _store_result(zcli, "Startup: Lazy Subsystems", "FAILED", f"Not built eagerly: {eager}")
+        if "data" in lazy_zcli.__dict__ or "walker" in lazy_zcli.__dict__:
+            return _store_result(zcli, "Startup: Lazy Subsystems", "FAILED", "zData/zWalker built at startup")
+        
+        data = lazy_zcli.data  # First access builds it
+        if "data" not in lazy_zcli.__dict__ or lazy_zcli.data is not data:
+            return _store_result(zcli, "Startup: Lazy Subsystems", "FAILED", "zData not cached after first access")
+        if not lazy_zcli.startup_timings.get("data", {}).get("on_demand"):
+            return _store_result(zcli, "Startup: Lazy Subsystems", "FAILED", "zData timing not marked on_demand")
+        
+        try:
+            lazy_zcli.no_such_subsystem
+            return _store_result(zcli, "Startup: Lazy Subsystems", "FAILED", "Unknown attribute did not raise")
+        except AttributeError:
+            pass
+        
+        return _store_result(zcli, "Startup: Lazy Subsystems", "PASSED", "Deferred until first access")
+    except Exception as e:
+        return _store_result(zcli, "Startup: Lazy Subsystems", "ERROR", f"Exception: {str(e)}")
+
+
+def test_startup_report(zcli=None, context=None):
+    """Test startup_report(): one row per built subsystem with import/init times."""
+    if not zcli:
+        return _store_result(None, "Startup: Report", "ERROR", "No zcli")
+    
+    try:
+        timings = zcli.startup_timings
+        if "config" not in timings or "display" not in timings:
+            return _store_result(zcli, "Startup: Report", "FAILED", f"Missing timings: {list(timings)}")
+        
+        report = zcli.startup_report()
+        lines = report.splitlines()
+        if not lines[0].startswith("zCLI startup") or len(lines) < len(timings) + 2:
+            return _store_result(zcli, "Startup: Report", "FAILED", f"Unexpected report: {lines[:2]}")
+        if not lines[2].endswith(" config"):
+            return _store_result(zcli, "Startup: Report", "FAILED", "zConfig is not the first row")
+        
+        return _store_result(zcli, "Startup: Report", "PASSED", f"{len(timings)} subsystems timed")
+    except Exception as e:
+        return _store_result(zcli, "Startup: Report", "ERROR", f"Exception: {str(e)}")
+
+
+# ═══════════════════════════════════════════════════════════
+# Q. Machine Snapshot Tests (2 tests)
+# ═══════════════════════════════════════════════════════════
+
+def test_snapshot_reuse_and_invalidate(zcli=None, context=None):
+    """Test machine snapshot round-trip: reused on matching fingerprint, rejected otherwise."""
+    if not zcli:
+        return _store_result(None, "Snapshot: Reuse & Invalidate", "ERROR", "No zcli")
+    
+    import tempfile
+    from zCLI.subsystems.zConfig.zConfig_modules.helpers import (
+        machine_fingerprint, load_machine_snapshot, save_machine_snapshot, SNAPSHOT_FILENAME
+    )
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / SNAPSHOT_FILENAME
+            fingerprint = machine_fingerprint()
+            probes = {"memory_gb": 16, "browser": "firefox"}
+            
+            if not save_machine_snapshot(path, probes, fingerprint):
+                return _store_result(zcli, "Snapshot: Reuse & Invalidate", "FAILED", "Snapshot not written")
+            
+            snapshot = load_machine_snapshot(path, machine_fingerprint())
+            if not snapshot or snapshot.get("probes") != probes:
+                return _store_result(zcli, "Snapshot: Reuse & Invalidate", "FAILED", "Matching snapshot not reused")
+            
+            changed = dict(fingerprint, kernel="0.0.0-other")
+            if load_machine_snapshot(path, changed) is not None:
+                return _store_result(zcli, "Snapshot: Reuse & Invalidate", "FAILED", "Kernel change not detected")
+            
+            path.write_text("{not json", encoding="utf-8")
+            if load_machine_snapshot(path, fingerprint) is not None:
+                return _store_result(zcli, "Snapshot: Reuse & Invalidate", "FAILED", "Corrupt snapshot accepted")
+        
+        source = getattr(zcli.config.machine, "snapshot_source", None)
+        return _store_result(zcli, "Snapshot: Reuse & Invalidate", "PASSED", f"Round-trip OK (this run: {source})")
+    except Exception as e:
+        return _store_result(zcli, "Snapshot: Reuse & Invalidate", "ERROR", f"Exception: {str(e)}")
+
+
+def test_snapshot_skip_probes(zcli=None, context=None):
+    """Test skipped probes: no detection runs, empty defaults, part of the fingerprint."""
+    if not zcli:
+        return _store_result(None, "Snapshot: Skip Probes", "ERROR", "No zcli")
+    
+    from zCLI.subsystems.zConfig.zConfig_modules.helpers import (
+        run_machine_probes, machine_fingerprint, parse_skip_probes, MACHINE_PROBES
+    )
+    
+    try:
+        skip = parse_skip_probes("gpu, network,bogus")
+        if skip != ("gpu", "network"):
+            return _store_result(zcli, "Snapshot: Skip Probes", "FAILED", f"Unexpected skip list: {skip}")
+        
+        probes = run_machine_probes(skip_probes=MACHINE_PROBES, is_production=True)
+        if probes["gpu"]["gpu_available"] or probes["network"]["network_interfaces"] or probes["memory_gb"] is not None:
+            return _store_result(zcli, "Snapshot: Skip Probes", "FAILED", "Skipped probe returned data")
+        if not probes["cpu"]["cpu_logical"]:
+            return _store_result(zcli, "Snapshot: Skip Probes", "FAILED", "Skipped CPU probe lost os.cpu_count()")
+        
+        if machine_fingerprint(skip) == machine_fingerprint():
+            return _store_result(zcli, "Snapshot: Skip Probes", "FAILED", "Skip list not in fingerprint")
+        
+        return _store_result(zcli, "Snapshot: Skip Probes", "PASSED", f"{len(MACHINE_PROBES)} probes skippable")
+    except Exception as e:
+        return _store_result(zcli, "Snapshot: Skip Probes", "ERROR", f"Exception: {str(e)}")
+
+
 # ===============================================================
 # Display Test Results (Final Step)
 # ===============================================================
@@ -1228,7 +1355,9 @@ def display_test_results(zcli=None, context=None):
         "L. Cross-Platform (3 tests)": [],
         "M. zConfig Facade API (5 tests)": [],
         "N. Helper Functions (7 tests)": [],
-        "O. Integration Tests (6 tests)": []
+        "O. Integration Tests (6 tests)": [],
+        "P. Startup (2 tests)": [],
+        "Q. Machine Snapshot (2 tests)": []
     }
     
     # Categorize
@@ -1249,6 +1378,8 @@ def display_test_results(zcli=None, context=None):
         elif "Facade:" in test: categories["M. zConfig Facade API (5 tests)"].append(r)
         elif "Helpers:" in test or "Detectors:" in test: categories["N. Helper Functions (7 tests)"].append(r)
         elif "Integration:" in test: categories["O. Integration Tests (6 tests)"].append(r)
+        elif "Startup:" in test: categories["P. Startup (2 tests)"].append(r)
+        elif "Snapshot:" in test: categories["Q. Machine Snapshot (2 tests)"].append(r)
     
     # Display by category
     for category, tests in categories.items():
@@ -1279,7 +1410,7 @@ def display_test_results(zcli=None, context=None):
     else:
         print(f"\n[FAILURE] {failed + errors} test(s) did not pass")
     
-    print(f"\n[INFO] Coverage: All 14 zConfig modules + 6 integration tests (A-to-O comprehensive coverage)")
+    print(f"\n[INFO] Coverage: All 14 zConfig modules + 6 integration tests + startup and machine snapshot (A-to-Q comprehensive coverage)")
     print("\n[INFO] Review results above.")
     if sys.stdin.isatty():
         input("Press Enter to return to main menu...")
@@ -1,12 +1,12 @@
 # zTestRunner/plugins/zdata_tests.py
 """
-zData Comprehensive Test Suite (120 tests - COMPLETE)
+zData Comprehensive Test Suite (133 tests - COMPLETE)
 =====================================================
 
 Declarative tests for zData subsystem covering real-world workflows.
 All 5 phases complete: 120/120 tests (100% coverage).
 
-Test Coverage (120 tests):
+Test Coverage (133 tests):
 ---------------------------
 A. Initialization (3 tests) - Basic setup, dependencies, methods
 B. SQLite Adapter (13 tests) - CRUD, transactions, DDL, filters
@@ -29,6 +29,11 @@ R. Schema Management (5 tests) - Versioning, hot reload, validation
 S. Data Types (5 tests) - JSON, datetime, boolean, enum, custom serializers
 T. Performance (5 tests) - Very large datasets, bulk ops, query optimization
 U. Final Integration (3 tests) - End-to-end workflows, production scenarios
+V. Connection Pool (4 tests) - Reuse across requests, thread affinity, release, wizard aliases
+W. Bulk Load (3 tests) - insert_many/upsert_many, file import, validation
+X. Streaming Reads (2 tests) - select_batches/select_iter, streamed zTable display
+Y. CSV Resident Engine (2 tests) - WAL + batched commit, crash replay/rollback, indexes
+Z. PostgreSQL Provisioning (2 tests) - One handshake once provisioned, re-provision, .pginfo.yaml (psycopg2 stubbed)
 
 Note: COMPLETE - 120/120 tests (100% coverage).
 """
@@ -186,6 +191,24 @@ __all__ = [
     "test_118_production_workflow",
     "test_119_full_crud_cycle",
     "test_120_comprehensive_integration",
+    # V. Connection Pool
+    "test_121_pool_reuse_across_requests",
+    "test_122_pool_thread_affinity_and_health",
+    "test_123_pool_release_semantics",
+    "test_133_pool_wizard_alias_handlers",
+    # W. Bulk Load
+    "test_124_bulk_insert_upsert_many",
+    "test_125_bulk_import_csv_file",
+    "test_126_bulk_import_validation",
+    # X. Streaming Reads
+    "test_127_stream_select_batches",
+    "test_128_stream_table_display",
+    # Y. CSV Resident Engine
+    "test_129_csv_resident_write_path",
+    "test_130_csv_resident_recovery",
+    # Z. PostgreSQL Provisioning
+    "test_131_postgres_provision_once",
+    "test_132_postgres_reprovision",
     # Display
     "display_test_results",
 ]
@@ -3582,6 +3605,577 @@ def test_120_comprehensive_integration(zcli: Optional[Any] = None, context: Opti
     except Exception as e:
         return _store_result(zcli, "Integration: Comprehensive", "ERROR", str(e))
 
+# ============================================================================
+# V. CONNECTION POOL (4 TESTS)
+# ============================================================================
+
+def _pool_schema(data_path: str, data_type: str = "sqlite") -> Dict[str, Any]:
+    """Minimal self-contained schema for connection pool tests"""
+    return {
+        "Meta": {"Data_Type": data_type, "Data_Path": data_path, "Data_Label": "pooltest"},
+        "items": {"id": {"type": "int", "pk": True}, "name": {"type": "str"}},
+    }
+
+def test_121_pool_reuse_across_requests(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test one-shot handle_request borrows from and returns to the pool"""
+    import tempfile
+    temp_dir = tempfile.mkdtemp()
+    try:
+        schema = _pool_schema(temp_dir)
+        options = {"_schema_cached": schema, "_alias_name": "pooltest", "tables": "items"}
+        before = zcli.data.get_connection_info()["pool"]
+        
+        for action in ("create", "read", "read"):
+            result = zcli.data.handle_request({"action": action, "options": dict(options)})
+            assert result != "error", f"{action} failed"
+            assert zcli.data.adapter is None, "Adapter should be returned after one-shot request"
+        
+        after = zcli.data.get_connection_info()["pool"]
+        created = after["created"] - before["created"]
+        reused = after["reused"] - before["reused"]
+        assert created == 1, f"Expected 1 new connection, got {created}"
+        assert reused == 2, f"Expected 2 reuses, got {reused}"
+        assert after["pools"].get(f"sqlite:{temp_dir}/pooltest", {}).get("idle") == 1, "Connection should be idle in pool"
+        
+        return _store_result(zcli, "Pool: Reuse Across Requests", "PASSED", f"3 requests, 1 connect ({after['reuse_rate']} reuse)")
+    except Exception as e:
+        return _store_result(zcli, "Pool: Reuse Across Requests", "ERROR", str(e))
+    finally:
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_122_pool_thread_affinity_and_health(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test SQLite connections stay on their thread and stale files are not reused"""
+    import tempfile
+    import threading
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+    from zCLI.subsystems.zData.zData_modules.shared.backends.connection_pool import ConnectionPool, make_pool_key
+    
+    temp_dir = tempfile.mkdtemp()
+    pool = ConnectionPool(max_size=2)
+    try:
+        config = {"path": temp_dir, "label": "pooltest", "meta": {}}
+        key = make_pool_key("sqlite", config)
+        factory = lambda: AdapterFactory.create_adapter("sqlite", config)
+        
+        main_adapter = pool.acquire(key, factory)
+        pool.release(main_adapter)
+        
+        seen = []
+        def worker():
+            adapter = pool.acquire(key, factory)
+            adapter.get_cursor().execute("SELECT 1")  # Would raise if created on another thread
+            seen.append(adapter)
+            pool.release(adapter)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert seen and seen[0] is not main_adapter, "SQLite connection crossed threads"
+        
+        assert pool.acquire(key, factory) is main_adapter, "Same-thread connection not reused"
+        pool.release(main_adapter)
+        
+        os.remove(os.path.join(temp_dir, "pooltest.db"))
+        fresh = pool.acquire(key, factory)
+        assert fresh is not main_adapter, "Connection to deleted database file was reused"
+        assert pool.get_stats()["health_failures"] == 1, "Health failure not counted"
+        pool.release(fresh)
+        
+        return _store_result(zcli, "Pool: Thread Affinity & Health", "PASSED", "Per-thread SQLite, stale file dropped")
+    except Exception as e:
+        return _store_result(zcli, "Pool: Thread Affinity & Health", "ERROR", str(e))
+    finally:
+        pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_123_pool_release_semantics(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test rollback on release, max_size overflow, and CSV not pooled"""
+    import tempfile
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+    from zCLI.subsystems.zData.zData_modules.shared.backends.connection_pool import ConnectionPool, make_pool_key
+    
+    temp_dir = tempfile.mkdtemp()
+    pool = ConnectionPool(max_size=1)
+    try:
+        config = {"path": temp_dir, "label": "pooltest", "meta": {}}
+        key = make_pool_key("sqlite", config)
+        factory = lambda: AdapterFactory.create_adapter("sqlite", config)
+        
+        adapter = pool.acquire(key, factory)
+        adapter.begin_transaction()
+        adapter.get_cursor().execute("CREATE TABLE leftover (id INTEGER)")
+        overflow = pool.acquire(key, factory)
+        pool.release(overflow)
+        assert not overflow.is_connected(), "Overflow connection should close on release"
+        pool.release(adapter)
+        
+        reused = pool.acquire(key, factory)
+        assert reused is adapter, "Pooled connection not reused"
+        assert not reused.table_exists("leftover"), "Open transaction was not rolled back on release"
+        pool.release(reused)
+        
+        csv_config = {"path": temp_dir, "label": "pooltest", "meta": {}}
+        csv_adapter = pool.acquire(make_pool_key("csv", csv_config), lambda: AdapterFactory.create_adapter("csv", csv_config))
+        pool.release(csv_adapter)
+        assert not csv_adapter.is_connected(), "CSV adapter should be disconnected (flushed), not pooled"
+        
+        stats = pool.get_stats()
+        assert stats["overflow"] == 1 and stats["idle"] == 1, f"Unexpected stats: {stats}"
+        
+        return _store_result(zcli, "Pool: Release Semantics", "PASSED", "Rollback on release, overflow closed, CSV unpooled")
+    except Exception as e:
+        return _store_result(zcli, "Pool: Release Semantics", "ERROR", str(e))
+    finally:
+        pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_133_pool_wizard_alias_handlers(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test a second wizard alias does not release the first alias's connection"""
+    import tempfile
+    from zCLI.subsystems.zLoader.loader_modules.loader_cache_schema import SchemaCache
+    
+    temp_dir = tempfile.mkdtemp()
+    cache = SchemaCache({}, zcli.logger)
+    wizard_ctx = {"wizard_mode": True, "schema_cache": cache}
+    try:
+        schema_a = _pool_schema(temp_dir)
+        schema_b = dict(_pool_schema(temp_dir), Meta={"Data_Type": "sqlite", "Data_Path": temp_dir, "Data_Label": "pooltest_b"})
+        request_a = lambda action: {"action": action, "options": {"_schema_cached": schema_a, "_alias_name": "a", "tables": "items"}}
+        request_b = lambda action: {"action": action, "options": {"_schema_cached": schema_b, "_alias_name": "b", "tables": "items"}}
+        before = zcli.data.get_connection_info()["pool"]["in_use"]
+        
+        assert zcli.data.handle_request(request_a("create"), wizard_ctx) != "error", "Alias a create failed"
+        handler_a = cache.get_connection("a")
+        assert handler_a is not zcli.data, "Alias connection should live on its own handler"
+        assert set(vars(handler_a)) == set(vars(zcli.data)), "Spawned handler attributes differ from zcli.data"
+        adapter_a = handler_a.adapter
+        cache.begin_transaction("a")
+        adapter_a.insert("items", ["id", "name"], [1, "pending"])
+        
+        # Loading alias b mid-transaction must leave alias a's connection alone
+        assert zcli.data.handle_request(request_b("create"), wizard_ctx) != "error", "Alias b create failed"
+        assert cache.get_connection("a").adapter is adapter_a and adapter_a.is_connected(), "Alias a adapter was released"
+        assert adapter_a.select("items", where={"id": 1}), "Alias a transaction was rolled back"
+        cache.commit_transaction("a")
+        
+        zcli.data.disconnect()
+        cache.clear()
+        after = zcli.data.get_connection_info()["pool"]["in_use"]
+        assert after == before, f"Connections not returned after cache clear: {before} -> {after}"
+        
+        return _store_result(zcli, "Pool: Wizard Alias Handlers", "PASSED", "Per-alias handlers, released on cache clear")
+    except Exception as e:
+        return _store_result(zcli, "Pool: Wizard Alias Handlers", "ERROR", str(e))
+    finally:
+        cache.clear()
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+# ============================================================================
+# W. BULK LOAD (3 tests)
+# ============================================================================
+
+def _write_import_file(temp_dir: str, name: str, text: str) -> str:
+    """Write an import fixture file and return its path"""
+    path = os.path.join(temp_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+def test_124_bulk_insert_upsert_many(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test insert_many/upsert_many on SQLite and CSV (one transaction, rollback on error)"""
+    import tempfile
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+    
+    temp_dir = tempfile.mkdtemp()
+    schema = _pool_schema(temp_dir)["items"]
+    try:
+        for backend in ("sqlite", "csv"):
+            adapter = AdapterFactory.create_adapter(backend, {"path": temp_dir, "label": f"bulk_{backend}", "meta": {}})
+            adapter.connect()
+            try:
+                adapter.create_table("items", schema)
+                stats = adapter.insert_many("items", ["id", "name"], ((i, f"item{i}") for i in range(1, 2501)), chunk_size=1000)
+                assert stats["rows"] == 2500 and stats["chunks"] == 3, f"{backend}: unexpected stats {stats}"
+                assert stats["rows_per_sec"] > 0, f"{backend}: no rows/sec reported"
+                
+                adapter.upsert_many("items", ["id", "name"], [{"id": 1, "name": "renamed"}, {"id": 2501, "name": "added"}], ["id"])
+                if backend == "sqlite":
+                    sql = adapter._build_upsert_sql("items", ["id", "name"], ["id"])
+                    assert adapter._build_upsert_sql("items", ["id", "name"], ["id"]) is sql, "Upsert SQL not memoized"
+                assert adapter.select("items", where={"id": 1})[0]["name"] == "renamed", f"{backend}: upsert did not update"
+                assert len(adapter.select("items")) == 2501, f"{backend}: upsert did not insert"
+            finally:
+                adapter.disconnect()
+        
+        adapter = AdapterFactory.create_adapter("sqlite", {"path": temp_dir, "label": "bulk_sqlite", "meta": {}})
+        adapter.connect()
+        try:
+            try:
+                adapter.insert_many("items", ["id", "name"], [(3000, "new"), (1, "duplicate")])
+                raise AssertionError("Duplicate primary key should fail")
+            except Exception as e:  # pylint: disable=broad-except
+                if isinstance(e, AssertionError):
+                    raise
+            assert not adapter.select("items", where={"id": 3000}), "Failed bulk insert was not rolled back"
+        finally:
+            adapter.disconnect()
+        
+        return _store_result(zcli, "Bulk: insert_many/upsert_many", "PASSED", f"SQLite + CSV, {stats['rows_per_sec']:.0f} rows/sec, rollback on error")
+    except Exception as e:
+        return _store_result(zcli, "Bulk: insert_many/upsert_many", "ERROR", str(e))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_125_bulk_import_csv_file(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test the import action streams a CSV file into a table"""
+    import tempfile
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = _write_import_file(temp_dir, "items.csv", "id,name\n" + "".join(f"{i},item{i}\n" for i in range(1, 1201)))
+        options = {"_schema_cached": _pool_schema(temp_dir), "_alias_name": "pooltest", "tables": "items"}
+        
+        result = zcli.data.handle_request({"action": "import", "file": path, "chunk_size": 500, "options": dict(options)})
+        assert isinstance(result, dict), f"Import failed: {result}"
+        assert result["rows"] == 1200 and result["chunks"] == 3, f"Unexpected stats: {result}"
+        
+        zcli.data.handle_request({"action": "read", "options": dict(options)}, {"wizard_mode": True})
+        rows = zcli.data.select("items", where={"id": 1200})
+        assert rows and rows[0]["name"] == "item1200", "Imported row not found"
+        assert isinstance(rows[0]["id"], int), "CSV text not coerced to schema int"
+        
+        return _store_result(zcli, "Bulk: Import CSV File", "PASSED", f"1200 rows at {result['rows_per_sec']:.0f} rows/sec")
+    except Exception as e:
+        return _store_result(zcli, "Bulk: Import CSV File", "ERROR", str(e))
+    finally:
+        zcli.data.disconnect()
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_126_bulk_import_validation(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test import validation: abort rolls back, skip drops bad rows, JSONL upsert"""
+    import tempfile
+    temp_dir = tempfile.mkdtemp()
+    try:
+        schema = _pool_schema(temp_dir)
+        schema["items"]["name"] = {"type": "str", "required": True}
+        options = {"_schema_cached": schema, "_alias_name": "pooltest", "tables": "items"}
+        path = _write_import_file(temp_dir, "items.jsonl",
+                                  '{"id": 1, "name": "one"}\n{"id": 2, "name": ""}\n{"id": 3, "name": "three"}\nnot json\n')
+        
+        result = zcli.data.handle_request({"action": "import", "file": path, "options": dict(options)})
+        assert result is False, f"Invalid row should abort the import, got {result}"
+        
+        result = zcli.data.handle_request({"action": "import", "file": path, "on_error": "skip", "options": dict(options)})
+        assert isinstance(result, dict) and result["rows"] == 2 and result["skipped"] == 2, f"Unexpected stats: {result}"
+        
+        extra_path = _write_import_file(temp_dir, "extra.jsonl", '{"id": 5, "name": "five"}\n{"id": 6, "name": "six", "note": "x"}\n')
+        result = zcli.data.handle_request({"action": "import", "file": extra_path, "options": dict(options)})
+        assert result is False, f"Record with keys outside the first record should be rejected, got {result}"
+        
+        upsert_path = _write_import_file(temp_dir, "update.jsonl", '{"id": 3, "name": "THREE"}\n{"id": 4, "name": "four"}\n')
+        result = zcli.data.handle_request({"action": "import", "file": upsert_path, "mode": "upsert", "options": dict(options)})
+        assert isinstance(result, dict) and result["rows"] == 2, f"Upsert import failed: {result}"
+        
+        zcli.data.handle_request({"action": "read", "options": dict(options)}, {"wizard_mode": True})
+        names = {row["id"]: row["name"] for row in zcli.data.select("items")}
+        assert names == {1: "one", 3: "THREE", 4: "four"}, f"Unexpected table contents: {names}"
+        
+        return _store_result(zcli, "Bulk: Import Validation", "PASSED", "Abort rolls back, skip drops 2 rows, extra keys rejected, upsert by pk")
+    except Exception as e:
+        return _store_result(zcli, "Bulk: Import Validation", "ERROR", str(e))
+    finally:
+        zcli.data.disconnect()
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+# ============================================================================
+# X. STREAMING READS (2 tests)
+# ============================================================================
+
+def test_127_stream_select_batches(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test select_batches/select_iter stream in batches on SQLite and CSV"""
+    import tempfile
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+    
+    temp_dir = tempfile.mkdtemp()
+    schema = _pool_schema(temp_dir)["items"]
+    try:
+        for backend in ("sqlite", "csv"):
+            adapter = AdapterFactory.create_adapter(backend, {"path": temp_dir, "label": f"stream_{backend}", "meta": {}})
+            adapter.connect()
+            try:
+                adapter.create_table("items", schema)
+                adapter.insert_many("items", ["id", "name"], ((i, f"item{i}") for i in range(1, 1201)))
+                
+                sizes = [len(batch) for batch in adapter.select_batches("items", batch_size=500, order="id")]
+                assert sizes == [500, 500, 200], f"{backend}: unexpected batch sizes {sizes}"
+                
+                matched = sum(1 for _ in adapter.select_iter("items", where={"id": {"$gt": 1000}}))
+                assert matched == 200, f"{backend}: select_iter WHERE returned {matched} rows"
+                
+                # Stop early, run another query mid-stream, then resume
+                stream = adapter.select_batches("items", batch_size=100, order="id")
+                assert next(stream)[0]["id"] == 1, f"{backend}: first batch out of order"
+                assert adapter.select("items", limit=2, offset=10, order="id")[0]["id"] == 11, f"{backend}: LIMIT/OFFSET broken"
+                assert next(stream)[0]["id"] == 101, f"{backend}: stream reset by another query"
+                stream.close()
+            finally:
+                adapter.disconnect()
+        
+        return _store_result(zcli, "Stream: select_batches/select_iter", "PASSED", "SQLite + CSV, 1200 rows in 500-row batches")
+    except Exception as e:
+        return _store_result(zcli, "Stream: select_batches/select_iter", "ERROR", str(e))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_128_stream_table_display(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test zTable renders iterators lazily and the read action streams"""
+    import tempfile
+    temp_dir = tempfile.mkdtemp()
+    try:
+        pulled = [0]
+        def rows(count):
+            for i in range(count):
+                pulled[0] += 1
+                yield {"id": i, "name": f"row{i}"}
+        
+        zcli.display.zTable("Stream", ["id", "name"], rows(10000), limit=20)
+        assert pulled[0] == 21, f"limit=20 should read one page + lookahead, read {pulled[0]}"
+        
+        pulled[0] = 0
+        zcli.display.zTable("Stream", ["id", "name"], rows(250), limit=-5)
+        assert pulled[0] == 250, f"Negative limit should read the whole stream, read {pulled[0]}"
+        
+        options = {"_schema_cached": _pool_schema(temp_dir), "_alias_name": "pooltest", "tables": "items"}
+        zcli.data.handle_request({"action": "create", "options": dict(options)})
+        zcli.data.handle_request({"action": "read", "options": dict(options)}, {"wizard_mode": True})
+        zcli.data.insert_many("items", ["id", "name"], ((i, f"item{i}") for i in range(1, 301)))
+        zcli.data.disconnect()
+        
+        result = zcli.data.handle_request({"action": "read", "batch_size": 50, "pause": False, "options": dict(options)})
+        assert result not in (False, "error"), f"Streamed read failed: {result}"
+        assert zcli.data.adapter is None, "Adapter should be returned to the pool after a streamed read"
+        
+        return _store_result(zcli, "Stream: Table Display", "PASSED", "limit=20 read 21 of 10000 rows, read action streamed 300 rows")
+    except Exception as e:
+        return _store_result(zcli, "Stream: Table Display", "ERROR", str(e))
+    finally:
+        zcli.data.disconnect()
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+# ============================================================================
+# Y. CSV RESIDENT ENGINE (2 tests)
+# ============================================================================
+
+def _resident_csv(temp_dir: str) -> Any:
+    """Connected CSV adapter with Data_Engine: resident."""
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+    adapter = AdapterFactory.create_adapter("csv", {"path": temp_dir, "label": "resident", "meta": {"Data_Engine": "resident"}})
+    adapter.connect()
+    return adapter
+
+def test_129_csv_resident_write_path(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test resident CSV writes go to the WAL and reach the CSV once, at commit()"""
+    import tempfile
+    import pandas as pd
+    temp_dir = tempfile.mkdtemp()
+    csv_file = Path(temp_dir) / "users.csv"
+    wal_file = Path(temp_dir) / "users.csv.wal"
+    schema = {
+        "id": {"type": "int", "pk": True, "auto_increment": True},
+        "email": {"type": "str", "unique": True},
+        "score": {"type": "int"},
+    }
+    try:
+        adapter = _resident_csv(temp_dir)
+        adapter.create_table("users", schema)
+        ids = [adapter.insert("users", ["email", "score"], [f"u{i}@x.io", i]) for i in range(1, 501)]
+        assert ids == list(range(1, 501)), "Running counter should hand out 1..500"
+        assert len(pd.read_csv(csv_file)) == 0, "Inserts should not rewrite the CSV before commit"
+        assert wal_file.exists(), "Inserts should be logged to the WAL"
+        
+        assert adapter.select("users", where={"email": "u250@x.io"})[0]["id"] == 250, "Unique index lookup failed"
+        assert adapter.upsert("users", ["email", "score"], ["u10@x.io", 99], ["email"]) == 10, "Upsert should hit the existing row"
+        assert adapter.update("users", ["score"], [0], {"id": 20}) == 1, "Update by pk failed"
+        assert adapter.delete("users", {"id": 30}) == 1, "Delete by pk failed"
+        assert adapter.insert("users", ["email"], ["late@x.io"]) == 501, "Counter should not reuse deleted ids"
+        
+        adapter.commit()
+        saved = pd.read_csv(csv_file)
+        assert not wal_file.exists(), "commit() should truncate the WAL"
+        assert len(saved) == 500, f"Expected 500 rows on disk, got {len(saved)}"
+        assert int(saved.loc[saved["id"] == 10, "score"].iloc[0]) == 99, "Upserted value not persisted"
+        assert 30 not in set(saved["id"]), "Deleted row persisted"
+        adapter.disconnect()
+        
+        return _store_result(zcli, "Resident: Write Path", "PASSED", "500 inserts, 0 CSV rewrites before commit, index lookups")
+    except Exception as e:
+        return _store_result(zcli, "Resident: Write Path", "ERROR", str(e))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_130_csv_resident_recovery(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test resident CSV replays an uncommitted WAL and rollback() discards changes"""
+    import tempfile
+    temp_dir = tempfile.mkdtemp()
+    schema = {"id": {"type": "int", "pk": True}, "name": {"type": "str"}}
+    try:
+        adapter = _resident_csv(temp_dir)
+        adapter.create_table("items", schema)
+        adapter.insert_many("items", ["id", "name"], ((i, f"item{i}") for i in range(1, 11)))
+        
+        # Session ends without commit()/disconnect() - only the WAL has these
+        adapter.insert("items", ["id", "name"], [11, "item11"])
+        adapter.update("items", ["name"], ["renamed"], {"id": 1})
+        adapter.delete("items", {"id": 2})
+        
+        recovered = _resident_csv(temp_dir)
+        rows = {row["id"]: row["name"] for row in recovered.select("items")}
+        assert len(rows) == 10 and 11 in rows and 2 not in rows, f"WAL replay mismatch: {sorted(rows)}"
+        assert rows[1] == "renamed", "Replayed update lost"
+        assert not (Path(temp_dir) / "items.csv.wal").exists(), "Replay should checkpoint the WAL"
+        
+        recovered.insert("items", ["id", "name"], [12, "item12"])
+        recovered.delete("items", {"id": 3})
+        recovered.rollback()
+        assert len(recovered.select("items")) == 10, "rollback() should restore the last commit"
+        recovered.disconnect()
+        
+        # Auto ids survive replay even after the max-id row was deleted
+        auto_schema = {"id": {"type": "int", "pk": True, "auto_increment": True}, "name": {"type": "str"}}
+        adapter = _resident_csv(temp_dir)
+        adapter.create_table("events", auto_schema)
+        for name in ("a", "b", "c"):
+            adapter.insert("events", ["name"], [name])
+        adapter.commit()
+        adapter.delete("events", {"id": 3})
+        new_id = adapter.insert("events", ["name"], ["d"])
+        assert new_id == 4, f"Counter should not reuse the deleted id, got {new_id}"
+        
+        recovered = _resident_csv(temp_dir)
+        events = {row["name"]: row["id"] for row in recovered.select("events")}
+        assert events == {"a": 1, "b": 2, "d": 4}, f"Replayed ids differ from the ids insert() returned: {events}"
+        recovered.disconnect()
+        
+        return _store_result(zcli, "Resident: Recovery + Rollback", "PASSED", "WAL replayed (auto ids kept), rollback restored 10 rows")
+    except Exception as e:
+        return _store_result(zcli, "Resident: Recovery + Rollback", "ERROR", str(e))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+# ============================================================================
+# Z. POSTGRESQL PROVISIONING (2 tests)
+# ============================================================================
+
+def _stub_psycopg2() -> Any:
+    """Stand-in psycopg2 module: connect() hands out mock connections, counted via call_args_list"""
+    from unittest.mock import MagicMock
+    
+    def _connection(**kwargs):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value
+        cursor.fetchone.return_value = ("PostgreSQL 16.1",)
+        cursor.fetchall.return_value = []
+        return connection
+    
+    stub = MagicMock()
+    stub.OperationalError = type("OperationalError", (Exception,), {})
+    stub.connect.side_effect = _connection
+    return stub
+
+def _pg_adapter(temp_dir: str, label: str) -> Any:
+    """PostgreSQLAdapter for label (call with the psycopg2 stub patched in)"""
+    from zCLI.subsystems.zData.zData_modules.shared.backends.postgresql_adapter import PostgreSQLAdapter
+    return PostgreSQLAdapter({"path": temp_dir, "label": label, "meta": {"Data_User": "ztest"}})
+
+def _pg_handshakes(stub: Any) -> List[str]:
+    """Databases psycopg2.connect() was called for, in order"""
+    return [call.kwargs["database"] for call in stub.connect.call_args_list]
+
+def test_131_postgres_provision_once(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test PostgreSQL provisions once per database; later connects are one handshake"""
+    import tempfile
+    from unittest.mock import patch
+    from zCLI.subsystems.zData.zData_modules.shared.backends import postgresql_adapter as pg
+    
+    temp_dir = tempfile.mkdtemp()
+    stub = _stub_psycopg2()
+    info_file = Path(temp_dir) / pg.PGINFO_FILENAME
+    try:
+        with patch.object(pg, "PSYCOPG2_AVAILABLE", True), patch.object(pg, "psycopg2", stub, create=True):
+            pg.reset_provisioned_databases()
+            _pg_adapter(temp_dir, "pgtest").connect()
+            assert ("localhost", "5432", "pgtest") in pg._provisioned_databases, "Database not cached as provisioned"
+            assert info_file.exists(), ".pginfo.yaml not written on first provision"
+            
+            # Second connect: straight to the target, .pginfo.yaml left alone
+            info_file.write_text("kept: true\n", encoding="utf-8")
+            stub.connect.reset_mock()
+            _pg_adapter(temp_dir, "pgtest").connect()
+            assert _pg_handshakes(stub) == ["pgtest"], f"Expected one handshake, got {_pg_handshakes(stub)}"
+            assert info_file.read_text(encoding="utf-8") == "kept: true\n", ".pginfo.yaml rewritten on a cached connect"
+            
+            # Provisioning an existing project keeps its .pginfo.yaml
+            pg.reset_provisioned_databases()
+            assert not pg._provisioned_databases, "reset_provisioned_databases() left entries"
+            stub.connect.reset_mock()
+            _pg_adapter(temp_dir, "pgtest").connect()
+            assert _pg_handshakes(stub) == ["pgtest"], f"Unexpected bootstrap: {_pg_handshakes(stub)}"
+            assert info_file.read_text(encoding="utf-8") == "kept: true\n", ".pginfo.yaml overwritten when present"
+        
+        return _store_result(zcli, "PG: Provision Once", "PASSED", "1 handshake once provisioned, .pginfo.yaml written only if missing")
+    except Exception as e:
+        return _store_result(zcli, "PG: Provision Once", "ERROR", str(e))
+    finally:
+        pg.reset_provisioned_databases()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def test_132_postgres_reprovision(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test a failed fast-path connect re-provisions the database (bootstrap included)"""
+    import tempfile
+    from unittest.mock import patch
+    from zCLI.subsystems.zData.zData_modules.shared.backends import postgresql_adapter as pg
+    
+    temp_dir = tempfile.mkdtemp()
+    stub = _stub_psycopg2()
+    try:
+        with patch.object(pg, "PSYCOPG2_AVAILABLE", True), patch.object(pg, "psycopg2", stub, create=True), \
+             patch.object(pg, "sql", create=True):
+            pg.reset_provisioned_databases()
+            _pg_adapter(temp_dir, "pgdropped").connect()
+            
+            # Database dropped since: fast path and provisioning connect fail, bootstrap recreates it
+            healthy = stub.connect.side_effect
+            failures = [2]
+            
+            def dropped(**kwargs):
+                if kwargs["database"] != pg.DEFAULT_DATABASE and failures[0]:
+                    failures[0] -= 1
+                    raise stub.OperationalError("database does not exist")
+                return healthy(**kwargs)
+            
+            stub.connect.side_effect = dropped
+            stub.connect.reset_mock()
+            adapter = _pg_adapter(temp_dir, "pgdropped")
+            adapter.connect()
+            expected = ["pgdropped", "pgdropped", pg.DEFAULT_DATABASE, "pgdropped"]
+            assert _pg_handshakes(stub) == expected, f"Re-provision sequence: {_pg_handshakes(stub)}"
+            assert adapter.connection is not None, "No connection after re-provisioning"
+            assert ("localhost", "5432", "pgdropped") in pg._provisioned_databases, "Re-provisioned database not cached"
+            
+            stub.connect.reset_mock()
+            _pg_adapter(temp_dir, "pgdropped").connect()
+            assert _pg_handshakes(stub) == ["pgdropped"], "Connect after re-provisioning should be one handshake"
+        
+        return _store_result(zcli, "PG: Re-provision", "PASSED", "Failed fast path re-provisioned, then back to 1 handshake")
+    except Exception as e:
+        return _store_result(zcli, "PG: Re-provision", "ERROR", str(e))
+    finally:
+        pg.reset_provisioned_databases()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
 # ============================================================================
 # DISPLAY RESULTS
 # ============================================================================
@@ -3648,7 +4242,12 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
         "R. Schema Management (5 tests)": [],
         "S. Data Types (5 tests)": [],
         "T. Performance (5 tests)": [],
-        "U. Final Integration (3 tests)": []
+        "U. Final Integration (3 tests)": [],
+        "V. Connection Pool (4 tests)": [],
+        "W. Bulk Load (3 tests)": [],
+        "X. Streaming Reads (2 tests)": [],
+        "Y. CSV Resident Engine (2 tests)": [],
+        "Z. PostgreSQL Provisioning (2 tests)": []
     }
     
     for r in results:
@@ -3691,6 +4290,16 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
             categories["S. Data Types (5 tests)"].append(r)
         elif "Perf:" in test_name:
             categories["T. Performance (5 tests)"].append(r)
+        elif "Pool:" in test_name:
+            categories["V. Connection Pool (4 tests)"].append(r)
+        elif "Bulk:" in test_name:
+            categories["W. Bulk Load (3 tests)"].append(r)
+        elif "Stream:" in test_name:
+            categories["X. Streaming Reads (2 tests)"].append(r)
+        elif "Resident:" in test_name:
+            categories["Y. CSV Resident Engine (2 tests)"].append(r)
+        elif "PG:" in test_name:
+            categories["Z. PostgreSQL Provisioning (2 tests)"].append(r)
         elif "Integration:" in test_name:
             # Integration appears in both O and U - check for distinction
             if test_name.startswith("Integration: Production") or \
@@ -1,12 +1,15 @@
 # zTestRunner/plugins/zdisplay_tests.py
 """
-Comprehensive A-to-M zDisplay Test Suite (73 tests)
+Comprehensive A-to-Q zDisplay Test Suite (92 tests)
 Declarative approach - uses existing zcli.display, minimal setup
 Covers all 13 zDisplay modules including facade, primitives, events, and delegates
 Results accumulated in zHat by zWizard for final display.
 """
 
+import contextlib
+import io
 import sys
+from unittest.mock import patch
 
 
 # ═══════════════════════════════════════════════════════════
@@ -1069,6 +1072,216 @@ def test_integration_ztable_empty_and_edge_cases(zcli=None, context=None):
         return _add_result(context, "AdvancedData: Edge Cases", "ERROR", f"Exception: {str(e)}")
 
 
+# ═══════════════════════════════════════════════════════════
+# P. Output Batching Tests (3 tests)
+# ═══════════════════════════════════════════════════════════
+
+class _CountingStream(io.StringIO):
+    """StringIO that records each non-empty write()."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def write(self, text):
+        if text:
+            self.chunks.append(text)
+        return super().write(text)
+
+
+def test_batching_coalesces_writes(zcli=None, context=None):
+    """Test lines written inside batch() reach stdout as one write, in order."""
+    if not zcli:
+        return _add_result(context, "Batching: Coalesced Writes", "ERROR", "No zcli instance")
+    
+    try:
+        prims = zcli.display.zPrimitives
+        stream = _CountingStream()
+        with contextlib.redirect_stdout(stream):
+            with prims.batch():
+                for i in range(50):
+                    prims.line(f"row {i}")
+                with prims.batch():  # Nested scope must not flush early
+                    prims.raw("tail")
+                if stream.chunks:
+                    return _add_result(context, "Batching: Coalesced Writes", "FAILED",
+                                      f"Output escaped the batch: {len(stream.chunks)} writes")
+        
+        expected = "".join(f"row {i}\n" for i in range(50)) + "tail"
+        if stream.chunks != [expected]:
+            return _add_result(context, "Batching: Coalesced Writes", "FAILED",
+                              f"Expected 1 write, got {len(stream.chunks)}")
+        
+        return _add_result(context, "Batching: Coalesced Writes", "PASSED", "51 outputs → 1 write")
+    except Exception as e:
+        return _add_result(context, "Batching: Coalesced Writes", "ERROR", f"Exception: {str(e)}")
+
+
+def test_batching_flush_before_prompt(zcli=None, context=None):
+    """Test read_string() flushes batched output before prompting."""
+    if not zcli:
+        return _add_result(context, "Batching: Flush Before Prompt", "ERROR", "No zcli instance")
+    
+    try:
+        prims = zcli.display.zPrimitives
+        stream = _CountingStream()
+        seen_at_prompt = []
+        
+        def fake_input(*_args):
+            seen_at_prompt.append(stream.getvalue())
+            return "ok"
+        
+        with contextlib.redirect_stdout(stream), patch("builtins.input", fake_input):
+            with prims.batch():
+                prims.line("Choose an option:")
+                answer = prims.read_string("> ")
+        
+        if answer != "ok" or seen_at_prompt != ["Choose an option:\n"]:
+            return _add_result(context, "Batching: Flush Before Prompt", "FAILED",
+                              f"Output at prompt: {seen_at_prompt!r}")
+        
+        return _add_result(context, "Batching: Flush Before Prompt", "PASSED", "Pending output shown before input()")
+    except Exception as e:
+        return _add_result(context, "Batching: Flush Before Prompt", "ERROR", f"Exception: {str(e)}")
+
+
+def test_batching_handle_bulk_events(zcli=None, context=None):
+    """Test handle() batches bulk renderers (list) but not interactive events."""
+    if not zcli:
+        return _add_result(context, "Batching: handle() Bulk Events", "ERROR", "No zcli instance")
+    
+    try:
+        from zCLI.subsystems.zDisplay.zDisplay import BATCHED_EVENTS
+        
+        for event in ("zTable", "json_data", "list", "text"):
+            if event not in BATCHED_EVENTS:
+                return _add_result(context, "Batching: handle() Bulk Events", "FAILED", f"'{event}' not batched")
+        for event in ("read_string", "selection", "progress_bar", "spinner", "zMenu", "zDialog"):
+            if event in BATCHED_EVENTS:
+                return _add_result(context, "Batching: handle() Bulk Events", "FAILED", f"'{event}' must not be batched")
+        
+        stream = _CountingStream()
+        with contextlib.redirect_stdout(stream):
+            zcli.display.handle({"event": "list", "items": [f"item {i}" for i in range(100)]})
+        
+        if len(stream.chunks) != 1 or stream.getvalue().count("item ") != 100:
+            return _add_result(context, "Batching: handle() Bulk Events", "FAILED",
+                              f"100-item list took {len(stream.chunks)} writes")
+        
+        return _add_result(context, "Batching: handle() Bulk Events", "PASSED", "100-item list → 1 write")
+    except Exception as e:
+        return _add_result(context, "Batching: handle() Bulk Events", "ERROR", f"Exception: {str(e)}")
+
+
+# ═══════════════════════════════════════════════════════════
+# Q. zTable Streaming Tests (3 tests)
+# ═══════════════════════════════════════════════════════════
+
+def test_stream_pages_in_chunks(zcli=None, context=None):
+    """Test TableStreams pages rows in sequenced chunks and closes when exhausted."""
+    if not zcli:
+        return _add_result(context, "Streaming: Chunked Pages", "ERROR", "No zcli instance")
+    
+    try:
+        from zCLI.subsystems.zDisplay.zDisplay_modules.display_table_stream import TableStreams
+        
+        streams = TableStreams(zcli.logger)
+        stream = streams.open(list(range(2500)), {"title": "Big", "columns": ["n"]}, chunk_size=300, page_size=1000)
+        
+        first = streams.page(stream.id)
+        names = [name for name, _ in first]
+        if names[0] != "zTable_start" or names[-1] != "zTable_end" or names.count("zTable_chunk") != 4:
+            return _add_result(context, "Streaming: Chunked Pages", "FAILED", f"First page events: {names}")
+        if first[0][1].get("total") != 2500 or not first[-1][1]["has_more"]:
+            return _add_result(context, "Streaming: Chunked Pages", "FAILED", f"Bad start/end: {first[0][1]}, {first[-1][1]}")
+        
+        rest = streams.page(stream.id, size=5000)
+        seqs = [data["seq"] for name, data in first + rest if name == "zTable_chunk"]
+        rows = [row for name, data in first + rest if name == "zTable_chunk" for row in data["rows"]]
+        if seqs != list(range(1, 10)) or rows != list(range(2500)) or rest[-1][1]["has_more"]:
+            return _add_result(context, "Streaming: Chunked Pages", "FAILED", f"Sequence {seqs}, {len(rows)} rows")
+        
+        try:
+            streams.page(stream.id)
+            return _add_result(context, "Streaming: Chunked Pages", "FAILED", "Exhausted stream still open")
+        except KeyError:
+            pass
+        
+        return _add_result(context, "Streaming: Chunked Pages", "PASSED", "2500 rows → 9 sequenced chunks over 2 pages")
+    except Exception as e:
+        return _add_result(context, "Streaming: Chunked Pages", "ERROR", f"Exception: {str(e)}")
+
+
+def test_stream_owner_and_release(zcli=None, context=None):
+    """Test claimed streams reject other connections and close their row source on release."""
+    if not zcli:
+        return _add_result(context, "Streaming: Ownership & Release", "ERROR", "No zcli instance")
+    
+    try:
+        from zCLI.subsystems.zDisplay.zDisplay_modules.display_table_stream import TableStreams
+        
+        closed = []
+        
+        def rows():
+            try:
+                yield from range(100)
+            finally:
+                closed.append(True)
+        
+        streams = TableStreams(zcli.logger)
+        stream = streams.open(rows(), {}, chunk_size=10, page_size=20)
+        start = [{"display_event": name, "data": data} for name, data in streams.page(stream.id)]
+        if streams.claim(start, "ws-a") != 1:
+            return _add_result(context, "Streaming: Ownership & Release", "FAILED", "Stream not claimed")
+        
+        try:
+            streams.page(stream.id, owner="ws-b")
+            return _add_result(context, "Streaming: Ownership & Release", "FAILED", "Other connection could fetch")
+        except PermissionError:
+            pass
+        
+        streams.page(stream.id, owner="ws-a")
+        if streams.release("ws-a") != 1 or not closed or streams.get_stats()["open"] != 0:
+            return _add_result(context, "Streaming: Ownership & Release", "FAILED", "Release did not close the cursor")
+        
+        return _add_result(context, "Streaming: Ownership & Release", "PASSED", "Owner-only fetch, cursor closed on release")
+    except Exception as e:
+        return _add_result(context, "Streaming: Ownership & Release", "ERROR", f"Exception: {str(e)}")
+
+
+def test_stream_ztable_bifrost_mode(zcli=None, context=None):
+    """Test zTable streams large tables in Bifrost mode and keeps one event for small ones."""
+    if not zcli:
+        return _add_result(context, "Streaming: zTable Bifrost Mode", "ERROR", "No zcli instance")
+    
+    display = zcli.display
+    original_mode = display.mode
+    try:
+        display.mode = "zBifrost"
+        display.clear_event_buffer()
+        table = display.zEvents.AdvancedData
+        
+        table.zTable("Small", ["id"], [{"id": i} for i in range(10)])
+        small = display.collect_buffered_events()
+        if [e["display_event"] for e in small] != ["zTable"] or len(small[0]["data"]["rows"]) != 10:
+            return _add_result(context, "Streaming: zTable Bifrost Mode", "FAILED", "Small table not sent as one zTable event")
+        
+        table.zTable("Big", ["id"], ({"id": i} for i in range(5000)), chunk_size=250)
+        big = display.collect_buffered_events()
+        names = [e["display_event"] for e in big]
+        if names[0] != "zTable_start" or names.count("zTable_chunk") != 4 or not big[-1]["data"]["has_more"]:
+            return _add_result(context, "Streaming: zTable Bifrost Mode", "FAILED", f"Streamed events: {names[:3]}...")
+        
+        stream_id = big[0]["data"]["stream"]
+        display.table_streams.close(stream_id)
+        return _add_result(context, "Streaming: zTable Bifrost Mode", "PASSED", "5000-row iterator → start + 4 chunks + end")
+    except Exception as e:
+        return _add_result(context, "Streaming: zTable Bifrost Mode", "ERROR", f"Exception: {str(e)}")
+    finally:
+        display.mode = original_mode
+        display.clear_event_buffer()
+
+
 # ═══════════════════════════════════════════════════════════
 # Display Test Results (Final Step)
 # ═══════════════════════════════════════════════════════════
@@ -1107,7 +1320,7 @@ def display_test_results(zcli=None, context=None):
     
     # Display header
     print("\n" + "=" * 80)
-    print("zDisplay Comprehensive Test Suite - 86 Tests")
+    print("zDisplay Comprehensive Test Suite - 89 Tests")
     print("=" * 80 + "\n")
     
     # Group results by category
@@ -1126,7 +1339,9 @@ def display_test_results(zcli=None, context=None):
         "L. System Extended (1 test)": ["System: zConfig"],
         "M. Integration & Multi-Mode (6 tests)": ["Integration: Terminal", "Integration: Bifrost", "Integration: Mode", "Integration: Event", "Integration: Error", "Integration: Session"],
         "N. Real Integration Tests (8 tests)": ["Integration: Real"],
-        "O. AdvancedData Integration (5 tests)": ["AdvancedData:"]
+        "O. AdvancedData Integration (5 tests)": ["AdvancedData:"],
+        "P. Output Batching (3 tests)": ["Batching:"],
+        "Q. zTable Streaming (3 tests)": ["Streaming:"]
     }
     
     for cat_name, prefixes in categories.items():
@@ -1164,7 +1379,7 @@ def display_test_results(zcli=None, context=None):
     else:
         print(f"\n[PARTIAL] {passed}/{total} tests passed ({pass_rate:.1f}%)\n")
     
-    print(f"[INFO] Coverage: All 13 zDisplay modules + 13 integration tests (A-to-O comprehensive coverage)\n")
+    print(f"[INFO] Coverage: All 13 zDisplay modules + 13 integration tests + output batching (A-to-P comprehensive coverage)\n")
     print(f"[INFO] Unit Tests: Facade, Primitives, Events, Outputs, Signals, Data (basic), System, Widgets, Inputs, Auth, Delegates\n")
     print(f"[INFO] Integration Tests: Text output, signals, tables, lists, JSON, headers, delegates, mode behavior\n")
     print(f"[INFO] AdvancedData Tests: zTable rendering, pagination (positive/negative), Pagination helper, edge cases\n")
@@ -1,6 +1,6 @@
 # zTestRunner/plugins/zfunc_tests.py
 """
-Comprehensive zFunc Test Suite (86 tests - 100% REAL TESTS)
+Comprehensive zFunc Test Suite (92 tests - 100% REAL TESTS)
 Declarative approach - uses existing zcli.zfunc with comprehensive validation
 Covers all public API + 4-tier architecture + special features
 Covers: Facade, Argument Parsing, Function Resolution, Execution, Auto-Injection, Context Injection
@@ -15,8 +15,10 @@ Covers: Facade, Argument Parsing, Function Resolution, Execution, Auto-Injection
 - G. Context Injection - zContext, zHat, zConv, this.field (12 tests)
 - H. Result Display - JSON Formatting (6 tests)
 - I. Integration Tests - End-to-End Workflows (8 tests)
+- J. Callable Cache - mtime/size reuse, PluginCache sharing, injection plans (3 tests)
+- K. Async Loop - persistent loop, timeout cancellation, loop-scoped resources (3 tests)
 
-**NO STUB TESTS** - All 86 tests perform real validation with assertions.
+**NO STUB TESTS** - All 92 tests perform real validation with assertions.
 
 Results accumulated in zHat by zWizard for final display.
 """
@@ -1134,6 +1136,181 @@ def test_integration_plugin_discovery(zcli: Optional[Any] = None, context: Optio
     except Exception as e:
         return {"status": "ERROR", "message": f"Plugin discovery failed: {str(e)}"}
 
+# ============================================================================
+# J. Callable Cache - mtime/size reuse, PluginCache sharing (3 tests)
+# ============================================================================
+
+def test_callable_cache_reuse_and_reload(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test cached callables are reused until the file's mtime/size change."""
+    from zCLI.subsystems.zFunc.zFunc_modules.func_cache import CallableCache
+
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plugin = Path(temp_dir) / "cc_reload_plugin.py"
+            plugin.write_text("def answer():\n    return 1\n")
+            cache = CallableCache(zcli.logger)
+
+            first, _ = cache.resolve(str(plugin), "answer")
+            again, _ = cache.resolve(str(plugin), "answer")
+            assert first is again, "Second resolve should not re-execute the module"
+            assert cache.get_stats()["loads"] == 1, f"Expected 1 load, got {cache.get_stats()['loads']}"
+
+            plugin.write_text("def answer():\n    return 22\n")
+            changed, _ = cache.resolve(str(plugin), "answer")
+            assert changed() == 22, "Edited file should be reloaded"
+            assert cache.get_stats()["reloads"] == 1, "Size change should count as a reload"
+
+        return {"status": "PASSED", "message": "Callable reused, reloaded after edit"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"Callable cache reuse failed: {str(e)}"}
+
+def test_callable_cache_shares_plugin_cache(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test zFunc loads modules through zLoader's PluginCache (and survives name collisions)."""
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        plugin_cache = zcli.loader.cache.plugin_cache
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first_dir, second_dir = Path(temp_dir) / "a", Path(temp_dir) / "b"
+            first_dir.mkdir()
+            second_dir.mkdir()
+            (first_dir / "cc_shared_plugin.py").write_text("def where():\n    return 'a'\n")
+            (second_dir / "cc_shared_plugin.py").write_text("def where():\n    return 'b'\n")
+
+            func, _ = zcli.zfunc.callables.resolve(str(first_dir / "cc_shared_plugin.py"), "where")
+            module = plugin_cache.get("cc_shared_plugin")
+            assert module is not None and module.where is func, "Module should be registered in the PluginCache"
+            assert module.zcli is zcli, "PluginCache should inject zcli into the module"
+
+            other, _ = zcli.zfunc.callables.resolve(str(second_dir / "cc_shared_plugin.py"), "where")
+            assert other() == "b", "Same-named file in another directory should load privately"
+            plugin_cache.invalidate("cc_shared_plugin")
+            zcli.zfunc.callables.invalidate()
+
+        return {"status": "PASSED", "message": "Modules shared with PluginCache, collision falls back"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"PluginCache sharing failed: {str(e)}"}
+
+def test_callable_cache_injection_plan(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test injection plans are computed once per function and drive auto-injection."""
+    from zCLI.subsystems.zFunc.zFunc_modules.func_cache import injection_plan
+
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        def needs_all(value, zcli=None, session=None, context=None):
+            return (value, zcli, session, context)
+
+        plan = injection_plan(needs_all)
+        assert plan == frozenset({"zcli", "session", "context"}), f"Unexpected plan: {plan}"
+        assert injection_plan(needs_all) is plan, "Plan should be memoized per function"
+        assert injection_plan(lambda x: x) == frozenset(), "Plain functions need no injection"
+
+        result = zcli.zfunc._execute_function(needs_all, [1], {"step": 1})
+        assert result[1] is zcli and result[2] is zcli.session and result[3] == {"step": 1}, "Injection failed"
+
+        return {"status": "PASSED", "message": "Injection plan memoized and applied"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"Injection plan failed: {str(e)}"}
+
+# ============================================================================
+# K. Async Loop - persistent loop, timeouts, loop-scoped resources (3 tests)
+# ============================================================================
+
+def test_async_loop_persists_across_calls(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test coroutine-returning functions all run on one long-lived zCLI loop."""
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = zcli.zfunc._execute_function(current_loop, [])
+        second = zcli.zfunc._execute_function(current_loop, [])
+        assert first is second, "Each call should reuse the same event loop"
+        assert not first.is_closed(), "Loop should stay open between calls"
+        assert zcli.zfunc.loop_runner.running, "Loop thread should be alive"
+
+        return {"status": "PASSED", "message": "Coroutines share one persistent event loop"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"Persistent loop failed: {str(e)}"}
+
+def test_async_loop_timeout_cancels(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test a coroutine that overruns its timeout is cancelled and drain reports it."""
+    from zCLI.subsystems.zFunc.zFunc_modules.func_loop import AsyncLoopRunner
+
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        runner = AsyncLoopRunner(zcli.logger, default_timeout=0.05)
+        state = {"cancelled": False}
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+
+        try:
+            runner.run(slow())
+            raise AssertionError("Expected TimeoutError")
+        except TimeoutError:
+            pass
+        assert runner.run(asyncio.sleep(0, result="ok"), timeout=1) == "ok", "Loop should survive a timeout"
+        assert state["cancelled"], "Timed-out coroutine should be cancelled on the loop"
+
+        runner.submit(asyncio.sleep(10))
+        summary = runner.shutdown(drain_timeout=0.05)
+        assert summary["cancelled"] == 1, f"Straggler should be cancelled on drain: {summary}"
+        assert not runner.running, "Loop thread should stop after shutdown"
+
+        return {"status": "PASSED", "message": "Timeout cancels the task, drain cancels stragglers"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"Timeout cancellation failed: {str(e)}"}
+
+def test_async_loop_resources_reused(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test loop-scoped resources are created once, reused, and closed on shutdown."""
+    from zCLI.subsystems.zFunc.zFunc_modules.func_loop import AsyncLoopRunner
+
+    if not zcli:
+        zcli = zCLI({'zWorkspace': '.', 'zMode': 'Terminal', 'zLoggerLevel': 'ERROR'})
+
+    try:
+        runner = AsyncLoopRunner(zcli.logger)
+        created = []
+
+        class Session:
+            closed = False
+
+            async def aclose(self):
+                self.closed = True
+
+        async def make_session():
+            created.append(asyncio.get_running_loop())
+            return Session()
+
+        session = runner.resource("http", make_session)
+        assert runner.resource("http", make_session) is session, "Second lookup should reuse the resource"
+        assert len(created) == 1, "Factory should run once"
+        assert created[0] is runner.start(), "Factory should run on the shared loop"
+
+        summary = runner.shutdown()
+        assert session.closed, "aclose() should be awaited on shutdown"
+        assert summary["resources"] == 1, f"Unexpected summary: {summary}"
+        assert not runner.has_resource("http"), "Resources should be forgotten after shutdown"
+
+        return {"status": "PASSED", "message": "Loop resource created once, closed on drain"}
+    except Exception as e:
+        return {"status": "ERROR", "message": f"Loop resources failed: {str(e)}"}
+
 # ============================================================================
 # Display Results
 # ============================================================================
@@ -1,9 +1,11 @@
 # zTestRunner/plugins/zserver_tests.py
 """
-zServer Comprehensive Test Suite (45 tests)
+zServer Comprehensive Test Suite (63 tests)
 Declarative approach - tests HTTP static file server functionality
 Covers all zServer moving parts: initialization, lifecycle, static files,
-CORS, error handling, health check, configuration, integration, routing & RBAC
+CORS, error handling, health check, configuration, integration, routing & RBAC,
+concurrent serving, template caching, static file caching, compression,
+page caching, compiled route table
 """
 
 import sys
@@ -1355,6 +1357,750 @@ def test_45_server_with_routes_integration(zcli: Optional[Any] = None, context:
             _cleanup_temp_dir(temp_dir)
 
 
+# ============================================================
+# J. CONCURRENT SERVING (3 tests)
+# ============================================================
+
+def _free_port() -> int:
+    """Find a free localhost port for live server tests"""
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_46_concurrency_defaults(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Concurrency defaults to single, threaded limits configurable"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer import zServer
+        
+        temp_dir = _create_temp_dir()
+        
+        default_server = zServer(Mock(), zcli=Mock(), serve_path=temp_dir)
+        if default_server.concurrency != "single":
+            return _store_result(zcli, "Concurrency: Defaults", "ERROR", f"Expected single, got {default_server.concurrency}")
+        
+        threaded = zServer(Mock(), zcli=Mock(), serve_path=temp_dir, concurrency="threaded", max_workers=4, backlog=8)
+        if (threaded.concurrency, threaded.max_workers, threaded.backlog) != ("threaded", 4, 8):
+            return _store_result(zcli, "Concurrency: Defaults", "ERROR", "Threaded limits not applied")
+        
+        return _store_result(zcli, "Concurrency: Defaults", "PASSED", "single by default, threaded limits applied")
+    
+    except Exception as e:
+        return _store_result(zcli, "Concurrency: Defaults", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_47_threaded_parallel_requests(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Threaded server processes slow requests in parallel"""
+    import threading
+    import time
+    import urllib.request
+    from http.server import BaseHTTPRequestHandler
+    
+    server = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.threaded_server import PooledHTTPServer
+        
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(0.2)
+                self.send_response(200)
+                self.send_header("Content-length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = PooledHTTPServer(("127.0.0.1", _free_port()), SlowHandler, max_workers=4, backlog=8)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        
+        def fetch():
+            with urllib.request.urlopen(url, timeout=5) as resp:
+                resp.read()
+        
+        clients = [threading.Thread(target=fetch) for _ in range(4)]
+        start = time.perf_counter()
+        for t in clients:
+            t.start()
+        for t in clients:
+            t.join()
+        elapsed = time.perf_counter() - start
+        
+        stats = server.get_stats()
+        if stats["served"] != 4:
+            return _store_result(zcli, "Concurrency: Parallel Requests", "ERROR", f"Expected 4 served, got {stats['served']}")
+        
+        # Serial handling would take >= 0.8s
+        if elapsed >= 0.7:
+            return _store_result(zcli, "Concurrency: Parallel Requests", "ERROR", f"Requests serialized ({elapsed:.2f}s)")
+        
+        return _store_result(zcli, "Concurrency: Parallel Requests", "PASSED", f"4 x 200ms requests in {elapsed:.2f}s (peak {stats['peak_active']})")
+    
+    except Exception as e:
+        return _store_result(zcli, "Concurrency: Parallel Requests", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+
+def test_48_threaded_health_check_workers(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: health_check reports worker pool stats in threaded mode"""
+    temp_dir = None
+    server = None
+    original_dir = os.getcwd()
+    try:
+        from zCLI.subsystems.zServer.zServer import zServer
+        
+        temp_dir = _create_temp_dir()
+        server = zServer(Mock(), zcli=Mock(), port=_free_port(), serve_path=temp_dir,
+                         concurrency="threaded", max_workers=3, backlog=5)
+        server.start()
+        
+        health = server.health_check()
+        workers = health.get("workers")
+        if health.get("concurrency") != "threaded" or not workers:
+            return _store_result(zcli, "Concurrency: Health Check", "ERROR", f"Missing worker stats: {health}")
+        
+        if workers["max_workers"] != 3 or workers["backlog"] != 5:
+            return _store_result(zcli, "Concurrency: Health Check", "ERROR", f"Wrong limits: {workers}")
+        
+        return _store_result(zcli, "Concurrency: Health Check", "PASSED", "Worker stats exposed via health_check()")
+    
+    except Exception as e:
+        return _store_result(zcli, "Concurrency: Health Check", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if server and server.is_running():
+            server.stop()
+        os.chdir(original_dir)
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+# ============================================================
+# K. TEMPLATE CACHE (3 tests)
+# ============================================================
+
+def test_49_template_cache_shared_environment(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Handler and WSGI app share one Jinja2 environment per templates dir"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.template_cache import get_template_cache, clear_template_caches
+        
+        clear_template_caches()
+        temp_dir = _create_temp_dir()
+        templates_dir = os.path.join(temp_dir, "templates")
+        os.makedirs(templates_dir)
+        
+        first = get_template_cache(templates_dir)
+        second = get_template_cache(os.path.join(temp_dir, ".", "templates"))
+        
+        if first is not second or first.env is not second.env:
+            return _store_result(zcli, "Templates: Shared Environment", "ERROR", "Separate environments created")
+        
+        return _store_result(zcli, "Templates: Shared Environment", "PASSED", "One environment per templates dir")
+    
+    except Exception as e:
+        return _store_result(zcli, "Templates: Shared Environment", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_50_template_cache_hits_misses(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Repeated renders hit the compiled cache"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.template_cache import get_template_cache, clear_template_caches
+        
+        clear_template_caches()
+        temp_dir = _create_temp_dir()
+        templates_dir = os.path.join(temp_dir, "templates")
+        os.makedirs(templates_dir)
+        with open(os.path.join(templates_dir, "page.html"), "w") as f:
+            f.write("<p>{{ name }}</p>")
+        
+        cache = get_template_cache(templates_dir, os.path.join(temp_dir, "bytecode"))
+        for _ in range(5):
+            html = cache.get_template("page.html").render(name="zolo")
+        
+        stats = cache.get_stats()
+        if html != "<p>zolo</p>":
+            return _store_result(zcli, "Templates: Hits/Misses", "ERROR", f"Bad render: {html}")
+        if stats["misses"] != 1 or stats["hits"] != 4:
+            return _store_result(zcli, "Templates: Hits/Misses", "ERROR", f"Unexpected stats: {stats}")
+        
+        return _store_result(zcli, "Templates: Hits/Misses", "PASSED", "1 miss, 4 hits for 5 renders")
+    
+    except Exception as e:
+        return _store_result(zcli, "Templates: Hits/Misses", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_51_template_cache_mtime_reload(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Template recompiled only after file mtime changes"""
+    temp_dir = None
+    try:
+        import time
+        from zCLI.subsystems.zServer.zServer_modules.template_cache import get_template_cache, clear_template_caches
+        
+        clear_template_caches()
+        temp_dir = _create_temp_dir()
+        templates_dir = os.path.join(temp_dir, "templates")
+        os.makedirs(templates_dir)
+        template_file = os.path.join(templates_dir, "page.html")
+        with open(template_file, "w") as f:
+            f.write("v1")
+        
+        cache = get_template_cache(templates_dir)
+        cache.get_template("page.html").render()
+        
+        with open(template_file, "w") as f:
+            f.write("v2")
+        future = time.time() + 5
+        os.utime(template_file, (future, future))
+        
+        html = cache.get_template("page.html").render()
+        if html != "v2":
+            return _store_result(zcli, "Templates: Mtime Reload", "ERROR", f"Stale template served: {html}")
+        if cache.get_stats()["misses"] != 2:
+            return _store_result(zcli, "Templates: Mtime Reload", "ERROR", f"Unexpected stats: {cache.get_stats()}")
+        
+        return _store_result(zcli, "Templates: Mtime Reload", "PASSED", "Reloaded after mtime change")
+    
+    except Exception as e:
+        return _store_result(zcli, "Templates: Mtime Reload", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+# ============================================================
+# L. STATIC FILE CACHING (3 tests)
+# ============================================================
+
+def _fetch_static(url: str, headers: Optional[Dict[str, str]] = None):
+    """GET url, returning (status, headers, body) including 3xx/4xx responses"""
+    import urllib.request
+    import urllib.error
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_52_static_etag_not_modified(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Static files carry ETag/Last-Modified and revalidate with 304"""
+    temp_dir = None
+    server = None
+    original_dir = os.getcwd()
+    try:
+        from zCLI.subsystems.zServer.zServer import zServer
+        
+        temp_dir = _create_temp_dir()
+        os.makedirs(os.path.join(temp_dir, "static"))
+        with open(os.path.join(temp_dir, "static", "app.css"), "w") as f:
+            f.write("body { color: red; }")
+        
+        server = zServer(Mock(), zcli=Mock(), port=_free_port(), serve_path=temp_dir)
+        server.start()
+        url = f"{server.get_url()}/static/app.css"
+        
+        status, headers, body = _fetch_static(url)
+        etag = headers.get("ETag")
+        if status != 200 or body != b"body { color: red; }" or not etag or not headers.get("Last-Modified"):
+            return _store_result(zcli, "Static Cache: ETag & 304", "ERROR", f"Bad first response: {status} {dict(headers)}")
+        
+        status, _, body = _fetch_static(url, {"If-None-Match": etag})
+        if status != 304 or body:
+            return _store_result(zcli, "Static Cache: ETag & 304", "ERROR", f"Expected empty 304, got {status}")
+        
+        status, _, _ = _fetch_static(url, {"If-Modified-Since": headers.get("Last-Modified")})
+        if status != 304:
+            return _store_result(zcli, "Static Cache: ETag & 304", "ERROR", f"If-Modified-Since ignored: {status}")
+        
+        return _store_result(zcli, "Static Cache: ETag & 304", "PASSED", "200 with validators, then 304")
+    
+    except Exception as e:
+        return _store_result(zcli, "Static Cache: ETag & 304", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if server and server.is_running():
+            server.stop()
+        os.chdir(original_dir)
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_53_static_range_requests(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Range requests return 206 partial content, 416 when unsatisfiable"""
+    temp_dir = None
+    server = None
+    original_dir = os.getcwd()
+    try:
+        from zCLI.subsystems.zServer.zServer import zServer
+        
+        temp_dir = _create_temp_dir()
+        os.makedirs(os.path.join(temp_dir, "static"))
+        with open(os.path.join(temp_dir, "static", "video.bin"), "wb") as f:
+            f.write(b"0123456789")
+        
+        server = zServer(Mock(), zcli=Mock(), port=_free_port(), serve_path=temp_dir)
+        server.start()
+        url = f"{server.get_url()}/static/video.bin"
+        
+        status, headers, body = _fetch_static(url, {"Range": "bytes=2-5"})
+        if status != 206 or body != b"2345" or headers.get("Content-Range") != "bytes 2-5/10":
+            return _store_result(zcli, "Static Cache: Range Requests", "ERROR", f"Bad 206: {status} {body!r}")
+        
+        status, _, body = _fetch_static(url, {"Range": "bytes=-3"})
+        if status != 206 or body != b"789":
+            return _store_result(zcli, "Static Cache: Range Requests", "ERROR", f"Bad suffix range: {status} {body!r}")
+        
+        status, headers, _ = _fetch_static(url, {"Range": "bytes=50-"})
+        if status != 416 or headers.get("Content-Range") != "bytes */10":
+            return _store_result(zcli, "Static Cache: Range Requests", "ERROR", f"Expected 416, got {status}")
+        
+        return _store_result(zcli, "Static Cache: Range Requests", "PASSED", "206 for ranges, 416 past EOF")
+    
+    except Exception as e:
+        return _store_result(zcli, "Static Cache: Range Requests", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if server and server.is_running():
+            server.stop()
+        os.chdir(original_dir)
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_54_static_wsgi_stat_cache(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: WSGI app uses stat cache and wsgi.file_wrapper for static files"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.wsgi_app import zServerWSGIApp
+        from zCLI.subsystems.zServer.zServer_modules.static_files import get_stat_cache
+        
+        temp_dir = _create_temp_dir()
+        os.makedirs(os.path.join(temp_dir, "static"))
+        with open(os.path.join(temp_dir, "static", "app.js"), "w") as f:
+            f.write("console.log(1);")
+        
+        zserver = Mock()
+        zserver.router = None
+        zserver.serve_path = temp_dir
+        zserver.static_folder = "static"
+        app = zServerWSGIApp(zserver)
+        
+        wrapped = []
+        def file_wrapper(fileobj, block_size):
+            wrapped.append(block_size)
+            return iter(lambda: fileobj.read(block_size), b"")
+        
+        responses = []
+        def start_response(status, headers):
+            responses.append((status, dict(headers)))
+        
+        cache = get_stat_cache()
+        cache.invalidate()
+        hits_before = cache.get_stats()["hits"]
+        
+        environ = {"PATH_INFO": "/static/app.js", "REQUEST_METHOD": "GET", "wsgi.file_wrapper": file_wrapper}
+        body = b"".join(app(environ, start_response))
+        etag = responses[0][1].get("ETag")
+        if not responses[0][0].startswith("200") or body != b"console.log(1);" or not wrapped:
+            return _store_result(zcli, "Static Cache: WSGI & Stat Cache", "ERROR", f"Bad 200: {responses[0][0]}")
+        
+        environ["HTTP_IF_NONE_MATCH"] = etag
+        body = b"".join(app(environ, start_response))
+        if not responses[1][0].startswith("304") or body:
+            return _store_result(zcli, "Static Cache: WSGI & Stat Cache", "ERROR", f"Expected 304, got {responses[1][0]}")
+        
+        if cache.get_stats()["hits"] <= hits_before:
+            return _store_result(zcli, "Static Cache: WSGI & Stat Cache", "ERROR", f"Stat cache not hit: {cache.get_stats()}")
+        
+        return _store_result(zcli, "Static Cache: WSGI & Stat Cache", "PASSED", "file_wrapper used, 304 served from cached stat")
+    
+    except Exception as e:
+        return _store_result(zcli, "Static Cache: WSGI & Stat Cache", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+# ============================================================
+# M. COMPRESSION (3 tests)
+# ============================================================
+
+def test_55_compression_negotiation(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Accept-Encoding negotiation honours q-values and min size"""
+    try:
+        import gzip
+        from zCLI.subsystems.zServer.zServer_modules.compression import choose_encoding, compress_body
+        
+        cases = [
+            ("gzip, br", ("br", "gzip"), "br"),
+            ("gzip;q=1.0, br;q=0.5", ("br", "gzip"), "gzip"),
+            ("br;q=0, *", ("br", "gzip"), "gzip"),
+            ("identity", ("br", "gzip"), None),
+            (None, ("gzip",), None),
+        ]
+        for header, available, expected in cases:
+            chosen = choose_encoding(header, available)
+            if chosen != expected:
+                return _store_result(zcli, "Compression: Negotiation", "ERROR", f"{header!r} → {chosen}, expected {expected}")
+        
+        html = b"<div>zolo</div>" * 200
+        body, encoding = compress_body(html, "gzip")
+        if encoding != "gzip" or gzip.decompress(body) != html:
+            return _store_result(zcli, "Compression: Negotiation", "ERROR", "Dynamic HTML not gzipped")
+        
+        if compress_body(b"<p>tiny</p>", "gzip") != (b"<p>tiny</p>", None):
+            return _store_result(zcli, "Compression: Negotiation", "ERROR", "Small body was compressed")
+        
+        return _store_result(zcli, "Compression: Negotiation", "PASSED", f"{len(cases)} headers negotiated, HTML {len(html)} → {len(body)} bytes")
+    
+    except Exception as e:
+        return _store_result(zcli, "Compression: Negotiation", "ERROR", f"Exception: {str(e)}")
+
+
+def test_56_compression_precompress_manifest(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: precompress writes sidecars, skips unchanged files by content hash"""
+    temp_dir = None
+    try:
+        import gzip
+        from zCLI.subsystems.zServer.zServer_modules.compression import precompress_assets, manifest_path
+        
+        temp_dir = _create_temp_dir()
+        css_file = os.path.join(temp_dir, "zTheme.css")
+        with open(css_file, "w") as f:
+            f.write(".zBtn { color: red; }\n" * 200)
+        with open(os.path.join(temp_dir, "logo.png"), "wb") as f:
+            f.write(b"\x89PNG" * 500)
+        
+        report = precompress_assets(temp_dir)
+        if len(report) != 1 or report[0]["saved"] <= 0 or report[0]["cached"]:
+            return _store_result(zcli, "Compression: Precompress", "ERROR", f"Unexpected report: {report}")
+        
+        served = sorted(os.listdir(temp_dir))
+        if served != ["logo.png", "zTheme.css", "zTheme.css.gz"] + (["zTheme.css.br"] if os.path.exists(css_file + ".br") else []):
+            return _store_result(zcli, "Compression: Precompress", "ERROR", f"Manifest left in served root: {served}")
+        if not os.path.exists(manifest_path(os.path.abspath(temp_dir))):
+            return _store_result(zcli, "Compression: Precompress", "ERROR", "Manifest not written to cache dir")
+        
+        with open(css_file + ".gz", "rb") as f, open(css_file, "rb") as src:
+            if gzip.decompress(f.read()) != src.read():
+                return _store_result(zcli, "Compression: Precompress", "ERROR", "Sidecar content mismatch")
+        
+        if not precompress_assets(temp_dir)[0]["cached"]:
+            return _store_result(zcli, "Compression: Precompress", "ERROR", "Unchanged file recompressed")
+        
+        with open(css_file, "a") as f:
+            f.write(".zCard { margin: 0; }\n")
+        if precompress_assets(temp_dir)[0]["cached"]:
+            return _store_result(zcli, "Compression: Precompress", "ERROR", "Changed file not recompressed")
+        
+        return _store_result(zcli, "Compression: Precompress", "PASSED", f"Saved {report[0]['saved']} bytes, re-run keyed by hash, manifest outside root")
+    
+    except Exception as e:
+        return _store_result(zcli, "Compression: Precompress", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            from zCLI.subsystems.zServer.zServer_modules.compression import manifest_path
+            if os.path.exists(manifest_path(os.path.abspath(temp_dir))):
+                os.remove(manifest_path(os.path.abspath(temp_dir)))
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_57_compression_serves_sidecar(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Server sends the .gz sidecar when the client accepts gzip"""
+    temp_dir = None
+    server = None
+    original_dir = os.getcwd()
+    try:
+        import gzip
+        from zCLI.subsystems.zServer.zServer import zServer
+        
+        temp_dir = _create_temp_dir()
+        os.makedirs(os.path.join(temp_dir, "static"))
+        css = (".zBtn { color: red; }\n" * 200).encode()
+        with open(os.path.join(temp_dir, "static", "zTheme.css"), "wb") as f:
+            f.write(css)
+        
+        server = zServer(Mock(), zcli=Mock(), port=_free_port(), serve_path=temp_dir, precompress=True)
+        server.start()
+        url = f"{server.get_url()}/static/zTheme.css"
+        
+        status, headers, body = _fetch_static(url, {"Accept-Encoding": "gzip"})
+        if status != 200 or headers.get("Content-Encoding") != "gzip" or gzip.decompress(body) != css:
+            return _store_result(zcli, "Compression: Sidecar Served", "ERROR", f"Bad gzip response: {status} {dict(headers)}")
+        if headers.get("Vary") != "Accept-Encoding":
+            return _store_result(zcli, "Compression: Sidecar Served", "ERROR", "Missing Vary: Accept-Encoding")
+        
+        status, plain_headers, plain_body = _fetch_static(url)
+        if plain_headers.get("Content-Encoding") or plain_body != css or plain_headers.get("ETag") == headers.get("ETag"):
+            return _store_result(zcli, "Compression: Sidecar Served", "ERROR", "Identity variant wrong or shares ETag")
+        
+        if not server.health_check()["compression"]["saved"]:
+            return _store_result(zcli, "Compression: Sidecar Served", "ERROR", "No savings reported in health_check")
+        
+        return _store_result(zcli, "Compression: Sidecar Served", "PASSED", f"{len(css)} → {len(body)} bytes over the wire")
+    
+    except Exception as e:
+        return _store_result(zcli, "Compression: Sidecar Served", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if server and server.is_running():
+            server.stop()
+        os.chdir(original_dir)
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+# ============================================================
+# N. PAGE CACHE (3 tests)
+# ============================================================
+
+def _page_cache_zcli(temp_dir: str) -> Any:
+    """Mock zCLI whose loader returns a small zUI block"""
+    zcli = Mock()
+    zcli.auth = None
+    zcli.session = {"zSpace": temp_dir}
+    zcli.loader.handle.return_value = {"zVaF": {"Title": {"zDisplay": {"event": "header", "label": "Dashboard"}}}}
+    return zcli
+
+
+def test_58_page_cache_hit(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Repeated dynamic renders are served from the page cache"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.page_renderer import PageRenderer
+        from zCLI.subsystems.zServer.zServer_modules.page_cache import get_page_cache
+        
+        get_page_cache().invalidate()
+        temp_dir = _create_temp_dir()
+        with open(os.path.join(temp_dir, "zUI.dash.yaml"), "w") as f:
+            f.write("zVaF: {}\n")
+        
+        mock_zcli = _page_cache_zcli(temp_dir)
+        renderer = PageRenderer(mock_zcli)
+        first = renderer.render_page_cached("./zUI.dash.yaml", "zVaF")
+        second = renderer.render_page_cached("./zUI.dash.yaml", "zVaF")
+        
+        if mock_zcli.loader.handle.call_count != 1:
+            return _store_result(zcli, "Page Cache: Hit", "ERROR", f"Loader called {mock_zcli.loader.handle.call_count}x")
+        if first != second or not first.etag.startswith('"') or b"<html" not in first.body.lower():
+            return _store_result(zcli, "Page Cache: Hit", "ERROR", "Cached page differs or lacks ETag")
+        
+        return _store_result(zcli, "Page Cache: Hit", "PASSED", f"1 render, 1 hit ({get_page_cache().get_stats()['hit_rate']})")
+    
+    except Exception as e:
+        return _store_result(zcli, "Page Cache: Hit", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_59_page_cache_mtime_and_role(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Cache keyed on file mtime and role; edits invalidate old entries"""
+    temp_dir = None
+    try:
+        import time
+        from zCLI.subsystems.zServer.zServer_modules.page_renderer import PageRenderer
+        from zCLI.subsystems.zServer.zServer_modules.page_cache import get_page_cache
+        
+        cache = get_page_cache()
+        cache.invalidate()
+        temp_dir = _create_temp_dir()
+        zui_file = os.path.join(temp_dir, "zUI.dash.yaml")
+        with open(zui_file, "w") as f:
+            f.write("zVaF: {}\n")
+        
+        mock_zcli = _page_cache_zcli(temp_dir)
+        renderer = PageRenderer(mock_zcli)
+        renderer.render_page_cached("./zUI.dash.yaml", "zVaF", role="admin")
+        renderer.render_page_cached("./zUI.dash.yaml", "zVaF", role="user")
+        if mock_zcli.loader.handle.call_count != 2 or cache.get_stats()["entries"] != 2:
+            return _store_result(zcli, "Page Cache: Mtime & Role", "ERROR", "Roles share a cache entry")
+        
+        future = time.time() + 5
+        os.utime(zui_file, (future, future))
+        renderer.render_page_cached("./zUI.dash.yaml", "zVaF", role="admin")
+        if mock_zcli.loader.handle.call_count != 3:
+            return _store_result(zcli, "Page Cache: Mtime & Role", "ERROR", "Stale page served after edit")
+        if cache.get_stats()["entries"] != 1:
+            return _store_result(zcli, "Page Cache: Mtime & Role", "ERROR", f"Old versions kept: {cache.get_stats()}")
+        
+        return _store_result(zcli, "Page Cache: Mtime & Role", "PASSED", "Per-role entries, edit re-renders and drops old")
+    
+    except Exception as e:
+        return _store_result(zcli, "Page Cache: Mtime & Role", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+def test_60_page_cache_lru_and_etag(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: LRU size cap and 304 revalidation on dynamic routes"""
+    temp_dir = None
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.page_cache import PageCache, make_page, get_page_cache
+        from zCLI.subsystems.zServer.zServer_modules.wsgi_app import zServerWSGIApp
+        
+        lru = PageCache(max_entries=2, max_bytes=1000)
+        lru.put(("a", 1, "zVaF", "anonymous"), make_page("a"))
+        lru.put(("b", 1, "zVaF", "anonymous"), make_page("b"))
+        lru.get(("a", 1, "zVaF", "anonymous"))
+        lru.put(("c", 1, "zVaF", "anonymous"), make_page("c"))
+        if lru.get(("b", 1, "zVaF", "anonymous")) is not None or lru.get(("a", 1, "zVaF", "anonymous")) is None:
+            return _store_result(zcli, "Page Cache: LRU & ETag", "ERROR", "LRU evicted wrong entry")
+        lru.put(("big", 1, "zVaF", "anonymous"), make_page("x" * 900))
+        if lru.get_stats()["bytes"] > 1000:
+            return _store_result(zcli, "Page Cache: LRU & ETag", "ERROR", f"Byte cap exceeded: {lru.get_stats()}")
+        
+        get_page_cache().invalidate()
+        temp_dir = _create_temp_dir()
+        with open(os.path.join(temp_dir, "zUI.dash.yaml"), "w") as f:
+            f.write("zVaF: {}\n")
+        zserver = Mock()
+        zserver.router.routes = {"routes": {}}
+        zserver.zcli = _page_cache_zcli(temp_dir)
+        app = zServerWSGIApp(zserver)
+        route = {"type": "dynamic", "zVaFile": "./zUI.dash.yaml", "zBlock": "zVaF"}
+        
+        status, headers, _ = app._handle_dynamic_route(route, {})
+        etag = dict(headers).get("ETag")
+        status_304, _, body = app._handle_dynamic_route(route, {"HTTP_IF_NONE_MATCH": etag})
+        if not status.startswith("200") or not etag or not status_304.startswith("304") or body:
+            return _store_result(zcli, "Page Cache: LRU & ETag", "ERROR", f"Revalidation failed: {status} / {status_304}")
+        
+        return _store_result(zcli, "Page Cache: LRU & ETag", "PASSED", "LRU + byte cap enforced, 304 on matching ETag")
+    
+    except Exception as e:
+        return _store_result(zcli, "Page Cache: LRU & ETag", "ERROR", f"Exception: {str(e)}")
+    finally:
+        if temp_dir:
+            _cleanup_temp_dir(temp_dir)
+
+
+# ============================================================
+# O. Route Table (3 tests)
+# ============================================================
+
+def test_61_route_table_params(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Path parameters with typed converters and static-first priority"""
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.router import HTTPRouter
+        
+        routes_data = {
+            "meta": {},
+            "routes": {
+                "/users/me": {"type": "content", "content": "me"},
+                "/users/<int:id>": {"type": "content", "content": "by id"},
+                "/users/<slug>": {"type": "content", "content": "by slug"},
+            }
+        }
+        router = HTTPRouter(routes_data, Mock(), Mock())
+        
+        by_id = router.match_route("/users/42?tab=posts")
+        by_slug = router.match_route("/users/ada/")
+        me = router.match_route("/users/me")
+        
+        if not by_id or by_id.get("_params") != {"id": 42}:
+            return _store_result(zcli, "Route Table: Params", "ERROR", f"Int param not extracted: {by_id}")
+        if not by_slug or by_slug.get("_params") != {"slug": "ada"}:
+            return _store_result(zcli, "Route Table: Params", "ERROR", f"Non-int did not fall to <slug>: {by_slug}")
+        if not me or me.get("content") != "me" or "_params" in me:
+            return _store_result(zcli, "Route Table: Params", "ERROR", "Static segment did not win over params")
+        if "_params" in routes_data["routes"]["/users/<int:id>"]:
+            return _store_result(zcli, "Route Table: Params", "ERROR", "Route definition mutated")
+        
+        return _store_result(zcli, "Route Table: Params", "PASSED", "int > str params, static segment wins")
+    
+    except Exception as e:
+        return _store_result(zcli, "Route Table: Params", "ERROR", f"Exception: {str(e)}")
+
+
+def test_62_route_table_mounts_and_methods(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: Prefix mounts, <path:...> capture and method-specific routes"""
+    try:
+        from zCLI.subsystems.zServer.zServer_modules.router import HTTPRouter
+        
+        routes_data = {
+            "meta": {"default_route": "index.html"},
+            "routes": {
+                "/docs/*": {"type": "content", "content": "docs"},
+                "/files/<path:rest>": {"type": "content", "content": "files"},
+                "/api/users": {"type": "json", "data": {"action": "list"}},
+                "POST /api/users": {"type": "json", "data": {"action": "create"}},
+            }
+        }
+        router = HTTPRouter(routes_data, Mock(), Mock())
+        
+        docs = router.match_route("/docs/guide/intro")
+        files = router.match_route("/files/css/app.css")
+        listed = router.match_route("/api/users", "GET")
+        created = router.match_route("/api/users", "POST")
+        fallback = router.match_route("/nowhere")
+        
+        if not docs or docs.get("content") != "docs" or not router.match_route("/docs"):
+            return _store_result(zcli, "Route Table: Mounts & Methods", "ERROR", "Prefix mount did not match")
+        if not files or files.get("_params") != {"rest": "css/app.css"}:
+            return _store_result(zcli, "Route Table: Mounts & Methods", "ERROR", f"<path:rest> not captured: {files}")
+        if listed["data"]["action"] != "list" or created["data"]["action"] != "create":
+            return _store_result(zcli, "Route Table: Mounts & Methods", "ERROR", "Method-specific route not selected")
+        if not fallback or fallback.get("file") != "index.html":
+            return _store_result(zcli, "Route Table: Mounts & Methods", "ERROR", "Default route not used on miss")
+        
+        return _store_result(zcli, "Route Table: Mounts & Methods", "PASSED", "Mounts, rest capture, POST route, default")
+    
+    except Exception as e:
+        return _store_result(zcli, "Route Table: Mounts & Methods", "ERROR", f"Exception: {str(e)}")
+
+
+def test_63_route_table_json_path_params(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test: {path.x} placeholders resolve in JSON routes; bad routes rejected"""
+    try:
+        import json
+        from zCLI.subsystems.zServer.zServer_modules.router import HTTPRouter
+        from zCLI.subsystems.zServer.zServer_modules.route_trie import RouteTrie
+        from zCLI.subsystems.zServer.zServer_modules.json_utils import render_json_response
+        
+        routes_data = {
+            "meta": {},
+            "routes": {
+                "/api/items/<int:id>": {"type": "json", "data": {"id": "{path.id}", "missing": "{path.nope}"}},
+            }
+        }
+        router = HTTPRouter(routes_data, Mock(), Mock())
+        route = router.match_route("/api/items/7")
+        body, status, _ = render_json_response(route, Mock(), Mock())
+        data = json.loads(body)
+        
+        if status != 200 or data != {"id": 7, "missing": ""}:
+            return _store_result(zcli, "Route Table: JSON Path Params", "ERROR", f"Unexpected body: {data}")
+        
+        trie = RouteTrie()
+        for bad_key in ("/a/<path:rest>/b", "/a/*/b", "/a/<uuid:id>"):
+            try:
+                trie.insert(bad_key, {})
+                return _store_result(zcli, "Route Table: JSON Path Params", "ERROR", f"Accepted invalid route {bad_key}")
+            except ValueError:
+                pass
+        
+        return _store_result(zcli, "Route Table: JSON Path Params", "PASSED", "Typed {path.id} resolved, invalid routes rejected")
+    
+    except Exception as e:
+        return _store_result(zcli, "Route Table: JSON Path Params", "ERROR", f"Exception: {str(e)}")
+
+
 # ============================================================
 # DISPLAY TEST RESULTS
 # ============================================================
@@ -1412,6 +2158,12 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
         "G. URL Generation (3 tests)": [],
         "H. Integration & Handler (3 tests)": [],
         "I. Declarative Routing & RBAC (10 tests)": [],
+        "J. Concurrent Serving (3 tests)": [],
+        "K. Template Cache (3 tests)": [],
+        "L. Static File Caching (3 tests)": [],
+        "M. Compression (3 tests)": [],
+        "N. Page Cache (3 tests)": [],
+        "O. Route Table (3 tests)": [],
     }
     
     # Categorize results
@@ -1436,6 +2188,18 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
             categories["H. Integration & Handler (3 tests)"].append(r)
         elif "Routing:" in test_name or "RBAC:" in test_name:
             categories["I. Declarative Routing & RBAC (10 tests)"].append(r)
+        elif "Concurrency:" in test_name:
+            categories["J. Concurrent Serving (3 tests)"].append(r)
+        elif "Templates:" in test_name:
+            categories["K. Template Cache (3 tests)"].append(r)
+        elif "Static Cache:" in test_name:
+            categories["L. Static File Caching (3 tests)"].append(r)
+        elif "Compression:" in test_name:
+            categories["M. Compression (3 tests)"].append(r)
+        elif "Page Cache:" in test_name:
+            categories["N. Page Cache (3 tests)"].append(r)
+        elif "Route Table:" in test_name:
+            categories["O. Route Table (3 tests)"].append(r)
     
     # Display by category
     for category, tests in categories.items():
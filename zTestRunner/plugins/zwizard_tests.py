@@ -1,6 +1,6 @@
 # zTestRunner/plugins/zwizard_tests.py
 """
-zWizard Comprehensive Test Suite (45 tests)
+zWizard Comprehensive Test Suite (52 tests)
 ===========================================
 
 Declarative tests for zWizard subsystem covering all real-world usage patterns.
@@ -14,6 +14,9 @@ D. Interpolation (6 tests) - zHat interpolation with various data types
 E. Transactions (6 tests) - Transaction lifecycle, commit, rollback
 F. Helper Methods (5 tests) - _get_display, interpolate_zhat, transaction helpers
 G. Exception Handling (5 tests) - Custom exceptions, hierarchy, error messages
+H. Block Plans (2 tests) - Compiled zBlock plans in execute_loop, SystemCache lifecycle
+I. zHat Templates (2 tests) - Compiled interpolation, shared static subtrees, step skipping
+J. Parallel Steps (3 tests) - Dependency graph, concurrent handle(), deterministic zHat, isolated zData reads
 
 Note: execute_loop() low-level mechanics are tested in zTestSuite/zWizard_Test.py (9 unit tests)
 """
@@ -74,6 +77,16 @@ __all__ = [
     "test_exception_messages",
     "test_custom_exception_catching",
     "test_exception_inheritance",
+    # Block plan tests
+    "test_block_plan_execute_loop",
+    "test_block_plan_cache_lifecycle",
+    # zHat template tests
+    "test_zhat_template_render",
+    "test_zhat_template_handle",
+    # Parallel step tests
+    "test_parallel_step_graph",
+    "test_parallel_handle",
+    "test_parallel_zdata_reads",
     # Display
     "display_test_results",
 ]
@@ -1146,6 +1159,308 @@ def test_exception_inheritance(zcli: Optional[Any] = None, context: Optional[Dic
         return _store_result(zcli, "Exceptions: Inheritance", "ERROR", str(e))
 
 
+# ============================================================================
+# H. BLOCK PLAN TESTS (2 tests)
+# ============================================================================
+
+def _plan_wizard(system_cache: Optional[Any] = None) -> Any:
+    """Walker-mode zWizard without display (execute_loop only)."""
+    import logging
+    from types import SimpleNamespace
+    from zCLI.subsystems.zWizard import zWizard
+
+    walker = SimpleNamespace(
+        zSession={"test": "data"}, logger=logging.getLogger("zwizard_tests"), display=None, zcli=None,
+        loader=SimpleNamespace(cache=SimpleNamespace(schema_cache=None, system_cache=system_cache)),
+    )
+    return zWizard(walker=walker)
+
+
+def test_block_plan_execute_loop(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test BlockPlan contents and execute_loop jumps/menu looping driven by it"""
+    try:
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_plan import compile_block_plan
+
+        block = {
+            "_meta": {"title": "ignored"},
+            "intro": "text",
+            "~Root*": ["a", "b"],
+            "a": {"zFunc": "&plugin.a()"},
+            "b": {"zDisplay": {"event": "text"}, "_rbac": {"require_role": "admin"}},
+        }
+        plan = compile_block_plan(block)
+        assert plan.keys == ("intro", "~Root*", "a", "b"), f"Keys: {plan.keys}"
+        assert plan.index["a"] == 2, "Key index"
+        assert plan.menu_anchor == (None, None, 1, 1), f"Anchors: {plan.menu_anchor}"
+
+        # Menu picks "a" then zBack; "a" returns to the menu via its anchor
+        del block["b"]
+        calls = []
+        picks = iter(["a", "zBack"])
+
+        def dispatch(key, value):
+            calls.append(key)
+            return next(picks) if key == "~Root*" else None
+
+        result = _plan_wizard().execute_loop(block, dispatch_fn=dispatch, start_key="~Root*")
+        assert result == "zBack", f"Result: {result}"
+        assert calls == ["~Root*", "a", "~Root*"], f"Order: {calls}"
+
+        return _store_result(zcli, "Plan: execute_loop", "PASSED", "Index, anchors and jumps correct")
+    except Exception as e:
+        return _store_result(zcli, "Plan: execute_loop", "ERROR", str(e))
+
+
+def test_block_plan_cache_lifecycle(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test plans are cached with the parsed UI in SystemCache and dropped with it"""
+    try:
+        import logging
+        from zCLI.subsystems.zLoader.loader_modules.loader_cache_system import SystemCache
+
+        cache = SystemCache({}, logging.getLogger("zwizard_tests"))
+        ui = {"Root": {"step": "text"}}
+        cache.set("zUI_test", ui)
+        wizard = _plan_wizard(cache)
+
+        for _ in range(3):
+            wizard.execute_loop(ui["Root"], dispatch_fn=lambda key, value: None)
+        stats = cache.get_stats()
+        assert (stats["plan_compiles"], stats["plan_hits"], stats["plans"]) == (1, 2, 1), f"Reuse: {stats}"
+
+        # In-place edits: a renamed key recompiles, a new _rbac is enforced
+        from unittest.mock import patch
+        ui["Root"]["renamed"] = ui["Root"].pop("step")
+        calls = []
+        wizard.execute_loop(ui["Root"], dispatch_fn=lambda key, value: calls.append(key))
+        assert calls == ["renamed"] and cache.get_stats()["plan_compiles"] == 2, f"Stale plan reused: {calls}"
+        ui["Root"]["renamed"] = {"zFunc": "&p.x()", "_rbac": {"require_role": "admin"}}
+        calls.clear()
+        with patch("zCLI.subsystems.zWizard.zWizard.check_rbac_access", return_value="access_denied") as rbac:
+            wizard.execute_loop(ui["Root"], dispatch_fn=lambda key, value: calls.append(key))
+        assert rbac.called and not calls, "_rbac added in place was not enforced"
+
+        cache.invalidate("zUI_test")
+        assert cache.get_stats()["plans"] == 0, "Plan should be dropped with its UI entry"
+
+        wizard.execute_loop({"adhoc": "text"}, dispatch_fn=lambda key, value: None)
+        assert cache.get_stats()["plans"] == 0, "Ad-hoc blocks should not be cached"
+
+        return _store_result(zcli, "Plan: Cache Lifecycle", "PASSED", "Compiled once, recompiled on key edits, dropped on invalidate")
+    except Exception as e:
+        return _store_result(zcli, "Plan: Cache Lifecycle", "ERROR", str(e))
+
+
+# ============================================================================
+# I. ZHAT TEMPLATE TESTS (2 tests)
+# ============================================================================
+
+def test_zhat_template_render(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test ZHatTemplate deps, shared static subtrees and by-reference values"""
+    try:
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_interpolation import compile_zhat_template
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_hat import WizardHat
+        from unittest.mock import MagicMock
+
+        rows = [{"id": i} for i in range(100)]
+        zHat = WizardHat()
+        zHat.add("fetch", rows)
+        zHat.add("count", 100)
+
+        static = {"event": "text", "content": "no references"}
+        step = {"zDisplay": static, "data": {"rows": "zHat[fetch]", "label": "Total: zHat[1]"}}
+        template = compile_zhat_template(step)
+        assert template.deps == frozenset({"fetch", 1}), f"Deps: {template.deps}"
+
+        result = template.render(zHat, MagicMock())
+        assert result["zDisplay"] is static, "Static subtree should be shared, not copied"
+        assert result["data"]["rows"] is rows, "Whole-string reference should pass the value itself"
+        assert result["data"]["label"] == "Total: 100", f"Embedded: {result['data']['label']}"
+        assert step["data"]["rows"] == "zHat[fetch]", "Source must not be modified"
+
+        plain = compile_zhat_template(static)
+        assert not plain.deps and plain.render(zHat, MagicMock()) is static, "No-reference step returned as-is"
+
+        return _store_result(zcli, "zHat Template: Render", "PASSED", "Deps, sharing and by-reference values correct")
+    except Exception as e:
+        return _store_result(zcli, "zHat Template: Render", "ERROR", str(e))
+
+
+def test_zhat_template_handle(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test handle() reuses compiled templates and skips steps without references"""
+    try:
+        from types import SimpleNamespace
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_interpolation import get_zhat_template
+
+        received = []
+        wizard = _plan_wizard()
+        wizard.walker.dispatch = SimpleNamespace(
+            handle=lambda key, value, context=None: received.append(value) or len(received)
+        )
+        first = {"zFunc": "&plugin.load()"}
+        workflow = {"load": first, "show": {"zDisplay": {"event": "text", "content": "zHat[load]"}}}
+
+        for _ in range(2):
+            received.clear()
+            wizard.handle(workflow)
+            assert received[0] is first, "Step without references should be dispatched as-is"
+            assert received[1]["zDisplay"]["content"] == 1, f"Interpolated: {received[1]}"
+
+        assert get_zhat_template(workflow["show"]) is get_zhat_template(workflow["show"]), "Template should be cached"
+
+        # Parallel step threads share the cache: hits, misses and evictions race
+        from concurrent.futures import ThreadPoolExecutor
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_interpolation import TEMPLATE_CACHE_SIZE
+        steps = [{"zFunc": f"&plugin.f(zHat[{i}])"} for i in range(TEMPLATE_CACHE_SIZE * 2)]
+
+        def compile_slice(offset):
+            return all(get_zhat_template(step).deps for step in steps[offset % 4::4])
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(compile_slice, range(64))), "Concurrent lookups returned a bad template"
+
+        return _store_result(zcli, "zHat Template: handle()", "PASSED", "Templates reused, static steps skipped")
+    except Exception as e:
+        return _store_result(zcli, "zHat Template: handle()", "ERROR", str(e))
+
+
+# ============================================================================
+# J. PARALLEL STEP TESTS (3 tests)
+# ============================================================================
+
+def test_parallel_step_graph(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test build_step_graph() dependencies from zHat refs, _after and $model steps"""
+    try:
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_parallel import build_step_graph
+        from zCLI.subsystems.zWizard.zWizard_modules.wizard_exceptions import WizardExecutionError
+
+        workflow = {
+            "_parallel": True,
+            "a": {"zData": {"action": "read", "model": "$db"}},
+            "b": {"zFunc": "&plugin.b()"},
+            "c": {"zData": {"action": "insert", "model": "$db"}},
+            "d": {"zFunc": "&plugin.d(zHat[b], zHat[later])"},
+            "e": {"_after": ["a"], "zFunc": "&plugin.e(zHat[1])"},
+            "later": "text",
+        }
+        graph = build_step_graph(workflow)
+        assert graph.keys == ["a", "b", "c", "d", "e", "later"], f"Keys: {graph.keys}"
+        assert graph.deps[3] == {1}, f"zHat[b] dep (forward ref ignored): {graph.deps[3]}"
+        assert graph.deps[4] == {0, 1}, f"_after + zHat[1] prefix: {graph.deps[4]}"
+        assert graph.serial == [True, False, True, False, False, False], f"Serial: {graph.serial}"
+        assert graph.deps[2] == {0}, "$model steps should be chained"
+        assert "_after" not in graph.values[4] and "_after" in workflow["e"], "_after stripped from dispatched copy"
+
+        cycle = {"x": {"_after": "y", "zFunc": "&p.x()"}, "y": {"_after": "x", "zFunc": "&p.y()"}}
+        try:
+            build_step_graph(cycle)
+            raise AssertionError("Cycle should raise WizardExecutionError")
+        except WizardExecutionError:
+            pass
+
+        return _store_result(zcli, "Parallel: Step Graph", "PASSED", "zHat, _after and $model edges correct")
+    except Exception as e:
+        return _store_result(zcli, "Parallel: Step Graph", "ERROR", str(e))
+
+
+def test_parallel_handle(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test _parallel handle() overlaps independent steps and keeps zHat order"""
+    try:
+        import threading
+        from types import SimpleNamespace
+
+        # The three independent steps only pass the barrier if they run together
+        barrier = threading.Barrier(3, timeout=5)
+
+        def dispatch(key, value, context=None):
+            if key.startswith("fetch"):
+                barrier.wait()
+                return key.upper()
+            return value["zFunc"]
+
+        wizard = _plan_wizard()
+        wizard.walker.dispatch = SimpleNamespace(handle=dispatch)
+        workflow = {
+            "_parallel": True,
+            "combine": {"zFunc": "zHat[fetch_c]"},
+            "fetch_a": {"zFunc": "&p.a()"},
+            "fetch_b": {"zFunc": "&p.b()"},
+            "fetch_c": {"zFunc": "&p.c()"},
+            "report": {"zFunc": "zHat[fetch_a]"},
+        }
+        zHat = wizard.handle(workflow)
+
+        # Forward reference (combine -> fetch_c) is not a dependency, same as sequential mode
+        assert [zHat[i] for i in range(len(zHat))] == ["None", "FETCH_A", "FETCH_B", "FETCH_C", "FETCH_A"], \
+            f"Declaration order / interpolation: {[zHat[i] for i in range(len(zHat))]}"
+        stats = wizard.last_run_stats
+        assert stats["mode"] == "parallel" and stats["max_in_flight"] >= 3, f"Stats: {stats}"
+        assert stats["elapsed_ms"] >= 0, "Latency should be reported"
+
+        wizard.handle({"only": {"zFunc": "value"}})
+        assert wizard.last_run_stats["mode"] == "sequential", "Default mode is sequential"
+
+        return _store_result(zcli, "Parallel: handle()", "PASSED", "Independent steps overlapped, zHat ordered")
+    except Exception as e:
+        return _store_result(zcli, "Parallel: handle()", "ERROR", str(e))
+
+
+def test_parallel_zdata_reads(zcli: Optional[Any] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Test _parallel zData reads over two SQLite schemas run on handlers of their own"""
+    if not zcli:
+        return _store_result(None, "Parallel: zData Reads", "ERROR", "No zcli")
+
+    import shutil
+    import tempfile
+    from types import SimpleNamespace
+    from zCLI.subsystems.zWizard import zWizard
+    from zCLI.subsystems.zData.zData_modules.shared.backends import AdapterFactory
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        schemas = {}
+        for label, table in (("users_db", "users"), ("teams_db", "teams")):
+            adapter = AdapterFactory.create_adapter("sqlite", {"path": temp_dir, "label": label})
+            adapter.connect()
+            adapter.create_table(table, {"id": {"type": "int", "pk": True}, "name": {"type": "str"}})
+            adapter.insert_many(table, ["id", "name"], ((i, f"{table}{i}") for i in range(1, 6)))
+            adapter.commit()
+            adapter.disconnect()
+            schemas[table] = {
+                "Meta": {"Data_Type": "sqlite", "Data_Path": temp_dir, "Data_Label": label},
+                table: {"id": {"type": "int", "pk": True}, "name": {"type": "str"}},
+            }
+
+        def read(table, row_id):
+            return {"zData": {"action": "read", "tables": [table], "where": f"id = {row_id}", "pause": False,
+                              "options": {"_schema_cached": schemas[table], "_alias_name": table}}}
+
+        workflow = {"_parallel": 8}
+        for row_id in range(1, 5):
+            workflow[f"user_{row_id}"] = read("users", row_id)
+            workflow[f"team_{row_id}"] = read("teams", row_id)
+
+        # Walker-mode wizard on the real dispatch (earlier tests replace zcli.shell with mocks)
+        walker = SimpleNamespace(zSession=zcli.session, logger=zcli.logger, display=None, zcli=zcli,
+                                 loader=zcli.loader, dispatch=zcli.dispatch)
+        wizard = zWizard(walker=walker)
+        before = zcli.data.get_connection_info()["pool"]["in_use"]
+        for _ in range(3):
+            zHat = wizard.handle(workflow)
+            failed = [key for key in workflow if not key.startswith("_") and zHat[key] is not True]
+            assert not failed, f"Reads failed: {failed}"
+        assert wizard.last_run_stats["max_in_flight"] > 1, "Reads should overlap"
+        assert zcli.data.adapter is None, "Pool steps should leave zcli.data untouched"
+        after = zcli.data.get_connection_info()["pool"]["in_use"]
+        assert after == before, f"Connections not returned to the pool: {before} -> {after}"
+
+        return _store_result(zcli, "Parallel: zData Reads", "PASSED", "3 runs x 8 overlapping reads over 2 schemas")
+    except Exception as e:
+        return _store_result(zcli, "Parallel: zData Reads", "ERROR", str(e))
+    finally:
+        zcli.data.pool.close_all()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 # ============================================================================
 # DISPLAY RESULTS
 # ============================================================================
@@ -1198,7 +1513,10 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
         "D. Interpolation (6 tests)": [],
         "E. Transactions (6 tests)": [],
         "F. Helper Methods (5 tests)": [],
-        "G. Exception Handling (5 tests)": []
+        "G. Exception Handling (5 tests)": [],
+        "H. Block Plans (2 tests)": [],
+        "I. zHat Templates (2 tests)": [],
+        "J. Parallel Steps (3 tests)": []
     }
     
     for r in results:
@@ -1217,6 +1535,12 @@ def display_test_results(zcli: Optional[Any] = None, context: Optional[Dict[str,
             categories["F. Helper Methods (5 tests)"].append(r)
         elif "Exceptions:" in test_name:
             categories["G. Exception Handling (5 tests)"].append(r)
+        elif "Plan:" in test_name:
+            categories["H. Block Plans (2 tests)"].append(r)
+        elif "zHat Template:" in test_name:
+            categories["I. zHat Templates (2 tests)"].append(r)
+        elif "Parallel:" in test_name:
+            categories["J. Parallel Steps (3 tests)"].append(r)
     
     # Display by category
     for category, tests in categories.items():